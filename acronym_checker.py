@@ -23,12 +23,15 @@ Logic:
 """
 
 import re
-import zipfile
 from typing import List, Dict, Tuple, Set, Optional, Any
 from dataclasses import dataclass
 import os
 from datetime import datetime
 
+from docx_package import open_package
+from phrase_matcher import PhraseMatcher
+from regex_registry import any_of, compile_pattern
+
 # Import from core contracts
 try:
     from base_checker import BaseChecker, ReviewIssue
@@ -59,6 +62,43 @@ except ImportError:
     __version__ = "2.5.0"
     _structured_logger = None
 
+# v6.3.3: Usage/definition patterns compiled once through the shared regex
+# registry (they were rebuilt on every check() call)
+_ACRONYM_CANDIDATE = compile_pattern(r'(?<![a-zA-Z])([A-Z][A-Z0-9&/-]{1,11})(?![a-zA-Z])',
+                                     name='acronym.candidate')
+# Template/instruction text in brackets: [GREEN TEXT], [INSERT NAME], [ENTER DATE]
+_TEMPLATE_BRACKET = compile_pattern(r'\[[A-Z][A-Z\s]+\]', name='acronym.template_bracket')
+# Document numbers/references to skip: N0-0202_00, F-FAC1-006, FAC1-001-DI, CTM N201
+# v2.9.1 Batch 7 A7: Enhanced document ID patterns
+_DOC_NUMBER = any_of([
+    r'^[A-Z]{1,2}\d-',           # N0-, F1-, C0-, D0- etc
+    r'^[A-Z]-[A-Z]{2,4}\d',      # F-FAC1, F-FAC2
+    r'^[A-Z]{2,4}\d-\d',         # FAC1-001, FAC2-001
+    r'^[A-Z]{2,4}-\d',           # CTM-123, etc
+    r'^\d{1,2}-[A-Z]',           # 01-A, etc (numbered items)
+    r'^[A-Z]{2}\s*N\d',          # CO N101, CTM N201
+    r'^MIL-STD-\d',              # MIL-STD-498, MIL-STD-882E
+    r'^MIL-[A-Z]+-\d',           # MIL-HDBK-217, etc
+    r'^DO-\d',                   # DO-178C, DO-254
+    r'^IEEE\s*\d',               # IEEE 830, IEEE 1233
+    r'^ISO\s*\d',                # ISO 9001, ISO 26262
+    r'^SAE\s*[A-Z]*\d',          # SAE AS6500, SAE J1939
+    # v2.9.1 Batch 7 A7: Additional Northrop Grumman doc patterns
+    r'^[A-Z]\d-\d{4}',           # C0-0920, D0-5400, etc.
+    r'^[A-Z]\d-\d{4}_\d',        # C0-0920_00, C0-0912_01
+    r'^[A-Z]{2,3}\d{3,5}',        # DI12345, SRS1234
+], name='acronym.doc_number')
+# Followed by -digits, _digits or space+N+digits: a document reference
+_DOC_REF_CONTEXT = any_of([r'^[-_]\d', r'^\s+N\d'], name='acronym.doc_ref_context')
+# Section reference codes (single letter + 1-2 digits): A1, B12, C3
+_SECTION_CODE = compile_pattern(r'^[A-Z]\d{1,2}$', name='acronym.section_code')
+_INLINE_DEFINITION = compile_pattern(
+    r'([A-Z][a-zA-Z]*(?:\s+(?:and|of|the|for|in|on|to|[A-Za-z]+))*)\s*'
+    r'\(([A-Z][A-Z0-9&/-]{1,9})\)', name='acronym.inline_definition')
+_XML_TEXT_RUN = compile_pattern(r'<w:t[^>]*>([^<]+)</w:t>', name='acronym.xml_text')
+_XML_HYPERLINK = compile_pattern(r'<w:hyperlink[^>]*>(.+?)</w:hyperlink>', re.DOTALL,
+                                 name='acronym.xml_hyperlink')
+
 # v4.6.0: Load external acronym database
 _EXTERNAL_ACRONYMS = None
 
@@ -582,6 +622,8 @@ class AcronymChecker(BaseChecker):
         self._defined: Set[str] = set()
         self._acronym_section_paras: Set[int] = set()  # Paragraph indices in acronym section
         self._errors: List[str] = []
+        self._embedded_in_defined: Optional[Set[str]] = None
+        self._indexed_acronyms: Set[str] = set()
         
         # v3.0.33: Strict mode configuration
         # Load from config if not explicitly provided
@@ -591,7 +633,11 @@ class AcronymChecker(BaseChecker):
             self._ignore_common_acronyms = ignore_common_acronyms
         
         # v3.0.33: Transparency metrics
-        self._metrics = {
+        self._metrics = self._fresh_metrics()
+
+    def _fresh_metrics(self) -> Dict[str, Any]:
+        """Empty transparency metrics for a new check."""
+        return {
             'total_acronyms_found': 0,
             'defined_count': 0,
             'suppressed_by_allowlist_count': 0,
@@ -599,6 +645,15 @@ class AcronymChecker(BaseChecker):
             'strict_mode': not self._ignore_common_acronyms,
             'allowlist_matches': []  # Track which acronyms were suppressed
         }
+
+    def reset_review_state(self):
+        """v6.3.3: Fresh per-review state for forked instances (see BaseChecker.fork)."""
+        self._defined = set()
+        self._acronym_section_paras = set()
+        self._errors = []
+        self._embedded_in_defined = None
+        self._indexed_acronyms = set()
+        self._metrics = self._fresh_metrics()
     
     def _load_config_setting(self) -> bool:
         """Load ignore_common_acronyms from config.json."""
@@ -638,17 +693,14 @@ class AcronymChecker(BaseChecker):
         self._defined = set()
         self._acronym_section_paras = set()
         self._errors = []
+        self._embedded_in_defined = None
+        self._indexed_acronyms = set()
+        # v6.3.3: Review's shared DocxPackage (document.xml is read once for both XML passes)
+        self._docx_package = kwargs.get('docx_package')
         issues = []
         
         # Reset metrics for this check
-        self._metrics = {
-            'total_acronyms_found': 0,
-            'defined_count': 0,
-            'suppressed_by_allowlist_count': 0,
-            'flagged_count': 0,
-            'strict_mode': not self._ignore_common_acronyms,
-            'allowlist_matches': []
-        }
+        self._metrics = self._fresh_metrics()
         
         _log(f"Starting check: {len(paragraphs)} paragraphs, filepath={bool(filepath)}, strict_mode={not self._ignore_common_acronyms}")
         
@@ -673,6 +725,7 @@ class AcronymChecker(BaseChecker):
             
             # Track total unique acronyms found
             self._metrics['total_acronyms_found'] = len(acronym_usage)
+            self._index_embedded_acronyms(acronym_usage)
             
             # Step 5: Generate issues for undefined acronyms with metrics tracking
             for acronym, info in acronym_usage.items():
@@ -859,15 +912,14 @@ class AcronymChecker(BaseChecker):
             return
         
         try:
-            with zipfile.ZipFile(filepath, 'r') as zf:
-                if 'word/document.xml' not in zf.namelist():
+            with open_package(filepath, getattr(self, '_docx_package', None)) as pkg:
+                xml_content = pkg.document_xml
+                if xml_content is None:
                     return
                 
-                xml_content = zf.read('word/document.xml').decode('utf-8')
-                
                 # Extract all text runs to find acronym patterns
                 # Pattern: Find all <w:t> text content
-                text_pattern = re.compile(r'<w:t[^>]*>([^<]+)</w:t>')
+                text_pattern = _XML_TEXT_RUN
                 all_texts = text_pattern.findall(xml_content)
                 
                 # Join consecutive texts and look for acronym definitions
@@ -968,12 +1020,7 @@ class AcronymChecker(BaseChecker):
             return
         
         # Pattern: "Full Name (ACRONYM)"
-        pattern = re.compile(
-            r'([A-Z][a-zA-Z]*(?:\s+(?:and|of|the|for|in|on|to|[A-Za-z]+))*)\s*'
-            r'\(([A-Z][A-Z0-9&/-]{1,9})\)'
-        )
-        
-        for match in pattern.finditer(text):
+        for match in _INLINE_DEFINITION.finditer(text):
             acronym = match.group(2)
             if len(acronym) >= 2 and acronym not in self.COMMON_CAPS_SKIP:
                 self._mark_defined(acronym, 'inline')
@@ -1096,35 +1143,6 @@ class AcronymChecker(BaseChecker):
         # Get hyperlinked text to exclude (document numbers)
         hyperlinked = self._get_hyperlinked_text(filepath) if filepath else set()
 
-        # Pattern for potential acronyms
-        acronym_pattern = re.compile(r'(?<![a-zA-Z])([A-Z][A-Z0-9&/-]{1,11})(?![a-zA-Z])')
-
-        # Pattern for template/instruction text in brackets - skip these entirely
-        # Matches: [GREEN TEXT], [INSERT NAME], [ENTER DATE], etc.
-        template_bracket_pattern = re.compile(r'\[[A-Z][A-Z\s]+\]')
-        
-        # Patterns for document numbers/references to SKIP
-        # These match things like: N0-0202_00, F-FAC1-006, FAC1-001-DI, CTM N201
-        # v2.9.1 Batch 7 A7: Enhanced document ID patterns
-        doc_number_patterns = [
-            re.compile(r'^[A-Z]{1,2}\d-'),           # N0-, F1-, C0-, D0- etc
-            re.compile(r'^[A-Z]-[A-Z]{2,4}\d'),      # F-FAC1, F-FAC2
-            re.compile(r'^[A-Z]{2,4}\d-\d'),         # FAC1-001, FAC2-001
-            re.compile(r'^[A-Z]{2,4}-\d'),           # CTM-123, etc
-            re.compile(r'^\d{1,2}-[A-Z]'),           # 01-A, etc (numbered items)
-            re.compile(r'^[A-Z]{2}\s*N\d'),          # CO N101, CTM N201
-            re.compile(r'^MIL-STD-\d'),              # MIL-STD-498, MIL-STD-882E
-            re.compile(r'^MIL-[A-Z]+-\d'),           # MIL-HDBK-217, etc
-            re.compile(r'^DO-\d'),                   # DO-178C, DO-254
-            re.compile(r'^IEEE\s*\d'),               # IEEE 830, IEEE 1233
-            re.compile(r'^ISO\s*\d'),                # ISO 9001, ISO 26262
-            re.compile(r'^SAE\s*[A-Z]*\d'),          # SAE AS6500, SAE J1939
-            # v2.9.1 Batch 7 A7: Additional Northrop Grumman doc patterns
-            re.compile(r'^[A-Z]\d-\d{4}'),           # C0-0920, D0-5400, etc.
-            re.compile(r'^[A-Z]\d-\d{4}_\d'),        # C0-0920_00, C0-0912_01
-            re.compile(r'^[A-Z]{2,3}\d{3,5}'),       # DI12345, SRS1234
-        ]
-        
         for idx, text in paragraphs:
             if not text:
                 continue
@@ -1141,7 +1159,7 @@ class AcronymChecker(BaseChecker):
 
             # v4.5.1: Remove template/instruction text in brackets before scanning
             # This prevents [GREEN TEXT], [INSERT NAME], etc. from being flagged
-            text_for_scan = template_bracket_pattern.sub(' ', text)
+            text_for_scan = _TEMPLATE_BRACKET.sub(' ', text)
 
             # v4.5.2: Detect ALL CAPS sentences/phrases and skip them entirely
             # These are instructional text like "A HARD OR ELECTRONIC COPY MUST BE AVAILABLE"
@@ -1150,7 +1168,7 @@ class AcronymChecker(BaseChecker):
                 _log(f"Skipping ALL CAPS instruction text: {text_for_scan[:50]}...")
                 continue
 
-            for match in acronym_pattern.finditer(text_for_scan):
+            for match in _ACRONYM_CANDIDATE.finditer(text_for_scan):
                 acronym = match.group(1).rstrip('&/-')
                 
                 if not acronym or len(acronym) < 2:
@@ -1170,13 +1188,8 @@ class AcronymChecker(BaseChecker):
                     continue
                 
                 # Skip if matches any document number pattern
-                is_doc_number = False
-                for pattern in doc_number_patterns:
-                    if pattern.match(acronym):
-                        _log(f"Skipping doc number pattern: {acronym}")
-                        is_doc_number = True
-                        break
-                if is_doc_number:
+                if _DOC_NUMBER.match(acronym):
+                    _log(f"Skipping doc number pattern: {acronym}")
                     continue
                 
                 # Check context - is this followed by digits/dashes suggesting doc reference?
@@ -1184,13 +1197,13 @@ class AcronymChecker(BaseChecker):
                 if end_pos < len(text_for_scan):
                     following = text_for_scan[end_pos:end_pos+10]
                     # Skip if followed by: -digits, _digits, space+N+digits
-                    if re.match(r'^[-_]\d', following) or re.match(r'^\s+N\d', following):
+                    if _DOC_REF_CONTEXT.match(following):
                         _log(f"Skipping doc ref context: {acronym}{following[:5]}")
                         continue
 
                 # v4.5.1: Skip section reference codes (single letter + 1-2 digits)
                 # Matches: A1, B12, C3, D99, etc. - common in SOPs and procedures
-                if re.match(r'^[A-Z]\d{1,2}$', acronym):
+                if _SECTION_CODE.match(acronym):
                     _log(f"Skipping section reference code: {acronym}")
                     continue
                 
@@ -1223,22 +1236,16 @@ class AcronymChecker(BaseChecker):
             return hyperlinked
         
         try:
-            with zipfile.ZipFile(filepath, 'r') as zf:
-                if 'word/document.xml' not in zf.namelist():
+            with open_package(filepath, getattr(self, '_docx_package', None)) as pkg:
+                xml_content = pkg.document_xml
+                if xml_content is None:
                     return hyperlinked
                 
-                xml_content = zf.read('word/document.xml').decode('utf-8')
-                
                 # Find hyperlink content
-                hyperlink_pattern = re.compile(
-                    r'<w:hyperlink[^>]*>(.+?)</w:hyperlink>',
-                    re.DOTALL
-                )
-                
-                for match in hyperlink_pattern.finditer(xml_content):
+                for match in _XML_HYPERLINK.finditer(xml_content):
                     content = match.group(1)
                     # Extract text from this hyperlink
-                    text_matches = re.findall(r'<w:t[^>]*>([^<]+)</w:t>', content)
+                    text_matches = _XML_TEXT_RUN.findall(content)
                     full_text = ''.join(text_matches).strip()
                     if full_text:
                         hyperlinked.add(full_text)
@@ -1283,9 +1290,8 @@ class AcronymChecker(BaseChecker):
                 return False
         
         # Check if part of a compound defined acronym
-        for defined in self._defined:
-            if len(defined) > len(acronym) and acronym in defined:
-                return False
+        if self._is_inside_defined(acronym):
+            return False
         
         # Roman numerals
         if re.match(r'^[IVXLCDM]+$', acronym):
@@ -1341,9 +1347,8 @@ class AcronymChecker(BaseChecker):
                 return False
         
         # Check if part of a compound defined acronym
-        for defined in self._defined:
-            if len(defined) > len(acronym) and acronym in defined:
-                return False
+        if self._is_inside_defined(acronym):
+            return False
         
         # Roman numerals
         if re.match(r'^[IVXLCDM]+$', acronym):
@@ -1356,6 +1361,28 @@ class AcronymChecker(BaseChecker):
         
         return True
     
+    def _index_embedded_acronyms(self, acronyms):
+        """
+        v6.3.3: Find which used acronyms occur inside a longer defined one
+        with one matcher pass per definition, instead of testing every
+        definition for every acronym.
+        """
+        matcher = PhraseMatcher(acronyms, case_sensitive=True, whole_words=False)
+        embedded: Set[str] = set()
+        if matcher:
+            for defined in self._defined:
+                for match in matcher.finditer(defined):
+                    if len(match.phrase) < len(defined):
+                        embedded.add(match.phrase)
+        self._embedded_in_defined = embedded
+        self._indexed_acronyms = set(matcher.phrases)
+
+    def _is_inside_defined(self, acronym: str) -> bool:
+        """True if `acronym` is part of a longer defined acronym (e.g. 'SE' in 'SEMP')."""
+        if self._embedded_in_defined is not None and acronym in self._indexed_acronyms:
+            return acronym in self._embedded_in_defined
+        return any(len(defined) > len(acronym) and acronym in defined for defined in self._defined)
+
     def _is_document_identifier(self, text: str) -> bool:
         """Check if text is a document identifier (not an acronym needing definition).
         
@@ -43,6 +43,11 @@ logger = logging.getLogger(__name__)
 # Version
 VERSION = '1.0.0'
 
+try:
+    from sqlite_pool import get_pool
+except ImportError:
+    get_pool = None
+
 
 # ============================================================
 # DATA CLASSES
@@ -218,7 +223,12 @@ class AdaptiveLearner:
         logger.info(f"[AdaptiveLearner] Initialized v{VERSION} with database: {db_path}")
 
     def _get_connection(self) -> sqlite3.Connection:
-        """Get thread-local database connection."""
+        """Get thread-local database connection.
+
+        v6.3.3: Served by the shared sqlite_pool (per-thread, tuned PRAGMAs).
+        """
+        if get_pool is not None:
+            return get_pool(self.db_path, timeout=30.0).connection()
         if not hasattr(self._local, 'connection') or self._local.connection is None:
             self._local.connection = sqlite3.connect(
                 self.db_path,
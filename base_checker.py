@@ -5,12 +5,15 @@ Base Checker Contract v2.1.0
 Defines the interface all checkers must implement.
 
 v2.1.0 - Added provenance tracking fields for source location validation
+v2.6.0 - Added PARALLEL_SAFE capability flag for checker_scheduler
+v2.7.0 - Added fork()/reset_review_state() for per-review checker state
+v2.8.0 - Added PARAGRAPH_LOCAL capability flag for incremental re-review
 """
 
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, field
 
-__version__ = "2.5.0"
+__version__ = "2.8.0"
 
 
 @dataclass
@@ -91,6 +94,19 @@ class BaseChecker:
     
     CHECKER_NAME = "Base"
     CHECKER_VERSION = "1.0.0"
+
+    # v6.3.3: Scheduler capability flag. True means check() is a pure function
+    # of its arguments (no state read back after the run, no shared mutable
+    # caches, no COM/network/NLP model handles) so the instance can be pickled
+    # into a worker process. Leave False for anything stateful.
+    PARALLEL_SAFE = False
+
+    # v6.3.3: Incremental re-review flag. True means every issue check() returns
+    # carries the paragraph_index of the paragraph that produced it and depends
+    # only on that paragraph's text (no document-wide caps, first-use tracking
+    # or cross-paragraph dedupe), so cached issues can be reused for unchanged
+    # paragraphs. See incremental_review.py.
+    PARAGRAPH_LOCAL = False
     
     # Patterns that indicate boilerplate/disclaimer content to skip
     BOILERPLATE_PATTERNS = [
@@ -381,6 +397,29 @@ class BaseChecker:
             **kwargs
         )
     
+    def fork(self) -> 'BaseChecker':
+        """
+        Return a per-review copy of this checker.
+
+        The cached instance acts as an immutable template: compiled regexes,
+        dictionaries and word lists are shared by reference, while the copy
+        gets fresh per-review state via reset_review_state(). This lets batch
+        threads run documents concurrently without sharing metrics/results.
+        """
+        import copy
+        clone = copy.copy(self)
+        clone.reset_review_state()
+        return clone
+
+    def reset_review_state(self):
+        """
+        Replace mutable per-review state with fresh containers.
+
+        Subclasses that keep results or metrics on the instance (read back by
+        the engine after check()) must override this and call super().
+        """
+        self._errors = []
+
     def clear_errors(self):
         """Clear accumulated errors."""
         self._errors = []
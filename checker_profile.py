@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+AEGIS Checker Profile
+=====================
+Per-checker telemetry for reviews: wall time, CPU time, peak traced memory,
+issue count and exception count.
+
+v6.3.3: review_document only reported coarse progress strings, so a slow
+batch could not be pinned on any of the 100+ checkers or the NLP checkers.
+ReviewProfile measures every checker run in a review (in-process runs via
+CheckerScheduler and the NLP loop, pool runs inside the worker) and
+CheckerProfileStore keeps the last N reviews in SQLite, where aggregate()
+rolls them up per checker for /api/diagnostics/checker-profile and the
+diagnostic export.
+
+Timing is always cheap (perf_counter / thread_time). Memory is measured with
+tracemalloc, which makes allocation-heavy checkers several times slower
+(nominalization: ~32s -> ~210s on the user guide), so memory sampling is
+opt-in: "checker_profile_memory_rate" defaults to 0. Checkers in reviews
+without tracing report peak_kb = None.
+
+tracemalloc is process-wide, while batch scans run reviews concurrently in
+threads. So at most one review owns tracing at a time, and only if no other
+review is running when it starts; a review that starts while one is traced
+marks it shared, and the traced review's peaks are discarded because other
+threads' allocations are in them.
+
+config.json "performance_settings":
+    "checker_profile": true            record telemetry (default on)
+    "checker_profile_memory_rate": 0   fraction of reviews that trace memory
+    "checker_profile_history": 200     reviews kept in the rolling store
+    "checker_profile_slow_ms": 2000    p95 wall time that marks a checker slow
+Review options 'checker_profile' / 'checker_profile_memory' override them.
+"""
+
+import json
+import random
+import threading
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from sqlite_pool import get_pool
+
+__version__ = "1.0.0"
+
+DEFAULT_PROFILE_PATH = Path(__file__).parent / 'data' / 'checker_profile.db'
+DEFAULT_MEMORY_RATE = 0.0
+DEFAULT_HISTORY = 200
+DEFAULT_SLOW_MS = 2000
+_CONFIG_FILE = Path(__file__).parent / 'config.json'
+
+KIND_CHECKER = 'checker'
+KIND_NLP = 'nlp'
+
+try:
+    from config_logging import get_logger
+    _logger = get_logger('checker_profile')
+except ImportError:
+    _logger = None
+
+
+def _log(message: str, level: str = 'debug', **kwargs):
+    """Internal logging helper."""
+    if _logger:
+        getattr(_logger, level)(message, **kwargs)
+    elif level in ('warning', 'error', 'critical'):
+        print(f"[{level.upper()}] {message}")
+
+
+def get_profile_settings(options: Optional[Dict] = None) -> Dict[str, Any]:
+    """Resolve profiling settings from review options, then config.json."""
+    settings = {
+        'enabled': True,
+        'memory_rate': DEFAULT_MEMORY_RATE,
+        'history': DEFAULT_HISTORY,
+        'slow_ms': DEFAULT_SLOW_MS,
+    }
+    try:
+        if _CONFIG_FILE.exists():
+            with open(_CONFIG_FILE, 'r', encoding='utf-8') as f:
+                perf = json.load(f).get('performance_settings', {}) or {}
+            if 'checker_profile' in perf:
+                settings['enabled'] = bool(perf['checker_profile'])
+            if 'checker_profile_memory_rate' in perf:
+                settings['memory_rate'] = float(perf['checker_profile_memory_rate'])
+            if perf.get('checker_profile_history'):
+                settings['history'] = int(perf['checker_profile_history'])
+            if perf.get('checker_profile_slow_ms'):
+                settings['slow_ms'] = float(perf['checker_profile_slow_ms'])
+    except Exception as e:
+        _log(f" Could not read performance settings: {e}")
+
+    options = options or {}
+    if 'checker_profile' in options:
+        settings['enabled'] = bool(options['checker_profile'])
+    if 'checker_profile_memory' in options:
+        settings['memory_rate'] = 1.0 if options['checker_profile_memory'] else 0.0
+    return settings
+
+
+# =============================================================================
+# MEASUREMENT
+# =============================================================================
+
+class Meter:
+    """
+    Measures one checker run: wall_ms, cpu_ms (this thread) and, when
+    trace_memory is set and tracemalloc is tracing, peak_kb above the
+    allocation level at entry.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.trace_memory = trace_memory
+        self.wall_ms = 0.0
+        self.cpu_ms = 0.0
+        self.peak_kb: Optional[float] = None
+
+    def __enter__(self) -> 'Meter':
+        self._tracing = self.trace_memory and tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.reset_peak()
+            self._base = tracemalloc.get_traced_memory()[0]
+        self._cpu = time.thread_time()
+        self._wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.wall_ms = (time.perf_counter() - self._wall) * 1000
+        self.cpu_ms = (time.thread_time() - self._cpu) * 1000
+        if self._tracing:
+            self.peak_kb = max(0, tracemalloc.get_traced_memory()[1] - self._base) / 1024
+        return False
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {'wall_ms': self.wall_ms, 'cpu_ms': self.cpu_ms, 'peak_kb': self.peak_kb}
+
+
+# Reviews between start() and stop(), and the one that owns tracemalloc
+_reviews_lock = threading.Lock()
+_active_reviews = 0
+_trace_owner: Optional['ReviewProfile'] = None
+_current = threading.local()
+
+
+class ReviewProfile:
+    """
+    Telemetry for one review, accumulated per checker.
+
+    A checker run several times in one review (incremental review runs it
+    per paragraph group) is summed; peak_kb keeps the largest run.
+    """
+
+    def __init__(self, trace_memory: bool = False):
+        self.review_id = uuid.uuid4().hex
+        self.trace_memory = trace_memory
+        self.memory_shared = False  # another review ran while this one traced
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self._active = False
+
+    @property
+    def memory_traced(self) -> bool:
+        """True when this review's peak_kb readings are its own."""
+        return self.trace_memory and not self.memory_shared
+
+    def start(self):
+        """
+        Register the review as running (and current for this thread); begin
+        memory tracing if it is sampled and no other review is running.
+        """
+        global _active_reviews, _trace_owner
+        with _reviews_lock:
+            if self._active:
+                return
+            self._active = True
+            _active_reviews += 1
+            if _trace_owner is not None:
+                _trace_owner.memory_shared = True
+            if self.trace_memory:
+                if _active_reviews == 1 and not tracemalloc.is_tracing():
+                    tracemalloc.start()
+                    _trace_owner = self
+                else:
+                    self.trace_memory = False
+        _current.profile = self
+
+    def stop(self):
+        """End the review; stops tracing if this review owns it. Idempotent."""
+        global _active_reviews, _trace_owner
+        with _reviews_lock:
+            if not self._active:
+                return
+            self._active = False
+            _active_reviews -= 1
+            if _trace_owner is self:
+                tracemalloc.stop()
+                _trace_owner = None
+        if getattr(_current, 'profile', None) is self:
+            _current.profile = None
+
+    def record(self, name: str, wall_ms: float, cpu_ms: float, peak_kb: Optional[float] = None,
+               issues: int = 0, errors: int = 0, kind: str = KIND_CHECKER, mode: str = 'local'):
+        entry = self.stats.get(name)
+        if entry is None:
+            entry = self.stats[name] = {
+                'checker': name, 'kind': kind, 'mode': mode, 'runs': 0,
+                'wall_ms': 0.0, 'cpu_ms': 0.0, 'peak_kb': None, 'issues': 0, 'errors': 0,
+            }
+        entry['runs'] += 1
+        entry['wall_ms'] += wall_ms
+        entry['cpu_ms'] += cpu_ms
+        if peak_kb is not None:
+            entry['peak_kb'] = max(entry['peak_kb'] or 0.0, peak_kb)
+        entry['issues'] += issues
+        entry['errors'] += errors
+        if mode != entry['mode']:
+            entry['mode'] = 'mixed'
+
+    @contextmanager
+    def measure(self, name: str, checker: Any = None, kind: str = KIND_CHECKER):
+        """
+        Time the block and record it under `name`. The block sets
+        `outcome['issues']` (and `outcome['errors']` for failures it handles
+        itself); errors the checker logged to get_errors() and exceptions
+        escaping the block are counted too.
+        """
+        errors_before = len(getattr(checker, '_errors', None) or [])
+        outcome = {'issues': 0, 'errors': 0}
+        meter = Meter(self.trace_memory)
+        raised = 0
+        try:
+            with meter:
+                yield outcome
+        except BaseException:
+            raised = 1
+            raise
+        finally:
+            logged = len(getattr(checker, '_errors', None) or []) - errors_before
+            self.record(name, meter.wall_ms, meter.cpu_ms, meter.peak_kb,
+                        issues=outcome['issues'],
+                        errors=outcome['errors'] + max(0, logged) + raised,
+                        kind=kind)
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Per-checker stats; peak_kb is None unless memory_traced."""
+        if self.memory_traced:
+            return [dict(e) for e in self.stats.values()]
+        return [dict(e, peak_kb=None) for e in self.stats.values()]
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-checker rows, slowest first, rounded for display."""
+        rows = []
+        for row in sorted(self.entries(), key=lambda e: e['wall_ms'], reverse=True):
+            row['wall_ms'] = round(row['wall_ms'], 2)
+            row['cpu_ms'] = round(row['cpu_ms'], 2)
+            if row['peak_kb'] is not None:
+                row['peak_kb'] = round(row['peak_kb'], 1)
+            rows.append(row)
+        return rows
+
+    def totals(self) -> Dict[str, Any]:
+        return {
+            'checkers': len(self.stats),
+            'wall_ms': round(sum(e['wall_ms'] for e in self.stats.values()), 2),
+            'cpu_ms': round(sum(e['cpu_ms'] for e in self.stats.values()), 2),
+            'issues': sum(e['issues'] for e in self.stats.values()),
+            'errors': sum(e['errors'] for e in self.stats.values()),
+            'memory_traced': self.memory_traced,
+        }
+
+
+def start_review_profile(options: Optional[Dict] = None) -> Optional[ReviewProfile]:
+    """ReviewProfile for a new review, or None when profiling is disabled."""
+    settings = get_profile_settings(options)
+    if not settings['enabled']:
+        return None
+    profile = ReviewProfile(trace_memory=random.random() < settings['memory_rate'])
+    profile.start()
+    return profile
+
+
+def stop_current_profile():
+    """Stop this thread's running ReviewProfile, if any (review_document's finally)."""
+    profile = getattr(_current, 'profile', None)
+    if profile is not None:
+        profile.stop()
+
+
+# =============================================================================
+# ROLLING STORE
+# =============================================================================
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))]
+
+
+class CheckerProfileStore:
+    """SQLite store of per-review checker telemetry, keeping the last `history` reviews."""
+
+    def __init__(self, db_path=DEFAULT_PROFILE_PATH, history: int = DEFAULT_HISTORY):
+        self.db_path = str(db_path)
+        self.history = max(1, int(history))
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    def _transaction(self):
+        return get_pool(self.db_path).transaction()
+
+    def _init_schema(self):
+        with self._transaction() as (conn, cursor):
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS checker_profile_reviews (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    review_id TEXT UNIQUE NOT NULL,
+                    recorded_at REAL NOT NULL,
+                    paragraphs INTEGER,
+                    word_count INTEGER,
+                    memory_traced INTEGER NOT NULL
+                )
+            ''')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS checker_profile_runs (
+                    review_id TEXT NOT NULL,
+                    checker TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    mode TEXT,
+                    runs INTEGER NOT NULL,
+                    wall_ms REAL NOT NULL,
+                    cpu_ms REAL NOT NULL,
+                    peak_kb REAL,
+                    issues INTEGER NOT NULL,
+                    errors INTEGER NOT NULL,
+                    PRIMARY KEY (review_id, checker)
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_checker_profile_runs_checker '
+                           'ON checker_profile_runs(checker)')
+
+    def record(self, profile: ReviewProfile, paragraphs: int = 0, word_count: int = 0):
+        """Store one review's telemetry and drop reviews beyond the history window."""
+        with self._transaction() as (conn, cursor):
+            cursor.execute('INSERT OR REPLACE INTO checker_profile_reviews '
+                           '(review_id, recorded_at, paragraphs, word_count, memory_traced) '
+                           'VALUES (?, ?, ?, ?, ?)',
+                           (profile.review_id, time.time(), paragraphs, word_count,
+                            int(profile.memory_traced)))
+            cursor.executemany(
+                'INSERT OR REPLACE INTO checker_profile_runs '
+                '(review_id, checker, kind, mode, runs, wall_ms, cpu_ms, peak_kb, issues, errors) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                [(profile.review_id, e['checker'], e['kind'], e['mode'], e['runs'], e['wall_ms'],
+                  e['cpu_ms'], e['peak_kb'], e['issues'], e['errors'])
+                 for e in profile.entries()])
+            cursor.execute('SELECT id FROM checker_profile_reviews ORDER BY id DESC LIMIT 1 OFFSET ?',
+                           (self.history - 1,))
+            row = cursor.fetchone()
+            if row:
+                cursor.execute('DELETE FROM checker_profile_runs WHERE review_id IN '
+                               '(SELECT review_id FROM checker_profile_reviews WHERE id < ?)', (row[0],))
+                cursor.execute('DELETE FROM checker_profile_reviews WHERE id < ?', (row[0],))
+
+    def aggregate(self, slow_ms: float = DEFAULT_SLOW_MS, kind: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Per-checker rollup over the stored reviews, slowest (total wall time) first.
+
+        issues_per_second is the checker's issue yield for the time it costs;
+        slow marks checkers whose p95 wall time per review exceeds `slow_ms`.
+        """
+        with self._transaction() as (conn, cursor):
+            cursor.execute('SELECT COUNT(*), COALESCE(SUM(memory_traced), 0), '
+                           'MIN(recorded_at), MAX(recorded_at) FROM checker_profile_reviews')
+            reviews, traced, oldest, newest = cursor.fetchone()
+            query = ('SELECT checker, kind, mode, runs, wall_ms, cpu_ms, peak_kb, issues, errors '
+                     'FROM checker_profile_runs')
+            params = ()
+            if kind:
+                query += ' WHERE kind = ?'
+                params = (kind,)
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+
+        per_checker: Dict[str, Dict[str, Any]] = {}
+        for name, row_kind, mode, runs, wall, cpu, peak, issues, errors in rows:
+            entry = per_checker.setdefault(name, {
+                'checker': name, 'kind': row_kind, 'modes': set(), 'walls': [], 'cpu_ms': 0.0,
+                'peaks': [], 'runs': 0, 'issues': 0, 'errors': 0,
+            })
+            entry['modes'].add(mode or 'local')
+            entry['walls'].append(wall)
+            entry['cpu_ms'] += cpu
+            if peak is not None:
+                entry['peaks'].append(peak)
+            entry['runs'] += runs
+            entry['issues'] += issues
+            entry['errors'] += errors
+
+        total_wall = sum(sum(e['walls']) for e in per_checker.values()) or 1.0
+        checkers = []
+        for entry in per_checker.values():
+            walls = entry['walls']
+            wall_total = sum(walls)
+            p95 = _percentile(walls, 0.95)
+            checkers.append({
+                'checker': entry['checker'],
+                'kind': entry['kind'],
+                'modes': sorted(entry['modes']),
+                'reviews': len(walls),
+                'runs': entry['runs'],
+                'wall_ms_total': round(wall_total, 2),
+                'wall_ms_avg': round(wall_total / len(walls), 2),
+                'wall_ms_p95': round(p95, 2),
+                'wall_ms_max': round(max(walls), 2),
+                'cpu_ms_avg': round(entry['cpu_ms'] / len(walls), 2),
+                'peak_kb_avg': round(sum(entry['peaks']) / len(entry['peaks']), 1) if entry['peaks'] else None,
+                'peak_kb_max': round(max(entry['peaks']), 1) if entry['peaks'] else None,
+                'issues_total': entry['issues'],
+                'issues_per_review': round(entry['issues'] / len(walls), 2),
+                'issues_per_second': round(entry['issues'] / (wall_total / 1000), 2) if wall_total else None,
+                'errors_total': entry['errors'],
+                'error_rate': round(entry['errors'] / entry['runs'], 4) if entry['runs'] else 0.0,
+                'time_share': round(wall_total / total_wall, 4),
+                'slow': p95 > slow_ms,
+            })
+        checkers.sort(key=lambda c: c['wall_ms_total'], reverse=True)
+        return {
+            'reviews': reviews,
+            'memory_traced_reviews': traced,
+            'oldest': oldest,
+            'newest': newest,
+            'history': self.history,
+            'slow_ms': slow_ms,
+            'checkers': checkers,
+        }
+
+    def clear(self):
+        with self._transaction() as (conn, cursor):
+            cursor.execute('DELETE FROM checker_profile_runs')
+            cursor.execute('DELETE FROM checker_profile_reviews')
+
+
+_stores: Dict[str, CheckerProfileStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_profile_store(db_path=DEFAULT_PROFILE_PATH) -> CheckerProfileStore:
+    """Process-wide store for `db_path`, sized from performance_settings."""
+    key = str(Path(db_path).resolve())
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = CheckerProfileStore(db_path, history=get_profile_settings()['history'])
+        return _stores[key]
+
+
+def get_checker_profile(kind: Optional[str] = None) -> Dict[str, Any]:
+    """Aggregated telemetry for the diagnostics endpoint and export."""
+    settings = get_profile_settings()
+    data = get_profile_store().aggregate(slow_ms=settings['slow_ms'], kind=kind)
+    data['enabled'] = settings['enabled']
+    data['memory_rate'] = settings['memory_rate']
+    return data
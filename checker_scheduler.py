@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+AEGIS Checker Scheduler
+=======================
+Runs the enabled checkers for one review, fanning PARALLEL_SAFE checkers out
+across a process pool while everything else stays in-process and sequential.
+
+v6.3.3: Introduced to replace the strictly sequential checker loop in
+AEGISEngine.review_document for large documents.
+
+Design notes:
+- Only checkers whose class sets PARALLEL_SAFE = True are shipped to workers.
+  Stateful checkers (acronyms metrics, hyperlink validation results, enhanced
+  analyzers with get_metrics(), NLP model holders) always run in the parent
+  so their post-run state stays readable by the engine.
+- common_kwargs and the parallel checker instances are pickled ONCE per review
+  via the pool initializer; each task is just a checker name.
+- Results are merged back in the original enabled_checkers order, so the issue
+  list is identical to the sequential run regardless of completion order.
+- Uses the 'spawn' start method (fork inside a threaded Flask server is what
+  caused the v4.5.x deadlocks). Daemonic processes cannot have children, so
+  the per-review worker process is started non-daemonic through
+  start_review_worker(), which terminates leftover workers at exit instead.
+  Any other daemonic caller falls back to sequential.
+- Any pool failure falls back to running the affected checkers sequentially.
+- With a checker_profile.ReviewProfile attached, every run is timed where it
+  executes (workers measure their own runs and ship the numbers back).
+"""
+
+import os
+import json
+import atexit
+import threading
+import multiprocessing
+import multiprocessing.util  # noqa: F401  (registers its exit handler before ours; atexit is LIFO)
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+__version__ = "1.0.0"
+
+# Documents smaller than this run sequentially: spawning workers and pickling
+# the document costs more than the checkers themselves on small files.
+DEFAULT_MIN_PARAGRAPHS = 400
+
+# Need at least this many parallel-safe checkers for the pool to pay off.
+MIN_PARALLEL_CHECKERS = 4
+
+DEFAULT_MAX_WORKERS = max(1, min(4, (os.cpu_count() or 2) - 1))
+
+_CONFIG_FILE = Path(__file__).parent / 'config.json'
+
+try:
+    from config_logging import get_logger
+    _logger = get_logger('checker_scheduler')
+except ImportError:
+    _logger = None
+
+
+def _log(message: str, level: str = 'debug', **kwargs):
+    """Internal logging helper."""
+    if _logger:
+        getattr(_logger, level)(message, **kwargs)
+    elif level in ('warning', 'error', 'critical'):
+        print(f"[{level.upper()}] {message}")
+
+
+# =============================================================================
+# WORKER-SIDE STATE (populated once per worker by the pool initializer)
+# =============================================================================
+
+_worker_kwargs: Optional[Dict[str, Any]] = None
+_worker_checkers: Dict[str, Any] = {}
+_worker_trace_memory = False
+
+
+def _worker_init(common_kwargs: Dict[str, Any], checkers: Dict[str, Any], trace_memory: bool = False):
+    """Pool initializer: receive the shared document kwargs and checkers once."""
+    global _worker_kwargs, _worker_checkers, _worker_trace_memory
+    _worker_kwargs = common_kwargs
+    _worker_checkers = checkers
+    _worker_trace_memory = trace_memory
+    if trace_memory:
+        import tracemalloc
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+
+def _worker_run(checker_name: str) -> Tuple[str, List[Any], List[str], Dict[str, Any]]:
+    """Run one checker inside a worker process.
+
+    Returns (checker_name, issues, errors, measurement). Errors are shipped
+    back so the parent checker's get_errors() reflects the worker run;
+    measurement is the Meter reading (wall_ms, cpu_ms, peak_kb) for the
+    parent's ReviewProfile.
+    """
+    from checker_profile import Meter
+
+    checker = _worker_checkers[checker_name]
+    if hasattr(checker, 'clear_errors'):
+        checker.clear_errors()
+    with Meter(_worker_trace_memory) as meter:
+        issues = checker.safe_check(**_worker_kwargs)
+    errors = checker.get_errors() if hasattr(checker, 'get_errors') else []
+    return checker_name, issues, errors, meter.as_dict()
+
+
+# =============================================================================
+# CONFIGURATION
+# =============================================================================
+
+def get_scheduler_settings(options: Optional[Dict] = None) -> Dict[str, Any]:
+    """Resolve scheduler settings from review options, then config.json.
+
+    Review options win over config.json so a single request can opt in/out:
+        options['parallel_checkers']  -> bool
+        options['checker_workers']    -> int
+    config.json:
+        "performance_settings": {"parallel_checkers": false,
+                                 "checker_workers": 0,
+                                 "parallel_min_paragraphs": 400}
+    """
+    settings = {
+        'parallel_checkers': False,
+        'checker_workers': DEFAULT_MAX_WORKERS,
+        'parallel_min_paragraphs': DEFAULT_MIN_PARAGRAPHS,
+    }
+    try:
+        if _CONFIG_FILE.exists():
+            with open(_CONFIG_FILE, 'r', encoding='utf-8') as f:
+                perf = json.load(f).get('performance_settings', {}) or {}
+            if 'parallel_checkers' in perf:
+                settings['parallel_checkers'] = bool(perf['parallel_checkers'])
+            if perf.get('checker_workers'):
+                settings['checker_workers'] = int(perf['checker_workers'])
+            if 'parallel_min_paragraphs' in perf:
+                settings['parallel_min_paragraphs'] = int(perf['parallel_min_paragraphs'])
+    except Exception as e:
+        _log(f" Could not read performance settings: {e}")
+
+    options = options or {}
+    if 'parallel_checkers' in options:
+        settings['parallel_checkers'] = bool(options['parallel_checkers'])
+    if options.get('checker_workers'):
+        settings['checker_workers'] = int(options['checker_workers'])
+    return settings
+
+
+def _can_spawn_children() -> bool:
+    """Daemonic processes are not allowed to create child processes."""
+    try:
+        return not multiprocessing.current_process().daemon
+    except Exception:
+        return False
+
+
+# =============================================================================
+# REVIEW WORKER PROCESSES
+# =============================================================================
+# The single-document review runs in its own process. A daemonic worker could
+# never start the checker pool, so workers are non-daemonic and tracked here;
+# whatever is still running at interpreter exit is terminated rather than
+# joined, so a long review cannot hold up server shutdown.
+
+_review_workers: set = set()
+_review_workers_lock = threading.Lock()
+
+
+def start_review_worker(target: Callable, args: Tuple = (),
+                        name: Optional[str] = None) -> multiprocessing.Process:
+    """Start a non-daemonic review worker process that may run its own checker pool."""
+    process = multiprocessing.Process(target=target, args=args, name=name, daemon=False)
+    process.start()
+    with _review_workers_lock:
+        _review_workers.difference_update([p for p in _review_workers if not p.is_alive()])
+        _review_workers.add(process)
+    return process
+
+
+def terminate_review_workers(timeout: float = 5.0):
+    """Terminate review workers that are still running (registered with atexit)."""
+    with _review_workers_lock:
+        workers = list(_review_workers)
+        _review_workers.clear()
+    for process in workers:
+        if process.is_alive():
+            process.terminate()
+    for process in workers:
+        process.join(timeout)
+        if process.is_alive():
+            process.kill()
+            process.join(1)
+
+
+atexit.register(terminate_review_workers)
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+class CheckerScheduler:
+    """
+    Runs a list of named checkers and returns their issues in a deterministic order.
+
+    Usage:
+        scheduler = CheckerScheduler(engine.checkers, max_workers=4)
+        for name, issues in scheduler.run(enabled, common_kwargs, on_complete=...):
+            ...
+
+    Pass profiler (a checker_profile.ReviewProfile) to record per-checker
+    wall/CPU time, peak memory, issue and error counts.
+    """
+
+    def __init__(self, checkers: Dict[str, Any], max_workers: int = DEFAULT_MAX_WORKERS,
+                 parallel: bool = True, min_paragraphs: int = DEFAULT_MIN_PARAGRAPHS,
+                 profiler: Optional[Any] = None):
+        self.checkers = checkers
+        self.max_workers = max(1, int(max_workers or 1))
+        self.parallel = parallel
+        self.min_paragraphs = min_paragraphs
+        self.profiler = profiler
+        self.last_mode = 'sequential'
+
+    @staticmethod
+    def is_parallel_safe(checker: Any) -> bool:
+        """Capability flag declared on the checker class (BaseChecker.PARALLEL_SAFE)."""
+        return bool(getattr(checker, 'PARALLEL_SAFE', False))
+
+    def partition(self, enabled: List[str]) -> Tuple[List[str], List[str]]:
+        """Split enabled checker names into (parallel, serial), preserving order."""
+        parallel, serial = [], []
+        for name in enabled:
+            checker = self.checkers.get(name)
+            if checker is not None and self.is_parallel_safe(checker):
+                parallel.append(name)
+            else:
+                serial.append(name)
+        return parallel, serial
+
+    def _should_use_pool(self, parallel_names: List[str], common_kwargs: Dict) -> bool:
+        if not self.parallel or self.max_workers < 2:
+            return False
+        if len(parallel_names) < MIN_PARALLEL_CHECKERS:
+            return False
+        if len(common_kwargs.get('paragraphs') or []) < self.min_paragraphs:
+            return False
+        if not _can_spawn_children():
+            _log(" Checker scheduler: daemonic process, running sequentially")
+            return False
+        return True
+
+    def _run_one(self, name: str, common_kwargs: Dict) -> List[Any]:
+        checker = self.checkers.get(name)
+        if not checker:
+            return []
+        if self.profiler is None:
+            return checker.safe_check(**common_kwargs)
+        with self.profiler.measure(name, checker) as outcome:
+            issues = checker.safe_check(**common_kwargs)
+            outcome['issues'] = len(issues or [])
+        return issues
+
+    def run(self, enabled: List[str], common_kwargs: Dict,
+            on_complete: Optional[Callable[[str, int, int], None]] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None) -> Optional[List[Tuple[str, List[Any]]]]:
+        """
+        Run enabled checkers.
+
+        Args:
+            enabled: Checker names in the order issues must be reported
+            common_kwargs: Keyword arguments passed to every checker.safe_check()
+            on_complete: Optional callback(checker_name, completed, total)
+            is_cancelled: Optional callback returning True to abort
+
+        Returns:
+            List of (checker_name, issues) in `enabled` order, or None if cancelled.
+        """
+        total = len(enabled)
+        results: Dict[str, List[Any]] = {}
+        completed = 0
+
+        def _done(name: str):
+            nonlocal completed
+            completed += 1
+            if on_complete:
+                try:
+                    on_complete(name, completed, total)
+                except Exception as e:
+                    _log(f" Scheduler progress callback error: {e}")
+
+        def _cancelled() -> bool:
+            if is_cancelled:
+                try:
+                    return bool(is_cancelled())
+                except Exception:
+                    return False
+            return False
+
+        parallel_names, serial_names = self.partition(enabled)
+        use_pool = self._should_use_pool(parallel_names, common_kwargs)
+        self.last_mode = 'parallel' if use_pool else 'sequential'
+
+        pool = None
+        pending = {}
+        if use_pool:
+            try:
+                ctx = multiprocessing.get_context('spawn')
+                pool = ProcessPoolExecutor(
+                    max_workers=min(self.max_workers, len(parallel_names)),
+                    mp_context=ctx,
+                    initializer=_worker_init,
+                    initargs=(common_kwargs, {n: self.checkers[n] for n in parallel_names},
+                              bool(self.profiler and self.profiler.trace_memory)),
+                )
+                pending = {pool.submit(_worker_run, name): name for name in parallel_names}
+                _log(f" Checker scheduler: {len(parallel_names)} parallel, "
+                     f"{len(serial_names)} serial, {self.max_workers} workers")
+            except Exception as e:
+                _log(f" Checker scheduler: pool unavailable ({e}), running sequentially", level='warning')
+                if pool:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                pool = None
+                pending = {}
+                self.last_mode = 'sequential'
+
+        local_names = serial_names if pool else list(enabled)
+
+        try:
+            # Serial checkers run in the parent while the pool works
+            for name in local_names:
+                if _cancelled():
+                    return None
+                try:
+                    results[name] = self._run_one(name, common_kwargs)
+                except Exception as e:
+                    _log(f" Error in {name}: {e}")
+                    results[name] = []
+                _done(name)
+
+            # Collect pool results as they finish
+            while pending:
+                if _cancelled():
+                    return None
+                done, _ = wait(list(pending), timeout=1.0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = pending.pop(future)
+                    try:
+                        _, issues, errors, measured = future.result()
+                        results[name] = issues
+                        checker = self.checkers.get(name)
+                        if errors and checker is not None and hasattr(checker, '_errors'):
+                            checker._errors.extend(errors)
+                        if self.profiler is not None:
+                            self.profiler.record(name, issues=len(issues or []), errors=len(errors or []),
+                                                 mode='pool', **measured)
+                    except Exception as e:
+                        # Worker died or result failed to unpickle: rerun locally
+                        _log(f" Parallel run of {name} failed ({e}), retrying in-process")
+                        try:
+                            results[name] = self._run_one(name, common_kwargs)
+                        except Exception as inner:
+                            _log(f" Error in {name}: {inner}")
+                            results[name] = []
+                    _done(name)
+        finally:
+            if pool:
+                pool.shutdown(wait=not pending, cancel_futures=True)
+
+        return [(name, results.get(name, [])) for name in enabled]
@@ -22,6 +22,8 @@ import re
 from typing import Dict, List, Any, Tuple, Optional
 from collections import defaultdict
 
+from regex_registry import word_pattern
+
 # Import base checker
 try:
     from base_checker import BaseChecker
@@ -52,6 +54,7 @@ class FutureTenseChecker(BaseChecker):
 
     CHECKER_NAME = "Future Tense Detector"
     CHECKER_VERSION = "3.4.0"
+    PARALLEL_SAFE = True
 
     # Future tense patterns
     FUTURE_PATTERNS = [
@@ -134,6 +137,7 @@ class LatinAbbreviationChecker(BaseChecker):
 
     CHECKER_NAME = "Latin Abbreviation Warnings"
     CHECKER_VERSION = "3.4.0"
+    PARALLEL_SAFE = True
 
     # Latin abbreviations with replacements and severity
     # Format: 'abbrev': ('replacement', 'severity')
@@ -181,9 +185,9 @@ class LatinAbbreviationChecker(BaseChecker):
                 # Build pattern (case-insensitive for most)
                 if abbrev in ['i.e.', 'e.g.', 'n.b.']:
                     # These are often lowercase
-                    pattern = re.compile(r'\b' + re.escape(abbrev), re.IGNORECASE)
+                    pattern = word_pattern(abbrev, trailing_boundary=False)
                 else:
-                    pattern = re.compile(r'\b' + re.escape(abbrev) + r'\b', re.IGNORECASE)
+                    pattern = word_pattern(abbrev)
 
                 for match in pattern.finditer(text):
                     found_abbrevs.add(abbrev.lower())
@@ -222,6 +226,7 @@ class SentenceInitialConjunctionChecker(BaseChecker):
 
     CHECKER_NAME = "Sentence-Initial Conjunction"
     CHECKER_VERSION = "3.4.0"
+    PARALLEL_SAFE = True
 
     # Conjunctions and their alternatives
     CONJUNCTIONS = {
@@ -288,6 +293,7 @@ class DirectionalLanguageChecker(BaseChecker):
 
     CHECKER_NAME = "Directional Language"
     CHECKER_VERSION = "3.4.0"
+    PARALLEL_SAFE = True
 
     # Directional patterns and their types
     DIRECTIONAL_PATTERNS = [
@@ -363,6 +369,7 @@ class TimeSensitiveLanguageChecker(BaseChecker):
 
     CHECKER_NAME = "Time-Sensitive Language"
     CHECKER_VERSION = "3.4.0"
+    PARALLEL_SAFE = True
 
     # Time-sensitive words/phrases and suggested alternatives
     TIME_SENSITIVE = {
@@ -428,8 +435,7 @@ class TimeSensitiveLanguageChecker(BaseChecker):
 
                 if phrase in text_lower:
                     # Find actual match with original case
-                    pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
-                    match = pattern.search(text)
+                    match = word_pattern(phrase).search(text)
 
                     if match:
                         found_phrases.add(phrase)
@@ -31,7 +31,6 @@ import ssl
 import socket
 import time
 import random
-import zipfile
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Set, NamedTuple, Any
 from xml.etree import ElementTree as ET
@@ -41,6 +40,8 @@ from enum import Enum
 from datetime import datetime
 import string
 
+from docx_package import open_package
+
 # Optional imports for connected mode
 try:
     import requests
@@ -780,6 +781,13 @@ class ComprehensiveHyperlinkChecker(BaseChecker):
         # Validation results cache for reporting
         self._validation_results: List[ValidationResult] = []
     
+    def reset_review_state(self):
+        """v6.3.3: Fresh per-review state for forked instances (see BaseChecker.fork)."""
+        self._errors = []
+        self._structure = DocumentStructure()
+        self._structure_built = False
+        self._validation_results = []
+
     def set_validation_mode(self, mode: ValidationMode):
         """F19a: Set the validation mode."""
         self.validation_mode = mode
@@ -833,7 +841,9 @@ class ComprehensiveHyperlinkChecker(BaseChecker):
         # Extract hyperlinks from DOCX
         docx_hyperlinks = []
         if filepath and os.path.exists(filepath):
-            docx_hyperlinks = self._extract_docx_hyperlinks(filepath, paragraphs)
+            docx_hyperlinks = self._extract_docx_hyperlinks(
+                filepath, paragraphs, kwargs.get('docx_package')
+            )
         
         # Validate each hyperlink
         for link_info in docx_hyperlinks:
@@ -920,7 +930,8 @@ class ComprehensiveHyperlinkChecker(BaseChecker):
     def _extract_docx_hyperlinks(
         self,
         filepath: str,
-        paragraphs: List[Tuple[int, str]]
+        paragraphs: List[Tuple[int, str]],
+        package=None
     ) -> List[HyperlinkInfo]:
         """
         Extract all hyperlinks from a DOCX file with context.
@@ -932,91 +943,82 @@ class ComprehensiveHyperlinkChecker(BaseChecker):
         hyperlinks = []
         
         try:
-            with zipfile.ZipFile(filepath, 'r') as zf:
-                rels = {}
-                rels_file = 'word/_rels/document.xml.rels'
-                if rels_file in zf.namelist():
-                    with zf.open(rels_file) as f:
-                        rels_tree = ET.parse(f)
-                        for rel in rels_tree.findall('.//{%s}Relationship' % NAMESPACES['rel']):
-                            rel_id = rel.get('Id', '')
-                            target = rel.get('Target', '')
-                            rel_type = rel.get('Type', '')
-                            if 'hyperlink' in rel_type.lower():
-                                rels[rel_id] = target
+            # v6.3.3: Relationships and document tree come from the review's DocxPackage
+            with open_package(filepath, package) as pkg:
+                if pkg is None:
+                    return hyperlinks
+                rels = pkg.hyperlink_targets()
                 
-                if 'word/document.xml' in zf.namelist():
-                    with zf.open('word/document.xml') as f:
-                        doc_tree = ET.parse(f)
+                doc_tree = pkg.document_tree
+                if doc_tree is not None:
+                    # Extract bookmarks
+                    for bookmark in doc_tree.iter('{%s}bookmarkStart' % NAMESPACES['w']):
+                        name = bookmark.get('{%s}name' % NAMESPACES['w'], '')
+                        if name and not name.startswith('_'):
+                            self._structure.bookmarks.add(name)
+                    
+                    para_idx = 0
+                    for para in doc_tree.iter('{%s}p' % NAMESPACES['w']):
+                        para_text_parts = []
+                        for t in para.iter('{%s}t' % NAMESPACES['w']):
+                            if t.text:
+                                para_text_parts.append(t.text)
+                        para_text = ''.join(para_text_parts)
                         
-                        # Extract bookmarks
-                        for bookmark in doc_tree.iter('{%s}bookmarkStart' % NAMESPACES['w']):
-                            name = bookmark.get('{%s}name' % NAMESPACES['w'], '')
-                            if name and not name.startswith('_'):
-                                self._structure.bookmarks.add(name)
+                        # Method 1: Standard <w:hyperlink> elements
+                        for hyperlink in para.iter('{%s}hyperlink' % NAMESPACES['w']):
+                            link_info = self._parse_hyperlink_element(
+                                hyperlink, rels, para_idx, para_text
+                            )
+                            if link_info:
+                                hyperlinks.append(link_info)
                         
-                        para_idx = 0
-                        for para in doc_tree.iter('{%s}p' % NAMESPACES['w']):
-                            para_text_parts = []
-                            for t in para.iter('{%s}t' % NAMESPACES['w']):
-                                if t.text:
-                                    para_text_parts.append(t.text)
-                            para_text = ''.join(para_text_parts)
-                            
-                            # Method 1: Standard <w:hyperlink> elements
-                            for hyperlink in para.iter('{%s}hyperlink' % NAMESPACES['w']):
-                                link_info = self._parse_hyperlink_element(
-                                    hyperlink, rels, para_idx, para_text
-                                )
-                                if link_info:
-                                    hyperlinks.append(link_info)
-                            
-                            # Method 2: <w:fldSimple> HYPERLINK field codes
-                            # These are common in older Word docs and pasted content
-                            for fld_simple in para.iter('{%s}fldSimple' % NAMESPACES['w']):
-                                instr = fld_simple.get('{%s}instr' % NAMESPACES['w'], '')
-                                link_info = self._parse_field_code_hyperlink(
-                                    instr, fld_simple, para_idx, para_text
-                                )
-                                if link_info:
-                                    hyperlinks.append(link_info)
+                        # Method 2: <w:fldSimple> HYPERLINK field codes
+                        # These are common in older Word docs and pasted content
+                        for fld_simple in para.iter('{%s}fldSimple' % NAMESPACES['w']):
+                            instr = fld_simple.get('{%s}instr' % NAMESPACES['w'], '')
+                            link_info = self._parse_field_code_hyperlink(
+                                instr, fld_simple, para_idx, para_text
+                            )
+                            if link_info:
+                                hyperlinks.append(link_info)
+                        
+                        # Method 3: Complex field codes using <w:instrText>
+                        # Format: <w:fldChar type="begin"/> ... <w:instrText> HYPERLINK "url" </w:instrText> ... <w:fldChar type="end"/>
+                        instr_texts = []
+                        in_field = False
+                        field_display_parts = []
+                        
+                        for elem in para.iter():
+                            tag_name = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
                             
-                            # Method 3: Complex field codes using <w:instrText>
-                            # Format: <w:fldChar type="begin"/> ... <w:instrText> HYPERLINK "url" </w:instrText> ... <w:fldChar type="end"/>
-                            instr_texts = []
-                            in_field = False
-                            field_display_parts = []
+                            if tag_name == 'fldChar':
+                                fld_type = elem.get('{%s}fldCharType' % NAMESPACES['w'], '')
+                                if fld_type == 'begin':
+                                    in_field = True
+                                    instr_texts = []
+                                    field_display_parts = []
+                                elif fld_type == 'end' and in_field:
+                                    in_field = False
+                                    full_instr = ''.join(instr_texts)
+                                    if 'HYPERLINK' in full_instr.upper():
+                                        display_text = ''.join(field_display_parts)
+                                        link_info = self._parse_field_code_hyperlink(
+                                            full_instr, None, para_idx, para_text, display_text
+                                        )
+                                        if link_info:
+                                            hyperlinks.append(link_info)
                             
-                            for elem in para.iter():
-                                tag_name = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-                                
-                                if tag_name == 'fldChar':
-                                    fld_type = elem.get('{%s}fldCharType' % NAMESPACES['w'], '')
-                                    if fld_type == 'begin':
-                                        in_field = True
-                                        instr_texts = []
-                                        field_display_parts = []
-                                    elif fld_type == 'end' and in_field:
-                                        in_field = False
-                                        full_instr = ''.join(instr_texts)
-                                        if 'HYPERLINK' in full_instr.upper():
-                                            display_text = ''.join(field_display_parts)
-                                            link_info = self._parse_field_code_hyperlink(
-                                                full_instr, None, para_idx, para_text, display_text
-                                            )
-                                            if link_info:
-                                                hyperlinks.append(link_info)
-                                
-                                elif tag_name == 'instrText' and in_field:
-                                    if elem.text:
-                                        instr_texts.append(elem.text)
-                                
-                                elif tag_name == 't' and in_field:
-                                    if elem.text:
-                                        field_display_parts.append(elem.text)
+                            elif tag_name == 'instrText' and in_field:
+                                if elem.text:
+                                    instr_texts.append(elem.text)
                             
-                            if para_text.strip():
-                                para_idx += 1
+                            elif tag_name == 't' and in_field:
+                                if elem.text:
+                                    field_display_parts.append(elem.text)
+                        
+                        if para_text.strip():
+                            para_idx += 1
         
         except Exception as e:
             self._errors.append(f"Error extracting hyperlinks from DOCX: {e}")
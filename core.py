@@ -11,11 +11,15 @@ Version is read from version.json via config_logging module.
 
 import os
 import re
-import zipfile
 from typing import List, Dict, Tuple, Optional, Callable
 from pathlib import Path
 from dataclasses import dataclass
 # v4.5.2: Removed ThreadPoolExecutor — causes deadlocks with checkers (see v4.5.0 notes)
+# v6.3.3: Opt-in process-pool scheduling of PARALLEL_SAFE checkers lives in checker_scheduler.py
+
+# v6.3.3: One lazily parsed .docx package shared by extraction and checkers
+from docx_package import DocxPackage, is_docx_file, open_package, set_current_package
+from regex_registry import compile_pattern
 
 # v4.3.0: mammoth for clean DOCX → HTML conversion
 MAMMOTH_AVAILABLE = False
@@ -298,6 +302,25 @@ _docling_session_broken = False
 # saving significant overhead in batch scans where each thread creates its own engine.
 _checker_cache = None  # Dict of cached checker instances + NLP attributes, or None
 
+
+def _fork_checker(checker):
+    """v6.3.3: Per-engine copy of a cached checker template.
+
+    Uses BaseChecker.fork() when available; fallback checker classes (defined
+    inline when base_checker can't be imported) get a shallow copy with a
+    fresh error list.
+    """
+    if hasattr(checker, 'fork'):
+        try:
+            return checker.fork()
+        except Exception as e:
+            _log(f" Checker fork failed for {type(checker).__name__}: {e}")
+    import copy
+    clone = copy.copy(checker)
+    if hasattr(clone, '_errors'):
+        clone._errors = []
+    return clone
+
 # v5.9.40: Clean up persistent worker on exit (non-daemon process won't auto-terminate)
 atexit.register(lambda: _docling_pool.shutdown() if _docling_pool else None)
 
@@ -391,6 +414,27 @@ class ReadabilityMetrics:
     gunning_fog_index: float = 0.0
 
 
+# v6.3.3: Document XML and heading patterns, compiled once through the shared
+# regex registry instead of on every extraction
+_XML_PARAGRAPH = compile_pattern(r'<w:p\b[^>]*>(.*?)</w:p>', re.DOTALL, name='docx.paragraph')
+_XML_TEXT = compile_pattern(r'<w:t[^>]*>([^<]*)</w:t>', name='docx.text')
+_XML_STYLE = compile_pattern(r'<w:pStyle\s+w:val="([^"]*)"', name='docx.style')
+_XML_BOLD = compile_pattern(r'<w:b(?:\s|/|>)', name='docx.bold')
+_XML_CENTER = compile_pattern(r'<w:jc\s+w:val="center"', name='docx.center')
+_XML_TABLE = compile_pattern(r'<w:tbl\b[^>]*>(.*?)</w:tbl>', re.DOTALL, name='docx.table')
+_XML_ROW = compile_pattern(r'<w:tr\b[^>]*>(.*?)</w:tr>', re.DOTALL, name='docx.row')
+_XML_CELL = compile_pattern(r'<w:tc\b[^>]*>(.*?)</w:tc>', re.DOTALL, name='docx.cell')
+_XML_COMMENT = compile_pattern(r'<w:comment[^>]*w:author="([^"]*)"[^>]*>(.*?)</w:comment>',
+                               re.DOTALL, name='docx.comment')
+_XML_INSERTION = compile_pattern(r'<w:ins\s[^>]*w:author="([^"]*)"', name='docx.insertion')
+_XML_DELETION = compile_pattern(r'<w:del\s[^>]*w:author="([^"]*)"', name='docx.deletion')
+_STYLE_LEVEL = compile_pattern(r'(\d+)', name='docx.style_level')
+# Numbered sections: "1.0 Introduction", "A.1 Scope"
+_SECTION_HEADING = compile_pattern(r'^([A-Z]?\d+(?:\.\d+)*\.?)\s+[A-Z]', re.IGNORECASE,
+                                   name='heading.section_number')
+_SECTION_NUMBER = compile_pattern(r'^([A-Z]?\d+(?:\.\d+)*)', name='heading.section_prefix')
+
+
 class DocumentExtractor:
     """Extracts content from Word documents using XML parsing."""
     
@@ -403,8 +447,9 @@ class DocumentExtractor:
     MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB limit
     LARGE_FILE_WARNING = 50 * 1024 * 1024  # 50MB warning threshold
     
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, package: Optional[DocxPackage] = None):
         self.filepath = filepath
+        self._package = package  # v6.3.3: shared DocxPackage for this review
         self.paragraphs: List[Tuple[int, str]] = []
         self.tables: List[Dict] = []
         self.figures: List[Dict] = []
@@ -453,13 +498,14 @@ class DocumentExtractor:
         self._check_file_size()
         
         try:
-            with zipfile.ZipFile(self.filepath, 'r') as zf:
-                if 'word/document.xml' in zf.namelist():
-                    doc_xml = zf.read('word/document.xml').decode('utf-8')
+            with open_package(self.filepath, self._package) as pkg:
+                doc_xml = pkg.document_xml
+                if doc_xml is not None:
                     self._parse_document(doc_xml)
                     self._detect_track_changes(doc_xml)
-                if 'word/comments.xml' in zf.namelist():
-                    self._parse_comments(zf.read('word/comments.xml').decode('utf-8'))
+                comments_xml = pkg.comments_xml
+                if comments_xml is not None:
+                    self._parse_comments(comments_xml)
         except Exception as e:
             raise ValueError(f"Failed to extract document: {e}")
     
@@ -471,22 +517,15 @@ class DocumentExtractor:
         figure_count = 0
 
         # Extract text from paragraphs
-        text_pattern = re.compile(r'<w:p\b[^>]*>(.*?)</w:p>', re.DOTALL)
-        text_extract = re.compile(r'<w:t[^>]*>([^<]*)</w:t>')
-        style_pattern = re.compile(r'<w:pStyle\s+w:val="([^"]*)"')
+        text_extract = _XML_TEXT
+        style_pattern = _XML_STYLE
 
         # v3.0.113: Enhanced patterns for heading detection
-        # Pattern for numbered sections: "1.0", "2.1", "3.2.1", "A.1", etc.
-        section_number_pattern = re.compile(
-            r'^([A-Z]?\d+(?:\.\d+)*\.?)\s+[A-Z]',  # "1.0 Introduction" or "A.1 Scope"
-            re.IGNORECASE
-        )
-        # Pattern for bold text detection in XML
-        bold_pattern = re.compile(r'<w:b(?:\s|/|>)')
-        # Pattern for centered alignment
-        center_pattern = re.compile(r'<w:jc\s+w:val="center"')
+        section_number_pattern = _SECTION_HEADING
+        bold_pattern = _XML_BOLD
+        center_pattern = _XML_CENTER
 
-        for para_match in text_pattern.finditer(xml_content):
+        for para_match in _XML_PARAGRAPH.finditer(xml_content):
             para_content = para_match.group(1)
 
             # Extract text
@@ -506,7 +545,7 @@ class DocumentExtractor:
             if 'heading' in style.lower() or 'title' in style.lower():
                 is_heading = True
                 detection_source = 'style'
-                level_match = re.search(r'(\d+)', style)
+                level_match = _STYLE_LEVEL.search(style)
                 if level_match:
                     detected_level = int(level_match.group(1))
                 elif 'title' in style.lower():
@@ -553,7 +592,7 @@ class DocumentExtractor:
             # Add to headings list if detected
             if is_heading and text_stripped:
                 # Also capture section numbers for section tracking
-                section_match = re.match(r'^([A-Z]?\d+(?:\.\d+)*)', text_stripped)
+                section_match = _SECTION_NUMBER.match(text_stripped)
                 if section_match and section_match.group(1) not in self.sections:
                     self.sections[section_match.group(1)] = para_idx
 
@@ -579,9 +618,9 @@ class DocumentExtractor:
                 para_idx += 1
         
         # Extract tables
-        table_pattern = re.compile(r'<w:tbl\b[^>]*>(.*?)</w:tbl>', re.DOTALL)
-        row_pattern = re.compile(r'<w:tr\b[^>]*>(.*?)</w:tr>', re.DOTALL)
-        cell_pattern = re.compile(r'<w:tc\b[^>]*>(.*?)</w:tc>', re.DOTALL)
+        table_pattern = _XML_TABLE
+        row_pattern = _XML_ROW
+        cell_pattern = _XML_CELL
         
         for tbl_match in table_pattern.finditer(xml_content):
             table_count += 1
@@ -631,16 +670,10 @@ class DocumentExtractor:
     
     def _parse_comments(self, xml_content: str):
         """Parse comments from comments.xml."""
-        comment_pattern = re.compile(
-            r'<w:comment[^>]*w:author="([^"]*)"[^>]*>(.*?)</w:comment>',
-            re.DOTALL
-        )
-        text_pattern = re.compile(r'<w:t[^>]*>([^<]*)</w:t>')
-        
-        for match in comment_pattern.finditer(xml_content):
+        for match in _XML_COMMENT.finditer(xml_content):
             author = match.group(1)
             content = match.group(2)
-            texts = text_pattern.findall(content)
+            texts = _XML_TEXT.findall(content)
             text = ' '.join(texts)
             
             self.comments.append({
@@ -650,10 +683,10 @@ class DocumentExtractor:
     
     def _detect_track_changes(self, xml_content: str):
         """Detect track changes in document."""
-        for match in re.finditer(r'<w:ins\s[^>]*w:author="([^"]*)"', xml_content):
+        for match in _XML_INSERTION.finditer(xml_content):
             self.track_changes.append({'type': 'insertion', 'author': match.group(1)})
         
-        for match in re.finditer(r'<w:del\s[^>]*w:author="([^"]*)"', xml_content):
+        for match in _XML_DELETION.finditer(xml_content):
             self.track_changes.append({'type': 'deletion', 'author': match.group(1)})
 
 
@@ -672,11 +705,12 @@ class MammothDocumentExtractor:
     MAX_FILE_SIZE = 100 * 1024 * 1024  # 100MB
     LARGE_FILE_WARNING = 50 * 1024 * 1024  # 50MB
 
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, package: Optional[DocxPackage] = None):
         if not MAMMOTH_AVAILABLE:
             raise ImportError("mammoth library not available")
 
         self.filepath = filepath
+        self._package = package  # v6.3.3: shared DocxPackage for this review
         self.paragraphs: List[Tuple[int, str]] = []
         self.tables: List[Dict] = []
         self.figures: List[Dict] = []
@@ -723,7 +757,7 @@ class MammothDocumentExtractor:
         self._parse_html(self.html_preview, raw_text)
 
         # Also try to extract comments and track changes from the docx XML
-        # (mammoth doesn't expose these, so we use zipfile for just these two)
+        # (mammoth doesn't expose these, so we read the package for just these two)
         self._extract_comments_and_changes()
 
         _log(f"MammothExtractor: {len(self.paragraphs)} paragraphs, "
@@ -747,9 +781,7 @@ class MammothDocumentExtractor:
         figure_count = 0
 
         # Section number pattern for heading detection
-        section_pattern = re.compile(
-            r'^([A-Z]?\d+(?:\.\d+)*\.?)\s+[A-Z]', re.IGNORECASE
-        )
+        section_pattern = _SECTION_HEADING
 
         # lxml.html.fromstring may wrap in <html><body> or return the div directly
         body = tree.find('.//body')
@@ -918,16 +950,12 @@ class MammothDocumentExtractor:
     def _extract_comments_and_changes(self):
         """Extract comments and track changes from docx XML (mammoth doesn't expose these)."""
         try:
-            text_extract = re.compile(r'<w:t[^>]*>([^<]*)</w:t>')
-            with zipfile.ZipFile(self.filepath, 'r') as zf:
+            text_extract = _XML_TEXT
+            with open_package(self.filepath, self._package) as pkg:
                 # Comments
-                if 'word/comments.xml' in zf.namelist():
-                    xml = zf.read('word/comments.xml').decode('utf-8')
-                    comment_pattern = re.compile(
-                        r'<w:comment[^>]*w:author="([^"]*)"[^>]*>(.*?)</w:comment>',
-                        re.DOTALL
-                    )
-                    for match in comment_pattern.finditer(xml):
+                xml = pkg.comments_xml
+                if xml is not None:
+                    for match in _XML_COMMENT.finditer(xml):
                         texts = text_extract.findall(match.group(2))
                         self.comments.append({
                             'author': match.group(1),
@@ -935,11 +963,11 @@ class MammothDocumentExtractor:
                         })
 
                 # Track changes
-                if 'word/document.xml' in zf.namelist():
-                    xml = zf.read('word/document.xml').decode('utf-8')
-                    for match in re.finditer(r'<w:ins\s[^>]*w:author="([^"]*)"', xml):
+                xml = pkg.document_xml
+                if xml is not None:
+                    for match in _XML_INSERTION.finditer(xml):
                         self.track_changes.append({'type': 'insertion', 'author': match.group(1)})
-                    for match in re.finditer(r'<w:del\s[^>]*w:author="([^"]*)"', xml):
+                    for match in _XML_DELETION.finditer(xml):
                         self.track_changes.append({'type': 'deletion', 'author': match.group(1)})
         except Exception as e:
             _log(f"mammoth: Could not extract comments/changes: {e}", level='debug')
@@ -1128,9 +1156,7 @@ class Pymupdf4llmExtractor:
         all_text = []
         table_count = 0
 
-        section_pattern = re.compile(
-            r'^([A-Z]?\d+(?:\.\d+)*\.?)\s+[A-Z]', re.IGNORECASE
-        )
+        section_pattern = _SECTION_HEADING
 
         current_table_rows = []
         in_table = False
@@ -1333,22 +1359,48 @@ class AEGISEngine:
         First engine does full eager load (warms Python import cache + instantiates
         all checkers). Subsequent engines reuse cached instances via shallow copy,
         avoiding redundant import resolution and object construction for 105+ checkers.
+
+        v6.3.3: Cached instances are now templates that never run a review. Every
+        engine (including the first) gets per-review forks via _fork_checker(), so
+        batch threads share compiled patterns/dictionaries but not results, metrics
+        or error lists.
         """
         global _checker_cache
 
-        if _checker_cache is not None:
-            # Fast path: reuse cached checker instances
-            self.checkers = dict(_checker_cache['checkers'])
-            self._nlp_checkers = _checker_cache['nlp_checkers']
-            self._nlp_available = _checker_cache['nlp_available']
-            self._enhanced_analyzers = _checker_cache['enhanced_analyzers']
-            self._v330_checkers = _checker_cache['v330_checkers']
-            self._v330_learner = _checker_cache['v330_learner']
-            self._v330_nlp = _checker_cache['v330_nlp']
-            self._v340_checkers = _checker_cache['v340_checkers']
-            _log(f" Reusing cached checkers: {len(self.checkers)} instances")
-            return
-
+        if _checker_cache is None:
+            self._load_checker_templates()
+            _checker_cache = {
+                'checkers': dict(self.checkers),
+                'nlp_checkers': self._nlp_checkers,
+                'nlp_available': self._nlp_available,
+                'enhanced_analyzers': self._enhanced_analyzers,
+                'v330_checkers': self._v330_checkers,
+                'v330_learner': self._v330_learner,
+                'v330_nlp': self._v330_nlp,
+                'v340_checkers': self._v340_checkers,
+            }
+            _log(f" Cached {len(self.checkers)} checker templates for reuse by batch engines")
+        else:
+            _log(f" Reusing cached checker templates: {len(_checker_cache['checkers'])} instances")
+
+        # Per-engine forks: same key -> same fork across the grouping dicts
+        forks = {name: _fork_checker(c) for name, c in _checker_cache['checkers'].items()}
+
+        def _forked_group(group):
+            return {name: forks[name] if name in forks else _fork_checker(c)
+                    for name, c in group.items()}
+
+        self.checkers = forks
+        self._nlp_checkers = _forked_group(_checker_cache['nlp_checkers'])
+        self._nlp_available = _checker_cache['nlp_available']
+        self._enhanced_analyzers = _forked_group(_checker_cache['enhanced_analyzers'])
+        self._v330_checkers = _forked_group(_checker_cache['v330_checkers'])
+        self._v330_learner = _checker_cache['v330_learner']
+        self._v330_nlp = _checker_cache['v330_nlp']
+        self._v340_checkers = _forked_group(_checker_cache['v340_checkers'])
+
+    def _load_checker_templates(self):
+        """Import and instantiate every checker (runs once per process)."""
         # Full eager load — first engine warms the import cache
         try:
             from writing_quality_checker import (
@@ -1861,19 +1913,6 @@ class AEGISEngine:
 
         _log(f" v5.3.0 spaCy Ecosystem Suite: 11 new checkers registered")
 
-        # v6.3.2: Cache all checker instances for reuse by subsequent engines
-        _checker_cache = {
-            'checkers': dict(self.checkers),
-            'nlp_checkers': self._nlp_checkers,
-            'nlp_available': self._nlp_available,
-            'enhanced_analyzers': self._enhanced_analyzers,
-            'v330_checkers': self._v330_checkers,
-            'v330_learner': self._v330_learner,
-            'v330_nlp': self._v330_nlp,
-            'v340_checkers': self._v340_checkers,
-        }
-        _log(f" Cached {len(self.checkers)} checker instances for reuse by batch engines")
-
     # Boilerplate patterns to filter out
     BOILERPLATE_PATTERNS = [
         r'^\s*Copyright\s*[©®]?\s*\d{4}',
@@ -2062,6 +2101,56 @@ class AEGISEngine:
         v3.0.39: Added progress_callback and cancellation_check for job-based review.
         v5.9.37: Added batch_mode option to skip html_preview/clean_full_text for speed.
         """
+        try:
+            return self._run_review(filepath, options, progress_callback, cancellation_check)
+        finally:
+            # v6.3.3: Never leave a parse store attached to a pooled batch thread
+            try:
+                from nlp_doc_store import set_current_store
+                set_current_store(None)
+            except ImportError:
+                pass
+            # v6.3.3: ...nor an open .docx package
+            set_current_package(None)
+            # v6.3.3: ...nor a running checker profile (and its tracemalloc session)
+            try:
+                from checker_profile import stop_current_profile
+                stop_current_profile()
+            except ImportError:
+                pass
+
+    def _extraction_signature(self) -> str:
+        """v6.3.3: Extraction cache namespace; changes whenever the extractor chain would."""
+        import importlib.util
+        docling = (not _docling_session_broken
+                   and importlib.util.find_spec('docling') is not None)
+        return (f"aegis={MODULE_VERSION};docling={int(docling)};"
+                f"mammoth={int(MAMMOTH_AVAILABLE)};pymupdf4llm={int(PYMUPDF4LLM_AVAILABLE)}")
+
+    def _lookup_extraction_cache(self, filepath: str, options: Dict, batch_mode: bool):
+        """
+        v6.3.3: (cache, file sha256, CachedExtraction or None).
+        cache is None when the extraction cache is disabled or unusable.
+        """
+        try:
+            from extraction_cache import (
+                cache_key, file_digest, get_extraction_cache, is_extraction_cache_enabled
+            )
+            if not is_extraction_cache_enabled(options):
+                return None, None, None
+            cache = get_extraction_cache()
+            file_sha = file_digest(filepath)
+            cached = cache.get(cache_key(file_sha, self._extraction_signature()),
+                               need_preview=not batch_mode)
+            return cache, file_sha, cached
+        except Exception as e:
+            _log(f" Extraction cache unavailable: {e}", level='warning')
+            return None, None, None
+
+    def _run_review(self, filepath: str, options: Dict = None,
+                    progress_callback: Callable = None,
+                    cancellation_check: Callable = None) -> Dict:
+        """Review implementation; see review_document()."""
         options = options or {}
         self.issues = []
         
@@ -2105,6 +2194,11 @@ class AEGISEngine:
                     "Alternatively, install LibreOffice for automatic conversion."
                 )
 
+        # v6.3.3: Open the .docx once; extractors, checkers and role extraction
+        # on this thread share its parsed parts (see docx_package.py)
+        docx_package = DocxPackage(filepath) if is_docx_file(filepath) else None
+        set_current_package(docx_package)
+
         # Determine file type and use appropriate extractor
         filepath_lower = filepath.lower()
         extractor = None
@@ -2132,6 +2226,17 @@ class AEGISEngine:
             skip_docling = True
             _log("  Docling previously failed this session — skipping (use fallback extractors)")
 
+        # v6.3.3: Same bytes extracted before by the same pipeline — reuse it
+        batch_mode = options.get('batch_mode', False) if options else False
+        extraction_cache, file_sha, cached = self._lookup_extraction_cache(filepath, options, batch_mode)
+        if cached is not None:
+            extractor = cached
+            docling_used = cached.docling_used
+            pdf_quality_info = cached.pdf_quality_info
+            skip_docling = True
+            report_progress('extracting', 50, 'Using cached extraction (file unchanged)...')
+            _log(f" Extraction cache hit ({cached.extractor_name}): {len(cached.paragraphs)} paragraphs")
+
         if not skip_docling and filepath_lower.endswith(('.pdf', '.docx', '.pptx', '.xlsx', '.html', '.htm')):
             try:
                 # v4.5.1: Check Docling availability before spawning subprocess
@@ -2260,12 +2365,12 @@ class AEGISEngine:
             elif filepath_lower.endswith('.docx'):
                 # v4.3.0: Try mammoth first for clean HTML extraction
                 try:
-                    extractor = MammothDocumentExtractor(filepath)
+                    extractor = MammothDocumentExtractor(filepath, package=docx_package)
                     _log(f" Extracted DOCX (mammoth): {len(extractor.paragraphs)} paragraphs, "
                          f"{len(extractor.tables)} tables, {extractor.word_count} words")
                 except Exception as e:
                     _log(f" mammoth extraction failed, using legacy: {e}", level='debug')
-                    extractor = DocumentExtractor(filepath)
+                    extractor = DocumentExtractor(filepath, package=docx_package)
 
             else:
                 # Try to detect file type by content
@@ -2288,9 +2393,9 @@ class AEGISEngine:
                         elif header.startswith(b'PK'):  # ZIP header (docx)
                             # v4.3.0: Try mammoth first
                             try:
-                                extractor = MammothDocumentExtractor(filepath)
+                                extractor = MammothDocumentExtractor(filepath, package=docx_package)
                             except Exception:
-                                extractor = DocumentExtractor(filepath)
+                                extractor = DocumentExtractor(filepath, package=docx_package)
                         else:
                             raise ValueError(f"Unsupported file type: {filepath}")
                 except Exception as e:
@@ -2302,7 +2407,6 @@ class AEGISEngine:
         # try to generate it from mammoth (DOCX) or pymupdf4llm (PDF)
         # v5.9.37: Skip in batch_mode — not needed for batch scan results
         # =====================================================================
-        batch_mode = options.get('batch_mode', False) if options else False
         if not batch_mode and not getattr(extractor, 'html_preview', ''):
             try:
                 # v4.5.2: Use helper to detect ZIP/DOCX without leaking file handles
@@ -2348,8 +2452,8 @@ class AEGISEngine:
         # without | and ** markers that pollute statement descriptions.
         # v5.9.37: Skip in batch_mode — Statement Forge runs separately
         # =====================================================================
-        clean_full_text = None
-        if not batch_mode and docling_used and MAMMOTH_AVAILABLE:
+        clean_full_text = cached.clean_full_text if cached is not None else None
+        if clean_full_text is None and not batch_mode and docling_used and MAMMOTH_AVAILABLE:
             try:
                 if filepath_lower.endswith('.docx') or (
                     not filepath_lower.endswith('.pdf') and
@@ -2370,6 +2474,18 @@ class AEGISEngine:
             clean_full_text = self._sanitize_for_statements(extractor.full_text)
             _log(f" Generated clean_full_text via sanitize fallback ({len(clean_full_text)} chars)")
 
+        if extraction_cache is not None and cached is None:
+            try:
+                # Signature re-read: a Docling failure above changes which pipeline ran
+                from extraction_cache import cache_key
+                extraction_cache.put(
+                    cache_key(file_sha, self._extraction_signature()), extractor,
+                    has_preview=not batch_mode, docling_used=docling_used,
+                    pdf_quality_info=pdf_quality_info, clean_full_text=clean_full_text,
+                )
+            except Exception as e:
+                _log(f" Could not store extraction in cache: {e}", level='warning')
+
         # Filter out boilerplate paragraphs
         filtered_paragraphs = self._filter_boilerplate(extractor.paragraphs)
 
@@ -2433,6 +2549,8 @@ class AEGISEngine:
             'figures': extractor.figures,
             'full_text': extractor.full_text,
             'filepath': filepath,
+            # v6.3.3: Shared lazily parsed .docx (None for PDFs and other formats)
+            'docx_package': docx_package,
             'headings': extractor.headings,
             'track_changes': getattr(extractor, 'track_changes', []),
             'comments': getattr(extractor, 'comments', []),
@@ -2444,6 +2562,14 @@ class AEGISEngine:
             'validation_mode': 'connected' if hyperlink_validation_mode == 'validator' else 'restricted',
         }
         _log(f" [v3.0.109] Passing validation_mode='{common_kwargs['validation_mode']}' to checkers")
+
+        # v6.3.3: Shared spaCy parse store — spaCy-based checkers read paragraph
+        # Docs from here (parsed once with nlp.pipe) instead of re-parsing each.
+        try:
+            from nlp_doc_store import ParsedDocStore, set_current_store
+            set_current_store(ParsedDocStore.for_review(filtered_paragraphs))
+        except ImportError:
+            pass
         
         # Map option names to checker names
         option_mapping = {
@@ -2603,7 +2729,6 @@ class AEGISEngine:
                 enabled_checkers.append(checker_name)
         
         total_checkers = len(enabled_checkers)
-        checkers_completed = 0
         
         # Report: Starting checker phase
         report_progress('checking', 0, f'Running quality checks (0/{total_checkers})...')
@@ -2613,24 +2738,68 @@ class AEGISEngine:
         # non-thread-safe checker internals. Sequential is stable and still fast.
         # v3.5.0: The review now runs in a separate PROCESS (multiprocessing.Process)
         # so sequential checkers here do NOT block the Flask server anymore.
-        for checker_name in enabled_checkers:
-            if is_cancelled():
-                return {'success': False, 'error': 'Operation cancelled', 'cancelled': True}
-            checker = self.checkers.get(checker_name)
-            if not checker:
-                checkers_completed += 1
-                continue
-            try:
-                checker_issues = checker.safe_check(**common_kwargs)
-                for issue in checker_issues:
-                    if isinstance(issue, dict):
-                        issue['checker'] = checker_name
-                self.issues.extend(checker_issues)
-            except Exception as e:
-                _log(f" Error in {checker_name}: {e}")
-            checkers_completed += 1
-            progress_pct = (checkers_completed / max(1, total_checkers)) * 100
-            report_progress('checking', progress_pct, f'Completed {checker_name} ({checkers_completed}/{total_checkers})')
+        # v6.3.3: CheckerScheduler fans PARALLEL_SAFE checkers out to a spawn'd
+        # process pool for large documents (opt-in via options/config.json
+        # performance_settings). Everything else still runs sequentially here,
+        # and issues are merged in enabled_checkers order so output is identical.
+        from checker_scheduler import CheckerScheduler, get_scheduler_settings
+        scheduler_settings = get_scheduler_settings(options)
+
+        # v6.3.3: Per-checker telemetry (wall/CPU time, sampled peak memory,
+        # issue and error counts) for /api/diagnostics/checker-profile
+        profile = None
+        try:
+            from checker_profile import start_review_profile
+            profile = start_review_profile(options)
+        except ImportError:
+            pass
+        except Exception as e:
+            _log(f" Checker profiling unavailable: {e}")
+
+        scheduler = CheckerScheduler(
+            self.checkers,
+            max_workers=scheduler_settings['checker_workers'],
+            parallel=scheduler_settings['parallel_checkers'],
+            min_paragraphs=scheduler_settings['parallel_min_paragraphs'],
+            profiler=profile,
+        )
+
+        def _on_checker_complete(checker_name, completed, total):
+            progress_pct = (completed / max(1, total)) * 100
+            report_progress('checking', progress_pct, f'Completed {checker_name} ({completed}/{total})')
+
+        # v6.3.3: Incremental re-review — PARAGRAPH_LOCAL checkers reuse cached
+        # issues for paragraphs they have already seen and only check new or
+        # edited ones; document-global checkers still see the whole document.
+        incremental = None
+        try:
+            from incremental_review import IncrementalReview, is_incremental_enabled
+            if is_incremental_enabled(options):
+                incremental = IncrementalReview(self.checkers, filtered_paragraphs, special_sections)
+        except ImportError:
+            pass
+        except Exception as e:
+            _log(f" Incremental review unavailable, running full review: {e}")
+
+        if incremental:
+            checker_results = incremental.run(
+                scheduler, enabled_checkers, common_kwargs,
+                on_complete=_on_checker_complete,
+                is_cancelled=is_cancelled,
+            )
+        else:
+            checker_results = scheduler.run(
+                enabled_checkers, common_kwargs,
+                on_complete=_on_checker_complete,
+                is_cancelled=is_cancelled,
+            )
+        if checker_results is None:
+            return {'success': False, 'error': 'Operation cancelled', 'cancelled': True}
+        for checker_name, checker_issues in checker_results:
+            for issue in checker_issues:
+                if isinstance(issue, dict):
+                    issue['checker'] = checker_name
+            self.issues.extend(checker_issues)
         
         # Report: Checker phase complete
         report_progress('checking', 100, f'Quality checks complete ({total_checkers} checkers)')
@@ -2666,7 +2835,13 @@ class AEGISEngine:
 
                 try:
                     # Run the NLP checker (with sampled paragraphs for large docs)
-                    result = checker.check(nlp_paragraphs, full_text=extractor.full_text)
+                    if profile:
+                        with profile.measure(checker_name, kind='nlp') as outcome:
+                            result = checker.check(nlp_paragraphs, full_text=extractor.full_text)
+                            outcome['issues'] = len(result.issues or []) if result.success else 0
+                            outcome['errors'] = 0 if result.success else 1
+                    else:
+                        result = checker.check(nlp_paragraphs, full_text=extractor.full_text)
 
                     # Collect metrics from the checker
                     if result.metrics:
@@ -2692,6 +2867,19 @@ class AEGISEngine:
 
             _log(f" NLP checks complete: {nlp_checker_count} checkers, {len(nlp_metrics)} metrics")
 
+        checker_profile = None
+        if profile:
+            # Ends memory tracing with the checker phase; review_document's
+            # finally stops it on every other exit path
+            profile.stop()
+            checker_profile = profile.summary()
+            try:
+                from checker_profile import get_profile_store
+                get_profile_store().record(profile, paragraphs=len(filtered_paragraphs),
+                                           word_count=getattr(extractor, 'word_count', 0))
+            except Exception as e:
+                _log(f" Could not store checker profile: {e}")
+
         # v3.0.95: Capture hyperlink validation results if hyperlink checker was run
         hyperlink_results = None
         try:
@@ -2770,8 +2958,10 @@ class AEGISEngine:
 
         # v5.9.50: Apply learned suppression patterns from review_learner
         try:
-            from review_learner import get_suppressed_categories, get_severity_override
-            learned_suppressed = get_suppressed_categories(detected_type)
+            # v6.3.3: One compiled snapshot for the whole issue list
+            from review_learner import get_review_rules
+            learned_rules = get_review_rules()
+            learned_suppressed = learned_rules.suppressed_categories(detected_type)
             if learned_suppressed:
                 for issue in self.issues:
                     cat_lower = issue.get('category', '').lower()
@@ -2780,7 +2970,7 @@ class AEGISEngine:
                         issue['message'] = issue.get('message', '') + ' [learned: usually dismissed]'
             # Apply severity overrides
             for issue in self.issues:
-                override = get_severity_override(issue.get('category', ''), detected_type)
+                override = learned_rules.severity_override(issue.get('category', ''), detected_type)
                 if override:
                     issue['severity'] = override
         except ImportError:
@@ -2940,6 +3130,12 @@ class AEGISEngine:
             'html_preview': getattr(extractor, 'html_preview', ''),
             # v4.4.0: Clean text for Statement Forge (no Docling artifacts)
             'clean_full_text': clean_full_text if clean_full_text else '',
+            # v6.3.3: Paragraph reuse statistics (None for a full review)
+            'incremental_review': incremental.stats if incremental else None,
+            # v6.3.3: True when extraction was served from the extraction cache
+            'extraction_cached': cached is not None,
+            # v6.3.3: Per-checker wall/CPU time, peak memory, issues and errors, slowest first
+            'checker_profile': checker_profile,
         }
     
     def _calculate_score(self) -> int:
@@ -25,6 +25,16 @@ try:
 except ImportError:
     from .base_checker import BaseChecker
 
+try:
+    from nlp_utils import get_spacy_model
+except ImportError:
+    def get_spacy_model(name='en_core_web_sm'):
+        """Fallback if nlp_utils not available."""
+        import spacy
+        return spacy.load(name)
+
+from nlp_doc_store import parse as parse_doc
+
 __version__ = "1.0.0"
 
 
@@ -73,8 +83,7 @@ class CoreferenceResolutionChecker(BaseChecker):
         spaCy 3.8+, this guard can be removed.
         """
         try:
-            import spacy
-            self.nlp = spacy.load('en_core_web_sm')
+            self.nlp = get_spacy_model('en_core_web_sm')
             model_ver = self.nlp.meta.get('version', '0.0.0')
             major_minor = tuple(int(x) for x in model_ver.split('.')[:2])
 
@@ -129,7 +138,7 @@ class CoreferenceResolutionChecker(BaseChecker):
             return []
 
         try:
-            doc = self.nlp(full_text)
+            doc = parse_doc(self.nlp, full_text, pipes=('coreferee',))
 
             # Find all coreference clusters
             coreference_clusters = self._extract_clusters(doc)
@@ -20,7 +20,12 @@ from typing import Dict, List, Optional, Any
 from contextlib import contextmanager
 import threading
 
-# Thread-local storage for connections
+try:
+    from sqlite_pool import get_pool
+except ImportError:
+    get_pool = None
+
+# Thread-local storage for connections (used when sqlite_pool is unavailable)
 _local = threading.local()
 
 DATABASE_PATH = Path(__file__).parent / 'data' / 'techwriter.db'
@@ -28,7 +33,14 @@ DATABASE_VERSION = 1
 
 
 def get_connection() -> sqlite3.Connection:
-    """Get thread-local database connection."""
+    """Get thread-local database connection.
+
+    v6.3.3: Served by the shared sqlite_pool (per-thread, tuned PRAGMAs).
+    """
+    if get_pool is not None:
+        DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        return get_pool(DATABASE_PATH, foreign_keys=True).connection()
+
     if not hasattr(_local, 'connection') or _local.connection is None:
         DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
         _local.connection = sqlite3.connect(str(DATABASE_PATH), check_same_thread=False)
@@ -576,6 +576,8 @@ class DiagnosticCollector:
                 result['modules'] = self._get_module_info()
                 # v3.0.114: Add database state for troubleshooting
                 result['database_state'] = self._get_database_state()
+                # v6.3.3: Per-checker telemetry over recent reviews
+                result['checker_profile'] = self._get_checker_profile()
 
             # v3.0.114: Include frontend console logs if available
             if hasattr(self, 'frontend_logs') and self.frontend_logs:
@@ -634,6 +636,14 @@ class DiagnosticCollector:
 
         return modules
 
+    def _get_checker_profile(self) -> Dict[str, Any]:
+        """Rolled-up checker telemetry (v6.3.3), or {'error': ...} if unavailable."""
+        try:
+            from checker_profile import get_checker_profile
+            return get_checker_profile()
+        except Exception as e:
+            return {'error': str(e)}
+
     def _get_database_state(self) -> Dict[str, Any]:
         """
         Get database state for troubleshooting (v3.0.114).
@@ -1027,6 +1037,34 @@ def format_diagnostic_report(data: Dict[str, Any]) -> str:
             lines.append(f"Error:             {scan_db.get('error', 'Unknown')}")
         lines.append("")
 
+    # v6.3.3: Checker Profile
+    if 'checker_profile' in data:
+        profile = data['checker_profile']
+        lines.append("")
+        lines.append("-" * 70)
+        lines.append("CHECKER PROFILE")
+        lines.append("-" * 70)
+        if profile.get('error'):
+            lines.append("Status:            NOT AVAILABLE")
+            lines.append(f"Error:             {profile['error']}")
+        else:
+            checkers = profile.get('checkers', [])
+            lines.append(f"Reviews Profiled:  {profile.get('reviews', 0)} "
+                         f"({profile.get('memory_traced_reviews', 0)} with memory tracing)")
+            lines.append(f"Slow Threshold:    p95 > {profile.get('slow_ms', 0):.0f} ms")
+            slow = [c['checker'] for c in checkers if c.get('slow')]
+            lines.append(f"Slow Checkers:     {', '.join(slow) if slow else 'none'}")
+            if checkers:
+                lines.append("Top checkers by total time:")
+                lines.append(f"  {'Checker':<28} {'avg ms':>9} {'p95 ms':>9} {'peak KB':>9} "
+                             f"{'iss/rev':>8} {'errors':>6}")
+                for c in checkers[:15]:
+                    peak = c.get('peak_kb_max')
+                    lines.append(f"  {c['checker'][:28]:<28} {c['wall_ms_avg']:>9.1f} {c['wall_ms_p95']:>9.1f} "
+                                 f"{(f'{peak:.0f}' if peak is not None else '-'):>9} "
+                                 f"{c['issues_per_review']:>8.1f} {c['errors_total']:>6}")
+        lines.append("")
+
     # v3.0.114: Frontend Console Logs
     if 'frontend_logs' in data:
         fe_data = data['frontend_logs']
@@ -13,10 +13,11 @@ Checks document structure and organization:
 
 import re
 import os
-import zipfile
 from typing import List, Dict, Tuple, Set, Optional
 from collections import defaultdict
 
+from docx_package import open_package
+
 try:
     from base_checker import BaseChecker
 except ImportError:
@@ -349,7 +350,7 @@ class TrackChangesChecker(BaseChecker):
         
         # If we have a filepath but no track_changes/comments provided, extract them
         if filepath and not track_changes and not comments:
-            track_changes, comments = self._extract_from_file(filepath)
+            track_changes, comments = self._extract_from_file(filepath, kwargs.get('docx_package'))
         
         # Check track changes
         if track_changes:
@@ -395,7 +396,7 @@ class TrackChangesChecker(BaseChecker):
         
         return issues
     
-    def _extract_from_file(self, filepath: str) -> Tuple[List[Dict], List[Dict]]:
+    def _extract_from_file(self, filepath: str, package=None) -> Tuple[List[Dict], List[Dict]]:
         """Extract track changes and comments from docx file."""
         track_changes = []
         comments = []
@@ -404,10 +405,12 @@ class TrackChangesChecker(BaseChecker):
             return track_changes, comments
         
         try:
-            with zipfile.ZipFile(filepath, 'r') as zf:
+            with open_package(filepath, package) as pkg:
+                if pkg is None:
+                    return track_changes, comments
                 # Extract track changes from document.xml
-                if 'word/document.xml' in zf.namelist():
-                    doc_xml = zf.read('word/document.xml').decode('utf-8')
+                doc_xml = pkg.document_xml
+                if doc_xml is not None:
                     
                     # Find insertions
                     for match in re.finditer(r'<w:ins\s[^>]*w:author="([^"]*)"', doc_xml):
@@ -418,8 +421,8 @@ class TrackChangesChecker(BaseChecker):
                         track_changes.append({'type': 'deletion', 'author': match.group(1)})
                 
                 # Extract comments from comments.xml
-                if 'word/comments.xml' in zf.namelist():
-                    comments_xml = zf.read('word/comments.xml').decode('utf-8')
+                comments_xml = pkg.comments_xml
+                if comments_xml is not None:
                     
                     comment_pattern = re.compile(
                         r'<w:comment[^>]*w:author="([^"]*)"[^>]*>(.*?)</w:comment>',
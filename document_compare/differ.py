@@ -1,5 +1,5 @@
 """
-Document Differ v2.0.0
+Document Differ v2.1.0
 ======================
 Enhanced document comparison engine with:
 - Line-level alignment with word-level diff highlighting
@@ -8,11 +8,14 @@ Enhanced document comparison engine with:
 - Change classification and statistics
 
 Uses diff-match-patch for accurate word-level comparisons
-and difflib.SequenceMatcher for line alignment.
+and patience-diff line alignment (difflib.SequenceMatcher inside regions
+that have no unique anchor lines).
 
 v1.0.0: Initial implementation with line/word diffs
 v1.0.1 (v3.0.114): Added comprehensive logging
 v2.0.0 (v4.6.1): Move detection, section awareness, change index, unified view support
+v2.1.0 (v6.3.3): Patience line alignment, shingle-indexed fuzzy move detection (no
+                 pair cap), bounded line matching, O(n) deleted/added index lookup
 Author: AEGIS
 """
 
@@ -20,6 +23,8 @@ import re
 import html
 import difflib
 import logging
+from bisect import bisect_left
+from collections import defaultdict, deque
 from typing import List, Tuple, Optional, Dict, Set
 from dataclasses import dataclass
 
@@ -104,10 +109,199 @@ def assign_sections(lines: List[str]) -> List[Optional[str]]:
     return sections
 
 
+# =============================================================================
+# LINE ALIGNMENT (v2.1.0)
+# =============================================================================
+# difflib.SequenceMatcher over whole documents is quadratic in the worst case
+# and its autojunk heuristic treats frequent lines (blank lines, repeated
+# bullets) as junk on large inputs. Patience diff anchors the alignment on
+# lines that occur exactly once in both versions, takes the longest increasing
+# run of those anchors and recurses between them. Regions with no unique
+# anchors (usually a handful of lines) fall back to SequenceMatcher.
+
+def _patience_matches(a: List[int], b: List[int]) -> List[Tuple[int, int]]:
+    """Matched (i, j) line pairs between interned sequences, in order."""
+    matches: List[Tuple[int, int]] = []
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        alo, ahi, blo, bhi = stack.pop()
+
+        # Common prefix / suffix
+        while alo < ahi and blo < bhi and a[alo] == b[blo]:
+            matches.append((alo, blo))
+            alo += 1
+            blo += 1
+        while alo < ahi and blo < bhi and a[ahi - 1] == b[bhi - 1]:
+            ahi -= 1
+            bhi -= 1
+            matches.append((ahi, bhi))
+        if alo == ahi or blo == bhi:
+            continue
+
+        # Lines unique to both sides of this region
+        counts_a: Dict[int, int] = defaultdict(int)
+        pos_a: Dict[int, int] = {}
+        for i in range(alo, ahi):
+            counts_a[a[i]] += 1
+            pos_a[a[i]] = i
+        counts_b: Dict[int, int] = defaultdict(int)
+        pos_b: Dict[int, int] = {}
+        for j in range(blo, bhi):
+            counts_b[b[j]] += 1
+            pos_b[b[j]] = j
+        anchors = sorted((pos_a[t], pos_b[t]) for t, c in counts_a.items()
+                         if c == 1 and counts_b.get(t) == 1)
+
+        if not anchors:
+            sm = difflib.SequenceMatcher(None, a[alo:ahi], b[blo:bhi], autojunk=False)
+            for i, j, size in sm.get_matching_blocks():
+                matches.extend((alo + i + k, blo + j + k) for k in range(size))
+            continue
+
+        # Longest increasing subsequence of anchor j positions
+        tails: List[int] = []
+        tail_idx: List[int] = []
+        prev: List[int] = [-1] * len(anchors)
+        for n, (_, j) in enumerate(anchors):
+            k = bisect_left(tails, j)
+            if k == len(tails):
+                tails.append(j)
+                tail_idx.append(n)
+            else:
+                tails[k] = j
+                tail_idx[k] = n
+            prev[n] = tail_idx[k - 1] if k else -1
+        chain = []
+        n = tail_idx[-1]
+        while n >= 0:
+            chain.append(anchors[n])
+            n = prev[n]
+        chain.reverse()
+
+        # Recurse into the gaps between anchors
+        last_i, last_j = alo, blo
+        for i, j in chain:
+            matches.append((i, j))
+            stack.append((last_i, i, last_j, j))
+            last_i, last_j = i + 1, j + 1
+        stack.append((last_i, ahi, last_j, bhi))
+
+    matches.sort()
+    return matches
+
+
+def line_opcodes(old_lines: List[str], new_lines: List[str]) -> List[Tuple[str, int, int, int, int]]:
+    """
+    Patience-diff alignment of two line lists.
+
+    Returns difflib-style opcodes: (tag, i1, i2, j1, j2) with tag in
+    'equal', 'delete', 'insert', 'replace'.
+    """
+    ids: Dict[str, int] = {}
+    a = [ids.setdefault(line, len(ids)) for line in old_lines]
+    b = [ids.setdefault(line, len(ids)) for line in new_lines]
+
+    opcodes = []
+    i = j = 0
+    for mi, mj in _patience_matches(a, b) + [(len(a), len(b))]:
+        if i < mi and j < mj:
+            opcodes.append(('replace', i, mi, j, mj))
+        elif i < mi:
+            opcodes.append(('delete', i, mi, j, j))
+        elif j < mj:
+            opcodes.append(('insert', i, i, j, mj))
+        if mi < len(a) and mj < len(b):
+            if opcodes and opcodes[-1][0] == 'equal' and opcodes[-1][2] == mi:
+                _, e1, _, f1, _ = opcodes[-1]
+                opcodes[-1] = ('equal', e1, mi + 1, f1, mj + 1)
+            else:
+                opcodes.append(('equal', mi, mi + 1, mj, mj + 1))
+        i, j = mi + 1, mj + 1
+    return opcodes
+
+
+def best_line_match(line: str, candidates: List[Tuple[int, 'difflib.SequenceMatcher']],
+                    floor: float = 0.0) -> Tuple[float, int]:
+    """
+    Highest SequenceMatcher(None, line, candidate).ratio() among `candidates`
+    ((index, matcher) pairs whose matcher already holds the candidate as seq2);
+    the first index wins ties. Candidates whose quick upper bounds cannot beat
+    the best so far, or reach `floor`, are skipped without computing ratio().
+
+    Returns (best_ratio, best_index); (0.0, -1) if nothing reaches `floor`.
+    """
+    best_ratio = 0.0
+    best_idx = -1
+    for idx, matcher in candidates:
+        matcher.set_seq1(line)
+        bound = matcher.real_quick_ratio()
+        if bound <= best_ratio or bound < floor:
+            continue
+        bound = matcher.quick_ratio()
+        if bound <= best_ratio or bound < floor:
+            continue
+        ratio = matcher.ratio()
+        if ratio > best_ratio and ratio >= floor:
+            best_ratio = ratio
+            best_idx = idx
+    return best_ratio, best_idx
+
+
 # =============================================================================
 # MOVE DETECTION
 # =============================================================================
 
+EXHAUSTIVE_MOVE_PAIRS = 50000   # below this, fuzzy matching compares every pair
+SHINGLE_SIZE = 2                # words per shingle in the candidate index
+MOVE_CANDIDATES = 10            # exact-verified candidates per line
+SHINGLE_MAX_POSTINGS = 500      # ignore shingles shared by more lines than this
+MOVE_MIN_OVERLAP = 0.5          # n-gram Dice floor for fuzzy move candidates
+
+_WORD_RE = re.compile(r'\w+')
+
+
+def _shingles(text: str, size: int = SHINGLE_SIZE) -> Set[Tuple[str, ...]]:
+    """Word n-grams of `text`, lowercased (the word tuple itself if shorter)."""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= size:
+        return {tuple(words)} if words else set()
+    return {tuple(words[k:k + size]) for k in range(len(words) - size + 1)}
+
+
+def shingle_candidates(queries: List[str], targets: List[str], limit: int = MOVE_CANDIDATES,
+                       min_overlap: float = 0.0) -> List[List[int]]:
+    """
+    For each query text, the indices of the target texts sharing the most
+    word n-grams with it (at most `limit`, in ascending index order).
+
+    Args:
+        min_overlap: Minimum Dice coefficient of the two n-gram sets
+    """
+    postings: Dict[Tuple[str, ...], List[int]] = defaultdict(list)
+    sizes = []
+    for idx, text in enumerate(targets):
+        grams = _shingles(text)
+        sizes.append(len(grams))
+        for gram in grams:
+            postings[gram].append(idx)
+
+    candidates = []
+    for text in queries:
+        grams = _shingles(text)
+        shared: Dict[int, int] = defaultdict(int)
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting and len(posting) <= SHINGLE_MAX_POSTINGS:
+                for idx in posting:
+                    shared[idx] += 1
+        if min_overlap > 0:
+            shared = {idx: count for idx, count in shared.items()
+                      if 2 * count >= min_overlap * (len(grams) + sizes[idx])}
+        top = sorted(shared.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+        candidates.append(sorted(idx for idx, _ in top))
+    return candidates
+
+
 def detect_moves(
     old_lines: List[str],
     new_lines: List[str],
@@ -164,41 +358,45 @@ def detect_moves(
                     break
 
     # Pass 2: Fuzzy matches for remaining unmatched
-    remaining_deleted = [i for i in deleted_indices if i not in matched_old and i < len(old_lines)]
-    remaining_added = [i for i in added_indices if i not in matched_new and i < len(new_lines)]
-
-    # Only do fuzzy matching for reasonable sizes (O(n*m) complexity)
-    if len(remaining_deleted) * len(remaining_added) <= 50000:
-        for old_idx in remaining_deleted:
-            old_line = old_lines[old_idx]
-            if not old_line.strip() or len(old_line.strip()) <= 15:
-                continue
-
-            best_ratio = 0
-            best_new_idx = -1
-
-            for new_idx in remaining_added:
-                if new_idx in matched_new:
-                    continue
-                new_line = new_lines[new_idx]
-                if not new_line.strip() or len(new_line.strip()) <= 15:
-                    continue
-
-                ratio = difflib.SequenceMatcher(None, old_line.strip(), new_line.strip()).ratio()
-                if ratio > best_ratio:
-                    best_ratio = ratio
-                    best_new_idx = new_idx
-
-            if best_ratio >= similarity_threshold and best_new_idx >= 0:
-                moves.append({
-                    'old_idx': old_idx,
-                    'new_idx': best_new_idx,
-                    'similarity': best_ratio,
-                    'old_line': old_lines[old_idx],
-                    'new_line': new_lines[best_new_idx]
-                })
-                matched_old.add(old_idx)
-                matched_new.add(best_new_idx)
+    # v2.1.0: Small inputs compare every pair; larger ones only verify the
+    # candidates from a word n-gram index (previously fuzzy matching was
+    # skipped entirely above 50,000 pairs).
+    remaining_deleted = sorted(i for i in deleted_indices if i not in matched_old and i < len(old_lines)
+                               and len(old_lines[i].strip()) > 15)
+    remaining_added = sorted(i for i in added_indices if i not in matched_new and i < len(new_lines)
+                             and len(new_lines[i].strip()) > 15)
+    if not remaining_deleted or not remaining_added:
+        return moves
+
+    matchers = {idx: difflib.SequenceMatcher(None, '', new_lines[idx].strip())
+                for idx in remaining_added}
+    if len(remaining_deleted) * len(remaining_added) <= EXHAUSTIVE_MOVE_PAIRS:
+        candidates = None
+    else:
+        found = shingle_candidates([old_lines[i].strip() for i in remaining_deleted],
+                                   [new_lines[i].strip() for i in remaining_added],
+                                   min_overlap=MOVE_MIN_OVERLAP)
+        candidates = {old_idx: [remaining_added[k] for k in found[n]]
+                      for n, old_idx in enumerate(remaining_deleted)}
+
+    for old_idx in remaining_deleted:
+        pool = candidates[old_idx] if candidates is not None else remaining_added
+        best_ratio, best_new_idx = best_line_match(
+            old_lines[old_idx].strip(),
+            [(idx, matchers[idx]) for idx in pool if idx not in matched_new],
+            floor=similarity_threshold
+        )
+
+        if best_ratio >= similarity_threshold and best_new_idx >= 0:
+            moves.append({
+                'old_idx': old_idx,
+                'new_idx': best_new_idx,
+                'similarity': best_ratio,
+                'old_line': old_lines[old_idx],
+                'new_line': new_lines[best_new_idx]
+            })
+            matched_old.add(old_idx)
+            matched_new.add(best_new_idx)
 
     return moves
 
@@ -281,20 +479,26 @@ class DocumentDiffer:
             raise
 
         # Detect moves among deleted/added lines
+        # v2.1.0: Each deleted/added row takes the first unused line index with
+        # its text (same assignment as before, without rescanning the document)
+        old_positions: Dict[str, deque] = defaultdict(deque)
+        for i, line in enumerate(old_lines):
+            old_positions[line].append(i)
+        new_positions: Dict[str, deque] = defaultdict(deque)
+        for i, line in enumerate(new_lines):
+            new_positions[line].append(i)
+
         deleted_indices = set()
         added_indices = set()
         for row in aligned_rows:
             if row.status == 'deleted':
-                # Find the original old line index
-                for i, line in enumerate(old_lines):
-                    if line == row.old_line and i not in deleted_indices:
-                        deleted_indices.add(i)
-                        break
+                positions = old_positions.get(row.old_line)
+                if positions:
+                    deleted_indices.add(positions.popleft())
             elif row.status == 'added':
-                for i, line in enumerate(new_lines):
-                    if line == row.new_line and i not in added_indices:
-                        added_indices.add(i)
-                        break
+                positions = new_positions.get(row.new_line)
+                if positions:
+                    added_indices.add(positions.popleft())
 
         moves = detect_moves(old_lines, new_lines, deleted_indices, added_indices)
         logger.info(f"Detected {len(moves)} moved lines")
@@ -304,22 +508,22 @@ class DocumentDiffer:
         move_new_lines = {m['new_line'].strip() for m in moves}
         move_pairs = {(m['old_line'].strip(), m['new_line'].strip()) for m in moves}
 
+        move_targets: Dict[str, str] = {}
+        move_sources: Dict[str, str] = {}
+        for m in moves:
+            move_targets.setdefault(m['old_line'].strip(), m['new_line'])
+            move_sources.setdefault(m['new_line'].strip(), m['old_line'])
+
         for row in aligned_rows:
             if row.status == 'deleted' and row.old_line.strip() in move_old_lines:
                 row.status = 'moved_from'
                 row.is_change = True
                 # Find the destination
-                for m in moves:
-                    if m['old_line'].strip() == row.old_line.strip():
-                        row.move_target = m['new_line']
-                        break
+                row.move_target = move_targets[row.old_line.strip()]
             elif row.status == 'added' and row.new_line.strip() in move_new_lines:
                 row.status = 'moved_to'
                 row.is_change = True
-                for m in moves:
-                    if m['new_line'].strip() == row.new_line.strip():
-                        row.move_source = m['old_line']
-                        break
+                row.move_source = move_sources[row.new_line.strip()]
 
         # Assign section info to each row
         old_line_idx = 0
@@ -452,10 +656,8 @@ class DocumentDiffer:
         rows = []
         row_index = 0
 
-        # Use difflib for intelligent sequence matching
-        matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
-
-        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        # v2.1.0: Patience alignment (was SequenceMatcher over the whole document)
+        for tag, i1, i2, j1, j2 in line_opcodes(old_lines, new_lines):
             if tag == 'equal':
                 # Unchanged lines
                 for idx in range(i2 - i1):
@@ -540,26 +742,27 @@ class DocumentDiffer:
         row_index = start_row_index
         matched_new = set()
 
+        # v2.1.0: One matcher per new line (SequenceMatcher caches its seq2),
+        # with quick upper bounds skipping lines that cannot win. Very large
+        # replaced blocks only compare against word n-gram index candidates.
+        matchers = [(new_idx, difflib.SequenceMatcher(None, '', new_line))
+                    for new_idx, new_line in enumerate(new_section)]
+        if len(old_section) * len(new_section) > EXHAUSTIVE_MOVE_PAIRS:
+            pools = shingle_candidates(old_section, new_section)
+        else:
+            pools = None
+
         # For each old line, find best matching new line
         for old_idx, old_line in enumerate(old_section):
-            best_match = None
-            best_ratio = 0.0
-            best_new_idx = -1
-
-            for new_idx, new_line in enumerate(new_section):
-                if new_idx in matched_new:
-                    continue
-
-                ratio = difflib.SequenceMatcher(
-                    None, old_line, new_line
-                ).ratio()
-
-                if ratio > best_ratio:
-                    best_ratio = ratio
-                    best_match = new_line
-                    best_new_idx = new_idx
-
-            if best_ratio >= self.similarity_threshold:
+            pool = [matchers[k] for k in pools[old_idx]] if pools is not None else matchers
+            best_ratio, best_new_idx = best_line_match(
+                old_line,
+                [m for m in pool if m[0] not in matched_new],
+                floor=self.similarity_threshold
+            )
+            best_match = new_section[best_new_idx] if best_new_idx >= 0 else None
+
+            if best_new_idx >= 0 and best_ratio >= self.similarity_threshold:
                 # Found a match - it's a modification
                 matched_new.add(best_new_idx)
 
@@ -867,7 +1070,7 @@ def compute_diff(
 
 if __name__ == '__main__':
     # Demo/test
-    print(f"Document Differ v2.0.0 - DMP Available: {DMP_AVAILABLE}")
+    print(f"Document Differ v2.1.0 - DMP Available: {DMP_AVAILABLE}")
     print("=" * 50)
 
     old_text = """1.0 INTRODUCTION
@@ -16,8 +16,11 @@ from flask import Blueprint, request, jsonify, session, g
 
 # Import db_connection context manager
 try:
-    from scan_history import db_connection
+    from scan_history import db_connection, load_scan_results
 except ImportError:
+    def load_scan_results(cursor, scan_id, results_json, include_issues=True, include_text=True):
+        return json.loads(results_json) if results_json else {}
+
     @contextmanager
     def db_connection(db_path):
         """Context manager for SQLite operations."""
@@ -262,17 +265,17 @@ def _get_scan_with_results(scan_id: int) -> dict:
 
         row = cursor.fetchone()
 
+        # Parse results_json (v6.3.3: reassembled from normalized tables)
+        results = {}
+        if row and row['results_json']:
+            try:
+                results = load_scan_results(cursor, row['id'], row['results_json'])
+            except json.JSONDecodeError:
+                pass
+
     if not row:
         return None
 
-    # Parse results_json
-    results = {}
-    if row['results_json']:
-        try:
-            results = json.loads(row['results_json'])
-        except json.JSONDecodeError:
-            pass
-
     return {
         'id': row['id'],
         'document_id': row['document_id'],
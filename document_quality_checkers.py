@@ -23,6 +23,8 @@ from typing import Dict, List, Any, Tuple, Set, Optional
 from collections import Counter, defaultdict
 from pathlib import Path
 
+from regex_registry import word_pattern
+
 # Import base checker
 try:
     from base_checker import BaseChecker
@@ -285,8 +287,7 @@ class ProductNameConsistencyChecker(BaseChecker):
 
                     # Case-sensitive search for wrong version
                     # Use word boundaries
-                    pattern = re.compile(r'\b' + re.escape(wrong) + r'\b')
-                    match = pattern.search(text)
+                    match = word_pattern(wrong, flags=0).search(text)
 
                     if match:
                         found_variants.add(wrong)
@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+AEGIS DOCX Package
+==================
+One open, lazily parsed view of a .docx shared by everything in a review.
+
+v6.3.3: A single review used to unzip and parse the same package again and
+again: DocumentExtractor / MammothDocumentExtractor, AcronymChecker (twice),
+the hyperlink checkers, ImageFigureChecker, DocumentChecker,
+RoleExtractor.extract_from_docx and TableProcessor each opened the zip and
+re-read (and usually re-parsed) word/document.xml on their own.
+
+How it works:
+- AEGISEngine.review_document opens a DocxPackage for the file, attaches it
+  to the reviewing thread and passes it to checkers as
+  common_kwargs['docx_package'].
+- Parts are read from the one open ZipFile on first use and memoized: raw
+  XML text, parsed ElementTree roots, relationships, the python-docx
+  Document, plus derived views (hyperlink targets, image parts, tables).
+- Consumers go through open_package(filepath, package): it returns the
+  review's package when the path matches, otherwise a private package that
+  is closed on exit. Standalone callers (unit tests, routes) therefore work
+  exactly as before.
+- Pickling (the process-pool checker scheduler) carries only the path; a
+  worker re-opens the file and memoizes its own parts.
+"""
+
+import os
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+__version__ = "1.0.0"
+
+DOCUMENT_PART = 'word/document.xml'
+COMMENTS_PART = 'word/comments.xml'
+STYLES_PART = 'word/styles.xml'
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+try:
+    from config_logging import get_logger
+    _logger = get_logger('docx_package')
+except ImportError:
+    _logger = None
+
+
+def _log(message: str, level: str = 'debug', **kwargs):
+    """Internal logging helper."""
+    if _logger:
+        getattr(_logger, level)(message, **kwargs)
+    elif level in ('warning', 'error', 'critical'):
+        print(f"[{level.upper()}] {message}")
+
+
+def _rels_part(part: str) -> str:
+    """'word/document.xml' -> 'word/_rels/document.xml.rels'."""
+    folder, name = os.path.split(part)
+    return f"{folder}/_rels/{name}.rels" if folder else f"_rels/{name}.rels"
+
+
+class DocxPackage:
+    """
+    Memoizing reader over one .docx file.
+
+    Every accessor returns None (or an empty container) for a part the
+    package does not have, and raises zipfile.BadZipFile / OSError only when
+    the file itself cannot be opened — the same failures the old per-module
+    zipfile code surfaced.
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self._lock = threading.RLock()
+        self._zip: Optional[zipfile.ZipFile] = None
+        self._names: Optional[frozenset] = None
+        self._text: Dict[str, Optional[str]] = {}
+        self._trees: Dict[str, Optional[ET.Element]] = {}
+        self._rels: Dict[str, Dict[str, Dict[str, str]]] = {}
+        self._derived: Dict[str, Any] = {}
+        self.reads = 0  # parts decompressed, for diagnostics
+
+    # -----------------------------------------------------------------
+    # Lifecycle
+    # -----------------------------------------------------------------
+
+    def _zipfile(self) -> zipfile.ZipFile:
+        # Caller holds self._lock
+        if self._zip is None:
+            self._zip = zipfile.ZipFile(self.filepath, 'r')
+            self._names = frozenset(self._zip.namelist())
+        return self._zip
+
+    def close(self):
+        with self._lock:
+            if self._zip is not None:
+                self._zip.close()
+                self._zip = None
+
+    def __enter__(self) -> 'DocxPackage':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __getstate__(self):
+        return {'filepath': self.filepath}
+
+    def __setstate__(self, state):
+        self.__init__(state['filepath'])
+
+    def matches(self, filepath: str) -> bool:
+        return bool(filepath) and os.path.abspath(filepath) == os.path.abspath(self.filepath)
+
+    # -----------------------------------------------------------------
+    # Parts
+    # -----------------------------------------------------------------
+
+    @property
+    def names(self) -> frozenset:
+        with self._lock:
+            self._zipfile()
+            return self._names
+
+    def has_part(self, name: str) -> bool:
+        return name in self.names
+
+    def read_bytes(self, name: str) -> Optional[bytes]:
+        """Raw part content (not memoized — use read_text()/xml() for XML parts)."""
+        with self._lock:
+            zf = self._zipfile()
+            if name not in self._names:
+                return None
+            self.reads += 1
+            return zf.read(name)
+
+    def part_size(self, name: str) -> int:
+        """Uncompressed size of a part (0 if missing), without reading it."""
+        with self._lock:
+            zf = self._zipfile()
+            return zf.getinfo(name).file_size if name in self._names else 0
+
+    def read_text(self, name: str) -> Optional[str]:
+        """Decoded XML text of a part, memoized."""
+        with self._lock:
+            if name not in self._text:
+                data = self.read_bytes(name)
+                self._text[name] = data.decode('utf-8') if data is not None else None
+            return self._text[name]
+
+    def xml(self, name: str) -> Optional[ET.Element]:
+        """Parsed root element of a part, memoized."""
+        with self._lock:
+            if name not in self._trees:
+                text = self.read_text(name)
+                self._trees[name] = ET.fromstring(text) if text is not None else None
+            return self._trees[name]
+
+    @property
+    def document_xml(self) -> Optional[str]:
+        return self.read_text(DOCUMENT_PART)
+
+    @property
+    def document_tree(self) -> Optional[ET.Element]:
+        return self.xml(DOCUMENT_PART)
+
+    @property
+    def comments_xml(self) -> Optional[str]:
+        return self.read_text(COMMENTS_PART)
+
+    @property
+    def styles_tree(self) -> Optional[ET.Element]:
+        return self.xml(STYLES_PART)
+
+    def relationships(self, part: str = DOCUMENT_PART) -> Dict[str, Dict[str, str]]:
+        """{rel_id: {'type': ..., 'target': ..., 'mode': ...}} for a part, memoized."""
+        with self._lock:
+            if part not in self._rels:
+                rels: Dict[str, Dict[str, str]] = {}
+                root = self.xml(_rels_part(part))
+                if root is not None:
+                    for rel in root.findall('.//{%s}Relationship' % REL_NS):
+                        rels[rel.get('Id', '')] = {
+                            'type': rel.get('Type', ''),
+                            'target': rel.get('Target', ''),
+                            'mode': rel.get('TargetMode', ''),
+                        }
+                self._rels[part] = rels
+            return self._rels[part]
+
+    def relationship_targets(self, kind: str, part: str = DOCUMENT_PART) -> Dict[str, str]:
+        """{rel_id: target} for relationships whose type contains `kind` ('hyperlink', 'image')."""
+        kind = kind.lower()
+        return {rel_id: rel['target'] for rel_id, rel in self.relationships(part).items()
+                if kind in rel['type'].lower()}
+
+    # -----------------------------------------------------------------
+    # Derived views
+    # -----------------------------------------------------------------
+
+    def _memo(self, key: str, build):
+        with self._lock:
+            if key not in self._derived:
+                self._derived[key] = build()
+            return self._derived[key]
+
+    def hyperlink_targets(self) -> Dict[str, str]:
+        return self._memo('hyperlinks', lambda: self.relationship_targets('hyperlink'))
+
+    def image_parts(self) -> Dict[str, int]:
+        """{part name: uncompressed size} for every image referenced by the body."""
+        def build():
+            parts = {}
+            for target in self.relationship_targets('image').values():
+                name = target.lstrip('/') if target.startswith('/') else f"word/{target}"
+                parts[name] = self.part_size(name)
+            return parts
+        return self._memo('images', build)
+
+    def tables(self) -> List[List[List[str]]]:
+        """Body tables as rows of cell text (nested tables flattened into their cell)."""
+        def build():
+            root = self.document_tree
+            if root is None:
+                return []
+            result = []
+            for tbl in root.iter('{%s}tbl' % W_NS):
+                rows = []
+                for tr in tbl.findall('{%s}tr' % W_NS):
+                    rows.append([
+                        ''.join(t.text or '' for t in tc.iter('{%s}t' % W_NS)).strip()
+                        for tc in tr.findall('{%s}tc' % W_NS)
+                    ])
+                result.append(rows)
+            return result
+        return self._memo('tables', build)
+
+    def python_docx(self):
+        """python-docx Document for this file (ImportError if python-docx is missing), memoized."""
+        def build():
+            from docx import Document
+            return Document(self.filepath)
+        return self._memo('python_docx', build)
+
+
+# =============================================================================
+# REVIEW-SCOPED PACKAGE
+# =============================================================================
+
+_active = threading.local()
+
+
+def is_docx_file(filepath: str) -> bool:
+    """Cheap check (extension + zip signature) that `filepath` can be a .docx package."""
+    if not filepath or filepath.lower().endswith('.pdf'):
+        return False
+    try:
+        with open(filepath, 'rb') as f:
+            return f.read(4) == b'PK\x03\x04'
+    except OSError:
+        return False
+
+
+def current_package() -> Optional[DocxPackage]:
+    """Package attached to this thread's review, if any."""
+    return getattr(_active, 'package', None)
+
+
+def set_current_package(package: Optional[DocxPackage]):
+    """Attach `package` to this thread (None detaches). The previous package is closed."""
+    previous = current_package()
+    if previous is not None and previous is not package:
+        previous.close()
+    _active.package = package
+
+
+@contextmanager
+def open_package(filepath: str, package: Optional[DocxPackage] = None) -> Iterator[Optional[DocxPackage]]:
+    """
+    Package for `filepath`: `package` or this thread's review package when
+    the path matches, otherwise a private one closed on exit. Yields None
+    for PDFs and missing files.
+    """
+    for shared in (package, current_package()):
+        if shared is not None and shared.matches(filepath):
+            yield shared
+            return
+    if not filepath or filepath.lower().endswith('.pdf') or not os.path.exists(filepath):
+        yield None
+        return
+    private = DocxPackage(filepath)
+    try:
+        yield private
+    finally:
+        private.close()
+
+
+def docx_document(filepath: str, package: Optional[DocxPackage] = None):
+    """python-docx Document for `filepath`, shared with the review when possible."""
+    for shared in (package, current_package()):
+        if shared is not None and shared.matches(filepath):
+            return shared.python_docx()
+    from docx import Document
+    return Document(filepath)
@@ -24,6 +24,16 @@ from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 import logging
 
+try:
+    from nlp_utils import get_spacy_model
+except ImportError:
+    def get_spacy_model(name='en_core_web_sm'):
+        """Fallback if nlp_utils not available."""
+        import spacy
+        return spacy.load(name)
+
+from nlp_doc_store import parse as parse_doc
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -206,11 +216,10 @@ class EnhancedPassiveChecker:
             return
 
         try:
-            import spacy
             # Try models in preference order
             for model in ['en_core_web_trf', 'en_core_web_lg', 'en_core_web_md', 'en_core_web_sm']:
                 try:
-                    self.nlp = spacy.load(model)
+                    self.nlp = get_spacy_model(model)
                     logger.info(f"Loaded spaCy model: {model}")
                     break
                 except OSError:
@@ -244,7 +253,7 @@ class EnhancedPassiveChecker:
         issues = []
 
         try:
-            doc = self.nlp(text)
+            doc = parse_doc(self.nlp, text)
         except Exception as e:
             logger.error(f"NLP processing error: {e}")
             return self._check_with_fallback(text)
@@ -21,6 +21,8 @@ import re
 from typing import List, Dict, Tuple, Set, Optional
 from collections import defaultdict
 
+from phrase_matcher import PhraseMatcher, shared_matcher
+
 try:
     from base_checker import BaseChecker
 except ImportError:
@@ -348,11 +350,13 @@ class TerminologyChecker(BaseChecker):
         
         full_text = ' '.join(text for _, text in paragraphs if text)
         
+        # v6.3.3: Every variation located in one pass instead of a regex per form
+        present = shared_matcher('terminology_variations', lambda: PhraseMatcher(
+            var for variations in self.TERM_VARIATIONS for var in variations
+        ), key=type(self)).present(full_text)
+        
         for variations, preferred in self.TERM_VARIATIONS.items():
-            found = []
-            for var in variations:
-                if re.search(r'\b' + re.escape(var) + r'\b', full_text, re.IGNORECASE):
-                    found.append(var)
+            found = [var for var in variations if var in present]
             if len(found) > 1:
                 issues.append(self.create_issue(
                     severity='Low',
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+AEGIS Extraction Cache
+======================
+Skips document extraction for files that were already extracted once.
+
+v6.3.3: Every review used to re-extract the file through Docling, mammoth,
+pymupdf4llm or PDFExtractorV2 — minutes for a dense PDF through Docling —
+even when a SharePoint or folder re-scan handed us the exact same bytes.
+The extraction cache stores the result of that phase (paragraphs, tables,
+headings, page_map, html_preview, ...) keyed by:
+- the SHA-256 of the file content (renamed/re-uploaded copies still hit), and
+- a pipeline signature from the caller: extractor versions and which
+  backends are available. A different signature is a different entry, so
+  upgrading AEGIS or installing Docling re-extracts.
+
+Entries are zlib-compressed JSON in SQLite. Least recently used entries are
+evicted once the payloads exceed the size budget.
+
+Disable with options['extraction_cache'] = False, or globally with
+config.json "performance_settings": {"extraction_cache": false}; the budget
+is "extraction_cache_max_mb" (default 256).
+"""
+
+import hashlib
+import json
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from sqlite_pool import get_pool
+
+__version__ = "1.0.0"
+
+_CACHE_FORMAT = 1
+DEFAULT_CACHE_PATH = Path(__file__).parent / 'data' / 'extraction_cache.db'
+DEFAULT_MAX_MB = 256
+_CONFIG_FILE = Path(__file__).parent / 'config.json'
+_HASH_CHUNK = 1024 * 1024
+
+# Extractor attributes the review pipeline reads, with their empty values
+EXTRACTOR_FIELDS = {
+    'paragraphs': list,
+    'tables': list,
+    'figures': list,
+    'comments': list,
+    'track_changes': list,
+    'headings': list,
+    'hyperlinks': list,
+    'full_text': str,
+    'word_count': int,
+    'has_toc': bool,
+    'sections': dict,
+    'page_map': dict,
+    'page_count': int,
+    'html_preview': str,
+}
+
+try:
+    from config_logging import get_logger
+    _logger = get_logger('extraction_cache')
+except ImportError:
+    _logger = None
+
+
+def _log(message: str, level: str = 'debug', **kwargs):
+    """Internal logging helper."""
+    if _logger:
+        getattr(_logger, level)(message, **kwargs)
+    elif level in ('warning', 'error', 'critical'):
+        print(f"[{level.upper()}] {message}")
+
+
+def _performance_settings() -> Dict[str, Any]:
+    try:
+        if _CONFIG_FILE.exists():
+            with open(_CONFIG_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f).get('performance_settings', {}) or {}
+    except Exception as e:
+        _log(f" Could not read performance settings: {e}")
+    return {}
+
+
+def is_extraction_cache_enabled(options: Optional[Dict] = None) -> bool:
+    """Review option wins over config.json performance_settings.extraction_cache (default on)."""
+    options = options or {}
+    if 'extraction_cache' in options:
+        return bool(options['extraction_cache'])
+    return bool(_performance_settings().get('extraction_cache', True))
+
+
+def file_digest(filepath: str) -> str:
+    """SHA-256 of the file content."""
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(digest: str, signature: str) -> str:
+    """Entry key for file content `digest` extracted by pipeline `signature`."""
+    return hashlib.sha256(f"{_CACHE_FORMAT}\x00{signature}\x00{digest}".encode('utf-8')).hexdigest()
+
+
+class CachedExtraction:
+    """
+    Stand-in for an extractor object rebuilt from a cache entry.
+
+    Exposes the same attributes as DocumentExtractor / PDFExtractorV2, plus
+    what the review recorded alongside: docling_used, pdf_quality_info and
+    clean_full_text.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        for name, empty in EXTRACTOR_FIELDS.items():
+            value = data.get(name)
+            setattr(self, name, empty() if value is None else value)
+        # JSON turns tuples into lists and int keys into strings
+        self.paragraphs = [tuple(p) for p in self.paragraphs]
+        self.page_map = {int(k): v for k, v in self.page_map.items()}
+        self.extractor_name: str = data.get('extractor_name', '')
+        self.docling_used: bool = bool(data.get('docling_used', False))
+        self.pdf_quality_info: Optional[Dict] = data.get('pdf_quality_info')
+        self.clean_full_text: Optional[str] = data.get('clean_full_text')
+        self.has_preview: bool = bool(data.get('has_preview', False))
+        self.from_cache = True
+
+
+def snapshot(extractor: Any, **extra) -> Dict[str, Any]:
+    """Serializable dict of an extractor's results (see CachedExtraction)."""
+    data = {name: getattr(extractor, name, None) for name in EXTRACTOR_FIELDS}
+    data['extractor_name'] = getattr(extractor, 'extractor_name', type(extractor).__name__)
+    data.update(extra)
+    return data
+
+
+# =============================================================================
+# EXTRACTION CACHE
+# =============================================================================
+
+class ExtractionCache:
+    """
+    SQLite store: cache key -> compressed extraction snapshot.
+
+    `max_bytes` bounds the total compressed payload size; the least recently
+    used entries are evicted first.
+    """
+
+    def __init__(self, db_path=DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_MB * 1024 * 1024):
+        self.db_path = str(db_path)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    def _transaction(self):
+        return get_pool(self.db_path).transaction()
+
+    def _init_schema(self):
+        with self._transaction() as (conn, cursor):
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS extraction_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    has_preview INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_extraction_cache_used '
+                           'ON extraction_cache(last_used)')
+
+    def get(self, key: str, need_preview: bool = True) -> Optional[CachedExtraction]:
+        """
+        Cached extraction for `key`, or None.
+
+        need_preview=False (batch mode) also accepts entries stored without
+        html_preview / clean_full_text.
+        """
+        with self._transaction() as (conn, cursor):
+            cursor.execute('SELECT payload, has_preview FROM extraction_cache WHERE cache_key = ?', (key,))
+            row = cursor.fetchone()
+            if row and (row[1] or not need_preview):
+                cursor.execute('UPDATE extraction_cache SET last_used = ? WHERE cache_key = ?',
+                               (time.time(), key))
+        if not row or (need_preview and not row[1]):
+            self.misses += 1
+            return None
+        try:
+            data = json.loads(zlib.decompress(row[0]).decode('utf-8'))
+        except (zlib.error, ValueError) as e:
+            _log(f" Discarding unreadable extraction cache entry: {e}", level='warning')
+            self.delete(key)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return CachedExtraction(data)
+
+    def put(self, key: str, extractor: Any, has_preview: bool = True, **extra) -> bool:
+        """
+        Store `extractor`'s results under `key`. `extra` (docling_used,
+        pdf_quality_info, clean_full_text) is stored alongside.
+        Returns False if the entry alone exceeds the size budget.
+        """
+        data = snapshot(extractor, has_preview=bool(has_preview), **extra)
+        payload = zlib.compress(json.dumps(data, default=str, separators=(',', ':')).encode('utf-8'))
+        if len(payload) > self.max_bytes:
+            _log(f" Extraction too large to cache ({len(payload)} bytes)")
+            return False
+        now = time.time()
+        with self._transaction() as (conn, cursor):
+            cursor.execute('INSERT OR REPLACE INTO extraction_cache '
+                           '(cache_key, payload, size, has_preview, created_at, last_used) '
+                           'VALUES (?, ?, ?, ?, ?, ?)',
+                           (key, payload, len(payload), int(bool(has_preview)), now, now))
+            self._evict(cursor)
+        return True
+
+    def _evict(self, cursor):
+        """Drop least recently used entries until the payloads fit max_bytes."""
+        cursor.execute('SELECT COALESCE(SUM(size), 0) FROM extraction_cache')
+        excess = cursor.fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        cursor.execute('SELECT cache_key, size FROM extraction_cache ORDER BY last_used')
+        doomed = []
+        for key, size in cursor.fetchall():
+            if excess <= 0:
+                break
+            doomed.append((key,))
+            excess -= size
+        cursor.executemany('DELETE FROM extraction_cache WHERE cache_key = ?', doomed)
+        _log(f" Extraction cache evicted {len(doomed)} entries")
+
+    def delete(self, key: str):
+        with self._transaction() as (conn, cursor):
+            cursor.execute('DELETE FROM extraction_cache WHERE cache_key = ?', (key,))
+
+    def clear(self):
+        with self._transaction() as (conn, cursor):
+            cursor.execute('DELETE FROM extraction_cache')
+
+    def stats(self) -> Dict[str, Any]:
+        with self._transaction() as (conn, cursor):
+            cursor.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM extraction_cache')
+            entries, size = cursor.fetchone()
+        return {'entries': entries, 'bytes': size, 'max_bytes': self.max_bytes,
+                'hits': self.hits, 'misses': self.misses}
+
+
+_caches: Dict[str, ExtractionCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_extraction_cache(db_path=DEFAULT_CACHE_PATH) -> ExtractionCache:
+    """Process-wide cache instance for `db_path`, sized from performance_settings."""
+    key = str(Path(db_path).resolve())
+    with _caches_lock:
+        if key not in _caches:
+            try:
+                max_mb = float(_performance_settings().get('extraction_cache_max_mb', DEFAULT_MAX_MB))
+            except (TypeError, ValueError):
+                max_mb = DEFAULT_MAX_MB
+            _caches[key] = ExtractionCache(db_path, max_bytes=int(max_mb * 1024 * 1024))
+        return _caches[key]
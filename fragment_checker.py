@@ -25,6 +25,16 @@ from typing import List, Dict, Any, Optional, Set
 from dataclasses import dataclass
 import logging
 
+try:
+    from nlp_utils import get_spacy_model
+except ImportError:
+    def get_spacy_model(name='en_core_web_sm'):
+        """Fallback if nlp_utils not available."""
+        import spacy
+        return spacy.load(name)
+
+from nlp_doc_store import parse as parse_doc
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -163,10 +173,9 @@ class FragmentChecker:
             return
 
         try:
-            import spacy
             for model in ['en_core_web_trf', 'en_core_web_lg', 'en_core_web_md', 'en_core_web_sm']:
                 try:
-                    self.nlp = spacy.load(model)
+                    self.nlp = get_spacy_model(model)
                     logger.info(f"Loaded spaCy model: {model}")
                     break
                 except OSError:
@@ -200,7 +209,7 @@ class FragmentChecker:
         issues = []
 
         try:
-            doc = self.nlp(text)
+            doc = parse_doc(self.nlp, text)
         except Exception as e:
             logger.error(f"NLP processing error: {e}")
             return self._check_with_fallback(text)
@@ -21,6 +21,8 @@ class PassiveVoiceChecker(BaseChecker):
     
     CHECKER_NAME = "Passive Voice"
     CHECKER_VERSION = "2.1.0"  # v2.1.0: Added provenance tracking
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
     
     # BUG-C01 FIX: Significantly expanded false positives list to reduce over-matching
     # Words that are often false positives (adjectives/past participles used as adjectives)
@@ -190,6 +192,8 @@ class ContractionsChecker(BaseChecker):
     
     CHECKER_NAME = "Contractions"
     CHECKER_VERSION = "2.1.0"  # v2.1.0: Added provenance tracking
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
     
     CONTRACTIONS = {
         "don't": "do not",
@@ -290,6 +294,8 @@ class RepeatedWordsChecker(BaseChecker):
     
     CHECKER_NAME = "Repeated Words"
     CHECKER_VERSION = "2.1.0"  # v2.1.0: Added provenance tracking
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
     
     # Words that can legitimately be repeated
     ALLOWED_REPEATS = {'that', 'had', 'very', 'really'}
@@ -342,6 +348,8 @@ class CapitalizationChecker(BaseChecker):
     
     CHECKER_NAME = "Capitalization"
     CHECKER_VERSION = "2.1.0"  # v2.1.0: Added provenance tracking for consistency
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
     
     def __init__(self, enabled: bool = True):
         super().__init__(enabled)
@@ -25,6 +25,8 @@ from xml.etree import ElementTree as ET
 from urllib.parse import urlparse, unquote
 import email.utils
 
+from docx_package import open_package
+
 try:
     from base_checker import BaseChecker
 except ImportError:
@@ -150,7 +152,7 @@ class HyperlinkChecker(BaseChecker):
         # Extract hyperlinks from DOCX if filepath provided
         docx_hyperlinks = []
         if filepath and os.path.exists(filepath):
-            docx_hyperlinks = self._extract_docx_hyperlinks(filepath)
+            docx_hyperlinks = self._extract_docx_hyperlinks(filepath, kwargs.get('docx_package'))
         
         # Also use any pre-extracted hyperlinks
         pre_extracted = kwargs.get('hyperlinks', [])
@@ -230,40 +232,31 @@ class HyperlinkChecker(BaseChecker):
                 if isinstance(f, dict) and 'number' in f:
                     self._figures.add(str(f['number']))
     
-    def _extract_docx_hyperlinks(self, filepath: str) -> List[Dict]:
-        """Extract all hyperlinks from a DOCX file."""
+    def _extract_docx_hyperlinks(self, filepath: str, package=None) -> List[Dict]:
+        """Extract all hyperlinks from a DOCX file (v6.3.3: via the shared DocxPackage)."""
         hyperlinks = []
         
         try:
-            with zipfile.ZipFile(filepath, 'r') as zf:
-                # Get relationships for hyperlink targets
-                rels = {}
-                if 'word/_rels/document.xml.rels' in zf.namelist():
-                    with zf.open('word/_rels/document.xml.rels') as f:
-                        rels_tree = ET.parse(f)
-                        for rel in rels_tree.findall('.//{%s}Relationship' % NAMESPACES['rel']):
-                            rel_id = rel.get('Id', '')
-                            target = rel.get('Target', '')
-                            rel_type = rel.get('Type', '')
-                            if 'hyperlink' in rel_type.lower():
-                                rels[rel_id] = target
+            with open_package(filepath, package) as pkg:
+                if pkg is None:
+                    return hyperlinks
+                # Relationships for hyperlink targets
+                rels = pkg.hyperlink_targets()
                 
                 # Parse document.xml for hyperlinks
-                if 'word/document.xml' in zf.namelist():
-                    with zf.open('word/document.xml') as f:
-                        doc_tree = ET.parse(f)
-                        
-                        # Find all hyperlink elements
-                        for hyperlink in doc_tree.iter('{%s}hyperlink' % NAMESPACES['w']):
-                            link_info = self._parse_hyperlink_element(hyperlink, rels)
-                            if link_info:
-                                hyperlinks.append(link_info)
-                        
-                        # Also extract bookmarks for internal link validation
-                        for bookmark in doc_tree.iter('{%s}bookmarkStart' % NAMESPACES['w']):
-                            name = bookmark.get('{%s}name' % NAMESPACES['w'], '')
-                            if name and not name.startswith('_'):
-                                self._bookmarks.add(name)
+                doc_tree = pkg.document_tree
+                if doc_tree is not None:
+                    # Find all hyperlink elements
+                    for hyperlink in doc_tree.iter('{%s}hyperlink' % NAMESPACES['w']):
+                        link_info = self._parse_hyperlink_element(hyperlink, rels)
+                        if link_info:
+                            hyperlinks.append(link_info)
+                    
+                    # Also extract bookmarks for internal link validation
+                    for bookmark in doc_tree.iter('{%s}bookmarkStart' % NAMESPACES['w']):
+                        name = bookmark.get('{%s}name' % NAMESPACES['w'], '')
+                        if name and not name.startswith('_'):
+                            self._bookmarks.add(name)
                 
         except Exception as e:
             self._errors.append(f"Error extracting hyperlinks: {e}")
@@ -47,6 +47,7 @@ from .models import (
     validate_cross_reference,
     validate_internal_bookmark,
     categorize_domain,
+    normalize_url,
     parse_url_list
 )
 
@@ -133,6 +134,7 @@ __all__ = [
     'validate_cross_reference',
     'validate_internal_bookmark',
     'categorize_domain',
+    'normalize_url',
     'parse_url_list',
     # Validator
     'StandaloneHyperlinkValidator',
@@ -0,0 +1,317 @@
+"""
+Domain-Aware Work Scheduler
+===========================
+Hands URLs to validation workers so that every worker stays busy on a
+different host instead of queueing behind a per-domain semaphore.
+
+v6.3.3: Replaces submit-everything-then-block batching. A 6,000-URL run
+dominated by a few large hosts used to park most pool threads inside the
+domain rate limiter while other hosts sat idle. The scheduler keeps:
+
+- a FIFO queue per host,
+- a token bucket per host (steady rate + small burst),
+- a cap on in-flight requests per host,
+- a round-robin ring of hosts that still have work,
+- adaptive backoff: a 429/503 pauses the host (Retry-After when the server
+  sends one, exponential otherwise), halves its request rate, and puts the
+  URL back on the host queue to be retried after the pause. Successful
+  responses restore the rate gradually.
+
+Workers call next_url() / complete() in a loop; next_url() blocks on a
+condition variable (never sleeping while holding the lock) until some host
+is eligible, and returns None once every URL has finished.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+
+# Defaults match the previous _DomainRateLimiter(max_per_domain=3, delay_between=0.2)
+DEFAULT_MAX_PER_HOST = 3
+DEFAULT_RATE_PER_HOST = 5.0
+BACKOFF_STATUS_CODES = (429, 503)
+BASE_BACKOFF_SECONDS = 2.0
+MAX_BACKOFF_SECONDS = 60.0
+MAX_REQUEUES = 2
+MIN_RATE_PER_HOST = 0.2
+
+
+def host_key(url: str) -> str:
+    """Scheduling key for a URL: lower-cased host name without port."""
+    try:
+        netloc = urlparse(url).netloc.lower()
+    except ValueError:
+        netloc = ''
+    netloc = netloc.rsplit('@', 1)[-1]
+    if netloc.startswith('['):
+        return netloc.split(']')[0] + ']'
+    return netloc.split(':')[0] or url[:50]
+
+
+def parse_retry_after(value) -> Optional[float]:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date), or None."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        from email.utils import parsedate_to_datetime
+        from datetime import datetime, timezone
+        when = parsedate_to_datetime(value)
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError, IndexError):
+        return None
+
+
+class TokenBucket:
+    """Classic token bucket. Not thread-safe; DomainScheduler holds its lock."""
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.updated = now
+
+    def _refill(self, now: float):
+        if now > self.updated:
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until one token is available (0 if available now)."""
+        self._refill(now)
+        if self.tokens >= 1.0:
+            return 0.0
+        return (1.0 - self.tokens) / self.rate
+
+    def take(self, now: float):
+        self._refill(now)
+        self.tokens -= 1.0
+
+
+class _HostState:
+    """Queue, limits and counters for one host."""
+
+    __slots__ = ('queue', 'bucket', 'base_rate', 'in_flight', 'in_ring', 'backoff_until',
+                 'backoff_level', 'completed', 'throttled', 'first_dispatch', 'last_complete')
+
+    def __init__(self, rate: float, burst: float, now: float):
+        self.queue: Deque[str] = deque()
+        self.bucket = TokenBucket(rate, burst, now)
+        self.base_rate = rate
+        self.in_flight = 0
+        self.in_ring = False
+        self.backoff_until = 0.0
+        self.backoff_level = 0
+        self.completed = 0
+        self.throttled = 0
+        self.first_dispatch: Optional[float] = None
+        self.last_complete: Optional[float] = None
+
+
+class DomainScheduler:
+    """
+    Thread-safe per-host work queue for URL validation workers.
+
+    Usage:
+        scheduler = DomainScheduler(unique_urls)
+        # in each worker thread:
+        while (url := scheduler.next_url()) is not None:
+            result = validate(url)
+            if scheduler.complete(url, result.status_code, result.retry_after):
+                continue  # requeued after backoff, result superseded
+            report(result)
+    """
+
+    def __init__(self, urls: Iterable[str],
+                 max_per_host: int = DEFAULT_MAX_PER_HOST,
+                 rate_per_host: float = DEFAULT_RATE_PER_HOST,
+                 burst: Optional[float] = None,
+                 max_requeues: int = MAX_REQUEUES,
+                 base_backoff: float = BASE_BACKOFF_SECONDS,
+                 max_backoff: float = MAX_BACKOFF_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_per_host = max(1, int(max_per_host))
+        self.rate_per_host = max(MIN_RATE_PER_HOST, float(rate_per_host))
+        self.burst = float(burst) if burst is not None else float(self.max_per_host)
+        self.max_requeues = max_requeues
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._hosts: Dict[str, _HostState] = {}
+        self._ring: Deque[str] = deque()
+        self._requeues: Dict[str, int] = {}
+        self._url_hosts: Dict[str, str] = {}
+        self._outstanding = 0
+        self._closed = False
+
+        now = clock()
+        for url in urls:
+            host = host_key(url)
+            state = self._hosts.get(host)
+            if state is None:
+                state = self._hosts[host] = _HostState(self.rate_per_host, self.burst, now)
+            state.queue.append(url)
+            self._url_hosts[url] = host
+            self._outstanding += 1
+            if not state.in_ring:
+                state.in_ring = True
+                self._ring.append(host)
+
+    # -----------------------------------------------------------------
+    # Worker API
+    # -----------------------------------------------------------------
+
+    def next_url(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Next URL whose host is under its in-flight cap, has a token and is
+        not backing off. Blocks until one is eligible; returns None when all
+        URLs have completed, the scheduler is closed, or `timeout` expires.
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            while True:
+                if self._closed or self._outstanding == 0:
+                    return None
+                now = self._clock()
+                url, wait = self._pick(now)
+                if url is not None:
+                    return url
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        return None
+                    wait = remaining if wait is None else min(wait, remaining)
+                # wait is None: every eligible host is at its in-flight cap,
+                # so only a complete() (which notifies) can free a slot.
+                self._cond.wait(wait)
+
+    def try_next(self) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Non-blocking next_url() for event-loop callers. Returns (url, None),
+        or (None, seconds until a host may become eligible by time alone),
+        or (None, None) if only a complete() can free work (or none is left).
+        """
+        with self._cond:
+            if self._closed or self._outstanding == 0:
+                return None, None
+            return self._pick(self._clock())
+
+    def complete(self, url: str, status_code: Optional[int] = None,
+                 retry_after: Optional[float] = None) -> bool:
+        """
+        Record that a dispatched URL finished. Returns True if the URL was
+        put back on its host queue (429/503 backoff) and will be handed out
+        again, in which case the caller should discard this result.
+        """
+        with self._cond:
+            now = self._clock()
+            host = self._url_hosts.get(url) or host_key(url)
+            state = self._hosts[host]
+            state.in_flight = max(0, state.in_flight - 1)
+            requeued = False
+
+            if status_code in BACKOFF_STATUS_CODES:
+                state.throttled += 1
+                state.backoff_level += 1
+                delay = retry_after if retry_after is not None else \
+                    self.base_backoff * (2 ** (state.backoff_level - 1))
+                state.backoff_until = max(state.backoff_until, now + min(delay, self.max_backoff))
+                state.bucket.rate = max(MIN_RATE_PER_HOST, state.bucket.rate / 2)
+                state.bucket.tokens = min(state.bucket.tokens, 0.0)
+                if self._requeues.get(url, 0) < self.max_requeues:
+                    self._requeues[url] = self._requeues.get(url, 0) + 1
+                    state.queue.append(url)
+                    if not state.in_ring:
+                        state.in_ring = True
+                        self._ring.append(host)
+                    requeued = True
+            elif status_code is not None and status_code < 500:
+                # Additive recovery toward the configured rate
+                state.backoff_level = max(0, state.backoff_level - 1)
+                state.bucket.rate = min(state.base_rate, state.bucket.rate + state.base_rate / 10)
+
+            if not requeued:
+                self._outstanding -= 1
+                state.completed += 1
+                state.last_complete = now
+            self._cond.notify_all()
+            return requeued
+
+    def close(self):
+        """Stop handing out work; blocked next_url() calls return None."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    # -----------------------------------------------------------------
+    # Introspection
+    # -----------------------------------------------------------------
+
+    @property
+    def outstanding(self) -> int:
+        """URLs queued or in flight."""
+        with self._cond:
+            return self._outstanding
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Per-host throughput and queue state for live progress reporting."""
+        with self._cond:
+            now = self._clock()
+            snap = {}
+            for host, state in self._hosts.items():
+                elapsed = None
+                if state.first_dispatch is not None:
+                    end = now if (state.queue or state.in_flight) else (state.last_complete or now)
+                    elapsed = end - state.first_dispatch
+                snap[host] = {
+                    'queued': len(state.queue),
+                    'in_flight': state.in_flight,
+                    'completed': state.completed,
+                    'throttled': state.throttled,
+                    'urls_per_second': round(state.completed / elapsed, 2) if elapsed else 0.0,
+                    'rate_limit': round(state.bucket.rate, 2),
+                    'backoff_remaining': round(max(0.0, state.backoff_until - now), 1),
+                }
+            return snap
+
+    # -----------------------------------------------------------------
+    # Internal
+    # -----------------------------------------------------------------
+
+    def _pick(self, now: float) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Round-robin over hosts with queued work. Returns (url, None) on
+        success, else (None, seconds until the earliest host could become
+        eligible by time alone, or None if only a completion can help).
+        """
+        soonest: Optional[float] = None
+        for _ in range(len(self._ring)):
+            host = self._ring[0]
+            state = self._hosts[host]
+            if not state.queue:
+                self._ring.popleft()
+                state.in_ring = False
+                continue
+            self._ring.rotate(-1)
+            if state.in_flight >= self.max_per_host:
+                continue
+            wait = max(state.backoff_until - now, state.bucket.wait_time(now))
+            if wait > 0:
+                soonest = wait if soonest is None else min(soonest, wait)
+                continue
+            state.bucket.take(now)
+            state.in_flight += 1
+            if state.first_dispatch is None:
+                state.first_dispatch = now
+            return state.queue.popleft(), None
+        return None, soonest
+
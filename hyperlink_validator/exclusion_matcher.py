@@ -0,0 +1,177 @@
+"""
+Compiled Exclusion Matcher
+==========================
+Matches a URL against any number of exclusion rules in time proportional to
+the URL length rather than the number of rules.
+
+v6.3.3: Exclusion checks used to try every rule per URL (and recompile regex
+rules on every call). CompiledExclusions builds one index per rule set:
+
+- exact:    hash lookup on the folded URL (plus the trailing-slash and
+            http/https variants ExclusionRule.matches() accepts)
+- prefix:   character trie walked along the URL
+- suffix:   character trie over reversed patterns, walked along the reversed URL
+- contains: Aho-Corasick automaton, one pass over the URL
+- regex:    one combined alternation used as a filter; only when it hits are
+            the individual patterns consulted to find the winning rule
+
+The first matching rule in the original rule order wins, exactly as with
+the linear scan it replaces.
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from phrase_matcher import AhoCorasick
+
+_BACKREF = re.compile(r'\\[1-9]|\(\?P=')
+
+
+class _Trie:
+    """Character trie; walk() returns ids of every pattern that prefixes the text."""
+
+    def __init__(self):
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+
+    def add(self, text: str, pattern_id: int):
+        node = self._root
+        for ch in text:
+            node = node.setdefault(ch, {})
+        node.setdefault(None, []).append(pattern_id)
+        self._size += 1
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def walk(self, text: str) -> List[int]:
+        found = list(self._root.get(None, ()))
+        node = self._root
+        for ch in text:
+            node = node.get(ch)
+            if node is None:
+                break
+            found.extend(node.get(None, ()))
+        return found
+
+
+class CompiledExclusions:
+    """
+    Index over a sequence of exclusion rules (anything with .pattern and
+    .match_type: ExclusionRule, StoredExclusion).
+
+    Default semantics are ExclusionRule.matches(): case-insensitive, exact
+    rules also match trailing-slash and http/https variants. With
+    storage_semantics=True they follow HyperlinkValidatorStorage's original
+    _matches_pattern(): case-sensitive literal rules, plain exact equality,
+    and suffix rules that also match anywhere in the URL.
+    """
+
+    def __init__(self, rules: Sequence[Any], storage_semantics: bool = False):
+        self.rules = list(rules)
+        self.storage_semantics = storage_semantics
+        self._exact: Dict[str, int] = {}
+        self._prefix = _Trie()
+        self._suffix = _Trie()
+        contains: List[Tuple[str, int]] = []
+        regexes: List[Tuple[int, str]] = []
+
+        for priority, rule in enumerate(self.rules):
+            pattern = getattr(rule, 'pattern', '') or ''
+            match_type = getattr(rule, 'match_type', 'contains')
+            if match_type == 'regex':
+                regexes.append((priority, pattern))
+                continue
+            text = self._fold(pattern)
+            if match_type == 'exact':
+                key = text if storage_semantics else text.rstrip('/')
+                self._exact.setdefault(key, priority)
+            elif match_type == 'prefix':
+                self._prefix.add(text, priority)
+            elif match_type == 'suffix' and not storage_semantics:
+                self._suffix.add(text[::-1], priority)
+            elif match_type in ('contains', 'suffix'):
+                if text:
+                    contains.append((text, priority))
+                else:
+                    # '' is contained in every URL
+                    self._suffix.add('', priority)
+
+        self._contains = AhoCorasick(contains)
+        self._regexes: List[Tuple[int, 're.Pattern']] = []
+        combinable = []
+        for priority, pattern in regexes:
+            try:
+                compiled = re.compile(pattern, re.IGNORECASE)
+            except re.error:
+                continue  # invalid patterns never match
+            self._regexes.append((priority, compiled))
+            if not _BACKREF.search(pattern):
+                combinable.append(pattern)
+        self._regex_filter = None
+        if combinable and len(combinable) == len(self._regexes):
+            try:
+                self._regex_filter = re.compile('|'.join(f'(?:{p})' for p in combinable), re.IGNORECASE)
+            except re.error:
+                self._regex_filter = None
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def __bool__(self) -> bool:
+        return bool(self.rules)
+
+    def __iter__(self):
+        return iter(self.rules)
+
+    def _fold(self, text: str) -> str:
+        return text if self.storage_semantics else text.lower().strip()
+
+    def match(self, url: str) -> Optional[Any]:
+        """First rule (in original order) that matches `url`, or None."""
+        if not self.rules:
+            return None
+        best = len(self.rules)
+        folded = self._fold(url)
+
+        if self._exact:
+            if self.storage_semantics:
+                keys = (folded,)
+            else:
+                norm = folded.rstrip('/')
+                keys = [norm]
+                if norm.startswith('http://'):
+                    keys.append(norm.replace('http://', 'https://'))
+                elif norm.startswith('https://'):
+                    keys.append(norm.replace('https://', 'http://'))
+            for key in keys:
+                priority = self._exact.get(key)
+                if priority is not None and priority < best:
+                    best = priority
+        if self._prefix:
+            best = min([best] + self._prefix.walk(folded))
+        if self._suffix:
+            best = min([best] + self._suffix.walk(folded[::-1]))
+        if self._contains:
+            best = min({best} | self._contains.find(folded))
+        if self._regexes and (self._regex_filter is None or self._regex_filter.search(url)):
+            for priority, compiled in self._regexes:
+                if priority >= best:
+                    break
+                if compiled.search(url):
+                    best = priority
+                    break
+
+        return self.rules[best] if best < len(self.rules) else None
+
+
+def first_matching_exclusion(exclusions: Any, url: str) -> Optional[Any]:
+    """Match via a CompiledExclusions index, or a linear scan of rule objects."""
+    if not exclusions:
+        return None
+    if isinstance(exclusions, CompiledExclusions):
+        return exclusions.match(url)
+    for exc in exclusions:
+        if exc.matches(url):
+            return exc
+    return None
@@ -13,6 +13,10 @@ Exclusion Handling:
 Highlighted Export (v3.0.110):
 - export_highlighted_docx: Creates DOCX with broken links highlighted in red
 - export_highlighted_excel: Creates Excel with rows containing broken links in red
+
+v6.3.3: All highlighted exports share one ResultIndex (normalized URL ->
+result, plus a substring automaton over broken URLs), so matching cost is
+linear in the document size instead of cells x results.
 """
 
 import csv
@@ -23,11 +27,15 @@ import re
 import zipfile
 import copy
 import html as html_lib  # For HTML escaping
+import logging
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import List, Optional, Any, Dict, Set, Tuple
 
-from .models import ValidationResult, ValidationSummary, ValidationRun
+from .models import ValidationResult, ValidationSummary, ValidationRun, normalize_url
+from .exclusion_matcher import AhoCorasick
+
+logger = logging.getLogger(__name__)
 
 # Check for python-docx availability
 try:
@@ -589,12 +597,70 @@ def _get_broken_urls(results: List[ValidationResult]) -> Set[str]:
     return broken_urls
 
 
-def _get_result_for_url(url: str, results: List[ValidationResult]) -> Optional[ValidationResult]:
-    """Get the validation result for a specific URL."""
-    for result in results:
-        if result.url == url or result.url.rstrip('/') == url.rstrip('/'):
-            return result
-    return None
+def _url_key(url: str) -> str:
+    """Lookup key for a URL: normalize_url() with http and https folded together."""
+    key = normalize_url(url)
+    if key.startswith('https://'):
+        return 'http://' + key[len('https://'):]
+    return key
+
+
+class ResultIndex:
+    """
+    URL -> ValidationResult index shared by the highlighted exports.
+
+    Lookups use a normalized key (case of scheme/host, default port,
+    fragment, trailing slash and http/https are ignored), so each one is a
+    single hash probe. broken_url_in_text() finds any broken URL embedded in
+    a cell or run of text with one Aho-Corasick pass over that text.
+    The first result for a URL wins when the list has duplicates.
+    """
+
+    def __init__(self, results: List[ValidationResult]):
+        self._results: Dict[str, ValidationResult] = {}
+        for result in results:
+            self._results.setdefault(_url_key(result.url), result)
+        self._display: Dict[str, ValidationResult] = {}
+        self.broken_urls = _get_broken_urls(results)
+        self._broken_list = sorted(self.broken_urls)
+        self._broken_matcher: Optional[AhoCorasick] = None
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    def get(self, url: str) -> Optional[ValidationResult]:
+        """Validation result for url, or None."""
+        if not url:
+            return None
+        return self._results.get(_url_key(url))
+
+    def get_display(self, url: str) -> Optional[ValidationResult]:
+        """Like get(), with exclusion display rules applied (see _apply_exclusion_display)."""
+        if not url:
+            return None
+        key = _url_key(url)
+        if key not in self._display:
+            result = self._results.get(key)
+            self._display[key] = _apply_exclusion_display(result) if result else None
+        return self._display[key]
+
+    def is_broken(self, url: str) -> bool:
+        """True if url (in any normalized form) failed validation."""
+        if not url:
+            return False
+        if url in self.broken_urls or url.rstrip('/') in self.broken_urls:
+            return True
+        result = self.get(url)
+        return result is not None and result.url in self.broken_urls
+
+    def broken_url_in_text(self, text: str) -> Optional[str]:
+        """A broken URL that occurs as a substring of text, or None."""
+        if not text or not self._broken_list:
+            return None
+        if self._broken_matcher is None:
+            self._broken_matcher = AhoCorasick((url, i) for i, url in enumerate(self._broken_list))
+        found = self._broken_matcher.find(text)
+        return self._broken_list[min(found)] if found else None
 
 
 def export_highlighted_docx(
@@ -625,9 +691,9 @@ def export_highlighted_docx(
     if not os.path.exists(source_path):
         return False, f"Source file not found: {source_path}", b''
 
-    broken_urls = _get_broken_urls(results)
+    index = ResultIndex(results)
 
-    if not broken_urls:
+    if not index.broken_urls:
         return False, "No broken links found to highlight.", b''
 
     try:
@@ -637,25 +703,25 @@ def export_highlighted_docx(
 
         # Process all paragraphs
         for para in doc.paragraphs:
-            highlighted_count += _highlight_broken_links_in_paragraph(para, broken_urls, results)
+            highlighted_count += _highlight_broken_links_in_paragraph(para, index)
 
         # Process tables
         for table in doc.tables:
             for row in table.rows:
                 for cell in row.cells:
                     for para in cell.paragraphs:
-                        highlighted_count += _highlight_broken_links_in_paragraph(para, broken_urls, results)
+                        highlighted_count += _highlight_broken_links_in_paragraph(para, index)
 
         # Process headers and footers
         for section in doc.sections:
             for header in [section.header, section.first_page_header, section.even_page_header]:
                 if header:
                     for para in header.paragraphs:
-                        highlighted_count += _highlight_broken_links_in_paragraph(para, broken_urls, results)
+                        highlighted_count += _highlight_broken_links_in_paragraph(para, index)
             for footer in [section.footer, section.first_page_footer, section.even_page_footer]:
                 if footer:
                     for para in footer.paragraphs:
-                        highlighted_count += _highlight_broken_links_in_paragraph(para, broken_urls, results)
+                        highlighted_count += _highlight_broken_links_in_paragraph(para, index)
 
         # Save to bytes buffer
         buffer = io.BytesIO()
@@ -674,11 +740,7 @@ def export_highlighted_docx(
         return False, f"Error processing DOCX: {str(e)}", b''
 
 
-def _highlight_broken_links_in_paragraph(
-    para,
-    broken_urls: Set[str],
-    results: List[ValidationResult]
-) -> int:
+def _highlight_broken_links_in_paragraph(para, index: ResultIndex) -> int:
     """
     Highlight broken hyperlinks in a paragraph.
 
@@ -708,7 +770,7 @@ def _highlight_broken_links_in_paragraph(
                         url = rel.target_ref if hasattr(rel, 'target_ref') else str(rel._target)
 
                         # Check if this URL is broken
-                        if url in broken_urls or url.rstrip('/') in broken_urls:
+                        if index.is_broken(url):
                             # Highlight all runs within this hyperlink
                             runs = hyperlink.findall('.//{http://schemas.openxmlformats.org/wordprocessingml/2006/main}r')
                             for run in runs:
@@ -720,12 +782,9 @@ def _highlight_broken_links_in_paragraph(
 
         # Also check for URLs in plain text (not hyperlinked)
         for run in para.runs:
-            if run.text:
-                for url in broken_urls:
-                    if url in run.text:
-                        _apply_broken_link_formatting_to_run(run)
-                        highlighted += 1
-                        break
+            if run.text and index.broken_url_in_text(run.text):
+                _apply_broken_link_formatting_to_run(run)
+                highlighted += 1
 
     except Exception:
         pass
@@ -801,9 +860,9 @@ def export_highlighted_excel(
     if not os.path.exists(source_path):
         return False, f"Source file not found: {source_path}", b''
 
-    broken_urls = _get_broken_urls(results)
+    index = ResultIndex(results)
 
-    if not broken_urls:
+    if not index.broken_urls:
         return False, "No broken links found to highlight.", b''
 
     try:
@@ -837,16 +896,17 @@ def export_highlighted_excel(
                         cell_value = str(cell.value) if cell.value else ''
 
                         # Check if cell contains a broken URL
-                        for url in broken_urls:
-                            if url in cell_value or cell_value in broken_urls:
+                        if cell_value:
+                            url = cell_value if index.is_broken(cell_value) else \
+                                index.broken_url_in_text(cell_value)
+                            if url:
                                 row_has_broken_link = True
                                 broken_cells.append((cell, url))
-                                break
 
                         # Also check hyperlink target
                         if cell.hyperlink and cell.hyperlink.target:
                             target = cell.hyperlink.target
-                            if target in broken_urls or target.rstrip('/') in broken_urls:
+                            if index.is_broken(target):
                                 row_has_broken_link = True
                                 broken_cells.append((cell, target))
 
@@ -864,7 +924,7 @@ def export_highlighted_excel(
                         cell.font = red_font
 
                         # Add comment with error details
-                        result = _get_result_for_url(url, results)
+                        result = index.get(url)
                         if result:
                             comment_text = f"BROKEN LINK\nStatus: {result.status}\nMessage: {result.message}"
                             if result.status_code:
@@ -984,26 +1044,6 @@ _STATUS_CATEGORY = {
 }
 
 
-def _build_url_status_map(results: List[ValidationResult]) -> Dict[str, ValidationResult]:
-    """
-    Build a map of URL → ValidationResult for quick lookup.
-    Includes normalized variants (no trailing slash, http/https swap).
-    """
-    url_map = {}
-    for result in results:
-        # Apply exclusion display rules
-        display_result = _apply_exclusion_display(result)
-        url = display_result.url
-        url_map[url] = display_result
-        url_map[url.rstrip('/')] = display_result
-        # Add protocol-swapped variant
-        if url.startswith('http://'):
-            url_map[url.replace('http://', 'https://')] = display_result
-        elif url.startswith('https://'):
-            url_map[url.replace('https://', 'http://')] = display_result
-    return url_map
-
-
 def export_highlighted_excel_multicolor(
     source_path: str,
     results: List[ValidationResult],
@@ -1047,8 +1087,8 @@ def export_highlighted_excel_multicolor(
         # Load workbook
         wb = load_workbook(source_path)
 
-        # Build URL → result lookup map
-        url_status_map = _build_url_status_map(results)
+        # Build URL → result lookup index
+        index = ResultIndex(results)
 
         # Pre-create PatternFill and Font objects for each status
         status_fills = {}
@@ -1152,8 +1192,7 @@ def export_highlighted_excel_multicolor(
                 # Strategy 2 — Look up by sheet-level hyperlink → URL map
                 if not row_result and row_idx in sheet_hl_map:
                     hl_url = sheet_hl_map[row_idx]
-                    row_result = url_status_map.get(hl_url) or \
-                                 url_status_map.get(hl_url.rstrip('/'))
+                    row_result = index.get_display(hl_url)
                     if row_result:
                         row_url = hl_url
 
@@ -1165,16 +1204,14 @@ def export_highlighted_excel_multicolor(
 
                         if cell_value and ('http://' in cell_value.lower() or 'https://' in cell_value.lower()):
                             row_url = cell_value
-                            row_result = url_status_map.get(cell_value) or \
-                                         url_status_map.get(cell_value.rstrip('/'))
+                            row_result = index.get_display(cell_value)
                             if row_result:
                                 break
 
                         # Also check hyperlink target
                         if cell.hyperlink and cell.hyperlink.target:
                             target = cell.hyperlink.target
-                            row_result = url_status_map.get(target) or \
-                                         url_status_map.get(target.rstrip('/'))
+                            row_result = index.get_display(target)
                             if row_result:
                                 row_url = target
                                 break
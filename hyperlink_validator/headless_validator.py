@@ -17,6 +17,10 @@ Features:
 - v5.9.44: Auth-server-allowlist flags for automatic Windows SSO passthrough
 - v5.9.44: Login page detection heuristics (ADFS, Azure AD, SAML)
 - v5.9.44: Soft 404 detection within headless browser results
+- v6.3.3: Persistent BrowserPool — one warm browser per process with reusable,
+          per-domain authenticated contexts (health-checked, recycled after a
+          request/age limit), so repeated deep validations skip browser
+          launch and SSO negotiation
 
 Requirements:
     pip install playwright
@@ -30,11 +34,13 @@ Usage:
         results = validator.validate_urls(failed_urls)
 """
 
+import asyncio
+import atexit
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from urllib.parse import urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 import threading
 import time
 
@@ -44,11 +50,15 @@ logger = logging.getLogger(__name__)
 PLAYWRIGHT_AVAILABLE = False
 try:
     from playwright.sync_api import sync_playwright, Browser, Page, Error as PlaywrightError
+    from playwright.async_api import async_playwright
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     logger.info("Playwright not installed. Headless browser validation unavailable.")
     logger.info("Install with: pip install playwright && playwright install chromium")
 
+    class PlaywrightError(Exception):
+        """Placeholder so error handling below works without Playwright."""
+
 
 def is_playwright_available() -> bool:
     """Check if Playwright is installed and available."""
@@ -178,6 +188,192 @@ def _is_soft_404(title: str, content: str) -> bool:
     return False
 
 
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
+)
+
+# Inject stealth scripts to hide automation
+# This removes the navigator.webdriver flag and other detection vectors
+STEALTH_INIT_SCRIPT = """
+    // Remove webdriver flag
+    Object.defineProperty(navigator, 'webdriver', {
+        get: () => undefined
+    });
+
+    // Mock plugins
+    Object.defineProperty(navigator, 'plugins', {
+        get: () => [
+            { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' },
+            { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
+            { name: 'Native Client', filename: 'internal-nacl-plugin' }
+        ]
+    });
+
+    // Mock languages
+    Object.defineProperty(navigator, 'languages', {
+        get: () => ['en-US', 'en']
+    });
+
+    // Mock permissions
+    const originalQuery = window.navigator.permissions.query;
+    window.navigator.permissions.query = (parameters) => (
+        parameters.name === 'notifications' ?
+            Promise.resolve({ state: Notification.permission }) :
+            originalQuery(parameters)
+    );
+
+    // Add chrome object
+    window.chrome = {
+        runtime: {},
+        loadTimes: function() {},
+        csi: function() {},
+        app: {}
+    };
+"""
+
+
+def _launch_args() -> Tuple[List[str], List[str]]:
+    """
+    v5.9.44: Chrome launch args (and Chromium fallback args) with
+    auth-server-allowlist so Chromium passes Windows credentials to
+    CORP_AUTH_DOMAINS automatically.
+    """
+    allowlist = ','.join(CORP_AUTH_DOMAINS)
+    base_args = [
+        '--disable-blink-features=AutomationControlled',
+        '--disable-dev-shm-usage',
+        '--no-sandbox',
+        '--disable-infobars',
+        '--disable-extensions',
+        '--disable-gpu',
+        '--window-size=1920,1080',
+        f'--auth-server-allowlist={allowlist}',
+        f'--auth-negotiate-delegate-allowlist={allowlist}',
+    ]
+    fallback_args = [
+        '--disable-blink-features=AutomationControlled',
+        '--disable-dev-shm-usage',
+        '--no-sandbox',
+        f'--auth-server-allowlist={allowlist}',
+        f'--auth-negotiate-delegate-allowlist={allowlist}',
+    ]
+    return base_args, fallback_args
+
+
+def _context_options(user_agent: str) -> Dict[str, Any]:
+    """Browser context settings shared by per-URL and pooled contexts."""
+    # These settings help bypass bot detection
+    # accept_downloads=True so we can detect file download links
+    return dict(
+        user_agent=user_agent,
+        viewport={'width': 1920, 'height': 1080},
+        java_script_enabled=True,
+        ignore_https_errors=True,  # Don't fail on SSL — we just want to know if the link exists
+        # Add realistic browser properties
+        locale='en-US',
+        timezone_id='America/New_York',
+        permissions=['geolocation'],
+        color_scheme='light',
+        accept_downloads=True,  # Accept downloads so we can detect file links
+    )
+
+
+def _needs_page_content(status_code: Optional[int]) -> bool:
+    """Login-page / soft-404 / soft-403 checks need the page HTML."""
+    return bool(status_code) and (200 <= status_code < 300 or status_code == 403)
+
+
+def _classify_response(result: HeadlessResult, url: str, page_content: str) -> None:
+    """
+    Set result.status / result.message from the navigation outcome already
+    stored on result (status_code, final_url, page_title).
+    """
+    if not result.status_code:
+        # No response but no error - assume success
+        result.status = 'WORKING'
+        result.message = 'Page loaded successfully'
+        return
+
+    status_code = result.status_code
+    if 200 <= status_code < 300:
+        final_url = result.final_url or url
+        page_title = result.page_title or ''
+
+        # v5.9.44: Login page detection — if we got 200 but it's a login page,
+        # the original URL requires authentication
+        if _is_login_page(final_url, page_title, page_content):
+            result.status = 'AUTH_REQUIRED'
+            result.message = f'Redirected to login page ({final_url[:80]})'
+        # v5.9.44: Soft 404 detection — server returned 200 but content says "not found"
+        elif _is_soft_404(page_title, page_content):
+            result.status = 'BROKEN'
+            result.message = f'Soft 404 — page says "not found" despite HTTP 200'
+        else:
+            result.status = 'WORKING'
+            result.message = f'HTTP {status_code} OK (headless browser)'
+    elif 300 <= status_code < 400:
+        result.status = 'REDIRECT'
+        result.message = f'Redirect to {result.final_url}'
+    elif status_code == 401:
+        result.status = 'AUTH_REQUIRED'
+        result.message = 'Authentication required (401)'
+    elif status_code == 403:
+        # Even with headless browser, check if we got real content
+        content = page_content
+        if len(content) > 1000 and ('<!DOCTYPE' in content or '<html' in content):
+            # v5.9.44: Check if "real content" is actually a login page
+            if _is_login_page(result.final_url or url, result.page_title or '', content):
+                result.status = 'AUTH_REQUIRED'
+                result.message = 'Login page detected (403 with auth form)'
+            else:
+                # Got real content despite 403 - likely soft block
+                result.status = 'WORKING'
+                result.message = 'Page accessible (soft 403)'
+        else:
+            result.status = 'BLOCKED'
+            result.message = 'Access forbidden (403)'
+    elif status_code == 404:
+        result.status = 'BROKEN'
+        result.message = 'Page not found (404)'
+    elif status_code >= 500:
+        result.status = 'BROKEN'
+        result.message = f'Server error ({status_code})'
+    else:
+        result.status = 'UNKNOWN'
+        result.message = f'HTTP {status_code}'
+
+
+def _classify_navigation_error(result: HeadlessResult, error: Exception, timeout_ms: int) -> None:
+    """Map a Playwright navigation error onto result."""
+    error_msg = str(error).lower()
+
+    if 'timeout' in error_msg:
+        result.status = 'TIMEOUT'
+        result.message = f'Page load timeout ({timeout_ms // 1000}s)'
+    elif 'net::err_name_not_resolved' in error_msg:
+        result.status = 'DNSFAILED'
+        result.message = 'Could not resolve hostname'
+    elif 'net::err_connection_refused' in error_msg:
+        result.status = 'BROKEN'
+        result.message = 'Connection refused'
+    elif 'net::err_ssl' in error_msg or 'certificate' in error_msg:
+        result.status = 'SSLERROR'
+        result.message = 'SSL certificate error'
+    else:
+        result.status = 'ERROR'
+        result.message = f'Navigation error: {str(error)[:100]}'
+
+    result.error_details = str(error)
+
+
+def _download_result(result: HeadlessResult, filename: str) -> None:
+    # Check if a file download was triggered — this IS the "document open popup"
+    # If the browser tried to download a file, the link is definitely valid
+    result.status = 'WORKING'
+    result.message = f'File download link (valid) — {filename}' if filename else 'File download link (valid)'
+
+
 class HeadlessValidator:
     """
     Validates URLs using a headless Chromium browser.
@@ -191,6 +387,11 @@ class HeadlessValidator:
     - Auth-server-allowlist: passes corporate SSO domains for automatic auth
     - Login page detection: prevents false WORKING when redirected to auth
     - Soft 404 detection: catches pages that return 200 but show "not found"
+
+    v6.3.3: With use_pool=True (default) validation runs on the process-wide
+    BrowserPool, so start()/stop() no longer launch and close Chromium on
+    every call and contexts keep their SSO session between calls.
+    use_pool=False keeps the original browser-per-call behavior.
     """
 
     # v5.9.44: Max concurrent validations (browser contexts)
@@ -201,7 +402,8 @@ class HeadlessValidator:
         timeout: int = 30,
         headless: bool = True,
         user_agent: Optional[str] = None,
-        max_concurrent: int = 5
+        max_concurrent: int = 5,
+        use_pool: bool = True
     ):
         """
         Initialize the headless validator.
@@ -210,7 +412,9 @@ class HeadlessValidator:
             timeout: Page load timeout in seconds
             headless: Run browser without visible window
             user_agent: Custom user agent string (optional)
-            max_concurrent: Max parallel browser contexts (default 5)
+            max_concurrent: Max parallel browser contexts (default 5); in pool
+                mode, max URLs this validator has in flight on the shared pool
+            use_pool: Validate on the shared warm BrowserPool (v6.3.3)
         """
         if not PLAYWRIGHT_AVAILABLE:
             raise RuntimeError(
@@ -220,14 +424,13 @@ class HeadlessValidator:
 
         self.timeout = timeout * 1000  # Playwright uses milliseconds
         self.headless = headless
-        self.user_agent = user_agent or (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-            "(KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36"
-        )
+        self.user_agent = user_agent or DEFAULT_USER_AGENT
         self.max_concurrent = min(max_concurrent, self.MAX_CONCURRENT)
+        self.use_pool = use_pool
 
         self._playwright = None
         self._browser: Optional[Browser] = None
+        self._pool: Optional['BrowserPool'] = None
 
     def __enter__(self):
         """Context manager entry - start browser."""
@@ -239,7 +442,13 @@ class HeadlessValidator:
         self.stop()
 
     def start(self):
-        """Start the browser instance."""
+        """Start the browser instance (or attach to the warm pool)."""
+        if self.use_pool:
+            if self._pool is None:
+                self._pool = get_browser_pool(self.headless, self.user_agent, self.MAX_CONCURRENT)
+            self._pool.start()
+            return
+
         if self._browser is not None:
             return
 
@@ -247,21 +456,8 @@ class HeadlessValidator:
         self._playwright = sync_playwright().start()
 
         # v5.9.44: Build launch args with auth-server-allowlist for corporate SSO
-        base_args = [
-            '--disable-blink-features=AutomationControlled',
-            '--disable-dev-shm-usage',
-            '--no-sandbox',
-            '--disable-infobars',
-            '--disable-extensions',
-            '--disable-gpu',
-            '--window-size=1920,1080',
-        ]
-
-        # v5.9.44: Add auth-server-allowlist for automatic Windows SSO passthrough
         # This tells Chromium to automatically pass Windows credentials to these domains
-        allowlist = ','.join(CORP_AUTH_DOMAINS)
-        base_args.append(f'--auth-server-allowlist={allowlist}')
-        base_args.append(f'--auth-negotiate-delegate-allowlist={allowlist}')
+        base_args, fallback_args = _launch_args()
 
         # Use "new headless" mode which is less detectable
         # channel="chrome" uses real Chrome instead of Chromium
@@ -274,13 +470,6 @@ class HeadlessValidator:
             logger.info("Headless browser started (Chrome channel) with SSO allowlist")
         except Exception:
             # Fall back to Chromium if Chrome not available
-            fallback_args = [
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                f'--auth-server-allowlist={allowlist}',
-                f'--auth-negotiate-delegate-allowlist={allowlist}',
-            ]
             self._browser = self._playwright.chromium.launch(
                 headless=self.headless,
                 args=fallback_args
@@ -288,7 +477,10 @@ class HeadlessValidator:
             logger.info("Headless browser started (Chromium fallback) with SSO allowlist")
 
     def stop(self):
-        """Stop the browser instance."""
+        """Stop the browser instance. Pooled validators leave the pool running."""
+        if self._pool is not None:
+            self._pool = None
+            return
         if self._browser:
             self._browser.close()
             self._browser = None
@@ -307,6 +499,11 @@ class HeadlessValidator:
         Returns:
             HeadlessResult with validation status
         """
+        if self.use_pool:
+            if self._pool is None:
+                self.start()
+            return self._pool.validate(url, self.timeout)
+
         if not self._browser:
             self.start()
 
@@ -318,20 +515,7 @@ class HeadlessValidator:
 
         try:
             # Create new context with stealth settings
-            # These settings help bypass bot detection
-            # accept_downloads=True so we can detect file download links
-            context = self._browser.new_context(
-                user_agent=self.user_agent,
-                viewport={'width': 1920, 'height': 1080},
-                java_script_enabled=True,
-                ignore_https_errors=True,  # Don't fail on SSL — we just want to know if the link exists
-                # Add realistic browser properties
-                locale='en-US',
-                timezone_id='America/New_York',
-                permissions=['geolocation'],
-                color_scheme='light',
-                accept_downloads=True,  # Accept downloads so we can detect file links
-            )
+            context = self._browser.new_context(**_context_options(self.user_agent))
 
             page = context.new_page()
 
@@ -358,44 +542,7 @@ class HeadlessValidator:
 
             page.on('download', handle_download)
 
-            # Inject stealth scripts to hide automation
-            # This removes the navigator.webdriver flag and other detection vectors
-            page.add_init_script("""
-                // Remove webdriver flag
-                Object.defineProperty(navigator, 'webdriver', {
-                    get: () => undefined
-                });
-
-                // Mock plugins
-                Object.defineProperty(navigator, 'plugins', {
-                    get: () => [
-                        { name: 'Chrome PDF Plugin', filename: 'internal-pdf-viewer' },
-                        { name: 'Chrome PDF Viewer', filename: 'mhjfbmdgcfjbbpaeojofohoefgiehjai' },
-                        { name: 'Native Client', filename: 'internal-nacl-plugin' }
-                    ]
-                });
-
-                // Mock languages
-                Object.defineProperty(navigator, 'languages', {
-                    get: () => ['en-US', 'en']
-                });
-
-                // Mock permissions
-                const originalQuery = window.navigator.permissions.query;
-                window.navigator.permissions.query = (parameters) => (
-                    parameters.name === 'notifications' ?
-                        Promise.resolve({ state: Notification.permission }) :
-                        originalQuery(parameters)
-                );
-
-                // Add chrome object
-                window.chrome = {
-                    runtime: {},
-                    loadTimes: function() {},
-                    csi: function() {},
-                    app: {}
-                };
-            """)
+            page.add_init_script(STEALTH_INIT_SCRIPT)
 
             # Set up response handler to capture status code
             response_status = {'code': None, 'url': None}
@@ -429,95 +576,23 @@ class HeadlessValidator:
                 except Exception:
                     pass
 
-                # Check if a file download was triggered — this IS the "document open popup"
-                # If the browser tried to download a file, the link is definitely valid
                 if download_triggered['value']:
-                    result.status = 'WORKING'
-                    fname = download_triggered['filename']
-                    result.message = f'File download link (valid) — {fname}' if fname else 'File download link (valid)'
+                    _download_result(result, download_triggered['filename'])
                     result.response_time_ms = (time.time() - start_time) * 1000
                     return result
 
-                # Determine status based on response
-                if result.status_code:
-                    if 200 <= result.status_code < 300:
-                        # v5.9.44: Check for login page redirect and soft 404
-                        page_content = ''
-                        try:
-                            page_content = page.content()
-                        except Exception:
-                            pass
+                # v5.9.44: Check for login page redirect, soft 404 and soft 403
+                page_content = ''
+                if _needs_page_content(result.status_code):
+                    try:
+                        page_content = page.content()
+                    except Exception:
+                        pass
 
-                        final_url = result.final_url or url
-                        page_title = result.page_title or ''
-
-                        # v5.9.44: Login page detection — if we got 200 but it's a login page,
-                        # the original URL requires authentication
-                        if _is_login_page(final_url, page_title, page_content):
-                            result.status = 'AUTH_REQUIRED'
-                            result.message = f'Redirected to login page ({final_url[:80]})'
-                        # v5.9.44: Soft 404 detection — server returned 200 but content says "not found"
-                        elif _is_soft_404(page_title, page_content):
-                            result.status = 'BROKEN'
-                            result.message = f'Soft 404 — page says "not found" despite HTTP 200'
-                        else:
-                            result.status = 'WORKING'
-                            result.message = f'HTTP {result.status_code} OK (headless browser)'
-                    elif 300 <= result.status_code < 400:
-                        result.status = 'REDIRECT'
-                        result.message = f'Redirect to {result.final_url}'
-                    elif result.status_code == 401:
-                        result.status = 'AUTH_REQUIRED'
-                        result.message = 'Authentication required (401)'
-                    elif result.status_code == 403:
-                        # Even with headless browser, check if we got real content
-                        content = page.content()
-                        if len(content) > 1000 and ('<!DOCTYPE' in content or '<html' in content):
-                            # v5.9.44: Check if "real content" is actually a login page
-                            if _is_login_page(result.final_url or url, result.page_title or '', content):
-                                result.status = 'AUTH_REQUIRED'
-                                result.message = 'Login page detected (403 with auth form)'
-                            else:
-                                # Got real content despite 403 - likely soft block
-                                result.status = 'WORKING'
-                                result.message = 'Page accessible (soft 403)'
-                        else:
-                            result.status = 'BLOCKED'
-                            result.message = 'Access forbidden (403)'
-                    elif result.status_code == 404:
-                        result.status = 'BROKEN'
-                        result.message = 'Page not found (404)'
-                    elif result.status_code >= 500:
-                        result.status = 'BROKEN'
-                        result.message = f'Server error ({result.status_code})'
-                    else:
-                        result.status = 'UNKNOWN'
-                        result.message = f'HTTP {result.status_code}'
-                else:
-                    # No response but no error - assume success
-                    result.status = 'WORKING'
-                    result.message = 'Page loaded successfully'
+                _classify_response(result, url, page_content)
 
             except PlaywrightError as e:
-                error_msg = str(e).lower()
-
-                if 'timeout' in error_msg:
-                    result.status = 'TIMEOUT'
-                    result.message = f'Page load timeout ({self.timeout // 1000}s)'
-                elif 'net::err_name_not_resolved' in error_msg:
-                    result.status = 'DNSFAILED'
-                    result.message = 'Could not resolve hostname'
-                elif 'net::err_connection_refused' in error_msg:
-                    result.status = 'BROKEN'
-                    result.message = 'Connection refused'
-                elif 'net::err_ssl' in error_msg or 'certificate' in error_msg:
-                    result.status = 'SSLERROR'
-                    result.message = 'SSL certificate error'
-                else:
-                    result.status = 'ERROR'
-                    result.message = f'Navigation error: {str(e)[:100]}'
-
-                result.error_details = str(e)
+                _classify_navigation_error(result, e, self.timeout)
 
         except Exception as e:
             result.status = 'ERROR'
@@ -552,6 +627,9 @@ class HeadlessValidator:
         parallel validation. Each URL gets its own context (isolated cookie/auth
         state) but shares the single browser instance. Max 5 concurrent contexts.
 
+        v6.3.3: Pooled validators hand the whole batch to BrowserPool, which
+        runs it concurrently on warm, domain-affine contexts.
+
         Args:
             urls: List of URLs to validate
             progress_callback: Optional callback(current, total, url)
@@ -563,6 +641,12 @@ class HeadlessValidator:
         if total == 0:
             return []
 
+        if self.use_pool:
+            if self._pool is None:
+                self.start()
+            return self._pool.validate_many(urls, self.timeout, progress_callback,
+                                            max_concurrent=self.max_concurrent)
+
         # Start browser if not already running
         was_running = self._browser is not None
         if not was_running:
@@ -644,6 +728,445 @@ class HeadlessValidator:
         return results
 
 
+# =============================================================================
+# v6.3.3: PERSISTENT BROWSER POOL
+# =============================================================================
+# A HeadlessValidator used to launch Chromium in start(), open a fresh context
+# per URL and close everything in stop(); every rescan paid the browser launch
+# plus a full Negotiate/ADFS round trip per URL. BrowserPool keeps one browser
+# per process on a dedicated event-loop thread (Playwright objects are bound to
+# the thread that created them) and leases long-lived contexts from it:
+#
+# - affinity: a context remembers the site it last served and is handed out
+#   again for that site first, so its SSO cookies are reused,
+# - recycling: a context is closed after MAX_REQUESTS_PER_CONTEXT navigations,
+#   MAX_CONTEXT_AGE_SECONDS, or a "target closed" style error,
+# - health: the browser is checked (is_connected) on every lease and
+#   relaunched if it crashed; an idle pool shuts the browser down after
+#   POOL_IDLE_SHUTDOWN_SECONDS and relaunches on the next request.
+
+DEFAULT_POOL_CONTEXTS = 5
+MAX_REQUESTS_PER_CONTEXT = 100
+MAX_CONTEXT_AGE_SECONDS = 1800.0
+POOL_IDLE_SHUTDOWN_SECONDS = 600.0
+
+
+def _affinity_key(url: str) -> str:
+    """Site a context is bound to: the last two labels of the host (army.mil, example.com)."""
+    try:
+        host = (urlparse(url).hostname or '').lower()
+    except ValueError:
+        return ''
+    labels = host.split('.')
+    return '.'.join(labels[-2:]) if len(labels) > 2 else host
+
+
+async def _launch_chromium(headless: bool):
+    """Start async Playwright and Chrome (Chromium fallback). Returns (playwright, browser)."""
+    playwright = await async_playwright().start()
+    base_args, fallback_args = _launch_args()
+    try:
+        browser = await playwright.chromium.launch(headless=headless, channel="chrome", args=base_args)
+        logger.info("Browser pool: started Chrome channel with SSO allowlist")
+    except Exception:
+        try:
+            browser = await playwright.chromium.launch(headless=headless, args=fallback_args)
+        except Exception:
+            await playwright.stop()
+            raise
+        logger.info("Browser pool: started Chromium fallback with SSO allowlist")
+    return playwright, browser
+
+
+async def _block_resources(route):
+    """Block images, CSS, fonts, media to speed up validation."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+@dataclass
+class _PooledContext:
+    context: Any
+    created_at: float
+    domain: str = ''
+    requests: int = 0
+    healthy: bool = True
+    last_used: float = 0.0
+
+
+class BrowserPool:
+    """
+    Process-wide warm browser with a pool of reusable contexts.
+
+    Thread-safe: validate() / validate_many() may be called from any thread;
+    all browser work runs on the pool's own event-loop thread.
+
+    Usage:
+        pool = get_browser_pool()
+        result = pool.validate(url, timeout_ms=30000)
+        results = pool.validate_many(urls, 30000, progress_callback)
+    """
+
+    def __init__(
+        self,
+        headless: bool = True,
+        user_agent: Optional[str] = None,
+        max_contexts: int = DEFAULT_POOL_CONTEXTS,
+        max_requests_per_context: int = MAX_REQUESTS_PER_CONTEXT,
+        max_context_age: float = MAX_CONTEXT_AGE_SECONDS,
+        idle_shutdown: float = POOL_IDLE_SHUTDOWN_SECONDS,
+        launcher=None,
+        clock=time.monotonic
+    ):
+        self.headless = headless
+        self.user_agent = user_agent or DEFAULT_USER_AGENT
+        self.max_contexts = max(1, max_contexts)
+        self.max_requests_per_context = max(1, max_requests_per_context)
+        self.max_context_age = max_context_age
+        self.idle_shutdown = idle_shutdown
+        self._launcher = launcher or _launch_chromium
+        self._clock = clock
+
+        self._thread_lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+        # Loop-thread state (only touched from the pool's event loop)
+        self._playwright = None
+        self._browser = None
+        self._idle: List[_PooledContext] = []
+        self._leased = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+        self._idle_timer: Optional[asyncio.TimerHandle] = None
+        self._stats = {
+            'launches': 0, 'requests': 0, 'contexts_created': 0,
+            'contexts_recycled': 0, 'affinity_hits': 0,
+        }
+
+    # -----------------------------------------------------------------
+    # Thread-facing API
+    # -----------------------------------------------------------------
+
+    def start(self):
+        """Launch the browser now instead of on the first request."""
+        self._run(self._ensure_browser())
+
+    def validate(self, url: str, timeout_ms: int = 30000) -> HeadlessResult:
+        """Validate one URL on a pooled context (blocks the calling thread)."""
+        return self._run(self._validate(url, timeout_ms), timeout_ms)
+
+    def validate_many(
+        self,
+        urls: List[str],
+        timeout_ms: int = 30000,
+        progress_callback: Optional[callable] = None,
+        max_concurrent: Optional[int] = None
+    ) -> List[HeadlessResult]:
+        """
+        Validate urls concurrently, in input order.
+
+        At most max_concurrent URLs from this call are in flight at once
+        (default: no per-call limit); the pool's max_contexts still caps
+        concurrency across all callers.
+        """
+        total = len(urls)
+        window = total if not max_concurrent else max(1, max_concurrent)
+        pending = iter(enumerate(urls))
+        futures = {}
+
+        def submit_next():
+            item = next(pending, None)
+            if item is not None:
+                futures[self._submit(self._validate(item[1], timeout_ms))] = item[0]
+
+        for _ in range(min(window, total)):
+            submit_next()
+        results: List[Optional[HeadlessResult]] = [None] * total
+        completed = 0
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = futures.pop(future)
+                try:
+                    results[i] = future.result()
+                except Exception as e:
+                    logger.error(f"Browser pool error for {urls[i]}: {e}")
+                    results[i] = HeadlessResult(url=urls[i], status='ERROR',
+                                                message=f'Browser pool error: {str(e)[:100]}')
+                completed += 1
+                if progress_callback:
+                    progress_callback(completed, total, urls[i])
+                submit_next()
+        return results
+
+    def close(self):
+        """Close all contexts, the browser and the loop thread."""
+        with self._thread_lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown_browser(), loop).result(timeout=30)
+        except Exception as e:
+            logger.debug(f"Browser pool shutdown: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+
+    def stats(self) -> Dict[str, Any]:
+        stats = dict(self._stats)
+        stats.update({
+            'browser_running': self._browser is not None,
+            'idle_contexts': len(self._idle),
+            'leased_contexts': self._leased,
+        })
+        return stats
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._thread_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._slots = asyncio.Semaphore(self.max_contexts)
+                self._browser_lock = asyncio.Lock()
+                thread = threading.Thread(target=loop.run_forever, name='hv-browser-pool', daemon=True)
+                thread.start()
+                self._loop, self._thread = loop, thread
+            return self._loop
+
+    def _submit(self, coro):
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def _run(self, coro, timeout_ms: int = 60000):
+        # Navigation carries its own timeout; this only guards a wedged browser
+        return self._submit(coro).result(timeout=timeout_ms / 1000 + 60)
+
+    # -----------------------------------------------------------------
+    # Loop-thread internals
+    # -----------------------------------------------------------------
+
+    async def _ensure_browser(self):
+        async with self._browser_lock:
+            if self._browser is not None:
+                try:
+                    connected = self._browser.is_connected()
+                except Exception:
+                    connected = False
+                if connected:
+                    return self._browser
+                logger.warning("Browser pool: browser disconnected, relaunching")
+                await self._shutdown_browser()
+            self._playwright, self._browser = await self._launcher(self.headless)
+            self._stats['launches'] += 1
+            return self._browser
+
+    async def _shutdown_browser(self):
+        if self._idle_timer is not None:
+            self._idle_timer.cancel()
+            self._idle_timer = None
+        idle, self._idle = self._idle, []
+        for pooled in idle:
+            await self._close_context(pooled)
+        browser, playwright = self._browser, self._playwright
+        self._browser = self._playwright = None
+        for closer in (browser and browser.close, playwright and playwright.stop):
+            if closer:
+                try:
+                    await closer()
+                except Exception:
+                    pass
+
+    async def _close_context(self, pooled: _PooledContext):
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+
+    def _expired(self, pooled: _PooledContext) -> bool:
+        return (not pooled.healthy
+                or pooled.requests >= self.max_requests_per_context
+                or self._clock() - pooled.created_at >= self.max_context_age)
+
+    async def _new_context(self, browser) -> _PooledContext:
+        context = await browser.new_context(**_context_options(self.user_agent))
+        # v5.9.44 resource blocking and stealth script, set once per context
+        await context.route('**/*', _block_resources)
+        await context.add_init_script(STEALTH_INIT_SCRIPT)
+        self._stats['contexts_created'] += 1
+        return _PooledContext(context=context, created_at=self._clock())
+
+    async def _acquire(self, domain: str) -> _PooledContext:
+        await self._slots.acquire()
+        try:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+                self._idle_timer = None
+            browser = await self._ensure_browser()
+            # Prefer the context that already holds this site's session, then
+            # an unassigned one, then a new context while under max_contexts;
+            # only a full pool rebinds its least recently used context.
+            pooled = next((c for c in self._idle if c.domain == domain), None)
+            if pooled is not None:
+                self._stats['affinity_hits'] += 1
+            else:
+                pooled = next((c for c in self._idle if not c.domain), None)
+                at_capacity = len(self._idle) + self._leased >= self.max_contexts
+                if pooled is None and self._idle and at_capacity:
+                    pooled = min(self._idle, key=lambda c: c.last_used)
+            if pooled is not None:
+                self._idle.remove(pooled)
+            else:
+                pooled = await self._new_context(browser)
+            pooled.domain = domain
+            self._leased += 1
+            return pooled
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def _release(self, pooled: _PooledContext):
+        self._leased -= 1
+        pooled.requests += 1
+        pooled.last_used = self._clock()
+        if self._expired(pooled) or self._browser is None:
+            self._stats['contexts_recycled'] += 1
+            await self._close_context(pooled)
+        else:
+            self._idle.append(pooled)
+        self._slots.release()
+        if self._leased == 0 and self.idle_shutdown and self._browser is not None:
+            if self._idle_timer is not None:
+                self._idle_timer.cancel()
+            loop = asyncio.get_running_loop()
+            self._idle_timer = loop.call_later(
+                self.idle_shutdown, lambda: loop.create_task(self._shutdown_if_idle()))
+
+    async def _shutdown_if_idle(self):
+        if self._leased == 0 and self._browser is not None:
+            logger.info("Browser pool: idle, closing browser")
+            await self._shutdown_browser()
+
+    async def _validate(self, url: str, timeout_ms: int) -> HeadlessResult:
+        start_time = time.time()
+        result = HeadlessResult(url=url, status='UNKNOWN')
+        self._stats['requests'] += 1
+
+        try:
+            pooled = await self._acquire(_affinity_key(url))
+        except Exception as e:
+            result.status = 'ERROR'
+            result.message = f'Browser unavailable: {str(e)[:100]}'
+            result.error_details = str(e)
+            return result
+
+        page = None
+        try:
+            page = await pooled.context.new_page()
+
+            # Track if a download was triggered (means the link is a valid file)
+            download_triggered = {'value': False, 'filename': ''}
+
+            def handle_download(download):
+                download_triggered['value'] = True
+                download_triggered['filename'] = download.suggested_filename or ''
+                # Cancel the actual download — we just needed to know it's valid
+                asyncio.ensure_future(download.cancel())
+
+            page.on('download', handle_download)
+
+            # Set up response handler to capture status code
+            response_status = {'code': None, 'url': None}
+
+            def handle_response(response):
+                # Capture the main document response
+                if response.request.resource_type == 'document':
+                    response_status['code'] = response.status
+                    response_status['url'] = response.url
+
+            page.on('response', handle_response)
+
+            try:
+                response = await page.goto(url, timeout=timeout_ms, wait_until='domcontentloaded')
+
+                if response:
+                    result.status_code = response.status
+                    result.final_url = response.url
+                elif response_status['code']:
+                    result.status_code = response_status['code']
+                    result.final_url = response_status['url']
+
+                try:
+                    result.page_title = await page.title()
+                except Exception:
+                    pass
+
+                if download_triggered['value']:
+                    _download_result(result, download_triggered['filename'])
+                else:
+                    page_content = ''
+                    if _needs_page_content(result.status_code):
+                        try:
+                            page_content = await page.content()
+                        except Exception:
+                            pass
+                    _classify_response(result, url, page_content)
+
+            except PlaywrightError as e:
+                if 'closed' in str(e).lower():
+                    pooled.healthy = False
+                _classify_navigation_error(result, e, timeout_ms)
+
+        except Exception as e:
+            pooled.healthy = False
+            result.status = 'ERROR'
+            result.message = f'Unexpected error: {str(e)[:100]}'
+            result.error_details = str(e)
+            logger.exception(f"Headless validation error for {url}")
+
+        finally:
+            if page is not None:
+                try:
+                    await page.close()
+                except Exception:
+                    pooled.healthy = False
+            await self._release(pooled)
+
+        result.response_time_ms = (time.time() - start_time) * 1000
+        return result
+
+
+_browser_pools: Dict[Tuple[bool, str], BrowserPool] = {}
+_browser_pools_lock = threading.Lock()
+
+
+def get_browser_pool(
+    headless: bool = True,
+    user_agent: Optional[str] = None,
+    max_contexts: int = DEFAULT_POOL_CONTEXTS
+) -> BrowserPool:
+    """Process-wide BrowserPool for (headless, user_agent), created on first use."""
+    key = (headless, user_agent or DEFAULT_USER_AGENT)
+    with _browser_pools_lock:
+        pool = _browser_pools.get(key)
+        if pool is None:
+            pool = _browser_pools[key] = BrowserPool(headless, key[1], max_contexts)
+        return pool
+
+
+def shutdown_browser_pools():
+    """Close every pooled browser (registered with atexit)."""
+    with _browser_pools_lock:
+        pools = list(_browser_pools.values())
+        _browser_pools.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(shutdown_browser_pools)
+
+
 def rescan_failed_urls(
     failed_urls: List[str],
     timeout: int = 30,
@@ -732,6 +1255,7 @@ def get_headless_capabilities() -> Dict[str, Any]:
         'features': [
             'Resource blocking (60-70% faster page loads)',
             'Parallel validation (5 concurrent contexts)',
+            'Persistent browser pool (warm browser, reusable SSO contexts)',
             'Auth-server-allowlist for Windows SSO',
             'Login page detection (ADFS, Azure AD, SAML)',
             'Soft 404 detection',
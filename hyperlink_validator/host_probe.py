@@ -0,0 +1,341 @@
+"""
+Host-Level DNS and TLS Probe Cache
+==================================
+Thorough-mode DNS resolution and SSL certificate checks, cached per host.
+
+v6.3.3: check_dns_resolution / check_ssl_certificate used to run once per
+URL (and again in the retest phase), so a 6,000-URL scan with 200 hosts
+paid for 6,000 lookups and handshakes. They also called
+socket.setdefaulttimeout(), which changes the timeout of every socket the
+process opens afterwards, from any thread.
+
+HostProbeCache keeps one entry per host (per host:port for TLS):
+
+- the first caller submits the probe to a small thread pool; concurrent
+  callers for the same host share that in-flight Future,
+- finished entries are reused until their TTL expires (failures expire
+  sooner than successes),
+- timeouts are applied by waiting on the Future, never through global
+  socket state; TLS probes use a per-connection timeout,
+- prefetch() resolves every distinct host of a batch concurrently up front,
+- aresolve() / assl_certificate() await the same Futures from an event loop.
+"""
+
+import asyncio
+import socket
+import ssl
+import threading
+import time
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DNS_TTL_SECONDS = 300.0
+DNS_FAILURE_TTL_SECONDS = 60.0
+SSL_TTL_SECONDS = 3600.0
+SSL_FAILURE_TTL_SECONDS = 300.0
+DEFAULT_PROBE_WORKERS = 16
+
+
+def split_host(netloc: str, default_port: int = 443) -> Tuple[str, int]:
+    """(hostname, port) from a netloc or bare host name, without credentials."""
+    netloc = (netloc or '').rsplit('@', 1)[-1].strip().lower()
+    if netloc.startswith('['):
+        host, _, rest = netloc[1:].partition(']')
+        port = rest[1:] if rest.startswith(':') else ''
+    elif netloc.count(':') == 1:
+        host, port = netloc.split(':')
+    else:
+        host, port = netloc, ''
+    try:
+        return host, int(port) if port else default_port
+    except ValueError:
+        return host, default_port
+
+
+def resolve_host(hostname: str) -> Dict[str, Any]:
+    """
+    Resolve hostname to its IPv4 addresses. Blocking; no timeout of its own
+    (callers bound the wait). Returns 'resolved', 'ip_addresses',
+    'response_time_ms' and, on failure, 'error'.
+    """
+    start = time.time()
+    try:
+        ip_addresses = socket.gethostbyname_ex(hostname)[2]
+        return {
+            'resolved': True,
+            'ip_addresses': ip_addresses,
+            'response_time_ms': round((time.time() - start) * 1000, 2)
+        }
+    except Exception as e:
+        return {
+            'resolved': False,
+            'ip_addresses': [],
+            'response_time_ms': round((time.time() - start) * 1000, 2),
+            'error': str(e)
+        }
+
+
+def probe_ssl_certificate(hostname: str, port: int = 443, timeout: int = 10) -> Dict[str, Any]:
+    """
+    TLS handshake with hostname:port and summarize its certificate.
+
+    Returns:
+        dict with 'valid', 'issuer', 'expires', 'days_until_expiry', 'warning'
+        (or 'valid': False and 'error')
+    """
+    context = ssl.create_default_context()
+    try:
+        with socket.create_connection((hostname, port), timeout=timeout) as sock:
+            with context.wrap_socket(sock, server_hostname=hostname) as ssock:
+                cert = ssock.getpeercert()
+                expires_str = cert.get('notAfter', '')
+
+                # Parse expiration date
+                try:
+                    expires = datetime.strptime(expires_str, '%b %d %H:%M:%S %Y %Z')
+                except ValueError:
+                    expires = datetime.now()
+
+                days_until = (expires - datetime.now()).days
+
+                # Extract issuer info
+                issuer_info = cert.get('issuer', ())
+                issuer_name = 'Unknown'
+                for item in issuer_info:
+                    for key, value in item:
+                        if key == 'organizationName':
+                            issuer_name = value
+                            break
+
+                warning = None
+                if days_until < 30:
+                    warning = f'Certificate expires in {days_until} days'
+                elif days_until < 0:
+                    warning = 'Certificate has expired!'
+
+                return {
+                    'valid': True,
+                    'issuer': issuer_name,
+                    'expires': expires.strftime('%Y-%m-%d'),
+                    'days_until_expiry': days_until,
+                    'warning': warning
+                }
+    except ssl.SSLError as e:
+        return {
+            'valid': False,
+            'error': f'SSL Error: {str(e)}'
+        }
+    except socket.timeout:
+        return {
+            'valid': False,
+            'error': 'Connection timeout'
+        }
+    except Exception as e:
+        return {
+            'valid': False,
+            'error': str(e)
+        }
+
+
+def _dns_timeout_result(timeout: float) -> Dict[str, Any]:
+    return {
+        'resolved': False,
+        'ip_addresses': [],
+        'response_time_ms': round(timeout * 1000, 2),
+        'error': f'DNS lookup timed out after {timeout}s'
+    }
+
+
+def _copy_dns(result: Dict[str, Any]) -> Dict[str, Any]:
+    # Each ValidationResult gets its own address list
+    return {**result, 'ip_addresses': list(result.get('ip_addresses', []))}
+
+
+class HostProbeCache:
+    """
+    Thread-safe TTL cache of per-host DNS and TLS probe results.
+
+    Usage:
+        probe = get_host_probe()
+        probe.prefetch(urls)                       # resolve all hosts concurrently
+        dns = probe.resolve(urlparse(url).netloc)  # shared, cached result
+        cert = probe.ssl_certificate(urlparse(url).netloc)
+    """
+
+    def __init__(self,
+                 dns_ttl: float = DNS_TTL_SECONDS,
+                 dns_failure_ttl: float = DNS_FAILURE_TTL_SECONDS,
+                 ssl_ttl: float = SSL_TTL_SECONDS,
+                 ssl_failure_ttl: float = SSL_FAILURE_TTL_SECONDS,
+                 max_workers: int = DEFAULT_PROBE_WORKERS,
+                 resolver: Callable[[str], Dict[str, Any]] = resolve_host,
+                 ssl_prober: Callable[..., Dict[str, Any]] = probe_ssl_certificate,
+                 clock: Callable[[], float] = time.monotonic):
+        self.dns_ttl = dns_ttl
+        self.dns_failure_ttl = dns_failure_ttl
+        self.ssl_ttl = ssl_ttl
+        self.ssl_failure_ttl = ssl_failure_ttl
+        self._resolver = resolver
+        self._ssl_prober = ssl_prober
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._dns: Dict[str, Tuple[float, Future]] = {}
+        self._ssl: Dict[Tuple[str, int], Tuple[float, Future]] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers),
+                                            thread_name_prefix='hv-host-probe')
+
+    # -----------------------------------------------------------------
+    # Blocking API
+    # -----------------------------------------------------------------
+
+    def resolve(self, netloc: str, timeout: float = 5, refresh: bool = False) -> Dict[str, Any]:
+        """
+        DNS result for the host of netloc, shape of check_dns_resolution().
+        refresh=True discards a finished cached entry and looks the host up again.
+        """
+        host = split_host(netloc)[0]
+        if refresh:
+            self._discard(self._dns, host)
+        future = self._dns_future(host)
+        try:
+            return _copy_dns(future.result(timeout=timeout))
+        except FutureTimeout:
+            return _dns_timeout_result(timeout)
+
+    def ssl_certificate(self, netloc: str, timeout: float = 10, refresh: bool = False) -> Dict[str, Any]:
+        """TLS certificate summary for host:port, shape of check_ssl_certificate()."""
+        key = split_host(netloc)
+        if refresh:
+            self._discard(self._ssl, key)
+        future = self._ssl_future(key, timeout)
+        try:
+            return dict(future.result(timeout=timeout + 1))
+        except FutureTimeout:
+            return {'valid': False, 'error': 'Connection timeout'}
+
+    def prefetch(self, urls: Iterable[str], dns: bool = True, ssl_certs: bool = False):
+        """
+        Start probes for every distinct host in urls without waiting for
+        them; later resolve()/ssl_certificate() calls pick up the results.
+        Returns the number of distinct hosts.
+        """
+        hosts = set()
+        tls_hosts = set()
+        for url in urls:
+            try:
+                parsed = urlparse(url)
+            except ValueError:
+                continue
+            if not parsed.netloc:
+                continue
+            host, port = split_host(parsed.netloc)
+            hosts.add(host)
+            if parsed.scheme == 'https':
+                tls_hosts.add((host, port))
+        if dns:
+            for host in hosts:
+                self._dns_future(host)
+        if ssl_certs:
+            for key in tls_hosts:
+                self._ssl_future(key, 10)
+        return len(hosts)
+
+    # -----------------------------------------------------------------
+    # Event-loop API
+    # -----------------------------------------------------------------
+
+    async def aresolve(self, netloc: str, timeout: float = 5) -> Dict[str, Any]:
+        future = self._dns_future(split_host(netloc)[0])
+        if future.done():
+            return _copy_dns(future.result())
+        try:
+            result = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout)
+            return _copy_dns(result)
+        except asyncio.TimeoutError:
+            return _dns_timeout_result(timeout)
+
+    async def assl_certificate(self, netloc: str, timeout: float = 10) -> Dict[str, Any]:
+        future = self._ssl_future(split_host(netloc), timeout)
+        if future.done():
+            return dict(future.result())
+        try:
+            result = await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(future)), timeout + 1)
+            return dict(result)
+        except asyncio.TimeoutError:
+            return {'valid': False, 'error': 'Connection timeout'}
+
+    # -----------------------------------------------------------------
+    # Introspection
+    # -----------------------------------------------------------------
+
+    def clear(self):
+        with self._lock:
+            self._dns.clear()
+            self._ssl.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {'dns_hosts': len(self._dns), 'ssl_hosts': len(self._ssl)}
+
+    # -----------------------------------------------------------------
+    # Internal
+    # -----------------------------------------------------------------
+
+    def _discard(self, table: Dict, key):
+        with self._lock:
+            entry = table.get(key)
+            if entry is not None and entry[1].done():
+                del table[key]
+
+    def _dns_future(self, host: str) -> Future:
+        return self._get_future(self._dns, host, lambda: self._executor.submit(self._resolver, host),
+                                'resolved', self.dns_ttl, self.dns_failure_ttl)
+
+    def _ssl_future(self, key: Tuple[str, int], timeout: float) -> Future:
+        host, port = key
+        return self._get_future(self._ssl, key,
+                                lambda: self._executor.submit(self._ssl_prober, host, port, timeout),
+                                'valid', self.ssl_ttl, self.ssl_failure_ttl)
+
+    def _get_future(self, table: Dict, key, submit: Callable[[], Future],
+                    ok_field: str, ttl: float, failure_ttl: float) -> Future:
+        with self._lock:
+            entry = table.get(key)
+            if entry is not None:
+                expires_at, future = entry
+                if not future.done() or self._clock() < expires_at:
+                    return future
+            future = submit()
+            table[key] = (float('inf'), future)
+
+        def _stamp(done: Future):
+            try:
+                ok = bool(done.result().get(ok_field))
+            except Exception:
+                ok = False
+            with self._lock:
+                current = table.get(key)
+                if current is not None and current[1] is done:
+                    table[key] = (self._clock() + (ttl if ok else failure_ttl), done)
+
+        future.add_done_callback(_stamp)
+        return future
+
+
+_host_probe: Optional[HostProbeCache] = None
+_host_probe_lock = threading.Lock()
+
+
+def get_host_probe() -> HostProbeCache:
+    """Process-wide HostProbeCache shared by both validation engines and the retest phase."""
+    global _host_probe
+    if _host_probe is None:
+        with _host_probe_lock:
+            if _host_probe is None:
+                _host_probe = HostProbeCache()
+    return _host_probe
@@ -19,13 +19,12 @@ import logging
 from datetime import datetime
 from urllib.parse import urlparse
 
+from learned_rules import LearnedRules, first_by_key
+
 logger = logging.getLogger(__name__)
 
 PATTERNS_FILE = os.path.join(os.path.dirname(__file__), 'hv_patterns.json')
 
-# Module-level cache
-_learned_patterns = None
-
 
 def _is_learning_enabled():
     """Check if learning is enabled via config.json (v5.9.52)."""
@@ -71,18 +70,49 @@ def save_patterns(patterns: dict):
             pass
 
 
+class HVRules:
+    """Learned link patterns compiled into domain-keyed sets and dicts (v6.3.3)."""
+
+    def __init__(self, patterns: dict):
+        self.trusted_domains = frozenset(
+            entry.get('domain', '').lower()
+            for entry in patterns.get('trusted_domains', [])
+            if entry.get('count', 0) >= 2)
+        self.headless_domains = frozenset(
+            entry.get('domain', '').lower()
+            for entry in patterns.get('headless_required_domains', [])
+            if entry.get('count', 0) >= 2)
+        self.excluded_domains = frozenset(
+            entry.get('domain', '').lower()
+            for entry in patterns.get('exclusion_domains', [])
+            if entry.get('count', 0) >= 3)
+        self._status_overrides = first_by_key(
+            ((entry.get('domain', '').lower(), entry.get('original_status', '').upper()),
+             entry.get('user_status', ''))
+            for entry in patterns.get('status_overrides', [])
+            if entry.get('count', 0) >= 2)
+
+    def status_override(self, domain: str, detected_status: str) -> str:
+        found = self._status_overrides.get((domain.lower(), detected_status.upper()))
+        return found[1] if found else ''
+
+
+_rules = LearnedRules(lambda: PATTERNS_FILE, load_patterns, HVRules)
+
+
 def reload_learned_patterns():
-    """Clear module-level cache so next access loads fresh from disk."""
-    global _learned_patterns
-    _learned_patterns = None
+    """Drop the compiled rules so next access loads fresh from disk."""
+    _rules.invalidate()
 
 
 def get_learned_patterns() -> dict:
-    """Get cached learned patterns (loads from disk on first call)."""
-    global _learned_patterns
-    if _learned_patterns is None:
-        _learned_patterns = load_patterns()
-    return _learned_patterns
+    """Get cached learned patterns (reloaded when the file changes on disk)."""
+    return _rules.patterns()
+
+
+def get_hv_rules() -> HVRules:
+    """Get the compiled link rules (recompiled when the file changes on disk)."""
+    return _rules.get()
 
 
 # ──────────────────────────────────────────────
@@ -201,14 +231,7 @@ def get_trusted_domains() -> set:
     URLs on these domains that fail validation should be downgraded
     to INFO instead of being flagged as errors.
     """
-    patterns = get_learned_patterns()
-    trusted = set()
-
-    for entry in patterns.get('trusted_domains', []):
-        if entry.get('count', 0) >= 2:
-            trusted.add(entry.get('domain', '').lower())
-
-    return trusted
+    return set(get_hv_rules().trusted_domains)
 
 
 def get_status_override(url: str, detected_status: str) -> str:
@@ -216,19 +239,10 @@ def get_status_override(url: str, detected_status: str) -> str:
 
     Returns override status if pattern count >= 2, else empty string.
     """
-    patterns = get_learned_patterns()
     domain = _extract_domain(url)
     if not domain:
         return ''
-
-    for entry in patterns.get('status_overrides', []):
-        if entry.get('count', 0) < 2:
-            continue
-        if entry.get('domain', '').lower() == domain.lower() and \
-           entry.get('original_status', '').upper() == detected_status.upper():
-            return entry.get('user_status', '')
-
-    return ''
+    return get_hv_rules().status_override(domain, detected_status)
 
 
 def should_prioritize_headless(domain: str) -> bool:
@@ -236,14 +250,7 @@ def should_prioritize_headless(domain: str) -> bool:
 
     Returns True if count >= 2 headless recoveries for this domain.
     """
-    patterns = get_learned_patterns()
-
-    for entry in patterns.get('headless_required_domains', []):
-        if entry.get('count', 0) >= 2 and \
-           entry.get('domain', '').lower() == domain.lower():
-            return True
-
-    return False
+    return domain.lower() in get_hv_rules().headless_domains
 
 
 def get_auto_exclude_suggestions(urls: list) -> list:
@@ -252,13 +259,7 @@ def get_auto_exclude_suggestions(urls: list) -> list:
     Returns list of URLs whose domains have been excluded >= 3 times.
     Higher threshold (3) since auto-exclusion skips validation entirely.
     """
-    patterns = get_learned_patterns()
-    excluded_domains = set()
-
-    for entry in patterns.get('exclusion_domains', []):
-        if entry.get('count', 0) >= 3:
-            excluded_domains.add(entry.get('domain', '').lower())
-
+    excluded_domains = get_hv_rules().excluded_domains
     if not excluded_domains:
         return []
 
@@ -278,6 +278,10 @@ class ValidationResult:
         excluded: Whether URL was excluded
         exclusion_reason: Why URL was excluded
         original_status: Original status before exclusion override
+        retry_after: Seconds from the server's Retry-After header (429/503)
+        cached: Result was served from the persistent URL cache
+        etag: ETag response header (for conditional revalidation)
+        last_modified: Last-Modified response header (for conditional revalidation)
     """
     url: str
     status: str = "PENDING"
@@ -307,6 +311,11 @@ class ValidationResult:
     excluded: bool = False
     exclusion_reason: str = ""
     original_status: Optional[str] = None
+    retry_after: Optional[float] = None
+    # Persistent URL cache fields
+    cached: bool = False
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
     # Source location fields (from Excel extraction — used for export highlighting)
     sheet_name: str = ""
     cell_address: str = ""
@@ -731,6 +740,38 @@ def categorize_domain(url: str) -> str:
     return 'other'
 
 
+def normalize_url(url: str, strip_trailing_slash: bool = True) -> str:
+    """
+    Canonical form of a URL for cache keys and lookups.
+
+    Lower-cases scheme and host, drops default ports, the fragment and a
+    trailing slash on the path. Query strings are kept as-is.
+
+    Args:
+        url: The URL to normalize
+        strip_trailing_slash: False keeps the path exactly as given (the URL
+            status cache: /docs and /docs/ can answer differently)
+
+    Returns:
+        Normalized URL string (the stripped input if it cannot be parsed)
+    """
+    from urllib.parse import urlsplit, urlunsplit
+
+    url = (url or '').strip()
+    try:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        netloc = parts.netloc.lower()
+    except ValueError:
+        return url
+    if not scheme or not netloc:
+        return url
+    if (scheme, netloc.rsplit(':', 1)[-1]) in (('http', '80'), ('https', '443')):
+        netloc = netloc.rsplit(':', 1)[0]
+    path = parts.path.rstrip('/') if strip_trailing_slash else parts.path
+    return urlunsplit((scheme, netloc, path, parts.query, ''))
+
+
 def validate_url_format(url: str) -> tuple[bool, str]:
     """
     Validate URL format.
@@ -7,18 +7,38 @@ Uses SQLite database (shared with scan_history.db) for persistence.
 """
 
 import sqlite3
+import hashlib
 import json
 import os
+import threading
+import time
 from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field, asdict
 
+from .exclusion_matcher import CompiledExclusions
+from .models import normalize_url
+
+
+try:
+    from sqlite_pool import get_pool, get_write_queue
+except ImportError:
+    get_pool = get_write_queue = None
+
 
 @contextmanager
 def db_connection(db_path):
-    """Context manager for SQLite operations."""
+    """Context manager for SQLite operations.
+
+    v6.3.3: Uses the shared per-thread connection pool when available.
+    """
+    if get_pool is not None:
+        with get_pool(db_path).transaction() as handles:
+            yield handles
+        return
+
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     conn.execute('PRAGMA journal_mode=WAL')
@@ -33,6 +53,56 @@ def db_connection(db_path):
         conn.close()
 
 
+# v6.3.3: How long a validation result stays fresh in the URL cache, by status.
+# Statuses not listed (RATE_LIMITED, SKIPPED, INVALID, UNKNOWN, ...) are never cached.
+URL_CACHE_TTLS = {
+    'WORKING': 7 * 86400,
+    'REDIRECT': 3 * 86400,
+    'SSL_WARNING': 3 * 86400,
+    'AUTH_REQUIRED': 86400,
+    'BROKEN': 86400,
+    'DNSFAILED': 86400,
+    'SSLERROR': 86400,
+    'BLOCKED': 86400,
+    'TIMEOUT': 6 * 3600,
+}
+_URL_CACHE_CHUNK = 500
+
+
+def _cache_key(url: str) -> str:
+    """URL cache key: normalize_url() with the path kept exactly as given."""
+    return normalize_url(url, strip_trailing_slash=False)
+
+
+def url_cache_context(auth: str = 'none', verify: Any = True, proxy: Optional[str] = None,
+                      client_cert: Any = None) -> str:
+    """
+    Request-context part of the URL cache key.
+
+    Results depend on who asks and how: an SSO or client-cert run can reach
+    pages an anonymous run gets AUTH_REQUIRED for, a no-verify run reports
+    WORKING where a verifying one reports SSLERROR, and a proxy can change
+    reachability. Each combination gets its own cache rows. The client
+    certificate and CA bundle are identified by path, hashed so the cache
+    does not store them.
+    """
+    raw = json.dumps([auth or 'none', verify, proxy or '', client_cert or ''], default=str)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()[:16]
+
+# v6.3.3: Compiled active-exclusion index per database, rebuilt after any
+# exclusion add/update/delete in this process. The generation counter stops a
+# rebuild that raced with a change from caching the index it read before it.
+_exclusion_indexes: Dict[str, CompiledExclusions] = {}
+_exclusion_generations: Dict[str, int] = {}
+_exclusion_indexes_lock = threading.Lock()
+
+
+def _invalidate_exclusion_index(db_path: str):
+    with _exclusion_indexes_lock:
+        _exclusion_indexes.pop(db_path, None)
+        _exclusion_generations[db_path] = _exclusion_generations.get(db_path, 0) + 1
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
@@ -228,6 +298,33 @@ class HyperlinkValidatorStorage:
                 ON link_scan_history(scan_time DESC)
             ''')
 
+            # v6.3.3: Persistent URL status cache, keyed on URL (path kept as
+            # given), scan depth and request context (auth, TLS verify, proxy).
+            # The cache is disposable: a table from before the context column
+            # is dropped rather than migrated.
+            cursor.execute("PRAGMA table_info(url_status_cache)")
+            cache_columns = {row[1] for row in cursor.fetchall()}
+            if cache_columns and 'context' not in cache_columns:
+                cursor.execute('DROP TABLE url_status_cache')
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS url_status_cache (
+                    url_key TEXT NOT NULL,
+                    scan_depth TEXT NOT NULL DEFAULT 'standard',
+                    context TEXT NOT NULL DEFAULT '',
+                    status TEXT NOT NULL,
+                    result_json TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    checked_at REAL NOT NULL,
+                    expires_at REAL NOT NULL,
+                    PRIMARY KEY (url_key, scan_depth, context)
+                )
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_url_cache_expires
+                ON url_status_cache(expires_at)
+            ''')
+
     # =========================================================================
     # EXCLUSION METHODS
     # =========================================================================
@@ -252,7 +349,9 @@ class HyperlinkValidatorStorage:
                     (pattern, match_type, reason, treat_as_valid, created_by)
                     VALUES (?, ?, ?, ?, ?)
                 ''', (pattern, match_type, reason, int(treat_as_valid), created_by))
-                return cursor.lastrowid
+                exclusion_id = cursor.lastrowid
+            _invalidate_exclusion_index(self.db_path)
+            return exclusion_id
         except sqlite3.IntegrityError:
             # Duplicate pattern/match_type combination
             return None
@@ -298,6 +397,7 @@ class HyperlinkValidatorStorage:
                 WHERE id = ?
             ''', params)
             success = cursor.rowcount > 0
+        _invalidate_exclusion_index(self.db_path)
         return success
 
     def delete_exclusion(self, exclusion_id: int) -> bool:
@@ -305,6 +405,7 @@ class HyperlinkValidatorStorage:
         with self.connection() as (conn, cursor):
             cursor.execute('DELETE FROM hyperlink_exclusions WHERE id = ?', (exclusion_id,))
             success = cursor.rowcount > 0
+        _invalidate_exclusion_index(self.db_path)
         return success
 
     def get_exclusion(self, exclusion_id: int) -> Optional[StoredExclusion]:
@@ -343,23 +444,47 @@ class HyperlinkValidatorStorage:
         return [StoredExclusion.from_row(row) for row in rows]
 
     def increment_exclusion_hit(self, exclusion_id: int):
-        """Increment hit count for an exclusion."""
-        with self.connection() as (conn, cursor):
-            cursor.execute('''
+        """Increment hit count for an exclusion.
+
+        v6.3.3: Queued on the shared write queue and applied in batches.
+        """
+        sql = '''
                 UPDATE hyperlink_exclusions
                 SET hit_count = hit_count + 1,
                     last_hit = CURRENT_TIMESTAMP
                 WHERE id = ?
-            ''', (exclusion_id,))
+            '''
+        if get_write_queue is not None:
+            get_write_queue(self.db_path).submit(sql, (exclusion_id,))
+            return
+        with self.connection() as (conn, cursor):
+            cursor.execute(sql, (exclusion_id,))
+
+    def _flush_pending_hits(self):
+        """Make queued hit-count updates visible before reading them."""
+        if get_write_queue is not None:
+            get_write_queue(self.db_path).flush(timeout=5.0)
+
+    def get_exclusion_index(self) -> CompiledExclusions:
+        """Compiled index of the active exclusions (built once, cached until they change)."""
+        with _exclusion_indexes_lock:
+            index = _exclusion_indexes.get(self.db_path)
+            generation = _exclusion_generations.get(self.db_path, 0)
+        if index is None:
+            index = CompiledExclusions(self.get_all_exclusions(active_only=True),
+                                       storage_semantics=True)
+            with _exclusion_indexes_lock:
+                if _exclusion_generations.get(self.db_path, 0) == generation:
+                    _exclusion_indexes[self.db_path] = index
+        return index
 
     def find_matching_exclusion(self, url: str) -> Optional[StoredExclusion]:
-        """Find the first exclusion that matches a URL."""
-        exclusions = self.get_all_exclusions(active_only=True)
+        """Find the first exclusion that matches a URL.
 
-        for exc in exclusions:
-            if self._matches_pattern(url, exc.pattern, exc.match_type):
-                return exc
-        return None
+        v6.3.3: Uses the compiled exclusion index instead of reloading and
+        scanning every rule per call. Matching follows _matches_pattern().
+        """
+        return self.get_exclusion_index().match(url)
 
     def _matches_pattern(self, url: str, pattern: str, match_type: str) -> bool:
         """Check if URL matches an exclusion pattern."""
@@ -382,6 +507,7 @@ class HyperlinkValidatorStorage:
 
     def get_exclusion_stats(self) -> Dict[str, Any]:
         """Get exclusion statistics."""
+        self._flush_pending_hits()
         with self.connection() as (conn, cursor):
             cursor.execute('''
                 SELECT
@@ -399,6 +525,126 @@ class HyperlinkValidatorStorage:
             'last_hit': row[3]
         }
 
+    # =========================================================================
+    # URL STATUS CACHE METHODS
+    # =========================================================================
+
+    def get_cached_url_results(
+        self,
+        urls: List[str],
+        scan_depth: str = "standard",
+        context: str = ""
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Look up cached validation results.
+
+        Only rows stored with the same scan_depth and context (see
+        url_cache_context) are returned, so a result from an anonymous or
+        unverified run is never reused by an authenticated one.
+
+        Returns {url: entry} for every URL with a cache row (fresh or stale).
+        Each entry has 'result' (ValidationResult dict), 'fresh', 'etag',
+        'last_modified', 'checked_at' and 'expires_at'. Stale entries with an
+        ETag or Last-Modified can be revalidated with a conditional request.
+        """
+        keys: Dict[str, List[str]] = {}
+        for url in urls:
+            keys.setdefault(_cache_key(url), []).append(url)
+        if not keys:
+            return {}
+
+        now = time.time()
+        found: Dict[str, Dict[str, Any]] = {}
+        key_list = list(keys)
+        with self.connection() as (conn, cursor):
+            for start in range(0, len(key_list), _URL_CACHE_CHUNK):
+                chunk = key_list[start:start + _URL_CACHE_CHUNK]
+                marks = ','.join('?' * len(chunk))
+                cursor.execute(f'''
+                    SELECT url_key, result_json, etag, last_modified, checked_at, expires_at
+                    FROM url_status_cache
+                    WHERE scan_depth = ? AND context = ? AND url_key IN ({marks})
+                ''', [scan_depth, context] + chunk)
+                for url_key, result_json, etag, last_modified, checked_at, expires_at in cursor.fetchall():
+                    try:
+                        result = json.loads(result_json)
+                    except (TypeError, ValueError):
+                        continue
+                    for url in keys[url_key]:
+                        found[url] = {
+                            'result': dict(result, url=url),
+                            'fresh': expires_at > now,
+                            'etag': etag,
+                            'last_modified': last_modified,
+                            'checked_at': checked_at,
+                            'expires_at': expires_at,
+                        }
+        return found
+
+    def cache_url_results(
+        self,
+        results: List[Any],
+        scan_depth: str = "standard",
+        ttls: Optional[Dict[str, int]] = None,
+        context: str = ""
+    ) -> int:
+        """
+        Store validation results (ValidationResult objects or dicts) under
+        scan_depth and the request context.
+
+        Excluded results and statuses without a TTL are skipped. Returns the
+        number of rows written.
+        """
+        ttls = dict(URL_CACHE_TTLS, **(ttls or {}))
+        now = time.time()
+        rows = []
+        for result in results:
+            data = result.to_dict() if hasattr(result, 'to_dict') else dict(result)
+            ttl = ttls.get(data.get('status'))
+            if not ttl or data.get('excluded') or not data.get('url'):
+                continue
+            data['cached'] = False
+            rows.append((
+                _cache_key(data['url']), scan_depth, context, data['status'],
+                json.dumps(data, default=str), data.get('etag'), data.get('last_modified'),
+                now, now + ttl
+            ))
+        if not rows:
+            return 0
+        with self.connection() as (conn, cursor):
+            cursor.executemany('''
+                INSERT OR REPLACE INTO url_status_cache
+                (url_key, scan_depth, context, status, result_json, etag, last_modified,
+                 checked_at, expires_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+        return len(rows)
+
+    def clear_url_cache(self, expired_only: bool = False) -> int:
+        """Delete cached URL results (all, or only those past their TTL)."""
+        with self.connection() as (conn, cursor):
+            if expired_only:
+                cursor.execute('DELETE FROM url_status_cache WHERE expires_at <= ?', (time.time(),))
+            else:
+                cursor.execute('DELETE FROM url_status_cache')
+            deleted = cursor.rowcount
+        return deleted
+
+    def get_url_cache_stats(self) -> Dict[str, Any]:
+        """Counts of cached URL results by status and freshness."""
+        with self.connection() as (conn, cursor):
+            cursor.execute('''
+                SELECT status, COUNT(*), SUM(CASE WHEN expires_at > ? THEN 1 ELSE 0 END)
+                FROM url_status_cache
+                GROUP BY status
+            ''', (time.time(),))
+            rows = cursor.fetchall()
+        return {
+            'total': sum(r[1] for r in rows),
+            'fresh': sum(r[2] or 0 for r in rows),
+            'by_status': {r[0]: r[1] for r in rows}
+        }
+
     # =========================================================================
     # SCAN HISTORY METHODS
     # =========================================================================
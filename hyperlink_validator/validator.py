@@ -25,9 +25,8 @@ Integrates with existing AEGIS infrastructure:
 import os
 import time
 import threading
-import socket
-import ssl
 import copy
+import queue
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import List, Dict, Optional, Any, Callable
@@ -59,6 +58,11 @@ from .models import (
     validate_internal_bookmark,
     parse_cross_reference
 )
+from .exclusion_matcher import CompiledExclusions, first_matching_exclusion
+from .domain_scheduler import (
+    DomainScheduler, DEFAULT_MAX_PER_HOST, DEFAULT_RATE_PER_HOST, parse_retry_after,
+)
+from .host_probe import get_host_probe, split_host
 
 # Import DOCX extractor
 try:
@@ -90,6 +94,14 @@ try:
 except ImportError:
     pass
 
+# v6.3.3: aiohttp enables the opt-in async HTTP engine (options['engine'] = 'async')
+ASYNC_ENGINE_AVAILABLE = False
+try:
+    import aiohttp  # noqa: F401
+    ASYNC_ENGINE_AVAILABLE = True
+except ImportError:
+    pass
+
 # v6.2.0: Windows SSO via unified auth_service (single initialization point)
 WINDOWS_AUTH_AVAILABLE = False
 HttpNegotiateAuth = None
@@ -454,6 +466,7 @@ class StandaloneHyperlinkValidator:
                 'custom_ca_bundle': True,
                 'async_jobs': JobManager is not None,
                 'requests_available': REQUESTS_AVAILABLE,
+                'async_engine': ASYNC_ENGINE_AVAILABLE,
                 'exclusions': True,
                 'domain_categorization': True,
                 'docx_extraction': DOCX_EXTRACTION_AVAILABLE,
@@ -621,8 +634,10 @@ class StandaloneHyperlinkValidator:
             'rate_limited': 0,
             'invalid': 0,
             'unknown': 0,
+            'cached': 0,  # v6.3.3: served from the persistent URL cache
             # Domain tracking
             'domains_checked': {},  # domain -> {working: N, broken: N, total: N}
+            'domain_throughput': {},  # host -> DomainScheduler.snapshot() entry
             # Timing data
             'avg_response_ms': 0.0,
             'min_response_ms': None,
@@ -668,6 +683,8 @@ class StandaloneHyperlinkValidator:
             }
             counter_key = status_map.get(result.status, 'unknown')
             live_stats[counter_key] = live_stats.get(counter_key, 0) + 1
+            if getattr(result, 'cached', False):
+                live_stats['cached'] = live_stats.get('cached', 0) + 1
 
             # Domain tracking
             try:
@@ -856,6 +873,10 @@ class StandaloneHyperlinkValidator:
                 domains_snapshot = {}
                 for domain, counts in list(live_stats.get('domains_checked', {}).items()):
                     domains_snapshot[domain] = dict(counts)
+                throughput_snapshot = {
+                    host: dict(entry)
+                    for host, entry in list(live_stats.get('domain_throughput', {}).items())
+                }
 
                 result['live_stats'] = {
                     'phase': live_stats.get('phase', 'unknown'),
@@ -874,8 +895,10 @@ class StandaloneHyperlinkValidator:
                     'rate_limited': live_stats.get('rate_limited', 0),
                     'invalid': live_stats.get('invalid', 0),
                     'unknown': live_stats.get('unknown', 0),
+                    'cached': live_stats.get('cached', 0),
                     'domains_checked': domains_snapshot,
                     'domain_count': len(domains_snapshot),
+                    'domain_throughput': throughput_snapshot,
                     'avg_response_ms': live_stats.get('avg_response_ms', 0),
                     'min_response_ms': live_stats.get('min_response_ms'),
                     'max_response_ms': live_stats.get('max_response_ms'),
@@ -1292,58 +1315,103 @@ class StandaloneHyperlinkValidator:
                 except Exception:
                     pass
 
-    def _validate_single_url(
+    def _retry_ssl_with_fresh_auth(
         self,
         url: str,
-        session: 'requests.Session',
         headers: Dict[str, str],
-        auth_used: str,
-        timeout: int,
-        retries: int,
-        follow_redirects: bool,
-        exclusions: List,
-        check_dns: bool,
-        check_ssl: bool,
-        detect_soft_404_flag: bool,
-        check_suspicious: bool
-    ) -> ValidationResult:
+        timeouts: tuple,
+        ssl_error_str: str
+    ) -> Optional[Dict[str, Any]]:
         """
-        Validate a single URL using the provided session.
+        SSL fallback strategy 2: fresh SSO session with verify=False.
 
-        This method is thread-safe: each call uses the shared session
-        (requests.Session is thread-safe for concurrent requests) but
-        creates its own ValidationResult with no shared mutable state.
+        Only tried for internal/corporate links, which often need both an SSL
+        bypass (internal CA) and Windows auth. Returns a dict with
+        'status_code', 'status', 'message', or None if not recovered.
+        """
+        if not WINDOWS_AUTH_AVAILABLE or not HttpNegotiateAuth:
+            return None
+        try:
+            parsed_url = urlparse(url)
+            _corp_domains = ('.mil', '.gov', 'intranet', 'internal',
+                             'sharepoint', 'teams.microsoft',
+                             '.myngc.com', '.northgrum.com',
+                             '.northropgrumman.com', 'ngc.sharepoint.us',
+                             '.ngc.', '.northgrum.')
+            if not any(d in parsed_url.netloc.lower() for d in _corp_domains):
+                return None
 
-        Args:
-            url: The URL to validate
-            session: Configured requests.Session (thread-safe)
-            headers: Request headers dict
-            auth_used: Authentication description string
-            timeout: Request timeout in seconds
-            retries: Number of retry attempts
-            follow_redirects: Whether to follow redirects
-            exclusions: List of ExclusionRule objects
-            check_dns: Whether to perform DNS resolution check
-            check_ssl: Whether to perform SSL certificate check
-            detect_soft_404_flag: Whether to detect soft 404 pages
-            check_suspicious: Whether to detect suspicious URLs
+            fresh_ssl_session = requests.Session()
+            fresh_ssl_session.verify = False
+            try:
+                fresh_ssl_session.auth = HttpNegotiateAuth()
+            except Exception:
+                return None
 
-        Returns:
-            ValidationResult for this URL
+            try:
+                auth_resp = fresh_ssl_session.get(
+                    url, timeout=timeouts,
+                    allow_redirects=True, headers=headers,
+                    stream=True
+                )
+                auth_status = auth_resp.status_code
+                auth_ct = auth_resp.headers.get('Content-Type', '').lower()
+                auth_cd = auth_resp.headers.get('Content-Disposition', '').lower()
+                auth_resp.close()
+
+                if 200 <= auth_status < 400:
+                    _doc_types2 = ('application/pdf', 'application/msword',
+                                   'application/vnd.openxmlformats', 'application/vnd.ms-excel',
+                                   'application/vnd.ms-powerpoint', 'application/octet-stream',
+                                   'application/zip', 'application/vnd.oasis.opendocument')
+                    _is_file2 = ('attachment' in auth_cd or
+                                 any(dt in auth_ct for dt in _doc_types2))
+                    if _is_file2:
+                        fname2 = ''
+                        if 'filename=' in auth_cd:
+                            fname2 = auth_cd.split('filename=')[-1].strip('"\'').strip()
+                        message = f'File download (valid, SSO authenticated) — SSL: {ssl_error_str} — {fname2 or auth_ct}'
+                    else:
+                        message = f'Link works (SSO authenticated) — SSL: {ssl_error_str}'
+                    return {'status': 'SSL_WARNING', 'status_code': auth_status, 'message': message}
+                if auth_status in (401, 403):
+                    # Server responded — link exists but needs different auth
+                    return {'status': 'AUTH_REQUIRED', 'status_code': auth_status,
+                            'message': f'Link exists, auth required — SSL: {ssl_error_str}'}
+            except Exception:
+                pass
+            finally:
+                try:
+                    fresh_ssl_session.close()
+                except Exception:
+                    pass
+        except Exception:
+            pass
+        return None
+
+    def _precheck_url(
+        self,
+        url: str,
+        auth_used: str,
+        exclusions: Any,
+        check_suspicious: bool,
+        start_time: float
+    ) -> 'tuple[ValidationResult, bool]':
+        """
+        Checks that need no network access: exclusions, suspicious-URL
+        detection, format validation and the .mil/.gov headless-first route.
+
+        Shared by the thread engine (_validate_single_url) and the async
+        engine. Returns (result, finished); when finished is True the result
+        is final and no HTTP request should be made.
         """
-        start_time = time.time()
         result = ValidationResult(url=url, auth_used=auth_used)
 
         # Set domain category
         result.domain_category = categorize_domain(url)
 
         # Check exclusions first
-        matched_exclusion = None
-        if exclusions:
-            for exc in exclusions:
-                if exc.matches(url):
-                    matched_exclusion = exc
-                    break
+        matched_exclusion = first_matching_exclusion(exclusions, url)
 
         if matched_exclusion:
             result.excluded = True
@@ -1356,7 +1424,7 @@ class StandaloneHyperlinkValidator:
                 result.message = f'Excluded: {result.exclusion_reason}'
             result.response_time_ms = (time.time() - start_time) * 1000
             logger.debug(f"URL excluded: {url} matched pattern '{matched_exclusion.pattern}' ({matched_exclusion.match_type})")
-            return result
+            return result, True
 
         # Check for suspicious URL (thorough mode)
         if check_suspicious:
@@ -1371,7 +1439,7 @@ class StandaloneHyperlinkValidator:
             result.status = 'INVALID'
             result.message = error
             result.response_time_ms = (time.time() - start_time) * 1000
-            return result
+            return result, True
 
         # v5.9.41: Headless-first for .mil/.gov — skip the 10-30s timeout that always
         # results in BLOCKED anyway. Route directly to headless browser queue.
@@ -1383,7 +1451,56 @@ class StandaloneHyperlinkValidator:
                 result.message = 'Government site — routed to headless browser validation'
                 result.response_time_ms = (time.time() - start_time) * 1000
                 logger.debug(f"Headless-first route for .mil/.gov: {url}")
-                return result
+                return result, True
+
+        return result, False
+
+    def _validate_single_url(
+        self,
+        url: str,
+        session: 'requests.Session',
+        headers: Dict[str, str],
+        auth_used: str,
+        timeout: int,
+        retries: int,
+        follow_redirects: bool,
+        exclusions: List,
+        check_dns: bool,
+        check_ssl: bool,
+        detect_soft_404_flag: bool,
+        check_suspicious: bool,
+        rate_limit: bool = True
+    ) -> ValidationResult:
+        """
+        Validate a single URL using the provided session.
+
+        This method is thread-safe: each call uses the shared session
+        (requests.Session is thread-safe for concurrent requests) but
+        creates its own ValidationResult with no shared mutable state.
+
+        Args:
+            url: The URL to validate
+            session: Configured requests.Session (thread-safe)
+            headers: Request headers dict
+            auth_used: Authentication description string
+            timeout: Request timeout in seconds
+            retries: Number of retry attempts
+            follow_redirects: Whether to follow redirects
+            exclusions: ExclusionRule objects, or a CompiledExclusions index
+            check_dns: Whether to perform DNS resolution check
+            check_ssl: Whether to perform SSL certificate check
+            detect_soft_404_flag: Whether to detect soft 404 pages
+            check_suspicious: Whether to detect suspicious URLs
+            rate_limit: Use the module-level per-domain limiter (False when a
+                DomainScheduler is already pacing requests to this host)
+
+        Returns:
+            ValidationResult for this URL
+        """
+        start_time = time.time()
+        result, finished = self._precheck_url(url, auth_used, exclusions, check_suspicious, start_time)
+        if finished:
+            return result
 
         # Try to validate with retries
         # Government sites often need more patience - use longer connect timeout
@@ -1393,7 +1510,8 @@ class StandaloneHyperlinkValidator:
         head_failed = False
 
         # v5.9.44: Rate limit — prevent hammering a single domain
-        _domain_rate_limiter.acquire(url)
+        if rate_limit:
+            _domain_rate_limiter.acquire(url)
 
         for attempt in range(retries + 1):
             try:
@@ -1435,6 +1553,12 @@ class StandaloneHyperlinkValidator:
                 result.response_time_ms = (time.time() - start_time) * 1000
                 result.attempts = attempt + 1
                 result.dns_resolved = True
+                # v6.3.3: Validators for conditional revalidation from the URL cache
+                result.etag = response.headers.get('ETag')
+                result.last_modified = response.headers.get('Last-Modified')
+                # v6.3.3: Keep the server's pacing hint for the domain scheduler
+                if response.status_code in (429, 503):
+                    result.retry_after = parse_retry_after(response.headers.get('Retry-After'))
 
                 # ===== Document download detection =====
                 # When a link points to a downloadable file (.docx, .pdf, .xlsx etc),
@@ -1714,32 +1838,7 @@ class StandaloneHyperlinkValidator:
                 # for internal links that need both SSL bypass AND Windows auth.
                 result.ssl_valid = False
                 last_error = e
-                # v5.9.31: Extract clean SSL error reason from verbose exception
-                # Raw: "HTTPSConnectionPool(host='x', port=443): Max retries...SSLError(...reason...)"
-                # Clean: just the reason part, or a generic message
-                _raw_ssl = str(e)
-                _ssl_reason = ''
-                if 'CERTIFICATE_VERIFY_FAILED' in _raw_ssl:
-                    _ssl_reason = 'certificate not trusted (corporate/internal CA)'
-                elif 'WRONG_VERSION_NUMBER' in _raw_ssl:
-                    _ssl_reason = 'SSL version mismatch'
-                elif 'HANDSHAKE_FAILURE' in _raw_ssl:
-                    _ssl_reason = 'SSL handshake failed'
-                elif 'certificate has expired' in _raw_ssl.lower():
-                    _ssl_reason = 'certificate expired'
-                elif 'self signed' in _raw_ssl.lower() or 'self-signed' in _raw_ssl.lower():
-                    _ssl_reason = 'self-signed certificate'
-                elif 'unable to get local issuer' in _raw_ssl.lower():
-                    _ssl_reason = 'certificate issuer not trusted (corporate/internal CA)'
-                else:
-                    # Fallback: try to extract from inside parentheses
-                    import re
-                    _m = re.search(r"Caused by SSLError\([^)]*?'([^']{10,80})'", _raw_ssl)
-                    if _m:
-                        _ssl_reason = _m.group(1)[:80]
-                    else:
-                        _ssl_reason = 'SSL certificate verification failed'
-                ssl_error_str = _ssl_reason
+                ssl_error_str = self._ssl_error_reason(str(e))
                 ssl_recovered = False
 
                 # --- SSL Strategy 1: GET with verify=False (no auth) ---
@@ -1782,71 +1881,15 @@ class StandaloneHyperlinkValidator:
                     pass  # Strategy 1 failed, try Strategy 2
 
                 # --- SSL Strategy 2: Fresh SSO session with verify=False (for internal/corporate links) ---
-                if not ssl_recovered and WINDOWS_AUTH_AVAILABLE and HttpNegotiateAuth:
-                    try:
-                        parsed_url = urlparse(url)
-                        _corp_domains = ('.mil', '.gov', 'intranet', 'internal',
-                                         'sharepoint', 'teams.microsoft',
-                                         '.myngc.com', '.northgrum.com',
-                                         '.northropgrumman.com', 'ngc.sharepoint.us',
-                                         '.ngc.', '.northgrum.')
-                        is_corp = any(d in parsed_url.netloc.lower() for d in _corp_domains)
-
-                        if is_corp:
-                            fresh_ssl_session = requests.Session()
-                            fresh_ssl_session.verify = False
-                            try:
-                                fresh_ssl_session.auth = HttpNegotiateAuth()
-                            except Exception:
-                                fresh_ssl_session = None
-
-                            if fresh_ssl_session:
-                                try:
-                                    auth_resp = fresh_ssl_session.get(
-                                        url, timeout=(connect_timeout, read_timeout),
-                                        allow_redirects=True, headers=headers,
-                                        stream=True
-                                    )
-                                    auth_status = auth_resp.status_code
-                                    auth_ct = auth_resp.headers.get('Content-Type', '').lower()
-                                    auth_cd = auth_resp.headers.get('Content-Disposition', '').lower()
-                                    auth_resp.close()
-
-                                    if 200 <= auth_status < 400:
-                                        _doc_types2 = ('application/pdf', 'application/msword',
-                                                       'application/vnd.openxmlformats', 'application/vnd.ms-excel',
-                                                       'application/vnd.ms-powerpoint', 'application/octet-stream',
-                                                       'application/zip', 'application/vnd.oasis.opendocument')
-                                        _is_file2 = ('attachment' in auth_cd or
-                                                     any(dt in auth_ct for dt in _doc_types2))
-                                        if _is_file2:
-                                            fname2 = ''
-                                            if 'filename=' in auth_cd:
-                                                fname2 = auth_cd.split('filename=')[-1].strip('"\'').strip()
-                                            result.status = 'SSL_WARNING'
-                                            result.status_code = auth_status
-                                            result.message = f'File download (valid, SSO authenticated) — SSL: {ssl_error_str} — {fname2 or auth_ct}'
-                                        else:
-                                            result.status = 'SSL_WARNING'
-                                            result.status_code = auth_status
-                                            result.message = f'Link works (SSO authenticated) — SSL: {ssl_error_str}'
-                                        ssl_recovered = True
-                                    elif auth_status in (401, 403):
-                                        # Server responded — link exists but needs different auth
-                                        result.status = 'AUTH_REQUIRED'
-                                        result.status_code = auth_status
-                                        result.message = f'Link exists, auth required — SSL: {ssl_error_str}'
-                                        ssl_recovered = True
-                                except Exception:
-                                    pass
-                                finally:
-                                    try:
-                                        fresh_ssl_session.close()
-                                    except Exception:
-                                        pass
-                    except Exception:
-                        pass
-
+                if not ssl_recovered:
+                    sso_retry = self._retry_ssl_with_fresh_auth(
+                        url, headers, (connect_timeout, read_timeout), ssl_error_str
+                    )
+                    if sso_retry:
+                        result.status = sso_retry['status']
+                        result.status_code = sso_retry['status_code']
+                        result.message = sso_retry['message']
+                        ssl_recovered = True
                 if not ssl_recovered:
                     result.status = 'SSLERROR'
                     result.message = f'SSL certificate error: {ssl_error_str}'
@@ -1900,15 +1943,54 @@ class StandaloneHyperlinkValidator:
                 time.sleep(wait_time)
 
         # v5.9.44: Release rate limiter slot (always, even on error)
-        _domain_rate_limiter.release(url)
+        if rate_limit:
+            _domain_rate_limiter.release(url)
 
         result.response_time_ms = (time.time() - start_time) * 1000
         result.attempts = min(attempt + 1, retries + 1) if 'attempt' in dir() else 1
 
-        # v5.9.30: Post-validation — ONLY network-level downgrades
-        # HTTP responses (200-5xx) are trusted as-is after the GET fallback above.
-        # Only DNS failures and connection-level errors on corporate domains get reclassified,
-        # because these are network access issues (VPN needed), not broken links.
+        self._downgrade_network_errors(result, url)
+
+        return result
+
+    @staticmethod
+    def _ssl_error_reason(raw_ssl: str) -> str:
+        """
+        v5.9.31: Extract a clean SSL error reason from a verbose exception.
+
+        Raw: "HTTPSConnectionPool(host='x', port=443): Max retries...SSLError(...reason...)"
+        Clean: just the reason part, or a generic message
+        """
+        if 'CERTIFICATE_VERIFY_FAILED' in raw_ssl:
+            return 'certificate not trusted (corporate/internal CA)'
+        if 'WRONG_VERSION_NUMBER' in raw_ssl:
+            return 'SSL version mismatch'
+        if 'HANDSHAKE_FAILURE' in raw_ssl:
+            return 'SSL handshake failed'
+        lowered = raw_ssl.lower()
+        if 'certificate has expired' in lowered:
+            return 'certificate expired'
+        if 'self signed' in lowered or 'self-signed' in lowered:
+            return 'self-signed certificate'
+        if 'unable to get local issuer' in lowered:
+            return 'certificate issuer not trusted (corporate/internal CA)'
+        # Fallback: try to extract from inside parentheses
+        import re
+        _m = re.search(r"Caused by SSLError\([^)]*?'([^']{10,80})'", raw_ssl)
+        if _m:
+            return _m.group(1)[:80]
+        return 'SSL certificate verification failed'
+
+    @staticmethod
+    def _downgrade_network_errors(result: ValidationResult, url: str):
+        """
+        v5.9.30: Post-validation — ONLY network-level downgrades.
+
+        HTTP responses (200-5xx) are trusted as-is after the GET fallback.
+        Only DNS failures and connection-level errors on corporate domains get
+        reclassified, because these are network access issues (VPN needed),
+        not broken links.
+        """
         try:
             domain = urlparse(url).netloc.lower()
 
@@ -1946,8 +2028,6 @@ class StandaloneHyperlinkValidator:
         except Exception:
             pass
 
-        return result
-
     def _validate_with_requests(
         self,
         urls: List[str],
@@ -1982,6 +2062,8 @@ class StandaloneHyperlinkValidator:
                 - ca_bundle: Path to custom CA bundle
                 - proxy: Proxy server URL
                 - verify_ssl: Whether to verify SSL (default True)
+                - engine: 'threads' (default) or 'async' (requires aiohttp)
+                - max_connections: Async engine socket limit (default 1000)
             live_stats: Optional shared dict for real-time progress tracking.
                         When provided, updated after each URL completes with
                         status counts, domain health, timing data, and activity.
@@ -2054,6 +2136,8 @@ class StandaloneHyperlinkValidator:
 
         if exclusions:
             logger.info(f"Active exclusions: {len(exclusions)} rules — patterns: {[e.pattern for e in exclusions[:5]]}{'...' if len(exclusions) > 5 else ''}")
+        # v6.3.3: Compile once per run so each URL check is O(URL length)
+        exclusions = CompiledExclusions(exclusions)
 
         # Set up session with authentication
         session = requests.Session()
@@ -2166,32 +2250,146 @@ class StandaloneHyperlinkValidator:
             check_suspicious=check_suspicious
         )
 
-        max_workers = min(self.max_concurrent, total_unique)
-
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            # Submit all unique URLs
-            future_to_url = {
-                executor.submit(self._validate_single_url, url, **shared_params): url
-                for url in unique_urls
-            }
+        # v6.3.3: Persistent URL cache. Fresh results are reused outright;
+        # stale ones that carry an ETag/Last-Modified get a conditional HEAD
+        # and are reused on 304. Excluded URLs always go through the normal
+        # exclusion path so rule changes take effect immediately. Rows are
+        # keyed on the request context too, so results never cross between
+        # anonymous/SSO/client-cert, verify on/off or different-proxy runs.
+        use_cache = options.get('use_cache', True)
+        url_cache = None
+        cache_context = ''
+        revalidate: Dict[str, Dict[str, Any]] = {}
+        if use_cache:
+            try:
+                from .storage import HyperlinkValidatorStorage, url_cache_context
+                url_cache = HyperlinkValidatorStorage()
+                cache_context = url_cache_context(auth=auth_used, verify=ca_bundle or bool(verify_ssl),
+                                                  proxy=proxy, client_cert=client_cert)
+                candidates = [u for u in unique_urls if exclusions.match(u) is None]
+                cached = url_cache.get_cached_url_results(candidates, scan_depth, context=cache_context)
+                for url, entry in cached.items():
+                    if entry['fresh']:
+                        unique_results[url] = self._result_from_cache(entry)
+                    elif entry['etag'] or entry['last_modified']:
+                        revalidate[url] = entry
+            except Exception as e:
+                logger.debug(f"URL cache unavailable (non-critical): {e}")
+                url_cache = None
 
-            # Collect results as they complete
-            for future in as_completed(future_to_url):
-                url = future_to_url[future]
+        if unique_results:
+            logger.info(f"URL cache: {len(unique_results)} fresh, {len(revalidate)} to revalidate, "
+                        f"{total_unique - len(unique_results)} to fetch")
+            if live_stats is not None:
+                for result in unique_results.values():
+                    self._update_live_stats(live_stats, result, stats_lock)
+            completed_count = len(unique_results)
+            if self.progress_callback:
+                self.progress_callback(int(completed_count / total_unique * total_original),
+                                       total_original, f"{completed_count} cached results")
+        to_fetch = [u for u in unique_urls if u not in unique_results]
+
+        # v6.3.3: Thorough mode pays DNS per host, not per URL — resolve every
+        # distinct host concurrently now; per-URL checks reuse these lookups
+        if check_dns and to_fetch:
+            host_count = get_host_probe().prefetch(to_fetch, dns=True)
+            logger.debug(f"Prefetching DNS for {host_count} hosts")
+
+        max_workers = max(1, min(self.max_concurrent, len(to_fetch)))
+
+        # v6.3.3: Domain-aware scheduling. Workers pull the next URL from a
+        # per-host round-robin (token bucket + in-flight cap + 429/503 backoff)
+        # instead of every URL being submitted up front and blocking inside
+        # the domain rate limiter, so busy hosts no longer starve idle ones.
+        shared_params['rate_limit'] = False
+        scheduler = DomainScheduler(
+            to_fetch,
+            max_per_host=options.get('max_per_host', DEFAULT_MAX_PER_HOST),
+            rate_per_host=options.get('rate_per_host', DEFAULT_RATE_PER_HOST),
+        )
+        done_queue: 'queue.Queue' = queue.Queue()
+
+        # v6.3.3: Opt-in asyncio engine — one event loop instead of one thread
+        # per in-flight request, for batches that need thousands of sockets
+        engine = options.get('engine', 'threads')
+        if engine == 'async' and not ASYNC_ENGINE_AVAILABLE:
+            logger.warning("aiohttp not installed, using the thread engine")
+            engine = 'threads'
+
+        def _worker():
+            while True:
+                url = scheduler.next_url()
+                if url is None:
+                    return
                 try:
-                    result = future.result()
-                    unique_results[url] = result
+                    result = None
+                    if url in revalidate:
+                        result = self._revalidate_cached_url(
+                            url, revalidate[url], session, headers, timeout)
+                    if result is None:
+                        result = self._validate_single_url(url, **shared_params)
                 except Exception as e:
                     logger.error(f"Unexpected error validating {url}: {e}")
-                    error_result = ValidationResult(url=url, auth_used=auth_used)
-                    error_result.status = 'BROKEN'
-                    error_result.message = f'Validation error: {str(e)[:50]}'
-                    unique_results[url] = error_result
-                    result = error_result
+                    result = ValidationResult(url=url, auth_used=auth_used)
+                    result.status = 'BROKEN'
+                    result.message = f'Validation error: {str(e)[:50]}'
+                if scheduler.complete(url, result.status_code, getattr(result, 'retry_after', None)):
+                    logger.debug(f"Backing off {urlparse(url).netloc} after HTTP {result.status_code}, requeued {url}")
+                    continue
+                done_queue.put((url, result))
+
+        last_domain_snapshot = 0.0
+        with ThreadPoolExecutor(max_workers=1 if engine == 'async' else max_workers) as executor:
+            if engine == 'async':
+                from .async_engine import AsyncValidationEngine, DEFAULT_MAX_CONNECTIONS
+                async_engine = AsyncValidationEngine(
+                    self, scheduler,
+                    headers=headers,
+                    auth_used=auth_used,
+                    timeout=timeout,
+                    retries=retries,
+                    follow_redirects=follow_redirects,
+                    exclusions=exclusions,
+                    check_dns=check_dns,
+                    check_ssl=check_ssl_opt,
+                    detect_soft_404_flag=detect_soft_404_flag,
+                    check_suspicious=check_suspicious,
+                    verify_ssl=verify_ssl,
+                    ca_bundle=ca_bundle,
+                    client_cert=client_cert,
+                    proxy=proxy,
+                    revalidate=revalidate,
+                    max_connections=options.get('max_connections', DEFAULT_MAX_CONNECTIONS),
+                    max_per_host=scheduler.max_per_host,
+                )
+                logger.info(f"Async engine: {len(to_fetch)} URLs, up to "
+                            f"{async_engine.max_connections} concurrent connections")
+                workers = [executor.submit(async_engine.run, lambda u, r: done_queue.put((u, r)))]
+            else:
+                workers = [executor.submit(_worker) for _ in range(max_workers)]
+
+            # Collect results as they complete
+            while completed_count < total_unique:
+                try:
+                    url, result = done_queue.get(timeout=1.0)
+                except queue.Empty:
+                    if all(w.done() for w in workers):
+                        for w in workers:
+                            if w.exception():
+                                logger.error(f"Validation worker failed: {w.exception()}")
+                        break
+                    continue
+                unique_results[url] = result
 
                 # Update live_stats with this result (thread-safe)
                 if live_stats is not None:
                     self._update_live_stats(live_stats, result, stats_lock)
+                    now = time.time()
+                    if now - last_domain_snapshot >= 0.5 or completed_count + 1 == total_unique:
+                        last_domain_snapshot = now
+                        domain_throughput = scheduler.snapshot()
+                        with stats_lock:
+                            live_stats['domain_throughput'] = domain_throughput
 
                 # Progress callback (reports progress based on total original URL count)
                 with progress_lock:
@@ -2201,6 +2399,16 @@ class StandaloneHyperlinkValidator:
                         scaled = int(completed_count / total_unique * total_original)
                         self.progress_callback(scaled, total_original, url)
 
+            scheduler.close()
+
+        # Any URL a failed worker never reported is treated as an error
+        for url in unique_urls:
+            if url not in unique_results:
+                error_result = ValidationResult(url=url, auth_used=auth_used)
+                error_result.status = 'BROKEN'
+                error_result.message = 'Validation error: worker stopped'
+                unique_results[url] = error_result
+
         session.close()
 
         # =================================================================
@@ -2210,7 +2418,8 @@ class StandaloneHyperlinkValidator:
         # v5.9.29: Added AUTH_REQUIRED to retest — internal links that got AUTH_REQUIRED
         # during primary validation should be retried with fresh SSO in the retest phase
         retest_statuses = {'BROKEN', 'TIMEOUT', 'DNSFAILED', 'BLOCKED', 'SSLERROR', 'AUTH_REQUIRED'}
-        broken_urls = [url for url, r in unique_results.items() if r.status in retest_statuses]
+        broken_urls = [url for url, r in unique_results.items()
+                       if r.status in retest_statuses and not r.cached]
 
         if broken_urls:
             logger.info(f"Re-test phase: retrying {len(broken_urls)} broken/failed links with deeper scan")
@@ -2234,6 +2443,14 @@ class StandaloneHyperlinkValidator:
                     if live_stats is not None:
                         self._update_live_stats(live_stats, retest_result, stats_lock)
 
+        if url_cache is not None:
+            try:
+                fresh_results = [r for r in unique_results.values() if not r.cached or r.url in revalidate]
+                url_cache.cache_url_results(fresh_results, scan_depth, ttls=options.get('cache_ttls'),
+                                            context=cache_context)
+            except Exception as e:
+                logger.debug(f"Could not update URL cache (non-critical): {e}")
+
         # Map results back to original URL order, creating copies for duplicates
         results = []
         for url in urls:
@@ -2261,6 +2478,51 @@ class StandaloneHyperlinkValidator:
 
         return results
 
+    @staticmethod
+    def _result_from_cache(entry: Dict[str, Any]) -> ValidationResult:
+        """Rebuild a ValidationResult from a URL cache entry, marked as cached."""
+        result = ValidationResult.from_dict(entry['result'])
+        result.cached = True
+        result.response_time_ms = 0.0
+        return result
+
+    def _revalidate_cached_url(
+        self,
+        url: str,
+        entry: Dict[str, Any],
+        session: 'requests.Session',
+        headers: Dict[str, str],
+        timeout: int
+    ) -> Optional[ValidationResult]:
+        """
+        Conditional HEAD for a stale cache entry.
+
+        Returns the cached result (marked cached, with this request's timing)
+        if the server answers 304 Not Modified, otherwise None so the caller
+        runs a full validation.
+        """
+        conditional = dict(headers)
+        if entry.get('etag'):
+            conditional['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            conditional['If-Modified-Since'] = entry['last_modified']
+        start_time = time.time()
+        try:
+            response = session.head(url, timeout=(min(timeout, 20), timeout),
+                                    allow_redirects=True, headers=conditional)
+            response.close()
+        except Exception as e:
+            logger.debug(f"Conditional revalidation failed for {url}: {e}")
+            return None
+        if response.status_code != 304:
+            return None
+        result = self._result_from_cache(entry)
+        result.response_time_ms = (time.time() - start_time) * 1000
+        result.checked_at = datetime.utcnow().isoformat() + "Z"
+        result.etag = response.headers.get('ETag') or entry.get('etag')
+        result.last_modified = response.headers.get('Last-Modified') or entry.get('last_modified')
+        return result
+
     def _retest_broken_links(
         self,
         broken_urls: List[str],
@@ -2514,13 +2776,13 @@ class StandaloneHyperlinkValidator:
                 parsed = urlparse(url)
                 hostname = parsed.netloc.split(':')[0] if parsed.netloc else ''
                 if hostname:
-                    socket.setdefaulttimeout(10)
-                    ip = socket.gethostbyname(hostname)
-                    if ip:
+                    # v6.3.3: Shared per-host cache — no global socket timeout
+                    dns_result = check_dns_resolution(hostname, timeout=10)
+                    if dns_result['resolved'] and dns_result['ip_addresses']:
                         # Domain resolves but server doesn't respond properly
                         # Don't upgrade to WORKING, but note DNS is valid
                         result.dns_resolved = True
-                        result.dns_ip_addresses = [ip]
+                        result.dns_ip_addresses = dns_result['ip_addresses'][:1]
             except Exception:
                 pass
 
@@ -2665,106 +2927,44 @@ class StandaloneHyperlinkValidator:
 # THOROUGH VALIDATION FUNCTIONS
 # =============================================================================
 
-def check_dns_resolution(hostname: str, timeout: int = 5) -> Dict[str, Any]:
+def check_dns_resolution(hostname: str, timeout: int = 5, use_cache: bool = True) -> Dict[str, Any]:
     """
     Check if hostname resolves to an IP address.
 
+    v6.3.3: Answered from the shared per-host cache (see host_probe) and
+    bounded by waiting on the lookup instead of socket.setdefaulttimeout().
+
     Args:
-        hostname: The hostname to resolve
-        timeout: Socket timeout in seconds
+        hostname: The hostname (or netloc) to resolve
+        timeout: Seconds to wait for the lookup
+        use_cache: Reuse a cached result for this host (default True);
+            False forces a fresh lookup, which then refreshes the cache
 
     Returns:
         dict with 'resolved', 'ip_addresses', 'response_time_ms'
     """
-    start = time.time()
-    try:
-        socket.setdefaulttimeout(timeout)
-        ip_addresses = socket.gethostbyname_ex(hostname)[2]
-        return {
-            'resolved': True,
-            'ip_addresses': ip_addresses,
-            'response_time_ms': round((time.time() - start) * 1000, 2)
-        }
-    except socket.gaierror as e:
-        return {
-            'resolved': False,
-            'ip_addresses': [],
-            'response_time_ms': round((time.time() - start) * 1000, 2),
-            'error': str(e)
-        }
-    except Exception as e:
-        return {
-            'resolved': False,
-            'ip_addresses': [],
-            'response_time_ms': round((time.time() - start) * 1000, 2),
-            'error': str(e)
-        }
+    return get_host_probe().resolve(hostname, timeout=timeout, refresh=not use_cache)
 
 
-def check_ssl_certificate(hostname: str, port: int = 443, timeout: int = 10) -> Dict[str, Any]:
+def check_ssl_certificate(hostname: str, port: int = 443, timeout: int = 10,
+                          use_cache: bool = True) -> Dict[str, Any]:
     """
     Check SSL certificate validity and expiration.
 
+    v6.3.3: One handshake per host:port, cached (see host_probe).
+
     Args:
-        hostname: The hostname to check
+        hostname: The hostname to check (a host:port netloc overrides port)
         port: SSL port (default 443)
         timeout: Connection timeout
+        use_cache: Reuse a cached result for this host (default True);
+            False forces a fresh handshake, which then refreshes the cache
 
     Returns:
         dict with 'valid', 'issuer', 'expires', 'days_until_expiry', 'warning'
     """
-    context = ssl.create_default_context()
-    try:
-        with socket.create_connection((hostname, port), timeout=timeout) as sock:
-            with context.wrap_socket(sock, server_hostname=hostname) as ssock:
-                cert = ssock.getpeercert()
-                expires_str = cert.get('notAfter', '')
-
-                # Parse expiration date
-                try:
-                    expires = datetime.strptime(expires_str, '%b %d %H:%M:%S %Y %Z')
-                except ValueError:
-                    expires = datetime.now()
-
-                days_until = (expires - datetime.now()).days
-
-                # Extract issuer info
-                issuer_info = cert.get('issuer', ())
-                issuer_name = 'Unknown'
-                for item in issuer_info:
-                    for key, value in item:
-                        if key == 'organizationName':
-                            issuer_name = value
-                            break
-
-                warning = None
-                if days_until < 30:
-                    warning = f'Certificate expires in {days_until} days'
-                elif days_until < 0:
-                    warning = 'Certificate has expired!'
-
-                return {
-                    'valid': True,
-                    'issuer': issuer_name,
-                    'expires': expires.strftime('%Y-%m-%d'),
-                    'days_until_expiry': days_until,
-                    'warning': warning
-                }
-    except ssl.SSLError as e:
-        return {
-            'valid': False,
-            'error': f'SSL Error: {str(e)}'
-        }
-    except socket.timeout:
-        return {
-            'valid': False,
-            'error': 'Connection timeout'
-        }
-    except Exception as e:
-        return {
-            'valid': False,
-            'error': str(e)
-        }
+    host, port = split_host(hostname, default_port=port)
+    return get_host_probe().ssl_certificate(f'{host}:{port}', timeout=timeout, refresh=not use_cache)
 
 
 def detect_soft_404(response_text: str) -> bool:
@@ -18,13 +18,14 @@ Version: reads from version.json (module v1.0)
 
 import os
 import re
-import zipfile
 import struct
 from typing import List, Dict, Tuple, Optional, Set
 from dataclasses import dataclass
 from xml.etree import ElementTree as ET
 from io import BytesIO
 
+from docx_package import DocxPackage, open_package
+
 try:
     from base_checker import BaseChecker
 except ImportError:
@@ -137,7 +138,7 @@ class ImageFigureChecker(BaseChecker):
         issues = []
         
         # Extract images from DOCX
-        images = self._extract_images(filepath)
+        images = self._extract_images(filepath, kwargs.get('docx_package'))
         
         # Find figure captions in paragraphs
         captions = self._find_captions(paragraphs)
@@ -162,39 +163,29 @@ class ImageFigureChecker(BaseChecker):
         
         return issues
     
-    def _extract_images(self, filepath: str) -> List[ImageInfo]:
-        """Extract all images from a DOCX file."""
+    def _extract_images(self, filepath: str, package: Optional[DocxPackage] = None) -> List[ImageInfo]:
+        """Extract all images from a DOCX file (v6.3.3: via the shared DocxPackage)."""
         images = []
         
         try:
-            with zipfile.ZipFile(filepath, 'r') as zf:
-                # Get relationships for image targets
-                rels = {}
-                rels_file = 'word/_rels/document.xml.rels'
-                if rels_file in zf.namelist():
-                    with zf.open(rels_file) as f:
-                        rels_tree = ET.parse(f)
-                        for rel in rels_tree.findall('.//{%s}Relationship' % NAMESPACES['rel']):
-                            rel_id = rel.get('Id', '')
-                            target = rel.get('Target', '')
-                            rel_type = rel.get('Type', '')
-                            if 'image' in rel_type.lower():
-                                rels[rel_id] = target
+            with open_package(filepath, package) as pkg:
+                if pkg is None:
+                    return images
+                # Relationships for image targets
+                rels = pkg.relationship_targets('image')
                 
                 # Parse document.xml for images
-                if 'word/document.xml' in zf.namelist():
-                    with zf.open('word/document.xml') as f:
-                        doc_tree = ET.parse(f)
+                doc_tree = pkg.document_tree
+                if doc_tree is not None:
+                    para_idx = 0
+                    for para in doc_tree.iter('{%s}p' % NAMESPACES['w']):
+                        # Check for drawings in this paragraph
+                        for drawing in para.iter('{%s}drawing' % NAMESPACES['w']):
+                            img_info = self._parse_drawing(drawing, rels, para_idx, pkg)
+                            if img_info:
+                                images.append(img_info)
                         
-                        para_idx = 0
-                        for para in doc_tree.iter('{%s}p' % NAMESPACES['w']):
-                            # Check for drawings in this paragraph
-                            for drawing in para.iter('{%s}drawing' % NAMESPACES['w']):
-                                img_info = self._parse_drawing(drawing, rels, para_idx, zf)
-                                if img_info:
-                                    images.append(img_info)
-                            
-                            para_idx += 1
+                        para_idx += 1
         
         except Exception as e:
             self._errors.append(f"Error extracting images: {e}")
@@ -206,7 +197,7 @@ class ImageFigureChecker(BaseChecker):
         drawing: ET.Element,
         rels: Dict[str, str],
         para_idx: int,
-        zf: zipfile.ZipFile
+        package: DocxPackage
     ) -> Optional[ImageInfo]:
         """Parse a drawing element to extract image info."""
         try:
@@ -253,8 +244,7 @@ class ImageFigureChecker(BaseChecker):
             # Get file size
             file_size = 0
             img_path = f'word/{target}' if not target.startswith('word/') else target
-            if img_path in zf.namelist():
-                file_size = zf.getinfo(img_path).file_size
+            file_size = package.part_size(img_path)
             
             return ImageInfo(
                 filename=filename,
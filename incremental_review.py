@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+AEGIS Incremental Review
+========================
+Reuses cached issues for unchanged paragraphs when a document is re-reviewed.
+
+v6.3.3: A rescan of a lightly edited document used to re-run every checker
+over every paragraph. With incremental review enabled:
+- Each paragraph is hashed (text + whether it sits in a special section).
+- Checkers whose class sets PARAGRAPH_LOCAL = True (issues for a paragraph
+  depend only on that paragraph's text) take their issues for already-seen
+  paragraphs from a content-addressed cache and only run on new or edited
+  paragraphs.
+- Every other checker (acronyms, terminology consistency, cross-references,
+  anything with document-level caps or first-use logic) runs over the whole
+  document as before.
+
+The cache is keyed by paragraph content, not by file name, so a renamed or
+re-uploaded copy of a document benefits too. Entries are tagged with the
+checker's class and CHECKER_VERSION; bumping the version invalidates them.
+
+Enable per review with options['incremental_review'] = True, or globally with
+config.json "performance_settings": {"incremental_review": true}.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlite_pool import get_pool
+
+__version__ = "1.0.0"
+
+_CACHE_FORMAT = 1
+DEFAULT_CACHE_PATH = Path(__file__).parent / 'data' / 'review_cache.db'
+MAX_CACHED_PARAGRAPHS = 200000
+_CONFIG_FILE = Path(__file__).parent / 'config.json'
+_SQL_CHUNK = 500
+
+try:
+    from config_logging import get_logger
+    _logger = get_logger('incremental_review')
+except ImportError:
+    _logger = None
+
+
+def _log(message: str, level: str = 'debug', **kwargs):
+    """Internal logging helper."""
+    if _logger:
+        getattr(_logger, level)(message, **kwargs)
+    elif level in ('warning', 'error', 'critical'):
+        print(f"[{level.upper()}] {message}")
+
+
+def is_incremental_enabled(options: Optional[Dict] = None) -> bool:
+    """Review option wins over config.json performance_settings.incremental_review."""
+    options = options or {}
+    if 'incremental_review' in options:
+        return bool(options['incremental_review'])
+    try:
+        if _CONFIG_FILE.exists():
+            with open(_CONFIG_FILE, 'r', encoding='utf-8') as f:
+                perf = json.load(f).get('performance_settings', {}) or {}
+            return bool(perf.get('incremental_review', False))
+    except Exception as e:
+        _log(f" Could not read performance settings: {e}")
+    return False
+
+
+def paragraph_hash(text: str, special: bool = False) -> str:
+    """Cache key for one paragraph (special-section membership changes some checkers' output)."""
+    return hashlib.sha1(f"{int(bool(special))}\x00{text}".encode('utf-8')).hexdigest()
+
+
+def is_paragraph_local(checker: Any) -> bool:
+    """Capability flag declared on the checker class (BaseChecker.PARAGRAPH_LOCAL)."""
+    return bool(getattr(checker, 'PARAGRAPH_LOCAL', False)) and getattr(checker, 'enabled', True)
+
+
+_CONFIG_TYPES = (bool, int, float, str, type(None))
+
+
+def checker_config(checker: Any) -> Dict[str, Any]:
+    """Public scalar instance attributes: the enabled flag and constructor options."""
+    try:
+        attrs = vars(checker)
+    except TypeError:
+        return {}
+    return {k: v for k, v in attrs.items() if not k.startswith('_') and isinstance(v, _CONFIG_TYPES)}
+
+
+def checker_cache_key(name: str, checker: Any) -> str:
+    """Cache namespace for a checker: registry name, class, version and options.
+
+    Options are part of the key so that e.g. toggling
+    RequirementsLanguageChecker(flag_should_in_reqs=...) never replays issues
+    computed under the other setting.
+    """
+    config = json.dumps(checker_config(checker), sort_keys=True)
+    digest = hashlib.sha1(config.encode('utf-8')).hexdigest()[:12]
+    return (f"{name}:{type(checker).__name__}:{getattr(checker, 'CHECKER_VERSION', '')}:"
+            f"{digest}:{_CACHE_FORMAT}")
+
+
+# =============================================================================
+# PARAGRAPH ISSUE CACHE
+# =============================================================================
+
+class ParagraphIssueCache:
+    """
+    SQLite store: paragraph hash -> {checker cache key: [issue dicts]}.
+
+    Stored issues have their paragraph_index removed; the caller restores it
+    for wherever the paragraph sits in the current document.
+    """
+
+    def __init__(self, db_path=DEFAULT_CACHE_PATH, max_entries: int = MAX_CACHED_PARAGRAPHS):
+        self.db_path = str(db_path)
+        self.max_entries = max_entries
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    def _transaction(self):
+        return get_pool(self.db_path).transaction()
+
+    def _init_schema(self):
+        with self._transaction() as (conn, cursor):
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS paragraph_issue_cache (
+                    para_hash TEXT PRIMARY KEY,
+                    payload BLOB NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_paragraph_cache_used '
+                           'ON paragraph_issue_cache(last_used)')
+
+    def load(self, hashes: Iterable[str]) -> Dict[str, Dict[str, List[Dict]]]:
+        """Cached entries for the given paragraph hashes (missing hashes are absent)."""
+        hashes = list(dict.fromkeys(hashes))
+        found: Dict[str, Dict[str, List[Dict]]] = {}
+        now = time.time()
+        with self._transaction() as (conn, cursor):
+            for start in range(0, len(hashes), _SQL_CHUNK):
+                chunk = hashes[start:start + _SQL_CHUNK]
+                marks = ','.join('?' * len(chunk))
+                cursor.execute(f'SELECT para_hash, payload FROM paragraph_issue_cache '
+                               f'WHERE para_hash IN ({marks})', chunk)
+                for para_hash, payload in cursor.fetchall():
+                    try:
+                        found[para_hash] = json.loads(zlib.decompress(payload).decode('utf-8'))
+                    except (zlib.error, ValueError):
+                        continue
+                if found:
+                    cursor.executemany('UPDATE paragraph_issue_cache SET last_used = ? WHERE para_hash = ?',
+                                       [(now, h) for h in chunk if h in found])
+        return found
+
+    def store(self, entries: Dict[str, Dict[str, List[Dict]]]):
+        """Write complete entries (callers merge with what load() returned)."""
+        if not entries:
+            return
+        now = time.time()
+        rows = [(h, zlib.compress(json.dumps(entry, default=str).encode('utf-8')), now)
+                for h, entry in entries.items()]
+        with self._transaction() as (conn, cursor):
+            cursor.executemany('INSERT OR REPLACE INTO paragraph_issue_cache '
+                               '(para_hash, payload, last_used) VALUES (?, ?, ?)', rows)
+            cursor.execute('SELECT COUNT(*) FROM paragraph_issue_cache')
+            excess = cursor.fetchone()[0] - self.max_entries
+            if excess > 0:
+                cursor.execute('DELETE FROM paragraph_issue_cache WHERE para_hash IN ('
+                               'SELECT para_hash FROM paragraph_issue_cache '
+                               'ORDER BY last_used LIMIT ?)', (excess,))
+
+    def clear(self):
+        with self._transaction() as (conn, cursor):
+            cursor.execute('DELETE FROM paragraph_issue_cache')
+
+
+_caches: Dict[str, ParagraphIssueCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_paragraph_cache(db_path=DEFAULT_CACHE_PATH) -> ParagraphIssueCache:
+    """Process-wide cache instance for `db_path`."""
+    key = str(Path(db_path).resolve())
+    with _caches_lock:
+        if key not in _caches:
+            _caches[key] = ParagraphIssueCache(db_path)
+        return _caches[key]
+
+
+# =============================================================================
+# INCREMENTAL RUN
+# =============================================================================
+
+def _strip_index(issue: Dict) -> Dict:
+    stored = dict(issue)
+    stored.pop('paragraph_index', None)
+    stored.pop('checker', None)
+    if isinstance(stored.get('source'), dict):
+        stored['source'] = {k: v for k, v in stored['source'].items() if k != 'paragraph_index'}
+    return stored
+
+
+def _with_index(issue: Dict, idx: int) -> Dict:
+    restored = json.loads(json.dumps(issue))
+    restored['paragraph_index'] = idx
+    if isinstance(restored.get('source'), dict):
+        restored['source']['paragraph_index'] = idx
+    return restored
+
+
+class IncrementalReview:
+    """
+    Runs one review's checkers through a CheckerScheduler, skipping
+    paragraph-local work whose result is already cached.
+
+    Usage:
+        incremental = IncrementalReview(engine.checkers, paragraphs, special_sections)
+        results = incremental.run(scheduler, enabled, common_kwargs, on_complete, is_cancelled)
+    """
+
+    def __init__(self, checkers: Dict[str, Any], paragraphs: List[Tuple[int, str]],
+                 special_sections: Optional[Dict[str, List[int]]] = None,
+                 cache: Optional[ParagraphIssueCache] = None):
+        self.checkers = checkers
+        self.paragraphs = list(paragraphs)
+        self.cache = cache or get_paragraph_cache()
+        special: Set[int] = set()
+        for indices in (special_sections or {}).values():
+            special.update(indices)
+        self.hashes = {idx: paragraph_hash(text, idx in special) for idx, text in self.paragraphs}
+        self.stats = {'paragraphs': len(self.paragraphs), 'rechecked_paragraphs': 0,
+                      'reused_checkers': 0, 'partial_checkers': 0, 'full_checkers': 0}
+
+    def run(self, scheduler, enabled: List[str], common_kwargs: Dict,
+            on_complete: Optional[Callable[[str, int, int], None]] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None) -> Optional[List[Tuple[str, List[Any]]]]:
+        """
+        Same contract as CheckerScheduler.run(): (checker_name, issues) in
+        `enabled` order, or None if cancelled.
+        """
+        local = [n for n in enabled if n in self.checkers and is_paragraph_local(self.checkers[n])]
+        local_set = set(local)
+        full = [n for n in enabled if n not in local_set]
+
+        try:
+            cached = self.cache.load(self.hashes.values())
+        except sqlite3.Error as e:
+            _log(f" Paragraph cache unavailable ({e}), running a full review", level='warning')
+            cached = {}
+            local, full = [], list(enabled)
+            local_set = set()
+
+        keys = {n: checker_cache_key(n, self.checkers[n]) for n in local}
+        # Checkers grouped by the paragraphs they still have to check
+        groups: Dict[Tuple[int, ...], List[str]] = defaultdict(list)
+        for name in local:
+            missing = tuple(idx for idx, _ in self.paragraphs
+                            if keys[name] not in cached.get(self.hashes[idx], {}))
+            groups[missing].append(name)
+
+        total = len(enabled)
+        completed = 0
+
+        def _done(name, *_):
+            nonlocal completed
+            completed += 1
+            if on_complete:
+                on_complete(name, completed, total)
+
+        results: Dict[str, List[Any]] = {}
+        fresh: Dict[str, Tuple[Tuple[int, ...], List[Any]]] = {}
+
+        for missing, names in groups.items():
+            if not missing:
+                self.stats['reused_checkers'] += len(names)
+                for name in names:
+                    fresh[name] = (missing, [])
+                    _done(name)
+                continue
+            self.stats['partial_checkers'] += len(names)
+            wanted = set(missing)
+            kwargs = dict(common_kwargs)
+            kwargs['paragraphs'] = [p for p in self.paragraphs if p[0] in wanted]
+            self.stats['rechecked_paragraphs'] = max(self.stats['rechecked_paragraphs'], len(missing))
+            group_results = scheduler.run(names, kwargs, on_complete=_done, is_cancelled=is_cancelled)
+            if group_results is None:
+                return None
+            for name, issues in group_results:
+                fresh[name] = (missing, issues)
+
+        if full:
+            self.stats['full_checkers'] = len(full)
+            full_results = scheduler.run(full, common_kwargs, on_complete=_done, is_cancelled=is_cancelled)
+            if full_results is None:
+                return None
+            results.update(full_results)
+
+        updates: Dict[str, Dict[str, List[Dict]]] = {}
+        for name, (missing, issues) in fresh.items():
+            results[name] = self._merge(name, keys[name], missing, issues, cached, updates)
+        try:
+            self.cache.store(updates)
+        except sqlite3.Error as e:
+            _log(f" Could not update paragraph cache: {e}", level='warning')
+
+        _log(f" Incremental review: {self.stats}")
+        return [(name, results.get(name, [])) for name in enabled]
+
+    def _merge(self, name: str, key: str, missing: Tuple[int, ...], issues: List[Any],
+               cached: Dict[str, Dict[str, List[Dict]]],
+               updates: Dict[str, Dict[str, List[Dict]]]) -> List[Any]:
+        """Cached issues for reused paragraphs + fresh issues, in paragraph order."""
+        wanted = set(missing)
+        by_paragraph: Dict[int, List[Any]] = defaultdict(list)
+        stray = []
+        for issue in issues:
+            idx = issue.get('paragraph_index') if isinstance(issue, dict) else None
+            if idx in wanted:
+                by_paragraph[idx].append(issue)
+            else:
+                stray.append(issue)
+        # Only cache results that are attributable to single paragraphs
+        cacheable = not stray
+
+        merged: List[Any] = []
+        for idx, _ in self.paragraphs:
+            para_hash = self.hashes[idx]
+            if idx in wanted:
+                merged.extend(by_paragraph.get(idx, []))
+                if cacheable:
+                    entry = updates.setdefault(para_hash, dict(cached.get(para_hash, {})))
+                    entry.setdefault(key, [_strip_index(i) for i in by_paragraph.get(idx, [])])
+            else:
+                merged.extend(_with_index(i, idx) for i in cached[para_hash][key])
+        if stray:
+            _log(f" {name}: {len(stray)} issues without a checked paragraph index, not cached")
+        return merged + stray
@@ -16,17 +16,54 @@ Features:
 - Thread-safe job storage
 
 Created for Thread 8: Job/Progress System
+
+v6.3.3: Progress ticks from worker threads no longer contend on one global
+lock with every other job and with UI polling:
+- Each Job carries its own lock/condition; the manager lock only guards the
+  jobs dict (create, cleanup, listing). get_job() is a plain dict lookup.
+- Progress updates mutate the job in place and wake waiters at most once
+  per PROGRESS_NOTIFY_INTERVAL (phase changes and terminal states wake them
+  immediately). wait_for_update() lets streaming endpoints block until a
+  job changes instead of polling.
+- Optional SQLite journal (JobManager(journal_path=...), enabled for the
+  global manager): unfinished jobs and their checkpoints survive a restart,
+  come back as INTERRUPTED, and can be resumed through a handler registered
+  per job type (register_resume_handler / resume_job). Only job types with
+  a resume handler are journaled; INTERRUPTED jobs are evicted like
+  finished ones.
 """
 
+import json
 import uuid
 import time
 import threading
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List
+from pathlib import Path
+from typing import Callable, Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
-__version__ = "1.0.0"
+from sqlite_pool import get_pool
+
+__version__ = "1.1.0"
+
+PROGRESS_NOTIFY_INTERVAL = 0.25  # seconds between waiter wake-ups for progress ticks
+DEFAULT_JOURNAL_PATH = Path(__file__).parent / 'data' / 'job_journal.db'
+_CONFIG_FILE = Path(__file__).parent / 'config.json'
+
+try:
+    from config_logging import get_logger
+    _logger = get_logger('job_manager')
+except ImportError:
+    _logger = None
+
+
+def _log(message: str, level: str = 'debug', **kwargs):
+    """Internal logging helper."""
+    if _logger:
+        getattr(_logger, level)(message, **kwargs)
+    elif level in ('warning', 'error', 'critical'):
+        print(f"[{level.upper()}] {message}")
 
 
 class JobPhase(Enum):
@@ -50,6 +87,12 @@ class JobStatus(Enum):
     COMPLETE = "complete"
     FAILED = "failed"
     CANCELLED = "cancelled"
+    INTERRUPTED = "interrupted"  # v6.3.3: unfinished when the server stopped (journal)
+
+
+TERMINAL_STATUSES = (JobStatus.COMPLETE, JobStatus.FAILED, JobStatus.CANCELLED)
+# v6.3.3: Statuses _cleanup_old_jobs may evict once completed_at is past the TTL
+EVICTABLE_STATUSES = TERMINAL_STATUSES + (JobStatus.INTERRUPTED,)
 
 
 # Phase weights for progress calculation (total = 100)
@@ -115,7 +158,12 @@ class Job:
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    checkpoint: Dict[str, Any] = field(default_factory=dict)  # v6.3.3: resume state
+    version: int = 0  # v6.3.3: bumped on every change
     _cancelled: bool = False
+    # v6.3.3: per-job lock; waiters in JobManager.wait_for_update() block on it
+    _cond: threading.Condition = field(default_factory=threading.Condition, repr=False, compare=False)
+    _last_notify: float = field(default=0.0, repr=False, compare=False)
     
     @property
     def elapsed_seconds(self) -> float:
@@ -176,6 +224,10 @@ class Job:
     
     def to_dict(self, include_result: bool = False) -> Dict[str, Any]:
         """Convert to dictionary for API response."""
+        with self._cond:
+            return self._to_dict(include_result)
+
+    def _to_dict(self, include_result: bool) -> Dict[str, Any]:
         data = {
             "job_id": self.job_id,
             "job_type": self.job_type,
@@ -187,13 +239,88 @@ class Job:
             "elapsed": self.elapsed_formatted,
             "eta": self.eta_formatted,
             "error": self.error,
-            "metadata": self.metadata
+            "metadata": self.metadata,
+            "version": self.version
         }
         if include_result and self.result is not None:
             data["result"] = self.result
         return data
 
 
+class JobJournal:
+    """
+    v6.3.3: SQLite journal of unfinished jobs.
+
+    Holds one row per job that has not reached a terminal state: type,
+    status, phase, metadata and checkpoint (JSON). Rows are deleted when the
+    job completes, fails or is cancelled, so after a restart the journal
+    contains exactly the jobs that were queued or still running. Results are
+    never journaled.
+    """
+
+    def __init__(self, db_path=DEFAULT_JOURNAL_PATH):
+        self.db_path = str(db_path)
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._transaction() as (conn, cursor):
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS job_journal (
+                    job_id TEXT PRIMARY KEY,
+                    job_type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    phase TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    started_at REAL,
+                    metadata TEXT NOT NULL,
+                    checkpoint TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            ''')
+
+    def _transaction(self):
+        return get_pool(self.db_path).transaction()
+
+    def save(self, row: Dict[str, Any]):
+        """Insert or replace one job row (see JobManager._journal_row)."""
+        with self._transaction() as (conn, cursor):
+            cursor.execute('''
+                INSERT OR REPLACE INTO job_journal
+                    (job_id, job_type, status, phase, created_at, started_at,
+                     metadata, checkpoint, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (row['job_id'], row['job_type'], row['status'], row['phase'],
+                  row['created_at'], row['started_at'],
+                  json.dumps(row['metadata'], default=str),
+                  json.dumps(row['checkpoint'], default=str), time.time()))
+
+    def delete(self, job_ids: List[str]):
+        if not job_ids:
+            return
+        with self._transaction() as (conn, cursor):
+            cursor.executemany('DELETE FROM job_journal WHERE job_id = ?',
+                               [(job_id,) for job_id in job_ids])
+
+    def load(self) -> List[Dict[str, Any]]:
+        """All journaled jobs, oldest first."""
+        with self._transaction() as (conn, cursor):
+            cursor.execute('''
+                SELECT job_id, job_type, status, phase, created_at, started_at,
+                       metadata, checkpoint
+                FROM job_journal ORDER BY created_at
+            ''')
+            rows = cursor.fetchall()
+        jobs = []
+        for job_id, job_type, status, phase, created_at, started_at, metadata, checkpoint in rows:
+            try:
+                jobs.append({
+                    'job_id': job_id, 'job_type': job_type, 'status': status,
+                    'phase': phase, 'created_at': created_at, 'started_at': started_at,
+                    'metadata': json.loads(metadata), 'checkpoint': json.loads(checkpoint),
+                })
+            except (TypeError, ValueError) as e:
+                _log(f" Skipping unreadable journal row {job_id}: {e}", level='warning')
+        return jobs
+
+
 class JobManager:
     """
     Thread-safe job manager for background operations.
@@ -208,20 +335,43 @@ class JobManager:
         manager.update_phase(job_id, JobPhase.EXTRACTING)
         manager.update_checker_progress(job_id, 'grammar', 5, 20)
         manager.complete_job(job_id, result={'issues': [...]})
+
+    v6.3.3 (restartable jobs):
+        manager = JobManager(journal_path='data/job_journal.db')
+        manager.register_resume_handler('batch_scan', restart_batch)
+        manager.checkpoint(job_id, {'completed': [...]})   # in the worker
+        ...
+        # after a restart, unfinished jobs are INTERRUPTED:
+        manager.resume_job(job_id)                         # calls restart_batch(job)
     """
     
-    def __init__(self, max_jobs: int = 100, job_ttl: float = 3600):
+    def __init__(self, max_jobs: int = 100, job_ttl: float = 3600,
+                 journal_path: Optional[str] = None,
+                 progress_interval: float = PROGRESS_NOTIFY_INTERVAL):
         """
         Initialize job manager.
         
         Args:
             max_jobs: Maximum jobs to keep in memory
             job_ttl: Time-to-live for completed jobs (seconds)
+            journal_path: SQLite journal for restart recovery (None = in-memory only)
+            progress_interval: Minimum seconds between waiter wake-ups for progress ticks
         """
         self._jobs: Dict[str, Job] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.RLock()  # guards self._jobs membership only
         self._max_jobs = max_jobs
         self._job_ttl = job_ttl
+        self._progress_interval = progress_interval
+        self._resume_handlers: Dict[str, Callable[[Job], Any]] = {}
+        self._journal: Optional[JobJournal] = None
+        self._journaled: set = set()  # job IDs that currently have a journal row
+        if journal_path:
+            try:
+                self._journal = JobJournal(journal_path)
+                self._restore_from_journal()
+            except Exception as e:
+                _log(f" Job journal unavailable ({journal_path}): {e}", level='warning')
+                self._journal = None
     
     def create_job(self, job_type: str, metadata: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -245,23 +395,25 @@ class JobManager:
                 metadata=metadata or {}
             )
             self._jobs[job_id] = job
-            return job_id
+        self._persist(job)
+        return job_id
     
     def get_job(self, job_id: str) -> Optional[Job]:
         """Get job by ID."""
-        with self._lock:
-            return self._jobs.get(job_id)
+        return self._jobs.get(job_id)
     
     def start_job(self, job_id: str) -> bool:
         """Mark job as started."""
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return False
+        job = self._jobs.get(job_id)
+        if not job:
+            return False
+        with job._cond:
             job.status = JobStatus.RUNNING
             job.started_at = time.time()
             job.progress.phase = JobPhase.QUEUED
-            return True
+            self._publish(job, force=True)
+        self._persist(job)
+        return True
     
     def update_phase(self, job_id: str, phase: JobPhase, log_message: Optional[str] = None) -> bool:
         """
@@ -272,11 +424,11 @@ class JobManager:
             phase: New phase
             log_message: Optional log message
         """
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return False
-            
+        job = self._jobs.get(job_id)
+        if not job:
+            return False
+        with job._cond:
+            changed = job.progress.phase != phase
             job.progress.phase = phase
             job.progress.phase_progress = 0.0
             job.progress.overall_progress = PHASE_PROGRESS_START.get(phase, 0)
@@ -284,7 +436,10 @@ class JobManager:
             if log_message:
                 job.progress.last_log = log_message
             
-            return True
+            self._publish(job, force=changed)
+        if changed:
+            self._persist(job)
+        return True
     
     def update_phase_progress(self, job_id: str, progress: float, log_message: Optional[str] = None) -> bool:
         """
@@ -295,26 +450,13 @@ class JobManager:
             progress: Progress within phase (0-100)
             log_message: Optional log message
         """
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return False
-            
-            job.progress.phase_progress = min(100, max(0, progress))
-            
-            # Calculate overall progress
-            phase = job.progress.phase
-            phase_start = PHASE_PROGRESS_START.get(phase, 0)
-            phase_weight = PHASE_WEIGHTS.get(phase, 0)
-            
-            # Add portion of current phase to overall
-            phase_contribution = (job.progress.phase_progress / 100) * phase_weight
-            job.progress.overall_progress = phase_start + phase_contribution
-            
-            if log_message:
-                job.progress.last_log = log_message
-            
-            return True
+        job = self._jobs.get(job_id)
+        if not job:
+            return False
+        with job._cond:
+            self._set_phase_progress(job, progress, log_message)
+            self._publish(job)
+        return True
     
     def update_checker_progress(self, job_id: str, checker_name: str, 
                                  completed: int, total: int) -> bool:
@@ -327,25 +469,50 @@ class JobManager:
             completed: Number of checkers completed
             total: Total number of checkers
         """
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return False
-            
+        job = self._jobs.get(job_id)
+        if not job:
+            return False
+        with job._cond:
             job.progress.current_checker = checker_name
             job.progress.checkers_completed = completed
             job.progress.checkers_total = total
             
             # Calculate phase progress based on checker completion
             if total > 0:
-                phase_progress = (completed / total) * 100
-                return self.update_phase_progress(
-                    job_id, 
-                    phase_progress,
-                    f"Running {checker_name}..."
-                )
+                self._set_phase_progress(job, (completed / total) * 100, f"Running {checker_name}...")
             
-            return True
+            self._publish(job)
+        return True
+
+    def checkpoint(self, job_id: str, data: Dict[str, Any]) -> bool:
+        """
+        v6.3.3: Merge data into the job's checkpoint and journal it.
+
+        The checkpoint is what a resume handler gets back after a restart
+        (e.g. the files a batch scan already finished).
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            return False
+        with job._cond:
+            job.checkpoint.update(data)
+            self._publish(job)
+        self._persist(job)
+        return True
+
+    def touch(self, job_id: str) -> bool:
+        """
+        v6.3.3: Wake wait_for_update() callers for a change kept outside the job.
+
+        Used when a job mirrors richer state held elsewhere (the batch scan's
+        per-file phases), so streams of that state need no polling loop.
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            return False
+        with job._cond:
+            self._publish(job)
+        return True
     
     def complete_job(self, job_id: str, result: Optional[Dict[str, Any]] = None) -> bool:
         """
@@ -355,11 +522,10 @@ class JobManager:
             job_id: Job ID
             result: Job result data
         """
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return False
-            
+        job = self._jobs.get(job_id)
+        if not job:
+            return False
+        with job._cond:
             job.status = JobStatus.COMPLETE
             job.progress.phase = JobPhase.COMPLETE
             job.progress.overall_progress = 100
@@ -367,8 +533,9 @@ class JobManager:
             job.completed_at = time.time()
             job.result = result
             job.progress.last_log = "Complete"
-            
-            return True
+            self._publish(job, force=True)
+        self._persist(job)
+        return True
     
     def fail_job(self, job_id: str, error: str) -> bool:
         """
@@ -378,18 +545,18 @@ class JobManager:
             job_id: Job ID
             error: Error message
         """
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return False
-            
+        job = self._jobs.get(job_id)
+        if not job:
+            return False
+        with job._cond:
             job.status = JobStatus.FAILED
             job.progress.phase = JobPhase.FAILED
             job.completed_at = time.time()
             job.error = error
             job.progress.last_log = f"Error: {error}"
-            
-            return True
+            self._publish(job, force=True)
+        self._persist(job)
+        return True
     
     def cancel_job(self, job_id: str) -> bool:
         """
@@ -398,16 +565,180 @@ class JobManager:
         Args:
             job_id: Job ID
         """
-        with self._lock:
-            job = self._jobs.get(job_id)
-            if not job:
-                return False
-            
-            if job.status not in (JobStatus.PENDING, JobStatus.RUNNING):
+        job = self._jobs.get(job_id)
+        if not job:
+            return False
+        with job._cond:
+            if job.status not in (JobStatus.PENDING, JobStatus.RUNNING, JobStatus.INTERRUPTED):
                 return False
-            
             job.cancel()
-            return True
+            self._publish(job, force=True)
+        self._persist(job)
+        return True
+
+    def wait_for_update(self, job_id: str, since_version: int = -1,
+                        timeout: float = 15.0) -> Optional[Tuple[int, Dict[str, Any]]]:
+        """
+        v6.3.3: Block until the job's version exceeds since_version (or timeout).
+
+        Returns (version, job dict) — unchanged if the wait timed out — or
+        None if the job does not exist. Used by the streaming progress
+        endpoints instead of client-side polling.
+        """
+        job = self._jobs.get(job_id)
+        if not job:
+            return None
+        deadline = time.monotonic() + timeout
+        with job._cond:
+            while job.version <= since_version and job.status not in TERMINAL_STATUSES:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                # Coalesced ticks may not notify; re-check at the notify interval
+                job._cond.wait(min(remaining, max(self._progress_interval, 0.01)))
+            return job.version, job._to_dict(include_result=False)
+
+    # -----------------------------------------------------------------
+    # v6.3.3: Restart recovery
+    # -----------------------------------------------------------------
+
+    def register_resume_handler(self, job_type: str, handler: Callable[[Job], Any]):
+        """
+        Register handler(job) that restarts an INTERRUPTED job of job_type.
+
+        Only job types with a handler are journaled, so register before
+        creating the jobs that should survive a restart.
+        """
+        self._resume_handlers[job_type] = handler
+
+    def is_resumable(self, job_id: str) -> bool:
+        job = self._jobs.get(job_id)
+        return bool(job and job.status == JobStatus.INTERRUPTED
+                    and job.job_type in self._resume_handlers)
+
+    def resume_job(self, job_id: str) -> bool:
+        """
+        Restart an INTERRUPTED job through its type's resume handler.
+
+        The job goes back to PENDING with its metadata and checkpoint intact;
+        the handler is responsible for start_job() and the actual work.
+        """
+        job = self._jobs.get(job_id)
+        if not job or not self.is_resumable(job_id):
+            return False
+        handler = self._resume_handlers[job.job_type]
+        with job._cond:
+            if job.status != JobStatus.INTERRUPTED:
+                return False
+            job.status = JobStatus.PENDING
+            job.completed_at = None
+            job.error = None
+            job.metadata['resume_count'] = job.metadata.get('resume_count', 0) + 1
+            job.progress.last_log = "Resuming after restart"
+            self._publish(job, force=True)
+        self._persist(job)
+        try:
+            handler(job)
+        except Exception as e:
+            _log(f" Resume of job {job_id} failed: {e}", level='error')
+            self.fail_job(job_id, f"Resume failed: {e}")
+            return False
+        return True
+
+    def resume_interrupted(self, job_type: Optional[str] = None) -> List[str]:
+        """Resume every INTERRUPTED job (of job_type) that has a handler; returns their IDs."""
+        with self._lock:
+            candidates = [j.job_id for j in self._jobs.values()
+                          if j.status == JobStatus.INTERRUPTED
+                          and (job_type is None or j.job_type == job_type)]
+        return [job_id for job_id in candidates if self.resume_job(job_id)]
+
+    def _restore_from_journal(self):
+        """
+        Load journaled jobs; anything that was queued or running is now INTERRUPTED.
+
+        completed_at is set to the restore time so unresumed jobs expire
+        after job_ttl (see _cleanup_old_jobs), taking their journal rows with them.
+        """
+        restored_at = time.time()
+        for row in self._journal.load():
+            try:
+                phase = JobPhase(row['phase'])
+            except ValueError:
+                phase = JobPhase.QUEUED
+            job = Job(
+                job_id=row['job_id'],
+                job_type=row['job_type'],
+                status=JobStatus.INTERRUPTED,
+                created_at=row['created_at'],
+                started_at=row['started_at'],
+                completed_at=restored_at,
+                metadata=row['metadata'],
+                checkpoint=row['checkpoint'],
+            )
+            job.progress.phase = phase
+            job.progress.overall_progress = PHASE_PROGRESS_START.get(phase, 0)
+            job.progress.last_log = "Interrupted by server restart"
+            self._jobs[job.job_id] = job
+            self._journaled.add(job.job_id)
+        if self._jobs:
+            _log(f" Restored {len(self._jobs)} interrupted job(s) from journal", level='info')
+
+    # -----------------------------------------------------------------
+    # Internal
+    # -----------------------------------------------------------------
+
+    def _set_phase_progress(self, job: Job, progress: float, log_message: Optional[str]):
+        # Caller holds job._cond
+        job.progress.phase_progress = min(100, max(0, progress))
+        
+        # Calculate overall progress
+        phase = job.progress.phase
+        phase_start = PHASE_PROGRESS_START.get(phase, 0)
+        phase_weight = PHASE_WEIGHTS.get(phase, 0)
+        
+        # Add portion of current phase to overall
+        phase_contribution = (job.progress.phase_progress / 100) * phase_weight
+        job.progress.overall_progress = phase_start + phase_contribution
+        
+        if log_message:
+            job.progress.last_log = log_message
+
+    def _publish(self, job: Job, force: bool = False):
+        """Bump the job version; wake waiters now, or later if this is a coalesced tick."""
+        # Caller holds job._cond
+        job.version += 1
+        now = time.monotonic()
+        if force or now - job._last_notify >= self._progress_interval:
+            job._last_notify = now
+            job._cond.notify_all()
+
+    def _persist(self, job: Job):
+        """Write (or, for finished jobs, drop) the job's journal row. Never raises."""
+        # Only resumable job types are journaled; other types only need their
+        # row removed if one was restored from an older journal.
+        if self._journal is None:
+            return
+        resumable = job.job_type in self._resume_handlers
+        if not resumable and job.job_id not in self._journaled:
+            return
+        try:
+            with job._cond:
+                finished = job.status in TERMINAL_STATUSES or not resumable
+                row = None if finished else {
+                    'job_id': job.job_id, 'job_type': job.job_type,
+                    'status': job.status.value, 'phase': job.progress.phase.value,
+                    'created_at': job.created_at, 'started_at': job.started_at,
+                    'metadata': dict(job.metadata), 'checkpoint': dict(job.checkpoint),
+                }
+            if row is None:
+                self._journal.delete([job.job_id])
+                self._journaled.discard(job.job_id)
+            else:
+                self._journal.save(row)
+                self._journaled.add(job.job_id)
+        except Exception as e:
+            _log(f" Job journal write failed for {job.job_id}: {e}", level='warning')
     
     def list_jobs(self, status: Optional[JobStatus] = None, 
                    job_type: Optional[str] = None,
@@ -425,56 +756,91 @@ class JobManager:
         """
         with self._lock:
             jobs = list(self._jobs.values())
-            
-            # Filter
-            if status:
-                jobs = [j for j in jobs if j.status == status]
-            if job_type:
-                jobs = [j for j in jobs if j.job_type == job_type]
-            
-            # Sort by created_at descending
-            jobs.sort(key=lambda j: j.created_at, reverse=True)
-            
-            # Limit
-            jobs = jobs[:limit]
-            
-            return [j.to_dict() for j in jobs]
+        
+        # Filter
+        if status:
+            jobs = [j for j in jobs if j.status == status]
+        if job_type:
+            jobs = [j for j in jobs if j.job_type == job_type]
+        
+        # Sort by created_at descending
+        jobs.sort(key=lambda j: j.created_at, reverse=True)
+        
+        # Limit
+        jobs = jobs[:limit]
+        
+        return [j.to_dict() for j in jobs]
     
     def _cleanup_old_jobs(self):
-        """Remove old completed jobs."""
+        """Remove old completed jobs (and, v6.3.3, unresumed INTERRUPTED ones)."""
         with self._lock:
             now = time.time()
             to_remove = []
+            interrupted = []
             
             for job_id, job in self._jobs.items():
-                # Remove completed/failed jobs older than TTL
-                if job.status in (JobStatus.COMPLETE, JobStatus.FAILED, JobStatus.CANCELLED):
+                # Remove completed/failed/interrupted jobs older than TTL
+                if job.status in EVICTABLE_STATUSES:
                     if job.completed_at and (now - job.completed_at) > self._job_ttl:
                         to_remove.append(job_id)
             
             for job_id in to_remove:
+                if self._jobs[job_id].status == JobStatus.INTERRUPTED:
+                    interrupted.append(job_id)
                 del self._jobs[job_id]
             
-            # If still over capacity, remove oldest completed jobs
+            # If still over capacity, remove oldest completed/interrupted jobs
             if len(self._jobs) >= self._max_jobs:
                 completed = [(jid, j) for jid, j in self._jobs.items() 
-                            if j.status in (JobStatus.COMPLETE, JobStatus.FAILED)]
+                            if j.status in (JobStatus.COMPLETE, JobStatus.FAILED, JobStatus.INTERRUPTED)]
                 completed.sort(key=lambda x: x[1].completed_at or 0)
                 
                 while len(self._jobs) >= self._max_jobs and completed:
-                    jid, _ = completed.pop(0)
+                    jid, j = completed.pop(0)
+                    if j.status == JobStatus.INTERRUPTED:
+                        interrupted.append(jid)
                     del self._jobs[jid]
 
+        # Evicted INTERRUPTED jobs must not come back on the next restart
+        if interrupted and self._journal is not None:
+            try:
+                self._journal.delete(interrupted)
+                self._journaled.difference_update(interrupted)
+            except Exception as e:
+                _log(f" Job journal cleanup failed: {e}", level='warning')
+
+
+def _journal_enabled() -> bool:
+    """config.json performance_settings.job_journal (default on)."""
+    try:
+        if _CONFIG_FILE.exists():
+            with open(_CONFIG_FILE, 'r', encoding='utf-8') as f:
+                perf = json.load(f).get('performance_settings', {}) or {}
+            return bool(perf.get('job_journal', True))
+    except Exception as e:
+        _log(f" Could not read performance settings: {e}")
+    return True
+
 
 # Global job manager instance
 _job_manager: Optional[JobManager] = None
+_job_manager_lock = threading.Lock()
 
 
 def get_job_manager() -> JobManager:
-    """Get or create the global job manager instance."""
+    """
+    Get or create the global job manager instance.
+
+    v6.3.3: The global manager journals unfinished jobs to
+    data/job_journal.db unless performance_settings.job_journal is false.
+    """
     global _job_manager
     if _job_manager is None:
-        _job_manager = JobManager()
+        with _job_manager_lock:
+            if _job_manager is None:
+                _job_manager = JobManager(
+                    journal_path=str(DEFAULT_JOURNAL_PATH) if _journal_enabled() else None
+                )
     return _job_manager
 
 
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+AEGIS Learned Rules
+===================
+Compiled, in-memory lookup structures for the learner pattern files.
+
+v6.3.3: The learners (review_learner, statement_learner, pattern_learner,
+hv_learner) answered every lookup by walking their JSON lists —
+get_severity_override ran once per issue in review_document, and the
+statement lookups called _context_matches for every learned entry on every
+statement. LearnedRules loads a learner's patterns file once, hands it to
+the learner's compile function (which builds dicts, sets and KeywordRules)
+and serves that compiled object until the file changes on disk. The
+file's (mtime, size, inode) signature is checked on access; a changed file
+is reloaded and the new snapshot replaces the old one in a single
+assignment, so concurrent readers see either the old rules or the new
+ones, never a half-built index.
+
+Compiled lookups keep the old first-match-in-file-order results: every
+index records the position of the entry it came from.
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from phrase_matcher import PhraseMatcher
+
+__version__ = "1.0.0"
+
+
+class _Snapshot(NamedTuple):
+    signature: Optional[Tuple[int, int, int]]
+    patterns: dict
+    compiled: Any
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """(mtime_ns, size, inode) of `path`, or None when it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class LearnedRules:
+    """
+    Compiled view of one learner's patterns file.
+
+    Args:
+        locate: returns the patterns file path (called on every refresh
+            check, so a learner's PATTERNS_FILE can be repointed)
+        load: reads the file and returns the patterns dict (the learner's
+            load_patterns, which falls back to an empty structure)
+        compile_fn: builds the learner's lookup object from the patterns dict
+    """
+
+    def __init__(self, locate: Callable[[], str], load: Callable[[], dict],
+                 compile_fn: Callable[[dict], Any]):
+        self._locate = locate
+        self._load = load
+        self._compile = compile_fn
+        self._snapshot: Optional[_Snapshot] = None
+        self._lock = threading.Lock()
+
+    def _current(self) -> _Snapshot:
+        snapshot = self._snapshot
+        signature = file_signature(self._locate())
+        if snapshot is not None and snapshot.signature == signature:
+            return snapshot
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and snapshot.signature == signature:
+                return snapshot
+            patterns = self._load()
+            snapshot = _Snapshot(signature, patterns, self._compile(patterns))
+            self._snapshot = snapshot
+        return snapshot
+
+    def get(self) -> Any:
+        """The compiled rules, recompiled first if the file changed."""
+        return self._current().compiled
+
+    def patterns(self) -> dict:
+        """The raw patterns dict the current rules were compiled from."""
+        return self._current().patterns
+
+    def invalidate(self):
+        """Recompile on next access even if the file signature is unchanged."""
+        self._snapshot = None
+
+
+class KeywordRules:
+    """
+    Keyword-indexed form of the learners' context rules.
+
+    A rule matches a text when at least 60% of its space-separated keywords
+    (and at least one) occur in the lowercased text as substrings — the
+    _context_matches test. All keywords are compiled into one PhraseMatcher,
+    so a lookup is a single pass over the text plus a check of the rules
+    that share a keyword with it, instead of a scan per rule.
+
+    Args:
+        rules: (context, value) pairs in file order
+    """
+
+    def __init__(self, rules: Iterable[Tuple[str, Any]]):
+        self._rules: List[Tuple[Tuple[str, ...], float, Any]] = []
+        phrases = []
+        for context, value in rules:
+            words = tuple((context or '').split())
+            if not words:
+                continue
+            rule_id = len(self._rules)
+            self._rules.append((words, max(1, len(words) * 0.6), value))
+            # Keywords with capitals can never occur in lowercased text
+            phrases.extend((word, rule_id) for word in set(words) if word == word.lower())
+        self._matcher = PhraseMatcher(phrases, whole_words=False)
+
+    def __len__(self) -> int:
+        return len(self._rules)
+
+    def first_match(self, text: str, default: Any = None) -> Any:
+        """Value of the earliest rule matching `text`, else `default`."""
+        found = self.first_match_index(text)
+        return default if found is None else self._rules[found][2]
+
+    def first_match_index(self, text: str) -> Optional[int]:
+        """Position (among the compiled rules) of the earliest matching rule."""
+        if not text or not self._matcher:
+            return None
+        present = set()
+        candidates = set()
+        for match in self._matcher.finditer(text):
+            if match.phrase not in present:
+                present.add(match.phrase)
+                candidates.update(match.values)
+        for rule_id in sorted(candidates):
+            words, needed, _ = self._rules[rule_id]
+            if sum(1 for word in words if word in present) >= needed:
+                return rule_id
+        return None
+
+
+def first_by_key(entries: Iterable[Tuple[Any, Any]]) -> Dict[Any, Tuple[int, Any]]:
+    """{key: (position, value)} keeping the first entry per key."""
+    index: Dict[Any, Tuple[int, Any]] = {}
+    for position, (key, value) in enumerate(entries):
+        if key not in index:
+            index[key] = (position, value)
+    return index
@@ -36,6 +36,8 @@ except ImportError:
         except Exception:
             return None
 
+from nlp_doc_store import parse as parse_doc
+
 __version__ = "1.0.0"
 
 # Negation cues for fallback regex
@@ -208,7 +210,7 @@ class NegationDetectionChecker(BaseChecker):
         """Use spaCy dependency tree to analyze negation scope."""
         issues = []
         try:
-            doc = self.nlp(text[:5000])  # Limit processing length
+            doc = parse_doc(self.nlp, text[:5000], pipes=('negex',))  # Limit processing length
 
             for token in doc:
                 if token.dep_ == 'neg':
@@ -21,6 +21,14 @@ from dataclasses import dataclass, field
 
 from ..base import NLPIntegrationBase
 
+# v6.3.3: Process-wide model and per-review parse store shared with the root checkers
+try:
+    from nlp_utils import get_spacy_model
+except ImportError:
+    get_spacy_model = None
+
+from nlp_doc_store import parse as parse_doc
+
 
 @dataclass
 class SpacyAnalysis:
@@ -115,7 +123,7 @@ class SpacyAnalyzer(NLPIntegrationBase):
 
         for model in models_to_try:
             try:
-                self._nlp = self._spacy.load(model)
+                self._nlp = get_spacy_model(model) if get_spacy_model else self._spacy.load(model)
                 self.model_name = model
                 self._available = True
                 return
@@ -160,7 +168,7 @@ class SpacyAnalyzer(NLPIntegrationBase):
         if not self.is_available:
             return SpacyAnalysis()
 
-        doc = self._nlp(text)
+        doc = parse_doc(self._nlp, text)
 
         return SpacyAnalysis(
             sentences=[sent.text for sent in doc.sents],
@@ -230,7 +238,7 @@ class SpacyAnalyzer(NLPIntegrationBase):
         if not self.is_available:
             return []
 
-        doc = self._nlp(text)
+        doc = parse_doc(self._nlp, text)
         pairs = []
 
         for sent_idx, sent in enumerate(doc.sents):
@@ -314,7 +322,7 @@ class SpacyAnalyzer(NLPIntegrationBase):
         if not self.is_available:
             return []
 
-        doc = self._nlp(text)
+        doc = parse_doc(self._nlp, text)
         modifiers = []
 
         for sent_idx, sent in enumerate(doc.sents):
@@ -410,7 +418,7 @@ class SpacyAnalyzer(NLPIntegrationBase):
         if not self.is_available:
             return []
 
-        doc = self._nlp(text)
+        doc = parse_doc(self._nlp, text)
         results = []
 
         for sent_idx, sent in enumerate(doc.sents):
@@ -488,7 +496,7 @@ class SpacyAnalyzer(NLPIntegrationBase):
         if not self.is_available:
             return {}
 
-        doc = self._nlp(text)
+        doc = parse_doc(self._nlp, text)
         entities_by_type = {}
 
         for ent in doc.ents:
@@ -8,6 +8,7 @@ Features:
 - Word frequency ranking for suggestions
 - Compound word segmentation
 - Custom dictionary support
+- Index pickled to dictionaries/.index/ after the first build (v6.3.3)
 
 Requires: pip install symspellpy
 """
@@ -83,26 +84,11 @@ class SymSpellChecker(NLPIntegrationBase):
                 prefix_length=self.prefix_length
             )
 
-            # Load main dictionary
-            import pkg_resources
-            dict_path = pkg_resources.resource_filename(
-                "symspellpy", self.FREQUENCY_DICT
-            )
-            self._sym_spell.load_dictionary(
-                dict_path,
-                term_index=0,
-                count_index=1
-            )
-
-            # Load bigram dictionary for compound word handling
-            bigram_path = pkg_resources.resource_filename(
-                "symspellpy", self.BIGRAM_DICT
-            )
-            self._sym_spell.load_bigram_dictionary(
-                bigram_path,
-                term_index=0,
-                count_index=2
-            )
+            # v6.3.3: Reuse the pickled index from dictionaries/.index/ when
+            # present; building it from the frequency files takes seconds.
+            if not self._load_cached_index():
+                self._build_index()
+                self._save_cached_index()
 
             # Load custom dictionary if provided
             if self.custom_dictionary and Path(self.custom_dictionary).exists():
@@ -118,6 +104,65 @@ class SymSpellChecker(NLPIntegrationBase):
             self._error = f"Failed to load dictionaries: {e}"
             self._available = False
 
+    def _build_index(self):
+        """Build the SymSpell index from the bundled frequency dictionaries."""
+        import pkg_resources
+
+        # Load main dictionary
+        dict_path = pkg_resources.resource_filename(
+            "symspellpy", self.FREQUENCY_DICT
+        )
+        self._sym_spell.load_dictionary(
+            dict_path,
+            term_index=0,
+            count_index=1
+        )
+
+        # Load bigram dictionary for compound word handling
+        bigram_path = pkg_resources.resource_filename(
+            "symspellpy", self.BIGRAM_DICT
+        )
+        self._sym_spell.load_bigram_dictionary(
+            bigram_path,
+            term_index=0,
+            count_index=2
+        )
+
+    def _cached_index_path(self) -> Path:
+        """Pickle location for this edit distance / prefix length combination."""
+        try:
+            from suggestion_index import INDEX_DIR
+        except ImportError:
+            INDEX_DIR = Path(__file__).resolve().parents[2] / 'dictionaries' / '.index'
+        try:
+            import symspellpy
+            lib_version = getattr(symspellpy, '__version__', 'unknown')
+        except ImportError:
+            lib_version = 'unknown'
+        return INDEX_DIR / (f"symspell_{lib_version}_d{self.max_edit_distance}"
+                            f"_p{self.prefix_length}.pickle")
+
+    def _load_cached_index(self) -> bool:
+        """Load a previously saved index; False if missing or unreadable."""
+        path = self._cached_index_path()
+        if not path.exists() or not hasattr(self._sym_spell, 'load_pickle'):
+            return False
+        try:
+            return bool(self._sym_spell.load_pickle(str(path)))
+        except Exception:
+            return False
+
+    def _save_cached_index(self):
+        """Persist the freshly built index (best effort)."""
+        if not hasattr(self._sym_spell, 'save_pickle'):
+            return
+        path = self._cached_index_path()
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._sym_spell.save_pickle(str(path))
+        except Exception:
+            pass  # Cache is an optimization only
+
     def _load_custom_dictionary(self):
         """Load custom technical terms dictionary."""
         try:
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+AEGIS Shared spaCy Parse Store
+==============================
+One spaCy model per process and one parse per paragraph per review.
+
+v6.3.3: Before this module every spaCy-based checker (negation, subjectivity,
+terminology consistency, text metrics, SRL, prose linter, fragments, passive
+voice, nlp/spacy analyzer...) ran `self.nlp(text)` over the same paragraphs
+independently, and because add-on components (negex, spacytextblob,
+spacy_wordnet, textdescriptives) are registered on the shared model, every one
+of those calls also ran every other checker's add-on.
+
+How it works:
+- get_shared_nlp() returns the process-wide model (via nlp_utils.get_spacy_model).
+- AEGISEngine.review_document builds a ParsedDocStore over filtered_paragraphs
+  and activates it for the current thread while checkers run.
+- Checkers call parse(self.nlp, text, pipes=(...)). When a store is active for
+  the same model, the paragraph is served from the store: the core pipeline
+  runs once (batched with nlp.pipe over all paragraphs on first use) and only
+  the add-on components the caller asked for are applied, once per Doc.
+- With no active store (unit tests, standalone use, a different model) parse()
+  simply calls nlp(text), so checker behaviour is unchanged.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+__version__ = "1.0.0"
+
+DEFAULT_MODEL = 'en_core_web_sm'
+DEFAULT_BATCH_SIZE = 64
+
+# Components shipped inside the standard spaCy pipelines. Anything else on the
+# shared model (negex, spacytextblob, spacy_wordnet, textdescriptives/*,
+# coreferee...) is an add-on that consumers request explicitly.
+CORE_PIPES = frozenset({
+    'tok2vec', 'transformer', 'tagger', 'morphologizer', 'parser',
+    'attribute_ruler', 'lemmatizer', 'trainable_lemmatizer', 'ner',
+    'senter', 'sentencizer',
+})
+
+try:
+    from config_logging import get_logger
+    _logger = get_logger('nlp_doc_store')
+except ImportError:
+    _logger = None
+
+
+def _log(message: str, level: str = 'debug', **kwargs):
+    """Internal logging helper."""
+    if _logger:
+        getattr(_logger, level)(message, **kwargs)
+    elif level in ('warning', 'error', 'critical'):
+        print(f"[{level.upper()}] {message}")
+
+
+def get_shared_nlp(model_name: str = DEFAULT_MODEL):
+    """Return the process-wide spaCy model, or None if spaCy/model is unavailable."""
+    try:
+        from nlp_utils import get_spacy_model
+        return get_spacy_model(model_name)
+    except Exception as e:
+        _log(f" Shared spaCy model '{model_name}' unavailable: {e}")
+        return None
+
+
+def addon_pipes(nlp) -> List[str]:
+    """Names of non-core components currently registered on `nlp`."""
+    return [name for name in getattr(nlp, 'pipe_names', []) if name not in CORE_PIPES]
+
+
+class ParsedDocStore:
+    """
+    Document-scoped store of parsed spaCy Docs, keyed by paragraph text.
+
+    Docs are produced with add-on components disabled; get(text, pipes=...)
+    applies requested add-ons lazily and remembers which ones already ran.
+    """
+
+    def __init__(self, nlp, paragraphs: Sequence[Tuple[int, str]] = (),
+                 batch_size: int = DEFAULT_BATCH_SIZE):
+        self.nlp = nlp
+        self.batch_size = batch_size
+        self._pending: List[str] = [text for _, text in paragraphs if text and text.strip()]
+        self._docs: Dict[str, Any] = {}
+        self._applied: Dict[int, set] = {}
+        self._lock = threading.RLock()
+        self.stats = {'parsed': 0, 'hits': 0, 'misses': 0, 'addons_applied': 0}
+
+    @classmethod
+    def for_review(cls, paragraphs: Sequence[Tuple[int, str]],
+                   model_name: str = DEFAULT_MODEL) -> Optional['ParsedDocStore']:
+        """Build a store over the review paragraphs, or None without spaCy."""
+        nlp = get_shared_nlp(model_name)
+        if nlp is None:
+            return None
+        return cls(nlp, paragraphs)
+
+    def _core_disable(self) -> List[str]:
+        return addon_pipes(self.nlp)
+
+    def _prime(self):
+        """Batch-parse all pending paragraphs with the core pipeline (once)."""
+        if not self._pending:
+            return
+        texts = list(dict.fromkeys(t for t in self._pending if t not in self._docs))
+        self._pending = []
+        if not texts:
+            return
+        try:
+            for text, doc in zip(texts, self.nlp.pipe(texts, batch_size=self.batch_size,
+                                                      disable=self._core_disable())):
+                self._docs[text] = doc
+            self.stats['parsed'] += len(texts)
+            _log(f" Parsed {len(texts)} paragraphs in one pass")
+        except Exception as e:
+            _log(f" Batch parse failed, falling back to per-paragraph parsing: {e}")
+
+    def _parse_one(self, text: str):
+        # Per-call disable: the model is shared, so never toggle its pipes
+        doc = self.nlp(text, disable=self._core_disable())
+        self.stats['parsed'] += 1
+        return doc
+
+    def get(self, text: str, pipes: Iterable[str] = ()):
+        """Return the Doc for `text` with the requested add-on components applied."""
+        with self._lock:
+            self._prime()
+            doc = self._docs.get(text)
+            if doc is None:
+                self.stats['misses'] += 1
+                doc = self._parse_one(text)
+                self._docs[text] = doc
+            else:
+                self.stats['hits'] += 1
+
+            wanted = [p for p in pipes if p in self.nlp.pipe_names]
+            if wanted:
+                applied = self._applied.setdefault(id(doc), set())
+                # Apply in pipeline order so dependent add-ons see their inputs
+                for name in self.nlp.pipe_names:
+                    if name in wanted and name not in applied:
+                        doc = self.nlp.get_pipe(name)(doc)
+                        applied.add(name)
+                        self.stats['addons_applied'] += 1
+                self._docs[text] = doc
+            return doc
+
+    def __len__(self):
+        return len(self._docs) + len(self._pending)
+
+
+# =============================================================================
+# THREAD-SCOPED ACTIVATION
+# =============================================================================
+# Batch scans run one review per thread, so the active store is thread-local.
+
+_active = threading.local()
+
+
+def current_store() -> Optional[ParsedDocStore]:
+    """The store activated for this thread's review, if any."""
+    return getattr(_active, 'store', None)
+
+
+def set_current_store(store: Optional[ParsedDocStore]):
+    """Attach `store` to this thread (None detaches). Prefer activate() where possible."""
+    _active.store = store
+
+
+@contextmanager
+def activate(store: Optional[ParsedDocStore]):
+    """Make `store` visible to parse() calls on this thread for the block."""
+    previous = current_store()
+    _active.store = store
+    try:
+        yield store
+    finally:
+        _active.store = previous
+
+
+def parse(nlp, text: str, pipes: Iterable[str] = ()):
+    """
+    Parse `text` with `nlp`, served from the active review store when possible.
+
+    Args:
+        nlp: The checker's spaCy Language object
+        text: Paragraph text (use the same slicing every time for cache hits)
+        pipes: Add-on component names this caller needs (e.g. ('negex',))
+    """
+    store = current_store()
+    if store is not None and store.nlp is nlp:
+        return store.get(text, pipes)
+    return nlp(text)
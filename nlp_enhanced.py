@@ -453,6 +453,9 @@ class EnhancedNLPProcessor:
                 continue
             try:
                 logger.info(f"Attempting to load spaCy model: {model}")
+                # v6.3.3: Deliberately a private instance, not nlp_utils.get_spacy_model():
+                # _setup_entity_ruler() inserts aerospace patterns before 'ner', which
+                # would change entities for every checker sharing the process model.
                 self.nlp = spacy.load(model)
                 self.model_name = model
                 self.is_loaded = True
@@ -32,7 +32,9 @@ Usage:
     deliverables = processor.extract_deliverables(text)
 """
 
+import importlib.util
 import re
+import threading
 from typing import List, Dict, Set, Tuple, Optional, Any
 from dataclasses import dataclass, field
 from collections import defaultdict
@@ -56,11 +58,10 @@ def _log(message: str, level: str = 'info', **kwargs):
 _spacy_available = False
 _nlp = None
 
-try:
-    import spacy
+if importlib.util.find_spec('spacy') is not None:
     _spacy_available = True
-    _log("spaCy import successful", level='debug')
-except ImportError:
+    _log("spaCy available", level='debug')
+else:
     _log("spaCy not available - NLP features disabled", level='warning')
 
 
@@ -247,7 +248,7 @@ class NLPProcessor:
 
         try:
             _log(f"Loading spaCy model: {self.model_name}", level='info')
-            self.nlp = spacy.load(self.model_name)
+            self.nlp = get_spacy_model(self.model_name)  # v6.3.3: process-wide instance
             _nlp = self.nlp  # Cache globally
             self.is_nlp_available = True
             _log(f"spaCy model loaded successfully: {self.nlp.meta['name']}", level='info')
@@ -257,7 +258,7 @@ class NLPProcessor:
             # Try smaller model as fallback
             try:
                 _log("Trying fallback model: en_core_web_sm", level='info')
-                self.nlp = spacy.load('en_core_web_sm')
+                self.nlp = get_spacy_model('en_core_web_sm')
                 _nlp = self.nlp
                 self.is_nlp_available = True
                 _log("Fallback model loaded successfully", level='info')
@@ -1100,6 +1101,7 @@ class NLPProcessor:
 
 # Module-level cache for spaCy models to prevent multiple loads
 _SPACY_MODEL_CACHE = {}
+_SPACY_MODEL_LOCK = threading.Lock()  # v6.3.3: batch threads may load concurrently
 
 
 def get_spacy_model(model_name: str):
@@ -1117,9 +1119,10 @@ def get_spacy_model(model_name: str):
     """
     global _SPACY_MODEL_CACHE
 
-    if model_name not in _SPACY_MODEL_CACHE:
-        import spacy
-        _SPACY_MODEL_CACHE[model_name] = spacy.load(model_name)
+    with _SPACY_MODEL_LOCK:
+        if model_name not in _SPACY_MODEL_CACHE:
+            import spacy
+            _SPACY_MODEL_CACHE[model_name] = spacy.load(model_name)
 
     return _SPACY_MODEL_CACHE[model_name]
 
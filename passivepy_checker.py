@@ -18,6 +18,14 @@ import logging
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    from nlp_utils import get_spacy_model
+except ImportError:
+    def get_spacy_model(name='en_core_web_sm'):
+        """Fallback if nlp_utils not available."""
+        import spacy
+        return spacy.load(name)
+
 logger = logging.getLogger(__name__)
 
 VERSION = '1.0.0'
@@ -77,12 +85,11 @@ class PassivePyChecker:
             return
 
         try:
-            import spacy
             # Try models in order of preference
             models_to_try = [self.spacy_model, 'en_core_web_md', 'en_core_web_lg', 'en_core_web_sm']
             for model in models_to_try:
                 try:
-                    self.nlp = spacy.load(model)
+                    self.nlp = get_spacy_model(model)
                     self.spacy_model = model
                     break
                 except OSError:
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+AEGIS Phrase Matcher
+====================
+Finds every occurrence of any number of dictionary phrases in one pass.
+
+v6.3.3: Dictionary scans used to loop over every entry and search the text
+once per entry — RoleExtractor._scan_for_known_roles called text.find for
+each known role and alias (O(roles x text) per paragraph, growing with the
+role dictionary), and TerminologyChecker ran one regex per spelling variant,
+UK/US pair, abbreviation and hyphenation form. PhraseMatcher compiles the
+phrases into an Aho-Corasick automaton once and reports all whole-word
+matches in a single pass over the text.
+
+Dictionary-backed matchers are rebuilt when their source changes: writers
+call notify_dictionary_changed(name) (ScanHistoryDB does so for every
+role_dictionary write, including adjudication) and holders compare
+dictionary_generation(name) with the generation they were built from.
+"""
+
+import threading
+from collections import deque
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Set, Tuple, Union
+
+__version__ = "1.0.0"
+
+ROLE_DICTIONARY = 'role_dictionary'
+
+
+def is_word_char(ch: str) -> bool:
+    """Regex \\w semantics: letters, digits and underscore."""
+    return ch.isalnum() or ch == '_'
+
+
+class AhoCorasick:
+    """
+    Multi-pattern substring automaton over (text, pattern_id) pairs.
+
+    Shared by PhraseMatcher and hyperlink_validator's CompiledExclusions.
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, int]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[int, ...]] = [()]
+        for text, pattern_id in patterns:
+            if text:
+                self._insert(text, pattern_id)
+        self._build()
+
+    def _insert(self, text: str, pattern_id: int):
+        node = 0
+        for ch in text:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            node = nxt
+        self._out[node] = self._out[node] + (pattern_id,)
+
+    def _build(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def __bool__(self) -> bool:
+        return len(self._goto) > 1
+
+    def scan(self, text: str) -> Iterator[Tuple[int, Tuple[int, ...]]]:
+        """(end, pattern_ids) for every position where at least one pattern ends, longest first."""
+        goto, fail, out = self._goto, self._fail, self._out
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                yield i + 1, out[node]
+
+    def find(self, text: str) -> Set[int]:
+        """Ids of every pattern present in `text`."""
+        found: Set[int] = set()
+        for _, pattern_ids in self.scan(text):
+            found.update(pattern_ids)
+        return found
+
+
+class PhraseMatch(NamedTuple):
+    """One occurrence: text[start:end] matched `phrase` (as compiled, lowercased unless case_sensitive)."""
+    start: int
+    end: int
+    phrase: str
+    values: Tuple[Any, ...]
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton over a phrase list.
+
+    Args:
+        phrases: phrases, or (phrase, value) pairs; a phrase given several
+            times keeps every value (PhraseMatch.values)
+        case_sensitive: False lowercases phrases and scanned text
+        whole_words: only report matches not embedded in a longer word
+        word_char: predicate for "word" characters at the match edges
+            (str.isalnum reproduces the old role-scan boundary test)
+    """
+
+    def __init__(self, phrases: Iterable[Union[str, Tuple[str, Any]]],
+                 case_sensitive: bool = False, whole_words: bool = True,
+                 word_char: Callable[[str], bool] = is_word_char):
+        self.case_sensitive = case_sensitive
+        self.whole_words = whole_words
+        self.word_char = word_char
+        self._ids: Dict[str, int] = {}
+        self.phrases: List[str] = []
+        self._values: List[Tuple[Any, ...]] = []
+
+        for item in phrases:
+            phrase, value = (item, None) if isinstance(item, str) else item
+            if not phrase:
+                continue
+            if not case_sensitive:
+                phrase = phrase.lower()
+            pattern_id = self._ids.get(phrase)
+            if pattern_id is None:
+                pattern_id = self._ids[phrase] = len(self.phrases)
+                self.phrases.append(phrase)
+                self._values.append(())
+            if value is not None and value not in self._values[pattern_id]:
+                self._values[pattern_id] += (value,)
+        self._automaton = AhoCorasick((phrase, i) for i, phrase in enumerate(self.phrases))
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def __bool__(self) -> bool:
+        return bool(self.phrases)
+
+    def __contains__(self, phrase: str) -> bool:
+        return (phrase if self.case_sensitive else phrase.lower()) in self._ids
+
+    def prepare(self, text: str) -> str:
+        """The text as scanned (lowercased unless case_sensitive); match offsets index into it."""
+        return text if self.case_sensitive else text.lower()
+
+    def finditer(self, text: str, overlapping: bool = True) -> Iterator[PhraseMatch]:
+        """
+        Matches in order of end position (longest first at the same end).
+
+        overlapping=False drops a match that overlaps the previous match of
+        the same phrase, which is what re.finditer does for one pattern.
+        Different phrases may always overlap ('program manager' and
+        'deputy program manager').
+        """
+        scan = self.prepare(text)
+        phrases, values = self.phrases, self._values
+        whole, word_char = self.whole_words, self.word_char
+        last_end: Dict[int, int] = {}
+        size = len(scan)
+        for end, pattern_ids in self._automaton.scan(scan):
+            for pattern_id in pattern_ids:
+                phrase = phrases[pattern_id]
+                start = end - len(phrase)
+                if whole:
+                    if start > 0 and word_char(phrase[0]) and word_char(scan[start - 1]):
+                        continue
+                    if end < size and word_char(phrase[-1]) and word_char(scan[end]):
+                        continue
+                if not overlapping:
+                    if start < last_end.get(pattern_id, 0):
+                        continue
+                    last_end[pattern_id] = end
+                yield PhraseMatch(start, end, phrase, values[pattern_id])
+
+    def findall(self, text: str, overlapping: bool = True) -> List[PhraseMatch]:
+        """All matches ordered by start position (longest first at the same start)."""
+        return sorted(self.finditer(text, overlapping), key=lambda m: (m.start, -m.end))
+
+    def positions(self, text: str, overlapping: bool = False) -> Dict[str, List[int]]:
+        """{phrase: [start, ...]} for the phrases present, starts ascending."""
+        found: Dict[str, List[int]] = {}
+        for match in self.finditer(text, overlapping):
+            found.setdefault(match.phrase, []).append(match.start)
+        return found
+
+    def present(self, text: str) -> Set[str]:
+        """Phrases occurring at least once."""
+        return {match.phrase for match in self.finditer(text)}
+
+
+# =============================================================================
+# DICTIONARY GENERATIONS
+# =============================================================================
+
+_generations: Dict[str, int] = {}
+_generations_lock = threading.Lock()
+
+
+def dictionary_generation(name: str = ROLE_DICTIONARY) -> int:
+    """Change counter for dictionary `name` in this process."""
+    return _generations.get(name, 0)
+
+
+def notify_dictionary_changed(name: str = ROLE_DICTIONARY):
+    """Mark matchers built from dictionary `name` as stale."""
+    with _generations_lock:
+        _generations[name] = _generations.get(name, 0) + 1
+
+
+_shared: Dict[Tuple[str, Any], Tuple[int, PhraseMatcher]] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_matcher(name: str, build: Callable[[], PhraseMatcher], key: Any = None) -> PhraseMatcher:
+    """
+    Process-wide matcher for dictionary `name` (and optional `key`),
+    built by `build()` on first use and again after notify_dictionary_changed(name).
+    """
+    generation = dictionary_generation(name)
+    cache_key = (name, key)
+    with _shared_lock:
+        cached = _shared.get(cache_key)
+        if cached and cached[0] == generation:
+            return cached[1]
+    matcher = build()
+    with _shared_lock:
+        _shared[cache_key] = (generation, matcher)
+    return matcher
@@ -24,6 +24,13 @@ try:
 except Exception:
     logger = logging.getLogger('portfolio')
 
+# v6.3.3: Scan results are stored normalized; load_scan_results reassembles them
+try:
+    from scan_history import load_scan_results
+except ImportError:
+    def load_scan_results(cursor, scan_id, results_json, include_issues=True, include_text=True):
+        return json.loads(results_json) if results_json else {}
+
 # Create Blueprint
 portfolio_blueprint = Blueprint('portfolio', __name__)
 
@@ -144,9 +151,9 @@ def get_batches():
         ''')
 
         scans = cursor.fetchall()
-        conn.close()
 
         if not scans:
+            conn.close()
             return jsonify({
                 'success': True,
                 'batches': [],
@@ -169,9 +176,10 @@ def get_batches():
 
             scan_dt = datetime.fromisoformat(scan_time.replace('Z', '+00:00')) if scan_time else datetime.now()
 
-            # Parse results for additional info
+            # Parse results for additional info (by_category lives in the slim row)
             try:
-                results = json.loads(results_json) if results_json else {}
+                results = load_scan_results(conn, scan_id, results_json,
+                                            include_issues=False, include_text=False)
             except:
                 results = {}
 
@@ -205,6 +213,7 @@ def get_batches():
                 # Start new batch
                 batch_start_time = scan_dt
                 current_batch = [doc_data]
+        conn.close()
 
         # Don't forget the last batch
         if current_batch:
@@ -308,14 +317,13 @@ def get_batch_details(batch_id):
         ''', (timestamp, timestamp))
 
         scans = cursor.fetchall()
-        conn.close()
 
         documents = []
         for scan in scans:
             scan_id, doc_id, scan_time, score, grade, issue_count, word_count, results_json, filename, filepath, scan_count = scan
 
             try:
-                results = json.loads(results_json) if results_json else {}
+                results = load_scan_results(conn, scan_id, results_json, include_text=False)
             except:
                 results = {}
 
@@ -336,6 +344,7 @@ def get_batch_details(batch_id):
                 'by_category': results.get('by_category', {}),
                 'top_issues': results.get('issues', [])[:3]
             })
+        conn.close()
 
         if not documents:
             return jsonify({'success': False, 'error': 'Batch not found'}), 404
@@ -376,17 +385,18 @@ def get_document_preview(scan_id):
         ''', (scan_id,))
 
         row = cursor.fetchone()
-        conn.close()
 
         if not row:
+            conn.close()
             return jsonify({'success': False, 'error': 'Document not found'}), 404
 
         scan_id, doc_id, scan_time, score, grade, issue_count, word_count, results_json, filename, filepath = row
 
         try:
-            results = json.loads(results_json) if results_json else {}
+            results = load_scan_results(conn, scan_id, results_json)
         except:
             results = {}
+        conn.close()
 
         # Get top issues for preview
         issues = results.get('issues', [])
@@ -48,6 +48,7 @@ class ImperativeMoodChecker(BaseChecker):
 
     CHECKER_NAME = "Imperative Mood for Procedures"
     CHECKER_VERSION = "3.4.0"
+    PARALLEL_SAFE = True
 
     # Patterns indicating non-imperative instructions
     NON_IMPERATIVE_PATTERNS = [
@@ -154,6 +155,7 @@ class SecondPersonChecker(BaseChecker):
 
     CHECKER_NAME = "Second Person Preference"
     CHECKER_VERSION = "3.4.0"
+    PARALLEL_SAFE = True
 
     # Third-person patterns and their second-person alternatives
     THIRD_PERSON_PATTERNS = [
@@ -245,6 +247,7 @@ class LinkTextQualityChecker(BaseChecker):
 
     CHECKER_NAME = "Link Text Quality"
     CHECKER_VERSION = "3.4.0"
+    PARALLEL_SAFE = True
 
     # Bad link text patterns
     BAD_LINK_PATTERNS = [
@@ -225,23 +225,21 @@ TABLE_HEADER_PATTERNS = re.compile(
 # Local learned patterns (parser_patterns.json)
 # ──────────────────────────────────────────────
 
-_learned_patterns = None
-
-def _get_learned_patterns():
-    """Load learned patterns from local JSON file. Cached after first load."""
-    global _learned_patterns
-    if _learned_patterns is None:
-        try:
-            from .pattern_learner import load_patterns
-            _learned_patterns = load_patterns()
-        except Exception:
-            _learned_patterns = {}
-    return _learned_patterns
+def _get_learned_rules():
+    """Compiled learned patterns (v6.3.3: refreshed when parser_patterns.json changes)."""
+    try:
+        from .pattern_learner import get_proposal_rules
+        return get_proposal_rules()
+    except Exception:
+        return None
 
 def reload_learned_patterns():
     """Force reload after learning new patterns (called after compare saves diffs)."""
-    global _learned_patterns
-    _learned_patterns = None
+    try:
+        from .pattern_learner import reload_learned_patterns as _reload
+        _reload()
+    except Exception:
+        pass
 
 
 # ──────────────────────────────────────────────
@@ -276,12 +274,10 @@ def classify_line_item(description: str) -> str:
 
     # Check learned category overrides first (user corrections take priority)
     # Require count >= 2 to avoid learning from single mistakes
-    patterns = _get_learned_patterns()
-    for override in patterns.get('category_overrides', []):
-        if override.get('count', 0) >= 2:
-            kw = override.get('keyword', '').lower()
-            if kw and kw in desc_lower:
-                return override.get('category', 'Other')
+    rules = _get_learned_rules()
+    learned = rules.category_for(desc_lower) if rules else None
+    if learned is not None:
+        return learned
 
     # Fall through to hardcoded patterns
     for category, pattern in CATEGORY_PATTERNS.items():
@@ -302,13 +298,11 @@ def extract_company_from_text(text: str, max_chars: int = 2000, filename: str =
     5. Company name extracted from the filename
     """
     # Strategy 0: Check learned company patterns (user corrections)
-    patterns = _get_learned_patterns()
-    if filename:
-        fn_lower = filename.lower()
-        for cp in patterns.get('company_patterns', []):
-            hint = cp.get('filename_hint', '')
-            if hint and hint in fn_lower and cp.get('count', 0) >= 2:
-                return cp.get('pattern', '')
+    rules = _get_learned_rules()
+    if filename and rules:
+        learned = rules.company_for(filename)
+        if learned is not None:
+            return learned
 
     search_text = text[:max_chars]
 
@@ -495,12 +489,12 @@ def extract_contract_term(text: str, sheet_names: List[str] = None, filename: st
 def is_financial_table(headers: List[str], rows: List[List[str]]) -> bool:
     """Determine if a table likely contains financial data."""
     # Check learned header signatures first (from user corrections)
-    patterns = _get_learned_patterns()
-    if headers:
+    rules = _get_learned_rules()
+    if headers and rules:
         sig = '|'.join(h.lower().strip()[:20] for h in headers)
-        for learned in patterns.get('financial_table_headers', []):
-            if learned.get('header_signature') == sig:
-                return learned.get('is_financial', True)
+        learned = rules.table_is_financial(sig)
+        if learned is not None:
+            return learned
 
     header_text = ' '.join(h.lower() for h in headers if h)
 
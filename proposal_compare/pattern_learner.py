@@ -17,6 +17,10 @@ import os
 import re
 import logging
 from datetime import datetime
+from typing import Optional
+
+from learned_rules import LearnedRules, first_by_key
+from phrase_matcher import PhraseMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -76,6 +80,65 @@ def save_patterns(patterns: dict):
             pass
 
 
+class ProposalRules:
+    """Learned parser patterns compiled for per-line-item lookups (v6.3.3).
+
+    classify_line_item runs for every row of every financial table; the
+    category keywords and filename hints are compiled into PhraseMatchers
+    so a lookup is one pass over the text instead of one test per pattern.
+    Each lookup returns None when no learned pattern applies.
+    """
+
+    def __init__(self, patterns: dict):
+        overrides = [entry for entry in patterns.get('category_overrides', [])
+                     if entry.get('count', 0) >= 2]
+        self._categories = [entry.get('category', 'Other') for entry in overrides]
+        self._category_matcher = PhraseMatcher(
+            ((entry.get('keyword', ''), position) for position, entry in enumerate(overrides)),
+            whole_words=False)
+
+        companies = [entry for entry in patterns.get('company_patterns', [])
+                     if entry.get('count', 0) >= 2]
+        self._companies = [entry.get('pattern', '') for entry in companies]
+        self._company_matcher = PhraseMatcher(
+            ((entry.get('filename_hint', ''), position) for position, entry in enumerate(companies)),
+            case_sensitive=True, whole_words=False)
+
+        self._table_headers = first_by_key(
+            (entry.get('header_signature'), entry.get('is_financial', True))
+            for entry in patterns.get('financial_table_headers', []))
+
+    @staticmethod
+    def _first(matcher: PhraseMatcher, text: str):
+        positions = [position for match in matcher.finditer(text) for position in match.values]
+        return min(positions) if positions else None
+
+    def category_for(self, description: str) -> Optional[str]:
+        position = self._first(self._category_matcher, description) if self._categories else None
+        return None if position is None else self._categories[position]
+
+    def company_for(self, filename: str) -> Optional[str]:
+        position = self._first(self._company_matcher, filename.lower()) if self._companies else None
+        return None if position is None else self._companies[position]
+
+    def table_is_financial(self, header_signature: str) -> Optional[bool]:
+        found = self._table_headers.get(header_signature)
+        return None if found is None else found[1]
+
+
+_rules = LearnedRules(lambda: PATTERNS_FILE, load_patterns, ProposalRules)
+
+
+def reload_learned_patterns():
+    """Drop the compiled rules so next access loads fresh from disk."""
+    _rules.invalidate()
+
+
+def get_proposal_rules() -> ProposalRules:
+    """Get the compiled parser rules (recompiled when the file changes on disk)."""
+    return _rules.get()
+
+
 def learn_from_corrections(proposals_with_originals: list):
     """Compare original parser extraction to user-edited data, learn patterns.
 
@@ -29,17 +29,24 @@ Usage:
 import re
 import os
 import json
+import importlib.util
 from typing import Dict, List, Any, Optional, Tuple, Set
 from collections import defaultdict
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
-# Optional spaCy integration
+# Optional spaCy integration (the model itself is loaded lazily)
+SPACY_AVAILABLE = importlib.util.find_spec('spacy') is not None
+
 try:
-    import spacy
-    SPACY_AVAILABLE = True
+    from nlp_utils import get_spacy_model
 except ImportError:
-    SPACY_AVAILABLE = False
+    def get_spacy_model(name='en_core_web_sm'):
+        """Fallback if nlp_utils not available."""
+        import spacy
+        return spacy.load(name)
+
+from nlp_doc_store import parse as parse_doc
 
 
 class Severity(Enum):
@@ -443,7 +450,7 @@ class ProseLinter:
         # Initialize spaCy if requested and available
         if use_spacy and SPACY_AVAILABLE:
             try:
-                self.nlp = spacy.load('en_core_web_sm')
+                self.nlp = get_spacy_model('en_core_web_sm')
             except OSError:
                 print("Warning: spaCy model not found. Run: python -m spacy download en_core_web_sm")
 
@@ -899,7 +906,7 @@ class ProseLinter:
         if not self.nlp:
             return issues
 
-        doc = self.nlp(text)
+        doc = parse_doc(self.nlp, text)
 
         for sent in doc.sents:
             # Look for collective nouns with wrong verb form
@@ -930,7 +937,7 @@ class ProseLinter:
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences."""
         if self.nlp:
-            doc = self.nlp(text)
+            doc = parse_doc(self.nlp, text)
             return [sent.text.strip() for sent in doc.sents]
         else:
             # Simple sentence splitting
@@ -29,6 +29,8 @@ try:
 except ImportError:
     from .base_checker import BaseChecker
 
+from regex_registry import compile_pattern, word_pattern
+
 __version__ = "1.0.0"
 
 
@@ -233,7 +235,7 @@ class AdvancedProseLintChecker(BaseChecker):
             text_lower = text.lower()
             for cliche, suggestion in self.CLICHES.items():
                 if cliche in text_lower:
-                    pattern = re.compile(re.escape(cliche), re.IGNORECASE)
+                    pattern = compile_pattern(re.escape(cliche), re.IGNORECASE)
                     for match in pattern.finditer(text):
                         issues.append(self.create_issue(
                             severity='Low',
@@ -248,9 +250,11 @@ class AdvancedProseLintChecker(BaseChecker):
 
             # Check hedging language
             for hedge, suggestion in self.HEDGING.items():
-                if re.search(r'\b' + hedge + r'\b', text, re.IGNORECASE):
-                    pattern = re.compile(r'\b' + re.escape(hedge) + r'\b', re.IGNORECASE)
-                    match = pattern.search(text)
+                test = compile_pattern(r'\b' + hedge + r'\b', re.IGNORECASE)
+                found = test.search(text)
+                if found:
+                    pattern = word_pattern(hedge)
+                    match = found if pattern is test else pattern.search(text)
                     if match:
                         issues.append(self.create_issue(
                             severity='Low',
@@ -265,25 +269,26 @@ class AdvancedProseLintChecker(BaseChecker):
 
             # Check redundancy
             for pattern, phrase, suggestion in self.REDUNDANCY_PATTERNS:
-                if re.search(pattern, text, re.IGNORECASE):
-                    match = re.search(pattern, text, re.IGNORECASE)
-                    if match:
-                        issues.append(self.create_issue(
-                            severity='Low',
-                            message=f'Redundant phrase: "{phrase}"',
-                            context=text[max(0, match.start() - 30):min(len(text), match.end() + 30)],
-                            paragraph_index=idx,
-                            suggestion=suggestion,
-                            rule_id='PROSE004',
-                            flagged_text=match.group()
-                        ))
-                        break
+                match = compile_pattern(pattern, re.IGNORECASE).search(text)
+                if match:
+                    issues.append(self.create_issue(
+                        severity='Low',
+                        message=f'Redundant phrase: "{phrase}"',
+                        context=text[max(0, match.start() - 30):min(len(text), match.end() + 30)],
+                        paragraph_index=idx,
+                        suggestion=suggestion,
+                        rule_id='PROSE004',
+                        flagged_text=match.group()
+                    ))
+                    break
 
             # Check for jargon
             for jargon, suggestion in self.COMPLEX_JARGON.items():
-                if re.search(r'\b' + jargon + r'\b', text, re.IGNORECASE):
-                    pattern = re.compile(r'\b' + re.escape(jargon) + r'\b', re.IGNORECASE)
-                    match = pattern.search(text)
+                test = compile_pattern(r'\b' + jargon + r'\b', re.IGNORECASE)
+                found = test.search(text)
+                if found:
+                    pattern = word_pattern(jargon)
+                    match = found if pattern is test else pattern.search(text)
                     if match:
                         issues.append(self.create_issue(
                             severity='Low',
@@ -298,20 +303,18 @@ class AdvancedProseLintChecker(BaseChecker):
 
             # Check defensive language
             for phrase, suggestion in self.DEFENSIVE_LANGUAGE.items():
-                if re.search(r'\b' + re.escape(phrase) + r'\b', text, re.IGNORECASE):
-                    pattern = re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
-                    match = pattern.search(text)
-                    if match:
-                        issues.append(self.create_issue(
-                            severity='Medium',
-                            message=f'Defensive/legal language: "{match.group()}"',
-                            context=text[max(0, match.start() - 30):min(len(text), match.end() + 30)],
-                            paragraph_index=idx,
-                            suggestion=suggestion,
-                            rule_id='PROSE006',
-                            flagged_text=match.group()
-                        ))
-                        break
+                match = word_pattern(phrase).search(text)
+                if match:
+                    issues.append(self.create_issue(
+                        severity='Medium',
+                        message=f'Defensive/legal language: "{match.group()}"',
+                        context=text[max(0, match.start() - 30):min(len(text), match.end() + 30)],
+                        paragraph_index=idx,
+                        suggestion=suggestion,
+                        rule_id='PROSE006',
+                        flagged_text=match.group()
+                    ))
+                    break
 
         return issues
 
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+AEGIS Regex Registry
+====================
+One process-wide table of compiled checker patterns.
+
+v6.3.3: Checkers compiled their patterns inside hot methods — the acronym
+checker rebuilt its usage pattern and fifteen document-number patterns on
+every call, DocumentExtractor recompiled its XML patterns per document and
+the prose/clarity checkers built one pattern per dictionary entry per
+paragraph. re's own cache holds 512 entries, which a full review with 100+
+checkers overruns, so many of those calls really recompiled. Checkers now
+compile through this module at import time (or on first use for
+data-driven patterns); identical sources share one compiled object.
+
+any_of() merges a list of alternatives that are only ever tested for
+"does any match" into a single alternation.
+
+Profiling mode (profile() and find_backtracking()) runs the registered
+patterns through the safe_regex_* helpers from role_extractor_v3: profile()
+reports match time per pattern over sample text, and find_backtracking()
+feeds each pattern growing runs of repeated characters and flags the ones
+whose time blows up (catastrophic backtracking).
+"""
+
+import re
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+__version__ = "1.0.0"
+
+# Data-driven patterns (config dictionaries, learned terms) register on first
+# use; past this many entries new sources are compiled but not kept.
+MAX_PATTERNS = 10000
+
+# Catastrophic-backtracking probes: pumped strings ending in a character few
+# patterns accept, at growing lengths (capped by the safe_regex_* input limit)
+BACKTRACK_PUMPS = ('a', 'A', '1', ' ', 'a ', 'A1', 'Aa-', '<w:t>', '.', '\t\n')
+BACKTRACK_TAIL = '\x00!'
+BACKTRACK_SIZES = (16, 20, 24, 32, 1000, 4000, 9000)
+BACKTRACK_BUDGET = 0.05  # seconds for one search
+
+_BACKREFERENCE = re.compile(r'\\[1-9]|\(\?P=')
+
+
+class RegexRegistry:
+    """Compiled patterns keyed by (source, flags), with optional names for reports."""
+
+    def __init__(self, max_patterns: int = MAX_PATTERNS):
+        self.max_patterns = max_patterns
+        self._compiled: Dict[Tuple[str, int], Pattern] = {}
+        self._names: Dict[str, Tuple[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._names
+
+    def compile(self, pattern: str, flags: int = 0, name: Optional[str] = None) -> Pattern:
+        """Compiled `pattern`, compiled once per (source, flags) for the process."""
+        key = (pattern, flags)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = re.compile(pattern, flags)
+            with self._lock:
+                if len(self._compiled) >= self.max_patterns:
+                    return compiled
+                compiled = self._compiled.setdefault(key, compiled)
+        if name is not None and name not in self._names:
+            with self._lock:
+                self._names.setdefault(name, key)
+        return compiled
+
+    def word(self, phrase: str, flags: int = re.IGNORECASE, name: Optional[str] = None,
+             trailing_boundary: bool = True) -> Pattern:
+        r"""Whole-word pattern for a literal phrase: \bphrase\b."""
+        source = r'\b' + re.escape(phrase) + (r'\b' if trailing_boundary else '')
+        return self.compile(source, flags, name)
+
+    def any_of(self, patterns: Iterable[str], flags: int = 0, name: Optional[str] = None) -> Pattern:
+        """
+        One alternation matching wherever any of `patterns` matches.
+
+        For patterns only used as a yes/no test. Group numbering shifts in
+        the merged pattern, so backreferences are rejected.
+        """
+        patterns = list(patterns)
+        for source in patterns:
+            if _BACKREFERENCE.search(source):
+                raise ValueError(f"Cannot merge pattern with a backreference: {source!r}")
+        return self.compile('|'.join(f'(?:{source})' for source in patterns), flags, name)
+
+    def get(self, name: str) -> Optional[Pattern]:
+        key = self._names.get(name)
+        return self._compiled.get(key) if key else None
+
+    def named(self) -> Dict[str, Pattern]:
+        """{name: compiled} for every named pattern."""
+        with self._lock:
+            return {name: self._compiled[key] for name, key in self._names.items()
+                    if key in self._compiled}
+
+    def _targets(self, names: Optional[Iterable[str]]) -> List[Tuple[str, Pattern]]:
+        if names is not None:
+            return [(name, self.get(name)) for name in names if self.get(name) is not None]
+        labelled = {key: name for name, key in self._names.items()}
+        with self._lock:
+            return [(labelled.get(key, key[0]), compiled) for key, compiled in self._compiled.items()]
+
+    # -------------------------------------------------------------------------
+    # Profiling mode
+    # -------------------------------------------------------------------------
+
+    def profile(self, samples: Iterable[str], names: Optional[Iterable[str]] = None) -> List[Dict]:
+        """
+        Time every registered pattern (or just `names`) over `samples`.
+
+        Returns [{name, pattern, seconds, matches}] slowest first.
+        """
+        from role_extractor_v3 import safe_regex_findall
+
+        samples = [s for s in samples if s]
+        report = []
+        for name, compiled in self._targets(names):
+            matches = 0
+            start = time.perf_counter()
+            for text in samples:
+                matches += len(safe_regex_findall(compiled, text))
+            report.append({
+                'name': name,
+                'pattern': compiled.pattern,
+                'seconds': round(time.perf_counter() - start, 6),
+                'matches': matches,
+            })
+        report.sort(key=lambda row: row['seconds'], reverse=True)
+        return report
+
+    def find_backtracking(self, names: Optional[Iterable[str]] = None,
+                          budget: float = BACKTRACK_BUDGET) -> List[Dict]:
+        """
+        Flag patterns that take longer than `budget` seconds on a probe.
+
+        Probes grow from a few dozen characters to the safe_regex_* limit and
+        each pattern stops at its first slow probe, so an exponential pattern
+        is caught on short input before it can stall the run.
+        Returns [{name, pattern, probe, length, seconds}].
+        """
+        from role_extractor_v3 import safe_regex_search
+
+        flagged = []
+        for name, compiled in self._targets(names):
+            slow = None
+            for size in BACKTRACK_SIZES:
+                for pump in BACKTRACK_PUMPS:
+                    probe = (pump * (size // len(pump) + 1))[:size] + BACKTRACK_TAIL
+                    start = time.perf_counter()
+                    safe_regex_search(compiled, probe)
+                    elapsed = time.perf_counter() - start
+                    if elapsed > budget:
+                        slow = {'name': name, 'pattern': compiled.pattern, 'probe': pump,
+                                'length': len(probe), 'seconds': round(elapsed, 4)}
+                        break
+                if slow:
+                    flagged.append(slow)
+                    break
+        return flagged
+
+
+REGISTRY = RegexRegistry()
+
+
+def compile_pattern(pattern: str, flags: int = 0, name: Optional[str] = None) -> Pattern:
+    """REGISTRY.compile: the shared compiled form of `pattern`."""
+    return REGISTRY.compile(pattern, flags, name)
+
+
+def word_pattern(phrase: str, flags: int = re.IGNORECASE, name: Optional[str] = None,
+                 trailing_boundary: bool = True) -> Pattern:
+    """REGISTRY.word: shared whole-word pattern for a literal phrase."""
+    return REGISTRY.word(phrase, flags, name, trailing_boundary)
+
+
+def any_of(patterns: Iterable[str], flags: int = 0, name: Optional[str] = None) -> Pattern:
+    """REGISTRY.any_of: shared merged alternation."""
+    return REGISTRY.any_of(patterns, flags, name)
@@ -38,6 +38,8 @@ class RequirementTraceabilityChecker(BaseChecker):
 
     CHECKER_NAME = "Requirement Traceability"
     CHECKER_VERSION = "1.0.0"
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
 
     # Patterns that indicate a requirement has an ID
     ID_PATTERNS = [
@@ -104,6 +106,8 @@ class VagueQuantifierChecker(BaseChecker):
 
     CHECKER_NAME = "Vague Quantifier"
     CHECKER_VERSION = "1.0.0"
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
 
     # Vague quantifiers to flag
     VAGUE_QUANTIFIERS = [
@@ -185,6 +189,8 @@ class VerificationMethodChecker(BaseChecker):
 
     CHECKER_NAME = "Verification Method"
     CHECKER_VERSION = "1.0.0"
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
 
     # Keywords indicating a verification method is mentioned
     VERIFICATION_KEYWORDS = re.compile(
@@ -250,6 +256,8 @@ class AmbiguousScopeChecker(BaseChecker):
 
     CHECKER_NAME = "Ambiguous Scope"
     CHECKER_VERSION = "1.0.0"
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
 
     # Overly broad scope patterns
     SCOPE_PATTERNS = [
@@ -318,6 +326,7 @@ class DirectiveVerbConsistencyChecker(BaseChecker):
 
     CHECKER_NAME = "Directive Verb Consistency"
     CHECKER_VERSION = "1.0.0"
+    PARALLEL_SAFE = True
 
     # Verbs to track with their standard meaning
     DIRECTIVE_VERBS = {
@@ -413,6 +422,7 @@ class UnresolvedCrossReferenceChecker(BaseChecker):
 
     CHECKER_NAME = "Unresolved Cross-Reference"
     CHECKER_VERSION = "1.0.0"
+    PARALLEL_SAFE = True
 
     # Patterns that indicate a vague cross-reference
     VAGUE_REF_PATTERNS = [
@@ -34,6 +34,8 @@ class RequirementsLanguageChecker(BaseChecker):
     
     CHECKER_NAME = "Requirements Language"
     CHECKER_VERSION = "2.0.0"
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
     
     def __init__(self, enabled: bool = True, flag_should_in_reqs: bool = True):
         """
@@ -153,6 +155,8 @@ class AmbiguousPronounsChecker(BaseChecker):
     
     CHECKER_NAME = "Ambiguous Pronouns"
     CHECKER_VERSION = "2.0.0"
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
     
     # Words that when followed by these nouns are NOT ambiguous
     SPECIFIC_REFERENCE_NOUNS = {
@@ -18,13 +18,12 @@ import re
 import logging
 from datetime import datetime
 
+from learned_rules import LearnedRules, first_by_key
+
 logger = logging.getLogger(__name__)
 
 PATTERNS_FILE = os.path.join(os.path.dirname(__file__), 'review_patterns.json')
 
-# Module-level cache for fast access during review
-_learned_patterns = None
-
 
 def _is_learning_enabled():
     """Check if learning is enabled via config.json (v5.9.52)."""
@@ -70,18 +69,75 @@ def save_patterns(patterns: dict):
             pass
 
 
+class ReviewRules:
+    """Learned review patterns compiled for per-issue lookups (v6.3.3).
+
+    review_document asks for a severity override once per issue; the
+    overrides, dismissals and fixes are hashed here once per patterns-file
+    version instead of being scanned on every call.
+    """
+
+    def __init__(self, patterns: dict):
+        self._suppressed = set()
+        self._suppressed_by_type = {}
+        for entry in patterns.get('dismissed_categories', []):
+            if entry.get('count', 0) < 2:
+                continue
+            cat_key = entry.get('category_key', '')
+            category = entry.get('category', '').lower()
+            if ':' not in cat_key:
+                self._suppressed.add(category)
+                continue
+            # Any prefix ending at a colon is a doc_type the key starts with
+            for pos, ch in enumerate(cat_key):
+                if ch == ':':
+                    self._suppressed_by_type.setdefault(cat_key[:pos], set()).add(category)
+
+        self._severity = first_by_key(
+            (entry.get('category_key', ''), entry.get('preferred_severity', ''))
+            for entry in patterns.get('severity_overrides', [])
+            if entry.get('count', 0) >= 2)
+
+        self._fixes = {}
+        for entry in patterns.get('fix_patterns', []):
+            if entry.get('count', 0) >= 2 and 'original' in entry:
+                self._fixes[entry['original']] = entry.get('replacement', '')
+
+    def suppressed_categories(self, doc_type: str = '') -> set:
+        suppressed = set(self._suppressed)
+        if doc_type:
+            suppressed |= self._suppressed_by_type.get(doc_type, set())
+        return suppressed
+
+    def severity_override(self, category: str, doc_type: str = '') -> str:
+        # The earlier entry wins between the doc_type-specific and universal keys
+        cat = category.lower()
+        best = self._severity.get(f"{doc_type}:{cat}") if doc_type else None
+        universal = self._severity.get(cat)
+        if universal and (best is None or universal[0] < best[0]):
+            best = universal
+        return best[1] if best else ''
+
+    def learned_fixes(self) -> dict:
+        return dict(self._fixes)
+
+
+_rules = LearnedRules(lambda: PATTERNS_FILE, load_patterns, ReviewRules)
+
+
 def reload_learned_patterns():
-    """Clear module-level cache so next access loads fresh from disk."""
-    global _learned_patterns
-    _learned_patterns = None
+    """Drop the compiled rules so next access loads fresh from disk."""
+    _rules.invalidate()
 
 
 def get_learned_patterns() -> dict:
-    """Get cached learned patterns (loads from disk on first call)."""
-    global _learned_patterns
-    if _learned_patterns is None:
-        _learned_patterns = load_patterns()
-    return _learned_patterns
+    """Get cached learned patterns (reloaded when the file changes on disk)."""
+    return _rules.patterns()
+
+
+def get_review_rules() -> ReviewRules:
+    """Get the compiled review rules (recompiled when the file changes on disk)."""
+    return _rules.get()
 
 
 # ──────────────────────────────────────────────
@@ -197,24 +253,7 @@ def get_suppressed_categories(doc_type: str = '') -> set:
 
     Only returns categories dismissed >= 2 times (safety threshold).
     """
-    patterns = get_learned_patterns()
-    suppressed = set()
-
-    for entry in patterns.get('dismissed_categories', []):
-        if entry.get('count', 0) < 2:
-            continue
-
-        cat_key = entry.get('category_key', '')
-        category = entry.get('category', '')
-
-        # Check doc_type-specific dismissals
-        if doc_type and cat_key.startswith(f"{doc_type}:"):
-            suppressed.add(category.lower())
-        # Check universal dismissals (no doc_type prefix)
-        elif ':' not in cat_key:
-            suppressed.add(category.lower())
-
-    return suppressed
+    return get_review_rules().suppressed_categories(doc_type)
 
 
 def get_severity_override(category: str, doc_type: str = '') -> str:
@@ -222,21 +261,7 @@ def get_severity_override(category: str, doc_type: str = '') -> str:
 
     Only returns overrides seen >= 2 times (safety threshold).
     """
-    patterns = get_learned_patterns()
-
-    for entry in patterns.get('severity_overrides', []):
-        if entry.get('count', 0) < 2:
-            continue
-
-        cat_key = entry.get('category_key', '')
-        # Check doc_type-specific first
-        if doc_type and cat_key == f"{doc_type}:{category.lower()}":
-            return entry.get('preferred_severity', '')
-        # Then universal
-        if cat_key == category.lower():
-            return entry.get('preferred_severity', '')
-
-    return ''
+    return get_review_rules().severity_override(category, doc_type)
 
 
 def get_learned_fixes() -> dict:
@@ -244,12 +269,7 @@ def get_learned_fixes() -> dict:
 
     Only returns fixes seen >= 2 times (safety threshold).
     """
-    patterns = get_learned_patterns()
-    fixes = {}
-    for entry in patterns.get('fix_patterns', []):
-        if entry.get('count', 0) >= 2:
-            fixes[entry['original']] = entry.get('replacement', '')
-    return fixes
+    return get_review_rules().learned_fixes()
 
 
 def get_pattern_stats() -> dict:
@@ -12,6 +12,11 @@ ACCURACY FOCUS:
 - Human-in-the-loop review process
 - Detailed audit trail
 
+v1.1: Candidate search no longer scores every role pair. Pairs are blocked on
+shared tokens / core role words (lossless for thresholds above 0.5), scored with
+quick_ratio upper bounds before the exact SequenceMatcher ratio, spread across a
+process pool for large sets, and new roles can be scored incrementally.
+
 Author: Nick / SAIC Systems Engineering
 """
 
@@ -87,6 +92,11 @@ class SimilarityEngine:
         'project': ['proj'],
     }
     
+    # Core role nouns used by semantic_similarity (last match in this order wins)
+    CORE_ROLES = ('engineer', 'manager', 'director', 'coordinator', 'specialist',
+                  'technician', 'supervisor', 'analyst', 'lead', 'chief',
+                  'inspector', 'auditor', 'planner', 'controller', 'officer')
+    
     # Words to ignore in comparison
     STOP_WORDS = {
         'the', 'a', 'an', 'and', 'or', 'of', 'for', 'to', 'in', 'on', 'at',
@@ -152,14 +162,10 @@ class SimilarityEngine:
         n2 = cls.normalize_role_name(s2)
         
         # Extract core role (usually the noun at the end)
-        core_roles = ['engineer', 'manager', 'director', 'coordinator', 'specialist',
-                     'technician', 'supervisor', 'analyst', 'lead', 'chief', 
-                     'inspector', 'auditor', 'planner', 'controller', 'officer']
-        
         core1 = None
         core2 = None
         
-        for core in core_roles:
+        for core in cls.CORE_ROLES:
             if core in n1:
                 core1 = core
             if core in n2:
@@ -252,10 +258,184 @@ class SimilarityEngine:
         # Explain semantic match
         if scores['semantic'] > 0.7:
             explanations.append(f"✓ Same core role type with similar qualifiers")
-        
+
         return explanations
 
 
+# =============================================================================
+# CANDIDATE BLOCKING & FAST SCORING
+# =============================================================================
+# Scoring every role pair with compute_overall_similarity is O(n²) and each
+# call re-normalizes both names (~80 regex substitutions). Instead:
+#
+# 1. Each role name is normalized/tokenized once into RoleFeatures.
+# 2. An inverted index over blocking keys (raw + normalized tokens and the
+#    semantic core role) yields candidate pairs. A pair sharing no key has
+#    token = semantic = 0, so its overall score is at most
+#    0.15 + 0.35 = 0.50 — for thresholds above BLOCKING_MAX_SCORE blocking
+#    never drops a pair the exhaustive scan would report.
+# 3. score_features() reproduces compute_overall_similarity exactly, but
+#    first rejects pairs whose upper bound (SequenceMatcher.real_quick_ratio /
+#    quick_ratio bound ratio()) cannot reach the threshold.
+
+BLOCKING_MAX_SCORE = 0.15 + 0.35   # best score possible without a shared key
+PARALLEL_MIN_PAIRS = 20000         # below this, a process pool costs more than it saves
+_SCORE_EPSILON = 1e-9
+
+
+class RoleFeatures:
+    """Per-role values reused by every comparison involving that role."""
+
+    __slots__ = ('name', 'lower', 'normalized', 'tokens', 'core', 'mods', 'mod_tokens', 'keys')
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lower = name.lower()
+        self.normalized = SimilarityEngine.normalize_role_name(name)
+        self.tokens = set(SimilarityEngine.tokenize(name))
+        self.core = None
+        for core in SimilarityEngine.CORE_ROLES:
+            if core in self.normalized:
+                self.core = core
+        self.mods = self.normalized.replace(self.core, '').strip() if self.core else ''
+        self.mod_tokens = set(SimilarityEngine.tokenize(self.mods))
+        self.keys = self.tokens | set(SimilarityEngine.tokenize(self.normalized))
+        if self.core:
+            self.keys.add('core:' + self.core)
+
+
+def score_features(f1: RoleFeatures, f2: RoleFeatures,
+                   min_similarity: float = 0.0) -> Optional[Tuple[float, Dict[str, float]]]:
+    """
+    Same result as SimilarityEngine.compute_overall_similarity(f1.name, f2.name),
+    or None when the pair provably scores below min_similarity.
+    """
+    if f1.tokens and f2.tokens:
+        token = len(f1.tokens & f2.tokens) / len(f1.tokens | f2.tokens)
+    else:
+        token = 0.0
+
+    semantic = 0.0
+    if f1.core and f2.core and f1.core == f2.core:
+        if f1.mods == f2.mods:
+            semantic = 1.0
+        else:
+            if f1.mod_tokens and f2.mod_tokens:
+                mod_sim = len(f1.mod_tokens & f2.mod_tokens) / len(f1.mod_tokens | f2.mod_tokens)
+            else:
+                mod_sim = 0.0
+            semantic = 0.7 + (0.3 * mod_sim)
+
+    partial = token * 0.20 + semantic * 0.30
+    sm_string = SequenceMatcher(None, f1.lower, f2.lower)
+    sm_norm = SequenceMatcher(None, f1.normalized, f2.normalized)
+    if min_similarity > 0:
+        if (partial + sm_string.real_quick_ratio() * 0.15 + sm_norm.real_quick_ratio() * 0.35
+                + _SCORE_EPSILON < min_similarity):
+            return None
+        if (partial + sm_string.quick_ratio() * 0.15 + sm_norm.quick_ratio() * 0.35
+                + _SCORE_EPSILON < min_similarity):
+            return None
+
+    scores = {
+        'string': sm_string.ratio(),
+        'normalized': sm_norm.ratio(),
+        'token': token,
+        'semantic': semantic
+    }
+    weights = {
+        'string': 0.15,
+        'normalized': 0.35,
+        'token': 0.20,
+        'semantic': 0.30
+    }
+    overall = sum(scores[k] * weights[k] for k in scores)
+    return overall, scores
+
+
+def blocked_pairs(features: List[RoleFeatures], only: Optional[Set[int]] = None) -> List[Tuple[int, int]]:
+    """
+    Candidate (i, j) pairs, i < j, that share at least one blocking key.
+
+    Args:
+        features: RoleFeatures in role order
+        only: If given, return only pairs involving at least one of these indices
+    """
+    index: Dict[str, List[int]] = defaultdict(list)
+    for i, f in enumerate(features):
+        for key in f.keys:
+            index[key].append(i)
+
+    pairs = set()
+    sources = sorted(only) if only is not None else range(len(features))
+    for i in sources:
+        for key in features[i].keys:
+            for j in index[key]:
+                if j != i:
+                    pairs.add((i, j) if i < j else (j, i))
+    return sorted(pairs)
+
+
+def all_pairs(n: int, only: Optional[Set[int]] = None) -> List[Tuple[int, int]]:
+    """Every (i, j) pair, i < j (optionally restricted to pairs touching `only`)."""
+    if only is None:
+        return [(i, j) for i in range(n) for j in range(i + 1, n)]
+    return sorted({(min(i, j), max(i, j)) for i in only for j in range(n) if j != i})
+
+
+_worker_features: List[RoleFeatures] = []
+
+
+def _init_score_worker(names: List[str]):
+    global _worker_features
+    _worker_features = [RoleFeatures(n) for n in names]
+
+
+def _score_pair_chunk(args) -> List[Tuple[int, int, float, Dict[str, float]]]:
+    pairs, min_similarity = args
+    results = []
+    for i, j in pairs:
+        scored = score_features(_worker_features[i], _worker_features[j], min_similarity)
+        if scored is not None and scored[0] >= min_similarity:
+            results.append((i, j, scored[0], scored[1]))
+    return results
+
+
+def score_pairs(features: List[RoleFeatures], pairs: List[Tuple[int, int]],
+                min_similarity: float, workers: Optional[int] = None,
+                chunk_size: int = 5000) -> List[Tuple[int, int, float, Dict[str, float]]]:
+    """
+    Score candidate pairs; return (i, j, overall, breakdown) at/above the
+    threshold in input order. Large inputs are spread over a process pool.
+    """
+    if workers is None:
+        workers = min(4, os.cpu_count() or 1)
+    if workers > 1 and len(pairs) >= PARALLEL_MIN_PAIRS:
+        try:
+            import multiprocessing
+            from concurrent.futures import ProcessPoolExecutor
+            if not multiprocessing.current_process().daemon:
+                chunks = [(pairs[k:k + chunk_size], min_similarity)
+                          for k in range(0, len(pairs), chunk_size)]
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context('spawn'),
+                                         initializer=_init_score_worker,
+                                         initargs=([f.name for f in features],)) as pool:
+                    results = []
+                    for chunk_result in pool.map(_score_pair_chunk, chunks):
+                        results.extend(chunk_result)
+                    return results
+        except Exception:
+            pass  # Fall back to in-process scoring
+
+    results = []
+    for i, j in pairs:
+        scored = score_features(features[i], features[j], min_similarity)
+        if scored is not None and scored[0] >= min_similarity:
+            results.append((i, j, scored[0], scored[1]))
+    return results
+
+
 # =============================================================================
 # CONSOLIDATION CANDIDATE
 # =============================================================================
@@ -334,94 +514,100 @@ class RoleConsolidationEngine:
             self._roles = {}
         
         self._candidates: List[ConsolidationCandidate] = []
+
+        # v1.1: Blocking / incremental state
+        self._features: Dict[str, RoleFeatures] = {}
+        self._scored_pairs: Dict[Tuple[str, str], Tuple[float, Dict[str, float]]] = {}
+        self._scored_threshold: Optional[float] = None
+        self._pending_role_ids: Set[str] = set()
     
+    def add_roles(self, roles: List[StandardRole]) -> List[str]:
+        """
+        Add (or replace) roles; the next find_consolidation_candidates(incremental=True)
+        scores only these against the existing set.
+
+        Returns:
+            The ids of the added roles
+        """
+        ids = []
+        for role in roles:
+            self._roles[role.id] = role
+            self._pending_role_ids.add(role.id)
+            ids.append(role.id)
+        return ids
+
+    def _features_for(self, role: StandardRole) -> RoleFeatures:
+        """Cached RoleFeatures for a role (recomputed if its name changed)."""
+        features = self._features.get(role.id)
+        if features is None or features.name != role.canonical_name:
+            if features is not None:
+                self._pending_role_ids.add(role.id)  # Renamed in place
+            features = RoleFeatures(role.canonical_name)
+            self._features[role.id] = features
+        return features
+
     def find_consolidation_candidates(self, 
-                                      min_similarity: float = None) -> List[ConsolidationCandidate]:
+                                      min_similarity: float = None,
+                                      incremental: bool = False,
+                                      workers: Optional[int] = None) -> List[ConsolidationCandidate]:
         """
         Analyze all roles and find potential consolidation candidates.
-        
+
+        v1.1: Only pairs sharing a blocking key are scored (lossless for
+        thresholds above BLOCKING_MAX_SCORE; lower thresholds score every pair),
+        scoring runs in a process pool for large role sets, and with
+        incremental=True only roles added via add_roles() since the previous
+        run are scored against the rest — earlier pair scores are reused.
+
+        Args:
+            min_similarity: Minimum overall similarity (default REVIEW_THRESHOLD)
+            incremental: Reuse the previous run's pair scores when possible
+            workers: Scoring processes (None = auto, 1 = in-process)
+
         Returns list of ConsolidationCandidate objects sorted by similarity (highest first).
         """
         if min_similarity is None:
             min_similarity = self.REVIEW_THRESHOLD
         
-        candidates = []
         roles = list(self._roles.values())
-        processed_pairs = set()
-        
-        for i, role1 in enumerate(roles):
-            for role2 in roles[i+1:]:
-                # Skip if already processed
-                pair_key = tuple(sorted([role1.id, role2.id]))
-                if pair_key in processed_pairs:
+        position = {role.id: i for i, role in enumerate(roles)}
+        features = [self._features_for(role) for role in roles]
+
+        reuse = incremental and self._scored_threshold == min_similarity
+        only = None
+        reused = []
+        if reuse:
+            changed = {rid for rid in self._pending_role_ids if rid in position}
+            only = {position[rid] for rid in changed}
+            for (id1, id2), (overall, breakdown) in self._scored_pairs.items():
+                if id1 in changed or id2 in changed:
                     continue
-                processed_pairs.add(pair_key)
-                
-                # Calculate similarity
-                overall, breakdown = SimilarityEngine.compute_overall_similarity(
-                    role1.canonical_name, role2.canonical_name
-                )
-                
-                if overall >= min_similarity:
-                    # Generate explanations
-                    explanations = SimilarityEngine.explain_similarity(
-                        role1.canonical_name, role2.canonical_name, breakdown
-                    )
-                    
-                    # Determine primary role (higher usage wins)
-                    if role1.usage_count >= role2.usage_count:
-                        primary, secondary = role1, role2
-                    else:
-                        primary, secondary = role2, role1
-                    
-                    # Calculate impact
-                    docs_affected = len(set(primary.source_document_ids) | 
-                                       set(secondary.source_document_ids))
-                    
-                    resps_to_merge = 0
-                    if self.database:
-                        resps1 = self.database.get_responsibilities_for_role(primary.id, active_only=False)
-                        resps2 = self.database.get_responsibilities_for_role(secondary.id, active_only=False)
-                        resps_to_merge = len(resps1) + len(resps2)
-                    
-                    # Determine recommendation
-                    if overall >= self.MERGE_THRESHOLD:
-                        recommendation = "merge"
-                        confidence = min(1.0, overall + 0.1)
-                    else:
-                        recommendation = "review"
-                        confidence = overall
-                    
-                    # Suggest canonical name and aliases
-                    suggested_name = primary.canonical_name
-                    suggested_aliases = list(set(
-                        [secondary.canonical_name] + 
-                        primary.aliases + 
-                        secondary.aliases
-                    ))
-                    
-                    candidate = ConsolidationCandidate(
-                        id=hashlib.md5(f"{primary.id}{secondary.id}".encode()).hexdigest()[:12],
-                        primary_role_id=primary.id,
-                        primary_role_name=primary.canonical_name,
-                        secondary_role_ids=[secondary.id],
-                        secondary_role_names=[secondary.canonical_name],
-                        overall_similarity=overall,
-                        similarity_breakdown=breakdown,
-                        explanations=explanations,
-                        documents_affected=docs_affected,
-                        responsibilities_to_merge=resps_to_merge,
-                        recommendation=recommendation,
-                        confidence=confidence,
-                        status="pending",
-                        reviewed_by="",
-                        review_date="",
-                        review_notes="",
-                        suggested_canonical_name=suggested_name,
-                        suggested_aliases=suggested_aliases
-                    )
-                    
-                    candidates.append(candidate)
+                i, j = position.get(id1), position.get(id2)
+                if i is None or j is None:
+                    continue
+                if i < j:
+                    reused.append((i, j, overall, breakdown))
+                else:
+                    only.add(i)  # Order changed: rescore this role's pairs
+
+        if min_similarity > BLOCKING_MAX_SCORE:
+            pairs = blocked_pairs(features, only)
+        else:
+            pairs = all_pairs(len(roles), only)
+        if reuse:
+            rescored = set(pairs)
+            reused = [r for r in reused if (r[0], r[1]) not in rescored]
+
+        scored = score_pairs(features, pairs, min_similarity, workers) + reused
+        scored.sort(key=lambda r: (r[0], r[1]))
+
+        self._scored_pairs = {(roles[i].id, roles[j].id): (overall, breakdown)
+                              for i, j, overall, breakdown in scored}
+        self._scored_threshold = min_similarity
+        self._pending_role_ids = set()
+
+        candidates = [self._build_pair_candidate(roles[i], roles[j], overall, breakdown)
+                      for i, j, overall, breakdown in scored]
         
         # Sort by similarity (highest first)
         candidates.sort(key=lambda c: -c.overall_similarity)
@@ -431,6 +617,69 @@ class RoleConsolidationEngine:
         
         self._candidates = candidates
         return candidates
+
+    def _build_pair_candidate(self, role1: StandardRole, role2: StandardRole, overall: float,
+                              breakdown: Dict[str, float]) -> ConsolidationCandidate:
+        """Build the candidate for one qualifying role pair."""
+        # Generate explanations
+        explanations = SimilarityEngine.explain_similarity(
+            role1.canonical_name, role2.canonical_name, breakdown
+        )
+
+        # Determine primary role (higher usage wins)
+        if role1.usage_count >= role2.usage_count:
+            primary, secondary = role1, role2
+        else:
+            primary, secondary = role2, role1
+
+        # Calculate impact
+        docs_affected = len(set(primary.source_document_ids) | 
+                           set(secondary.source_document_ids))
+
+        resps_to_merge = 0
+        if self.database:
+            resps1 = self.database.get_responsibilities_for_role(primary.id, active_only=False)
+            resps2 = self.database.get_responsibilities_for_role(secondary.id, active_only=False)
+            resps_to_merge = len(resps1) + len(resps2)
+
+        # Determine recommendation
+        if overall >= self.MERGE_THRESHOLD:
+            recommendation = "merge"
+            confidence = min(1.0, overall + 0.1)
+        else:
+            recommendation = "review"
+            confidence = overall
+
+        # Suggest canonical name and aliases
+        suggested_name = primary.canonical_name
+        suggested_aliases = list(set(
+            [secondary.canonical_name] + 
+            primary.aliases + 
+            secondary.aliases
+        ))
+
+        candidate = ConsolidationCandidate(
+            id=hashlib.md5(f"{primary.id}{secondary.id}".encode()).hexdigest()[:12],
+            primary_role_id=primary.id,
+            primary_role_name=primary.canonical_name,
+            secondary_role_ids=[secondary.id],
+            secondary_role_names=[secondary.canonical_name],
+            overall_similarity=overall,
+            similarity_breakdown=breakdown,
+            explanations=explanations,
+            documents_affected=docs_affected,
+            responsibilities_to_merge=resps_to_merge,
+            recommendation=recommendation,
+            confidence=confidence,
+            status="pending",
+            reviewed_by="",
+            review_date="",
+            review_notes="",
+            suggested_canonical_name=suggested_name,
+            suggested_aliases=suggested_aliases
+        )
+
+        return candidate
     
     def _group_related_candidates(self, 
                                   candidates: List[ConsolidationCandidate]) -> List[ConsolidationCandidate]:
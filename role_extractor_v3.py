@@ -48,6 +48,9 @@ import os
 import csv
 from enum import Enum
 
+from docx_package import docx_document
+from phrase_matcher import (PhraseMatcher, ROLE_DICTIONARY, dictionary_generation)
+
 # Structured logging support
 try:
     from config_logging import get_logger
@@ -761,23 +764,24 @@ class RoleExtractor:
         # v3.5.0: Organization entities (not roles) - filtered from results
         self._organization_entities = set(self.ORGANIZATION_ENTITIES)
 
-        # Load from dictionary if available
-        if use_dictionary:
-            dict_roles = self._load_dictionary_roles()
-            if dict_roles:
-                self.known_roles.update(r.lower() for r in dict_roles)
-
         self.false_positives = set(fp.lower() for fp in self.FALSE_POSITIVES)
         if custom_false_positives:
             self.false_positives.update(fp.lower() for fp in custom_false_positives)
 
-        # v3.2.0: Load rejected roles from dictionary as false positives
-        # This makes the extractor smarter over time as users adjudicate roles
+        # v6.3.3: Dictionary-derived entries are tracked separately so an
+        # adjudication change can swap them (see _refresh_dictionary_roles)
+        self._use_dictionary = use_dictionary
+        self._dictionary_roles: Set[str] = set()
+        self._rejected_roles: Set[str] = set()
+        self._dictionary_generation = dictionary_generation(ROLE_DICTIONARY)
+        self._known_role_matcher: Optional[PhraseMatcher] = None
+        self._known_role_matcher_key = None
+
+        # Load from dictionary if available
+        # v3.2.0: Rejected roles become false positives - this makes the
+        # extractor smarter over time as users adjudicate roles
         if use_dictionary:
-            rejected_roles = self._load_rejected_roles()
-            if rejected_roles:
-                self.false_positives.update(r.lower() for r in rejected_roles)
-                _log(f"Loaded {len(rejected_roles)} rejected roles as false positives", level='debug')
+            self._refresh_dictionary_roles()
         
         # Initialize NLP processor for better extraction (v3.1.2 - ENH-008)
         self._nlp_processor = None
@@ -832,6 +836,51 @@ class RoleExtractor:
 
         self._build_patterns()
     
+    def _refresh_dictionary_roles(self):
+        """(Re)load active and rejected dictionary roles into known_roles / false_positives."""
+        builtin_roles = set(r.lower() for r in self.KNOWN_ROLES)
+        builtin_fps = set(fp.lower() for fp in self.FALSE_POSITIVES)
+        dict_roles = set(r.lower() for r in self._load_dictionary_roles())
+        rejected_roles = set(r.lower() for r in self._load_rejected_roles())
+
+        self.known_roles -= self._dictionary_roles - builtin_roles
+        self.known_roles |= dict_roles
+        self.false_positives -= self._rejected_roles - builtin_fps
+        self.false_positives |= rejected_roles
+        self._dictionary_roles = dict_roles
+        self._rejected_roles = rejected_roles
+        if rejected_roles:
+            _log(f"Loaded {len(rejected_roles)} rejected roles as false positives", level='debug')
+
+    def _get_known_role_matcher(self) -> PhraseMatcher:
+        """
+        v6.3.3: Compiled matcher over known roles and aliases for _scan_for_known_roles.
+
+        Rebuilt after an adjudication changes the role dictionary (the
+        dictionary entries are reloaded first) or when known_roles /
+        false_positives are edited or replaced.
+        """
+        generation = dictionary_generation(ROLE_DICTIONARY)
+        if self._use_dictionary and generation != self._dictionary_generation:
+            self._refresh_dictionary_roles()
+            self._dictionary_generation = generation
+        # known_roles / false_positives are public and edited in place, so
+        # key on their contents rather than on identity or size
+        key = (generation, hash(frozenset(self.known_roles)), hash(frozenset(self.false_positives)))
+        if self._known_role_matcher is None or key != self._known_role_matcher_key:
+            all_known = set(self.known_roles)
+            for canonical, aliases in self.ROLE_ALIASES.items():
+                all_known.add(canonical.lower())
+                for alias in aliases:
+                    all_known.add(alias.lower())
+            # Skip short acronyms to avoid false matches
+            # v3.0.91d: Skip roles that are in false_positives
+            self._known_role_matcher = PhraseMatcher(
+                (r for r in all_known if len(r) >= 5 and r not in self.false_positives),
+                word_char=str.isalnum)
+            self._known_role_matcher_key = key
+        return self._known_role_matcher
+
     def _load_dictionary_roles(self) -> List[str]:
         """Load active roles from the database dictionary if available."""
         try:
@@ -2589,88 +2638,62 @@ class RoleExtractor:
         """
         Directly scan for known roles that may have been missed by pattern matching.
         This ensures high-confidence roles like "Systems Engineer" are always found.
+
+        v6.3.3: One pass of a compiled multi-phrase matcher instead of a
+        text.find loop per known role and alias.
         """
-        text_lower = text.lower()
-        
-        # Combine known roles with their aliases for comprehensive matching
-        all_known = set(self.known_roles)
-        for canonical, aliases in self.ROLE_ALIASES.items():
-            all_known.add(canonical.lower())
-            for alias in aliases:
-                all_known.add(alias.lower())
-        
-        for known_role in all_known:
-            if len(known_role) < 5:  # Skip short acronyms to avoid false matches
+        for match in self._get_known_role_matcher().findall(text):
+            pos, after_pos = match.start, match.end
+            # Get the actual case from original text
+            actual_role = text[pos:after_pos]
+            canonical, variant = self._get_canonical_role(actual_role)
+
+            # v3.0.91d: Skip if canonical form is in false_positives
+            if canonical.lower() in self.false_positives:
                 continue
-            
-            # v3.0.91d: Skip if this role is in false_positives
-            if known_role in self.false_positives:
+
+            match_key = (canonical, pos)
+            if match_key in seen_matches:
                 continue
-            
-            # Find all occurrences of this known role
-            start = 0
-            while True:
-                pos = text_lower.find(known_role, start)
-                if pos == -1:
-                    break
-                
-                # Check word boundaries
-                before_ok = pos == 0 or not text[pos-1].isalnum()
-                after_pos = pos + len(known_role)
-                after_ok = after_pos >= len(text) or not text[after_pos].isalnum()
-                
-                if before_ok and after_ok:
-                    # Get the actual case from original text
-                    actual_role = text[pos:after_pos]
-                    canonical, variant = self._get_canonical_role(actual_role)
-                    
-                    # v3.0.91d: Skip if canonical form is in false_positives
-                    if canonical.lower() in self.false_positives:
-                        start = pos + 1
-                        continue
-                    
-                    match_key = (canonical, pos)
-                    if match_key not in seen_matches:
-                        seen_matches.add(match_key)
-                        
-                        # Get sentence context
-                        context = self._get_sentence_context(text, pos, after_pos)
-                        responsibility, action_type = self._extract_responsibility(context, actual_role)
-                        
-                        occurrence = RoleOccurrence(
-                            role=actual_role,
-                            context=context,
-                            responsibility=responsibility,
-                            action_type=action_type,
-                            location=source_location,
-                            confidence=0.90  # High confidence for known roles
-                        )
-                        
-                        if canonical not in existing_roles:
-                            # v3.0.12: Use helper to ensure entity_kind is populated
-                            # v3.0.12b: Fixed NameError - use actual_role not match.group(0)
-                            existing_roles[canonical] = self._create_extracted_role(canonical, actual_role)
-                        
-                        role_entry = existing_roles[canonical]
-                        role_entry.variants.add(variant)
-                        role_entry.occurrences.append(occurrence)
-                        
-                        if responsibility:
-                            role_entry.responsibilities.append(responsibility)
-                        role_entry.action_types[action_type] += 1
-                
-                start = pos + 1
-        
+            seen_matches.add(match_key)
+
+            # Get sentence context
+            context = self._get_sentence_context(text, pos, after_pos)
+            responsibility, action_type = self._extract_responsibility(context, actual_role)
+
+            occurrence = RoleOccurrence(
+                role=actual_role,
+                context=context,
+                responsibility=responsibility,
+                action_type=action_type,
+                location=source_location,
+                confidence=0.90  # High confidence for known roles
+            )
+
+            if canonical not in existing_roles:
+                # v3.0.12: Use helper to ensure entity_kind is populated
+                # v3.0.12b: Fixed NameError - use actual_role not match.group(0)
+                existing_roles[canonical] = self._create_extracted_role(canonical, actual_role)
+
+            role_entry = existing_roles[canonical]
+            role_entry.variants.add(variant)
+            role_entry.occurrences.append(occurrence)
+
+            if responsibility:
+                role_entry.responsibilities.append(responsibility)
+            role_entry.action_types[action_type] += 1
+
         return existing_roles
     
     def extract_from_docx(self, filepath: str) -> Dict[str, ExtractedRole]:
         """Extract roles from a Word document."""
         try:
-            from docx import Document
+            import docx  # noqa: F401
         except ImportError:
             raise ImportError("python-docx required. Install: pip install python-docx")
         
-        doc = Document(filepath)
+        # v6.3.3: Reuse the review's parsed document when one is attached to this thread
+        doc = docx_document(filepath)
         all_roles: Dict[str, ExtractedRole] = {}
         
         for para_num, paragraph in enumerate(doc.paragraphs, 1):
@@ -14,6 +14,7 @@ import time
 import uuid
 import traceback
 import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timezone
 from functools import wraps
@@ -426,3 +427,23 @@ BATCH_SCAN_CHUNK_SIZE = 5   # Files per chunk in async batch scan
 BATCH_SCAN_MAX_WORKERS = 3  # Concurrent workers per chunk
 BATCH_SCAN_PER_FILE_TIMEOUT = 480  # 8 min per file (matches folder scan)
 BATCH_SCAN_CLEANUP_AGE = 1800  # 30 min after completion, clean up state
+
+# v6.3.3: Server-Sent Events progress streams
+# Each open stream holds a server worker thread (waitress runs threads=8), so
+# streams are capped and short-lived; the client reconnects with
+# Last-Event-ID, and a stream refused for lack of a slot falls back to polling.
+SSE_HEARTBEAT_SECONDS = 15      # comment line so proxies keep the connection open
+SSE_MAX_STREAM_SECONDS = 60     # client EventSource reconnects after this
+SSE_MAX_CONCURRENT_STREAMS = 3  # leaves the other worker threads for regular requests
+_sse_stream_slots = threading.BoundedSemaphore(SSE_MAX_CONCURRENT_STREAMS)
+
+
+@contextmanager
+def sse_stream_slot():
+    """Yield True if a progress stream slot was free (released when the stream ends)."""
+    acquired = _sse_stream_slots.acquire(blocking=False)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            _sse_stream_slots.release()
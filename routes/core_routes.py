@@ -1284,6 +1284,23 @@ def diagnostics_health():
         return (jsonify({'success': False, 'error': {'code': 'HEALTH_CHECK_ERROR', 'message': str(e)}}), 500)
 
 
+@core_bp.route('/api/diagnostics/checker-profile')
+@handle_api_errors
+def diagnostics_checker_profile():
+    """
+    v6.3.3: Per-checker telemetry rolled up over recent reviews — wall/CPU
+    time, peak memory, issue yield, error counts and a slow flag.
+    Optional ?kind=checker|nlp filter.
+    """
+    try:
+        from checker_profile import get_checker_profile
+        kind = request.args.get('kind', '').lower() or None
+        return jsonify({'success': True, 'data': get_checker_profile(kind=kind)})
+    except Exception as e:
+        logger.exception(f'Error reading checker profile: {e}')
+        return (jsonify({'success': False, 'error': {'code': 'CHECKER_PROFILE_ERROR', 'message': str(e)}}), 500)
+
+
 # ─────────────────────────────────────────────────────────────────
 # Package Repair — v6.7.0
 # Background thread repairs broken packages via pip reinstall
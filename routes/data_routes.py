@@ -50,6 +50,12 @@ def db_connection(db_path):
     return _db_conn(db_path)
 
 
+def read_metrics_rollups(cursor, **kwargs):
+    """Dashboard aggregates from the scan history rollup tables (v6.3.3)."""
+    from scan_history import read_metrics_rollups as _read
+    return _read(cursor, **kwargs)
+
+
 @data_bp.route('/api/sow/generate', methods=['POST'])
 @require_csrf
 @handle_api_errors
@@ -310,19 +316,19 @@ def get_metrics_dashboard():
             raise
 
     with db.connection() as (conn, cursor):
-        # === OVERVIEW (core tables — documents, scans) ===
+        # === OVERVIEW (v6.3.3: scan aggregates come from the metrics rollups
+        # maintained by record_scan, not from scanning every row) ===
+        rollups = read_metrics_rollups(cursor)
         cursor.execute('SELECT COUNT(*) FROM documents')
         total_docs = cursor.fetchone()[0] or 0
-        cursor.execute('SELECT COUNT(*) FROM scans')
-        total_scans = cursor.fetchone()[0] or 0
+        total_scans = rollups['total_scans']
 
         # scan_statements count (newer table — safe query)
         total_stmts = 0
         try:
             cursor.execute('''
                 SELECT COUNT(*) FROM scan_statements ss
-                JOIN scans s ON s.id = ss.scan_id
-                WHERE s.id IN (SELECT MAX(id) FROM scans GROUP BY document_id)
+                JOIN metrics_latest_scan ls ON ls.scan_id = ss.scan_id
             ''')
             total_stmts = cursor.fetchone()[0] or 0
         except Exception:
@@ -340,12 +346,10 @@ def get_metrics_dashboard():
             except Exception:
                 pass
 
-        cursor.execute('SELECT AVG(score), SUM(issue_count), SUM(word_count), MAX(scan_time) FROM scans')
-        agg = cursor.fetchone()
-        avg_score = round(agg[0], 1) if agg[0] else 0
-        total_issues = agg[1] or 0
-        total_words = agg[2] or 0
-        last_scan = agg[3] or None
+        avg_score = rollups['avg_score']
+        total_issues = rollups['total_issues']
+        total_words = rollups['total_words']
+        last_scan = rollups['last_scan_time']
         cursor.execute('SELECT AVG(word_count) FROM documents WHERE word_count > 0')
         avg_wc_row = cursor.fetchone()
         avg_word_count = round(avg_wc_row[0]) if avg_wc_row[0] else 0
@@ -367,7 +371,8 @@ def get_metrics_dashboard():
                        (SELECT COUNT(DISTINCT dr.role_id) FROM document_roles dr WHERE dr.document_id = d.id) as role_count,
                        dc.category_type, dc.function_code
                 FROM documents d
-                LEFT JOIN scans s ON s.document_id = d.id AND s.id = (SELECT MAX(id) FROM scans WHERE document_id = d.id)
+                LEFT JOIN metrics_latest_scan ls ON ls.document_id = d.id
+                LEFT JOIN scans s ON s.id = ls.scan_id
                 LEFT JOIN document_categories dc ON dc.document_id = d.id
                 ORDER BY d.filename
             ''')
@@ -387,7 +392,8 @@ def get_metrics_dashboard():
                 SELECT d.id, d.filename, d.word_count, d.scan_count, d.first_scan, d.last_scan,
                        s.score as latest_score, s.grade as latest_grade, s.issue_count
                 FROM documents d
-                LEFT JOIN scans s ON s.document_id = d.id AND s.id = (SELECT MAX(id) FROM scans WHERE document_id = d.id)
+                LEFT JOIN metrics_latest_scan ls ON ls.document_id = d.id
+                LEFT JOIN scans s ON s.id = ls.scan_id
                 ORDER BY d.filename
             ''')
             for row in cursor.fetchall():
@@ -407,7 +413,7 @@ def get_metrics_dashboard():
                    s.issue_count, s.word_count
             FROM scans s
             JOIN documents d ON d.id = s.document_id
-            ORDER BY s.scan_time DESC
+            ORDER BY s.id DESC
             LIMIT 200
         ''')
         scans = []
@@ -429,9 +435,8 @@ def get_metrics_dashboard():
             cursor.execute('''
                 SELECT ss.directive, ss.role, ss.level, ss.document_id, d.filename
                 FROM scan_statements ss
-                JOIN scans s ON s.id = ss.scan_id
+                JOIN metrics_latest_scan ls ON ls.scan_id = ss.scan_id
                 JOIN documents d ON d.id = ss.document_id
-                WHERE s.id IN (SELECT MAX(id) FROM scans GROUP BY document_id)
             ''')
             for sr in cursor.fetchall():
                 d_val = (sr['directive'] or '').lower().strip()
@@ -536,44 +541,14 @@ def get_metrics_dashboard():
             'function_coverage': func_coverage
         }
 
-        # === QUALITY ANALYSIS ===
-        cursor.execute('SELECT score FROM scans WHERE score IS NOT NULL')
-        scores = [row['score'] for row in cursor.fetchall()]
-        score_dist = {}
-        for s in scores:
-            bucket = min(s // 10 * 10, 90)
-            label = f'{bucket}-{bucket + 10}'
-            score_dist[label] = score_dist.get(label, 0) + 1
-        for i in range(0, 100, 10):
-            label = f'{i}-{i + 10}'
-            if label not in score_dist:
-                score_dist[label] = 0
-
-        cursor.execute('SELECT grade, COUNT(*) as cnt FROM scans WHERE grade IS NOT NULL GROUP BY grade')
-        grade_dist = {row['grade']: row['cnt'] for row in cursor.fetchall()}
-
-        cursor.execute('SELECT results_json FROM scans WHERE results_json IS NOT NULL ORDER BY id DESC LIMIT 100')
-        issue_cats = {}
-        top_issue_msgs = {}
-        for row in cursor.fetchall():
-            try:
-                results = json.loads(row['results_json']) if row['results_json'] else {}
-                for issue in results.get('issues', []):
-                    cat = issue.get('category', 'Unknown')
-                    issue_cats[cat] = issue_cats.get(cat, 0) + 1
-                    msg = issue.get('message', '')[:80]
-                    if msg:
-                        key = (msg, cat)
-                        top_issue_msgs[key] = top_issue_msgs.get(key, 0) + 1
-            except (json.JSONDecodeError, TypeError):
-                continue
-
+        # === QUALITY ANALYSIS (v6.3.3: all read from the rollups) ===
         data['quality'] = {
-            'score_distribution': sorted([{'range': k, 'count': v} for k, v in score_dist.items()], key=lambda x: int(x['range'].split('-')[0])),
-            'grade_distribution': grade_dist,
+            'score_distribution': rollups['score_distribution'],
+            'grade_distribution': rollups['grade_distribution'],
+            'severity_distribution': rollups['severity_distribution'],
             'score_trend': [{'scan_time': s['scan_time'], 'score': s['score'], 'filename': s['filename']} for s in reversed(scans[:50]) if s['score'] is not None],
-            'issue_categories': sorted([{'category': k, 'count': v} for k, v in issue_cats.items()], key=lambda x: -x['count'])[:15],
-            'top_issues': sorted([{'message': k[0], 'category': k[1], 'count': v} for k, v in top_issue_msgs.items()], key=lambda x: -x['count'])[:10]
+            'issue_categories': rollups['issue_categories'],
+            'top_issues': rollups['top_issues']
         }
 
         # === DOCUMENTS META (document_categories — newer table) ===
@@ -1772,7 +1747,7 @@ def factory_reset():
             try:
                 db = get_scan_history_db()
                 with db.connection() as (conn, cursor):
-                    for table in ['scan_statements', 'issue_changes', 'document_roles', 'document_categories', 'role_required_actions', 'role_function_tags', 'role_relationships', 'role_dictionary', 'function_categories', 'document_category_types', 'roles', 'scans', 'documents', 'scan_profiles']:
+                    for table in ['scan_statements', 'issue_changes', 'scan_issues', 'scan_payloads', 'scan_blobs', 'document_roles', 'document_categories', 'role_required_actions', 'role_function_tags', 'role_relationships', 'role_dictionary', 'function_categories', 'document_category_types', 'roles', 'scans', 'documents', 'scan_profiles']:
                         try:
                             cursor.execute(f'DELETE FROM {table}')
                         except Exception:
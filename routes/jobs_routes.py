@@ -6,10 +6,11 @@ Handles job management and hyperlink health validation endpoints.
 
 import json
 import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
-from flask import Blueprint, jsonify, request, send_file, g
+from flask import Blueprint, Response, jsonify, request, send_file, g, stream_with_context
 
 from routes._shared import (
     require_csrf,
@@ -17,17 +18,21 @@ from routes._shared import (
     config,
     logger,
     SessionManager,
-    ValidationError
+    ValidationError,
+    SSE_HEARTBEAT_SECONDS,
+    SSE_MAX_STREAM_SECONDS,
+    sse_stream_slot
 )
 import routes._shared as _shared
 
 
 # Import job-related utilities
 try:
-    from job_manager import get_job_manager, JobStatus
+    from job_manager import get_job_manager, JobStatus, TERMINAL_STATUSES
 except ImportError:
     get_job_manager = None
     JobStatus = None
+    TERMINAL_STATUSES = ()
 
 # Import hyperlink health utilities
 try:
@@ -346,6 +351,77 @@ def cancel_job(job_id):
             return jsonify({'success': True, 'message': f'Job {job_id} cancelled'})
 
 
+@jobs_bp.route('/api/job/<job_id>/stream', methods=['GET'])
+@handle_api_errors
+def stream_job(job_id):
+    """
+    v6.3.3: Stream job progress as Server-Sent Events.
+
+    Sends the job dict (same shape as /api/job/<job_id>) each time it
+    changes, at most a few times per second, and closes after a terminal
+    state or SSE_MAX_STREAM_SECONDS (the client reconnects). When all
+    SSE_MAX_CONCURRENT_STREAMS slots are taken it sends a single `busy`
+    event and the client polls /api/job/<job_id> instead.
+
+    Returns:
+        text/event-stream of `data: <job json>` events
+    """
+    if not _shared.JOB_MANAGER_AVAILABLE:
+        raise ProcessingError('Job manager not available', stage='job_stream')
+    else:
+        manager = get_job_manager()
+        if not manager.get_job(job_id):
+            return (jsonify({'success': False, 'error': f'Job not found: {job_id}'}), 404)
+
+        def generate():
+            with sse_stream_slot() as slot:
+                if not slot:
+                    yield 'event: busy\ndata: {}\n\n'
+                    return
+                version = -1
+                deadline = time.monotonic() + SSE_MAX_STREAM_SECONDS
+                while time.monotonic() < deadline:
+                    update = manager.wait_for_update(job_id, version, timeout=SSE_HEARTBEAT_SECONDS)
+                    if update is None:
+                        yield 'event: gone\ndata: {}\n\n'
+                        return
+                    new_version, job = update
+                    if new_version == version:
+                        yield ': keepalive\n\n'
+                        continue
+                    version = new_version
+                    yield f'id: {version}\ndata: {json.dumps(job, default=str)}\n\n'
+                    if job['status'] in {s.value for s in TERMINAL_STATUSES}:
+                        return
+
+        return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+
+@jobs_bp.route('/api/job/<job_id>/resume', methods=['POST'])
+@require_csrf
+@handle_api_errors
+def resume_job(job_id):
+    """
+    v6.3.3: Resume a job that was interrupted by a server restart.
+
+    Only job types with a registered resume handler (batch scans) can be
+    resumed; see /api/job/list?status=interrupted.
+    """
+    if not _shared.JOB_MANAGER_AVAILABLE:
+        raise ProcessingError('Job manager not available', stage='job_resume')
+    else:
+        manager = get_job_manager()
+        job = manager.get_job(job_id)
+        if not job:
+            return (jsonify({'success': False, 'error': f'Job not found: {job_id}'}), 404)
+        if not manager.is_resumable(job_id):
+            return (jsonify({'success': False, 'error': f'Job cannot be resumed (state: {job.status.value}, type: {job.job_type})'}), 400)
+        if not manager.resume_job(job_id):
+            return (jsonify({'success': False, 'error': job.error or 'Resume failed'}), 500)
+        return jsonify({'success': True, 'message': f'Job {job_id} resumed', 'job': job.to_dict()})
+
+
 @jobs_bp.route('/api/job/list', methods=['GET'])
 @handle_api_errors
 def list_jobs():
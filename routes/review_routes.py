@@ -1,4 +1,4 @@
-from flask import Blueprint, request, jsonify, g, send_file, make_response, current_app
+from flask import Blueprint, request, jsonify, g, send_file, make_response, current_app, Response, stream_with_context
 import io
 import os
 import sys
@@ -40,6 +40,9 @@ from routes._shared import (
     BATCH_SCAN_MAX_WORKERS,
     BATCH_SCAN_PER_FILE_TIMEOUT,
     BATCH_SCAN_CLEANUP_AGE,
+    SSE_HEARTBEAT_SECONDS,
+    SSE_MAX_STREAM_SECONDS,
+    sse_stream_slot,
     get_engine,
     _human_size
 )
@@ -65,11 +68,14 @@ except ImportError:
     compute_fix_statistics = None
 
 try:
-    from job_manager import get_job_manager, JobStatus, JobPhase
+    from job_manager import get_job_manager, JobStatus, JobPhase, TERMINAL_STATUSES
 except ImportError:
     get_job_manager = None
     JobStatus = None
     JobPhase = None
+    TERMINAL_STATUSES = ()
+
+from checker_scheduler import start_review_worker
 
 # v6.6.0: SP Repository Manager — persistent local copies of SP documents
 # v6.6.3: Raise recursion limit before import — scikit-learn/nltk/sentence-transformers
@@ -130,7 +136,12 @@ _FOLDER_SCAN_CLEANUP_AGE = 1800  # 30 minutes
 # Key: scan_id (str) → dict with phase, progress, per-file phases, timing info.
 # Mirrors the folder scan async pattern from v5.7.0.
 _batch_scan_state = {}
-_batch_scan_state_lock = threading.Lock()
+# v6.3.3: Re-entrant — _add_batch_activity() is called with the lock already held
+_batch_scan_state_lock = threading.RLock()
+
+# v6.3.3: Batch progress streaming / coalescing
+BATCH_PROGRESS_MIN_INTERVAL = 0.25   # per-file progress_callback writes are coalesced to this
+BATCH_STREAM_POLL_INTERVAL = 0.5     # change check for a scan without a mirrored job
 
 # =============================================================================
 # v6.3.5: SharePoint Connector Cache
@@ -1997,34 +2008,13 @@ def batch_scan_start():
     total_chunks = (total_files + BATCH_SCAN_CHUNK_SIZE - 1) // BATCH_SCAN_CHUNK_SIZE
 
     with _batch_scan_state_lock:
-        _batch_scan_state[scan_id] = {
-            'phase': 'reviewing',
-            'total_files': total_files,
-            'processed': 0,
-            'errors': 0,
-            'current_file': None,
-            'current_chunk': 0,
-            'total_chunks': total_chunks,
-            'current_files': {},    # per-file phase tracking from progress_callback
-            'documents': [],
-            'summary': {
-                'total_documents': total_files,
-                'processed': 0,
-                'errors': 0,
-                'total_issues': 0,
-                'total_words': 0,
-                'issues_by_severity': {},
-                'issues_by_category': {},
-                'grade_distribution': {},
-            },
-            'roles_found': {},
-            'started_at': time.time(),
-            'completed_at': None,
-            'elapsed_seconds': 0,
-            'estimated_remaining': None,
-            'cancelled': False,
-            'activity_log': [],
-        }
+        _batch_scan_state[scan_id] = _new_batch_scan_state(total_files, total_chunks)
+
+    # v6.3.3: Journal the scan so it can be resumed after a server restart
+    job_id = _register_batch_job(scan_id, discovery, options)
+    if job_id:
+        with _batch_scan_state_lock:
+            _batch_scan_state[scan_id]['job_id'] = job_id
 
     # Spawn background thread
     thread = threading.Thread(
@@ -2040,13 +2030,220 @@ def batch_scan_start():
         'success': True,
         'data': {
             'scan_id': scan_id,
+            'job_id': job_id,
             'total_files': total_files,
             'total_chunks': total_chunks,
             'discovery': discovery,
+            'stream_url': f'/api/review/batch-progress/{scan_id}/stream',
         }
     })
 
 
+def _new_batch_scan_state(total_files, total_chunks, completed_paths=None):
+    """Initial _batch_scan_state entry for a scan of total_files files."""
+    return {
+        'phase': 'reviewing',
+        'total_files': total_files,
+        'processed': 0,
+        'errors': 0,
+        'current_file': None,
+        'current_chunk': 0,
+        'total_chunks': total_chunks,
+        'current_files': {},    # per-file phase tracking from progress_callback
+        'documents': [],
+        'summary': {
+            'total_documents': total_files,
+            'processed': 0,
+            'errors': 0,
+            'total_issues': 0,
+            'total_words': 0,
+            'issues_by_severity': {},
+            'issues_by_category': {},
+            'grade_distribution': {},
+        },
+        'roles_found': {},
+        'started_at': time.time(),
+        'completed_at': None,
+        'elapsed_seconds': 0,
+        'estimated_remaining': None,
+        'cancelled': False,
+        'activity_log': [],
+        'job_id': None,
+        # v6.3.3: files finished so far (journaled as the job checkpoint)
+        'completed_paths': list(completed_paths or []),
+    }
+
+
+# =============================================================================
+# v6.3.3: Batch scans as journaled jobs (resumable after a restart)
+# =============================================================================
+# Each async batch scan is mirrored by a 'batch_scan' JobManager job whose
+# metadata holds the discovery list and options and whose checkpoint holds
+# the files already finished. If the server stops mid-scan the journal
+# brings the job back as INTERRUPTED; POST /api/job/<job_id>/resume (or
+# JobManager.resume_interrupted) restarts it for the remaining files under
+# the same scan_id. Finished files were already recorded in scan history.
+
+def _batch_job_manager():
+    if not (_shared.JOB_MANAGER_AVAILABLE and get_job_manager):
+        return None
+    try:
+        return get_job_manager()
+    except Exception as e:
+        logger.warning(f'[BatchScan-Async] Job manager unavailable: {e}')
+        return None
+
+
+def _register_batch_job(scan_id, discovery, options):
+    """Create and start the 'batch_scan' job for a new scan; returns its job_id or None."""
+    manager = _batch_job_manager()
+    if not manager:
+        return None
+    try:
+        job_id = manager.create_job('batch_scan', metadata={
+            'scan_id': scan_id,
+            'filename': f'{len(discovery)} files',
+            'discovery': discovery,
+            'options': options,
+        })
+        manager.start_job(job_id)
+        manager.update_phase(job_id, JobPhase.CHECKING, f'Batch scan of {len(discovery)} files')
+        return job_id
+    except Exception as e:
+        logger.warning(f'[BatchScan-Async] Could not journal scan {scan_id}: {e}')
+        return None
+
+
+def _checkpoint_batch_job(scan_id):
+    """Journal finished files and overall progress after each file."""
+    with _batch_scan_state_lock:
+        state = _batch_scan_state.get(scan_id)
+        if not state or not state.get('job_id'):
+            return
+        job_id = state['job_id']
+        completed = list(state['completed_paths'])
+        done = state['processed'] + state['errors']
+        total = state['total_files']
+    manager = _batch_job_manager()
+    if manager:
+        manager.checkpoint(job_id, {'completed': completed})
+        if total:
+            manager.update_phase_progress(job_id, done / total * 100, f'Processed {done} of {total} files')
+
+
+def _touch_batch_job(job_id):
+    """Wake progress streams waiting on the scan's job after a per-file state change."""
+    manager = _batch_job_manager() if job_id else None
+    if manager:
+        manager.touch(job_id)
+
+
+def _finish_batch_job(scan_id):
+    """Move the scan's job to its terminal state once the scan phase is final."""
+    with _batch_scan_state_lock:
+        state = _batch_scan_state.get(scan_id)
+        if not state or not state.get('job_id'):
+            return
+        job_id = state['job_id']
+        phase = state['phase']
+        summary = dict(state['summary'])
+        error_message = state.get('error_message', 'Unknown error')
+    manager = _batch_job_manager()
+    if not manager:
+        return
+    if phase == 'complete':
+        manager.complete_job(job_id, result={'scan_id': scan_id, 'summary': summary})
+    elif phase == 'cancelled':
+        manager.cancel_job(job_id)
+    elif phase == 'error':
+        manager.fail_job(job_id, error_message)
+
+
+def _resume_batch_scan(job):
+    """JobManager resume handler: restart an interrupted batch scan for its unfinished files."""
+    scan_id = job.metadata['scan_id']
+    options = job.metadata.get('options', {})
+    done = set(job.checkpoint.get('completed', []))
+    remaining = [f for f in job.metadata.get('discovery', [])
+                 if f['filepath'] not in done and Path(f['filepath']).exists()]
+    if not remaining:
+        raise ValidationError('No unfinished files left to scan')
+
+    total_chunks = (len(remaining) + BATCH_SCAN_CHUNK_SIZE - 1) // BATCH_SCAN_CHUNK_SIZE
+    state = _new_batch_scan_state(len(remaining), total_chunks, completed_paths=done)
+    state['job_id'] = job.job_id
+    with _batch_scan_state_lock:
+        _batch_scan_state[scan_id] = state
+    _add_batch_activity(scan_id, 'scan_resumed',
+                        f'Resumed after restart: {len(done)} files already done, '
+                        f'{len(remaining)} remaining')
+
+    manager = _batch_job_manager()
+    manager.start_job(job.job_id)
+    manager.update_phase(job.job_id, JobPhase.CHECKING, f'Resumed: {len(remaining)} files remaining')
+
+    threading.Thread(
+        target=_process_batch_scan_async,
+        args=(scan_id, remaining, options),
+        daemon=True
+    ).start()
+    logger.info(f'[BatchScan-Async] Resumed {scan_id} (job {job.job_id}): {len(remaining)} files')
+
+
+if get_job_manager is not None:
+    try:
+        get_job_manager().register_resume_handler('batch_scan', _resume_batch_scan)
+    except Exception as e:
+        logger.warning(f'[BatchScan-Async] Could not register resume handler: {e}')
+
+
+def _batch_progress_payload(scan_id, state, since):
+    """Response body for batch progress (caller holds _batch_scan_state_lock)."""
+    docs = list(state['documents'][since:])
+
+    # v5.7.1 pattern: Compute elapsed_seconds LIVE from started_at
+    if state['phase'] == 'reviewing' and state.get('started_at'):
+        live_elapsed = round(time.time() - state['started_at'], 1)
+    else:
+        live_elapsed = state['elapsed_seconds']
+
+    response = {
+        'scan_id': scan_id,
+        'phase': state['phase'],
+        'total_files': state['total_files'],
+        'processed': state['processed'],
+        'errors': state['errors'],
+        'current_file': state['current_file'],
+        'current_chunk': state['current_chunk'],
+        'total_chunks': state['total_chunks'],
+        'current_files': dict(state.get('current_files', {})),
+        'elapsed_seconds': live_elapsed,
+        'estimated_remaining': state['estimated_remaining'],
+        'summary': dict(state['summary']),
+        'total_documents_ready': len(state['documents']),
+        'documents': docs,
+        'since': since,
+        'cancelled': state.get('cancelled', False),
+        'activity_log': list(state.get('activity_log', [])[-50:]),  # Last 50 entries
+    }
+    if state['phase'] == 'error':
+        response['error_message'] = state.get('error_message', 'Unknown error')
+    if state['phase'] == 'complete':
+        response['roles_found'] = dict(state.get('roles_found', {}))
+    return response
+
+
+def _batch_state_signature(state):
+    """Cheap fingerprint of everything the progress UI renders (elapsed time excluded)."""
+    return (
+        state['phase'], state['processed'], state['errors'], len(state['documents']),
+        len(state.get('activity_log', [])), state['current_chunk'], state['current_file'],
+        state.get('cancelled', False), state['estimated_remaining'],
+        tuple((name, info.get('phase'), info.get('progress'))
+              for name, info in state.get('current_files', {}).items()),
+    )
+
+
 @review_bp.route('/api/review/batch-progress/<scan_id>', methods=['GET'])
 @handle_api_errors
 def batch_scan_progress(scan_id):
@@ -2077,39 +2274,90 @@ def batch_scan_progress(scan_id):
     since = request.args.get('since', 0, type=int)
 
     with _batch_scan_state_lock:
-        docs = list(state['documents'][since:])
+        response = _batch_progress_payload(scan_id, state, since)
 
-        # v5.7.1 pattern: Compute elapsed_seconds LIVE from started_at
-        if state['phase'] == 'reviewing' and state.get('started_at'):
-            live_elapsed = round(time.time() - state['started_at'], 1)
-        else:
-            live_elapsed = state['elapsed_seconds']
+    return jsonify({'success': True, 'data': response})
 
-        response = {
-            'scan_id': scan_id,
-            'phase': state['phase'],
-            'total_files': state['total_files'],
-            'processed': state['processed'],
-            'errors': state['errors'],
-            'current_file': state['current_file'],
-            'current_chunk': state['current_chunk'],
-            'total_chunks': state['total_chunks'],
-            'current_files': dict(state.get('current_files', {})),
-            'elapsed_seconds': live_elapsed,
-            'estimated_remaining': state['estimated_remaining'],
-            'summary': dict(state['summary']),
-            'total_documents_ready': len(state['documents']),
-            'documents': docs,
-            'since': since,
-            'cancelled': state.get('cancelled', False),
-            'activity_log': list(state.get('activity_log', [])[-50:]),  # Last 50 entries
-        }
-        if state['phase'] == 'error':
-            response['error_message'] = state.get('error_message', 'Unknown error')
-        if state['phase'] == 'complete':
-            response['roles_found'] = dict(state.get('roles_found', {}))
 
-    return jsonify({'success': True, 'data': response})
+@review_bp.route('/api/review/batch-progress/<scan_id>/stream', methods=['GET'])
+@handle_api_errors
+def batch_scan_progress_stream(scan_id):
+    """
+    v6.3.3: Stream async batch scan progress as Server-Sent Events.
+
+    Pushes the same payload as /batch-progress whenever the scan state
+    changes, with only the documents completed since the previous event.
+    Changes are awaited on the scan's mirrored 'batch_scan' job
+    (JobManager.wait_for_update, like /api/job/<job_id>/stream); only a scan
+    without a job falls back to checking every BATCH_STREAM_POLL_INTERVAL.
+    Each event id is the running document count, so an EventSource
+    reconnect (after SSE_MAX_STREAM_SECONDS) resumes from Last-Event-ID.
+    The stream ends after complete/error/cancelled. When no stream slot is
+    free it sends a single `busy` event and the client polls instead.
+
+    Query Params:
+        since (int): Start after this many completed documents
+    """
+    with _batch_scan_state_lock:
+        exists = scan_id in _batch_scan_state
+
+    if not exists:
+        return jsonify({
+            'success': False,
+            'error': {'message': f'Batch scan {scan_id} not found', 'code': 'SCAN_NOT_FOUND'}
+        }), 404
+
+    last_event_id = request.headers.get('Last-Event-ID', '')
+    since = int(last_event_id) if last_event_id.isdigit() else request.args.get('since', 0, type=int)
+
+    def generate():
+        with sse_stream_slot() as slot:
+            if not slot:
+                yield 'event: busy\ndata: {}\n\n'
+                return
+            cursor = since
+            last_signature = None
+            version = -1
+            manager = _batch_job_manager()
+            last_sent = time.monotonic()
+            deadline = last_sent + SSE_MAX_STREAM_SECONDS
+            while time.monotonic() < deadline:
+                # Snapshot under the lock; never yield while holding it
+                payload = None
+                with _batch_scan_state_lock:
+                    state = _batch_scan_state.get(scan_id)
+                    job_id = state.get('job_id') if state else None
+                    if state is not None:
+                        signature = _batch_state_signature(state)
+                        if signature != last_signature:
+                            last_signature = signature
+                            payload = _batch_progress_payload(scan_id, state, cursor)
+
+                if state is None:
+                    yield 'event: gone\ndata: {}\n\n'
+                    return
+                if payload is not None:
+                    cursor = payload['total_documents_ready']
+                    last_sent = time.monotonic()
+                    yield f'id: {cursor}\ndata: {json.dumps(payload, default=str)}\n\n'
+                    if payload['phase'] in ('complete', 'error', 'cancelled'):
+                        return
+                elif time.monotonic() - last_sent >= SSE_HEARTBEAT_SECONDS:
+                    last_sent = time.monotonic()
+                    yield ': keepalive\n\n'
+
+                update = None
+                if manager and job_id:
+                    wait = max(0.0, SSE_HEARTBEAT_SECONDS - (time.monotonic() - last_sent))
+                    update = manager.wait_for_update(job_id, version, timeout=wait)
+                if update is None or update[1]['status'] in {s.value for s in TERMINAL_STATUSES}:
+                    # No mirrored job (or it already finished): re-check on a timer
+                    time.sleep(BATCH_STREAM_POLL_INTERVAL)
+                else:
+                    version = update[0]
+
+    return Response(stream_with_context(generate()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
 
 
 @review_bp.route('/api/review/batch-cancel/<scan_id>', methods=['POST'])
@@ -2185,6 +2433,7 @@ def _update_batch_state_with_result(scan_id, result, options, flask_app):
 
             # Remove from per-file phase tracking (file is done)
             state['current_files'].pop(filename, None)
+            state['completed_paths'].append(result.get('filepath', ''))
 
             if result.get('status') == 'error':
                 state['errors'] += 1
@@ -2294,6 +2543,11 @@ def _update_batch_state_with_result(scan_id, result, options, flask_app):
         logger.error(f'[BatchScan-Async] Fatal error in _update_batch_state_with_result: {outer_e}\n'
                      f'{traceback.format_exc()}')
 
+    try:
+        _checkpoint_batch_job(scan_id)
+    except Exception as e:
+        logger.warning(f'[BatchScan-Async] Checkpoint failed for {scan_id}: {e}')
+
 
 def _process_batch_scan_async(scan_id, discovery, options):
     """
@@ -2326,17 +2580,27 @@ def _process_batch_scan_async(scan_id, discovery, options):
 
         try:
             # v6.2.0: Wire progress_callback for per-file phase tracking
+            # v6.3.3: Coalesced — within a phase, at most one state write per
+            # BATCH_PROGRESS_MIN_INTERVAL instead of one lock round-trip per tick
+            last_write = {'phase': None, 'at': 0.0}
+
             def progress_cb(phase, progress, message):
                 """Called by core.py review_document() during processing phases."""
+                now = time.monotonic()
+                if phase == last_write['phase'] and now - last_write['at'] < BATCH_PROGRESS_MIN_INTERVAL:
+                    return
+                last_write['phase'], last_write['at'] = phase, now
                 try:
                     with _batch_scan_state_lock:
                         state = _batch_scan_state.get(scan_id)
+                        job_id = state.get('job_id') if state else None
                         if state:
                             state['current_files'][filename] = {
                                 'phase': phase,       # extracting, parsing, checking, postprocessing
                                 'progress': progress,  # 0-100
                                 'message': message,
                             }
+                    _touch_batch_job(job_id)
                 except Exception:
                     pass  # Never let callback errors affect the scan
 
@@ -2484,7 +2748,9 @@ def _process_batch_scan_async(scan_id, discovery, options):
                     _add_batch_activity(scan_id, 'scan_cancelled',
                                         f'Cancelled after {state["processed"]} files')
                     logger.info(f'[BatchScan-Async] {scan_id} cancelled by user')
-                    return
+            if state and state.get('cancelled'):
+                _finish_batch_job(scan_id)
+                return
 
             logger.info(f'[BatchScan-Async] {scan_id} chunk {chunk_idx + 1}/{len(chunks)} ({len(chunk)} files)')
 
@@ -2593,6 +2859,7 @@ def _process_batch_scan_async(scan_id, discovery, options):
                                     f'{state["summary"]["errors"]} errors, '
                                     f'{state["summary"]["total_issues"]} total issues in '
                                     f'{state["elapsed_seconds"]}s')
+        _finish_batch_job(scan_id)
 
     except Exception as e:
         logger.error(f'[BatchScan-Async] {scan_id} fatal error: {e}\n{traceback.format_exc()}')
@@ -2604,6 +2871,7 @@ def _process_batch_scan_async(scan_id, discovery, options):
                 state['completed_at'] = time.time()
                 state['elapsed_seconds'] = round(time.time() - state['started_at'], 1)
                 _add_batch_activity(scan_id, 'scan_error', f'Fatal error: {str(e)[:100]}')
+        _finish_batch_job(scan_id)
 
 
 # =============================================================================
@@ -4829,13 +5097,13 @@ def review_start():
         progress_queue = multiprocessing.Queue(maxsize=500)
 
         # Start worker PROCESS (separate GIL - won't block Flask)
-        worker = multiprocessing.Process(
-            target=_review_worker_process,
+        # v6.3.3: Non-daemonic so the checker scheduler inside it can start its
+        # process pool; live workers are terminated at exit by checker_scheduler.
+        worker = start_review_worker(
+            _review_worker_process,
             args=(str(filepath), original_filename, options, progress_queue, result_file),
-            daemon=True,
             name=f'review-worker-{job_id}'
         )
-        worker.start()
         logger.info(f'Started review worker PROCESS (PID {worker.pid}) for job {job_id}')
 
         # Start monitor THREAD (lightweight - just reads queue and updates state)
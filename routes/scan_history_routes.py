@@ -26,6 +26,12 @@ def get_scan_history_db():
     return _get_db()
 
 
+def load_scan_results(cursor, scan_id, results_json, **kwargs):
+    """Reassemble stored scan results (v6.3.3 normalized storage)."""
+    from scan_history import load_scan_results as _load
+    return _load(cursor, scan_id, results_json, **kwargs)
+
+
 def get_document_extractor(filepath, analyze_quality=False):
     """Get document extractor for file."""
     from routes._shared import get_document_extractor as _get_extractor
@@ -272,14 +278,14 @@ def api_scan_history_document_text():
         with db.connection() as (conn, cursor):
             if scan_id:
                 cursor.execute('''
-                    SELECT s.results_json, d.filename
+                    SELECT s.id, s.results_json, d.filename
                     FROM scans s
                     JOIN documents d ON s.document_id = d.id
                     WHERE s.id = ?
                 ''', (int(scan_id),))
             elif doc_id:
                 cursor.execute('''
-                    SELECT s.results_json, d.filename
+                    SELECT s.id, s.results_json, d.filename
                     FROM scans s
                     JOIN documents d ON s.document_id = d.id
                     WHERE d.id = ?
@@ -287,25 +293,25 @@ def api_scan_history_document_text():
                 ''', (int(doc_id),))
             else:
                 cursor.execute('''
-                    SELECT s.results_json, d.filename
+                    SELECT s.id, s.results_json, d.filename
                     FROM scans s
                     JOIN documents d ON s.document_id = d.id
                     WHERE d.filename = ?
                     ORDER BY s.scan_time DESC LIMIT 1
                 ''', (filename,))
             row = cursor.fetchone()
+            try:
+                results = load_scan_results(cursor, row[0], row[1], include_issues=False) if row else {}
+            except json.JSONDecodeError:
+                return (jsonify({'success': False, 'error': 'Could not parse scan results'}), 500)
         if not row:
             return (jsonify({'success': False, 'error': 'Document not found'}), 404)
-        results_json, doc_filename = row
-        try:
-            results = json.loads(results_json) if results_json else {}
-            full_text = results.get('full_text', '')
-            if not full_text:
-                return (jsonify({'success': False, 'error': 'Document text not available in scan history', 'filename': doc_filename}), 404)
-            html_preview = results.get('html_preview', '')
-            return jsonify({'success': True, 'text': full_text, 'html_preview': html_preview, 'format': 'html' if html_preview else 'text', 'filename': doc_filename, 'word_count': len(full_text.split())})
-        except json.JSONDecodeError:
-            return (jsonify({'success': False, 'error': 'Could not parse scan results'}), 500)
+        doc_filename = row[2]
+        full_text = results.get('full_text', '')
+        if not full_text:
+            return (jsonify({'success': False, 'error': 'Document text not available in scan history', 'filename': doc_filename}), 404)
+        html_preview = results.get('html_preview', '')
+        return jsonify({'success': True, 'text': full_text, 'html_preview': html_preview, 'format': 'html' if html_preview else 'text', 'filename': doc_filename, 'word_count': len(full_text.split())})
     except Exception as e:
         return (jsonify({'success': False, 'error': str(e)}), 500)
 
@@ -10,6 +10,7 @@ Features:
 - Custom scan profiles (saved check configurations)
 - Document-Role relationship tracking
 - SHAREABLE ROLE DICTIONARIES for team distribution
+- Normalized, compressed scan result storage (v6.3.3)
 
 Author: TechWriterReview
 """
@@ -19,6 +20,7 @@ import re
 import json
 import sqlite3
 import hashlib
+import zlib
 from contextlib import contextmanager
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -45,13 +47,22 @@ def _log(msg: str, level: str = 'info'):
 # DATABASE CONNECTION CONTEXT MANAGER
 # ============================================================
 
+try:
+    from sqlite_pool import get_pool
+except ImportError:
+    get_pool = None
+
+
 @contextmanager
 def db_connection(db_path):
     """Context manager for SQLite database operations.
 
-    Creates a connection with Row factory and WAL mode enabled.
-    Auto-commits on success, auto-rolls-back on exception,
-    and always closes the connection.
+    Uses this thread's pooled connection (Row factory, WAL, tuned PRAGMAs —
+    see sqlite_pool). Auto-commits on success and auto-rolls-back on
+    exception; nested blocks on one thread become savepoints.
+
+    v6.3.3: Connections are reused per thread instead of opened and closed
+    on every call.
 
     Usage:
         with db_connection(db.db_path) as (conn, cursor):
@@ -61,6 +72,11 @@ def db_connection(db_path):
     Yields:
         Tuple of (connection, cursor)
     """
+    if get_pool is not None:
+        with get_pool(db_path).transaction() as handles:
+            yield handles
+        return
+
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     conn.execute('PRAGMA journal_mode=WAL')
@@ -75,6 +91,270 @@ def db_connection(db_path):
         conn.close()
 
 
+# ============================================================
+# NORMALIZED SCAN RESULT STORAGE (v6.3.3)
+# ============================================================
+# scans.results_json used to hold json.dumps(results) verbatim — every issue
+# plus full_text, paragraphs and html_preview — and each rescan re-parsed the
+# whole previous blob just to fingerprint issues. Now:
+#   - issues live in scan_issues, one row each, with a precomputed fingerprint
+#   - large text payloads are zlib-compressed into scan_blobs once per content
+#     hash (rescans of an unchanged document share them) and linked to scans
+#     through scan_payloads
+#   - results_json keeps only the small remainder, tagged with STORAGE_MARKER
+# load_scan_results() reassembles the original dict for readers; rows written
+# before the migration (no marker) are returned as-is.
+
+STORAGE_MARKER = '_storage'
+STORAGE_VERSION = 1
+LARGE_RESULT_FIELDS = ('full_text', 'clean_full_text', 'html_preview', 'paragraphs', 'headings')
+_NORMALIZED_PREFIX = '{"%s":' % STORAGE_MARKER
+
+
+def issue_fingerprint(issue: Dict) -> str:
+    """Stable fingerprint used for rescan change detection (category, message prefix, paragraph)."""
+    key = [issue.get('category', ''), (issue.get('message') or '')[:50], issue.get('paragraph_index', 0)]
+    return hashlib.sha1(json.dumps(key, default=str).encode('utf-8')).hexdigest()
+
+
+def _store_payload(cursor, value) -> str:
+    """Store a JSON-serializable value compressed, once per content hash."""
+    raw = json.dumps(value).encode('utf-8')
+    content_hash = hashlib.sha256(raw).hexdigest()
+    cursor.execute('''
+        INSERT OR IGNORE INTO scan_blobs (content_hash, encoding, raw_size, data)
+        VALUES (?, 'zlib', ?, ?)
+    ''', (content_hash, len(raw), zlib.compress(raw, 6)))
+    return content_hash
+
+
+def _load_payload(cursor, content_hash: str):
+    cursor.execute('SELECT encoding, data FROM scan_blobs WHERE content_hash = ?', (content_hash,))
+    row = cursor.fetchone()
+    if not row:
+        return None
+    data = zlib.decompress(row[1]) if row[0] == 'zlib' else row[1]
+    return json.loads(data)
+
+
+def write_scan_results(cursor, scan_id: int, results: Dict) -> str:
+    """
+    Write issues and large payloads for `scan_id` to their own tables.
+
+    Returns:
+        The slim results_json to store on the scans row
+    """
+    slim = {STORAGE_MARKER: STORAGE_VERSION}
+    payloads = {}
+    for key, value in results.items():
+        if key == 'issues':
+            continue
+        if key in LARGE_RESULT_FIELDS and value:
+            payloads[key] = value
+        else:
+            slim[key] = value
+
+    cursor.executemany('''
+        INSERT INTO scan_issues (scan_id, seq, fingerprint, category, severity,
+                                 paragraph_index, message, issue_json)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', [
+        (scan_id, seq, issue_fingerprint(issue), issue.get('category', ''),
+         issue.get('severity', ''), issue.get('paragraph_index'),
+         issue.get('message', ''), json.dumps(issue))
+        for seq, issue in enumerate(results.get('issues') or [])
+    ])
+    for field, value in payloads.items():
+        cursor.execute('''
+            INSERT OR REPLACE INTO scan_payloads (scan_id, field, content_hash)
+            VALUES (?, ?, ?)
+        ''', (scan_id, field, _store_payload(cursor, value)))
+    return json.dumps(slim)
+
+
+def load_scan_results(cursor, scan_id: int, results_json: Optional[str],
+                      include_issues: bool = True, include_text: bool = True) -> Dict:
+    """
+    Rebuild the results dict recorded for a scan.
+
+    Args:
+        cursor: sqlite3 cursor or connection on the scan history database
+        scan_id: scans.id of the row
+        results_json: That row's results_json column
+        include_issues: Load the issue list from scan_issues
+        include_text: Load full_text / paragraphs / html_preview payloads
+
+    Raises:
+        json.JSONDecodeError: if results_json is not valid JSON
+    """
+    if not results_json:
+        return {}
+    results = json.loads(results_json)
+    if not isinstance(results, dict) or results.pop(STORAGE_MARKER, None) is None:
+        return results  # Pre-v6.3.3 row: the full blob
+
+    if include_issues:
+        rows = cursor.execute(
+            'SELECT issue_json FROM scan_issues WHERE scan_id = ? ORDER BY seq', (scan_id,)
+        ).fetchall()
+        results['issues'] = [json.loads(r[0]) for r in rows]
+    if include_text:
+        refs = cursor.execute(
+            'SELECT field, content_hash FROM scan_payloads WHERE scan_id = ?', (scan_id,)
+        ).fetchall()
+        for field, content_hash in refs:
+            value = _load_payload(cursor, content_hash)
+            if value is not None:
+                results[field] = value
+    return results
+
+
+# ============================================================
+# MATERIALIZED METRICS ROLLUPS (v6.3.3)
+# ============================================================
+# /api/metrics/dashboard used to aggregate over every scan on each load:
+# AVG/SUM over scans, a Python pass over every score, a correlated
+# MAX(id) subquery per document, and json.loads of the last 100 full
+# result blobs for issue categories. The same numbers are now maintained
+# incrementally by record_scan / delete_scan:
+#   - metrics_totals: one row of running sums (scans, scores, issues, words)
+#   - metrics_rollup: (dimension, bucket, category) -> count for the score
+#     buckets, grades, issue categories, severities and top issue messages
+#   - metrics_latest_scan: document_id -> newest scan id
+# ScanHistoryDB.rebuild_metrics_rollups() recomputes them from scratch.
+
+ROLLUP_SCORE = 'score'
+ROLLUP_GRADE = 'grade'
+ROLLUP_CATEGORY = 'category'
+ROLLUP_SEVERITY = 'severity'
+ROLLUP_MESSAGE = 'message'
+ROLLUP_MESSAGE_LENGTH = 80
+
+
+def score_bucket(score) -> Optional[str]:
+    """Dashboard score range label ('80-90'; 90+ folds into '90-100')."""
+    if score is None:
+        return None
+    try:
+        low = min(int(score) // 10 * 10, 90)
+    except (TypeError, ValueError):
+        return None
+    return f'{low}-{low + 10}'
+
+
+def _issue_rollup_keys(category, severity, message) -> List[tuple]:
+    """(dimension, bucket, category) keys one issue contributes to."""
+    category = category or 'Unknown'
+    keys = [(ROLLUP_CATEGORY, category, ''), (ROLLUP_SEVERITY, severity or 'Unknown', '')]
+    message = (message or '')[:ROLLUP_MESSAGE_LENGTH]
+    if message:
+        keys.append((ROLLUP_MESSAGE, message, category))
+    return keys
+
+
+def _bump_rollups(cursor, counts: Dict[tuple, int]):
+    """Add `counts` ({(dimension, bucket, category): delta}) to metrics_rollup."""
+    rows = [(d, b, c) for (d, b, c), delta in counts.items() if delta]
+    if not rows:
+        return
+    cursor.executemany('''
+        INSERT OR IGNORE INTO metrics_rollup (dimension, bucket, category, count)
+        VALUES (?, ?, ?, 0)
+    ''', rows)
+    cursor.executemany('''
+        UPDATE metrics_rollup SET count = count + ?
+        WHERE dimension = ? AND bucket = ? AND category = ?
+    ''', [(delta, d, b, c) for (d, b, c), delta in counts.items() if delta])
+    if any(delta < 0 for delta in counts.values()):
+        cursor.execute('DELETE FROM metrics_rollup WHERE count <= 0')
+
+
+def apply_scan_rollups(cursor, scan: Dict, issues: List[tuple], sign: int = 1):
+    """
+    Add (sign=1) or remove (sign=-1) one scan's contribution to the rollups.
+
+    Args:
+        cursor: cursor inside the transaction that writes/deletes the scan
+        scan: dict with score, grade, issue_count, word_count
+        issues: (category, severity, message) per issue
+    """
+    score = scan.get('score')
+    cursor.execute('INSERT OR IGNORE INTO metrics_totals (id) VALUES (1)')
+    cursor.execute('''
+        UPDATE metrics_totals
+        SET scan_count = scan_count + ?,
+            scored_count = scored_count + ?,
+            score_sum = score_sum + ?,
+            issue_sum = issue_sum + ?,
+            word_sum = word_sum + ?
+        WHERE id = 1
+    ''', (sign, sign if score is not None else 0, sign * (score or 0),
+          sign * (scan.get('issue_count') or 0), sign * (scan.get('word_count') or 0)))
+
+    counts: Dict[tuple, int] = {}
+    bucket = score_bucket(score)
+    if bucket:
+        counts[(ROLLUP_SCORE, bucket, '')] = sign
+    if scan.get('grade') is not None:
+        counts[(ROLLUP_GRADE, scan['grade'], '')] = sign
+    for category, severity, message in issues:
+        for key in _issue_rollup_keys(category, severity, message):
+            counts[key] = counts.get(key, 0) + sign
+    _bump_rollups(cursor, counts)
+
+
+def read_metrics_rollups(cursor, top_categories: int = 15, top_messages: int = 10) -> Dict[str, Any]:
+    """
+    Dashboard aggregates from the rollup tables (no scan-sized work).
+
+    Returns:
+        Dict with total_scans, avg_score, total_issues, total_words,
+        last_scan_time, score_distribution, grade_distribution,
+        severity_distribution, issue_categories and top_issues
+    """
+    cursor.execute('SELECT scan_count, scored_count, score_sum, issue_sum, word_sum '
+                   'FROM metrics_totals WHERE id = 1')
+    row = cursor.fetchone()
+    scan_count, scored, score_sum, issue_sum, word_sum = row if row else (0, 0, 0, 0, 0)
+    cursor.execute('SELECT scan_time FROM scans ORDER BY id DESC LIMIT 1')
+    last = cursor.fetchone()
+
+    def _dimension(dimension, limit=None):
+        sql = ('SELECT bucket, category, count FROM metrics_rollup WHERE dimension = ? '
+               'ORDER BY count DESC, bucket')
+        if limit:
+            sql += f' LIMIT {int(limit)}'
+        cursor.execute(sql, (dimension,))
+        return [tuple(r) for r in cursor.fetchall()]
+
+    scores = {f'{i}-{i + 10}': 0 for i in range(0, 100, 10)}
+    scores.update({bucket: count for bucket, _, count in _dimension(ROLLUP_SCORE)})
+    return {
+        'total_scans': scan_count or 0,
+        'avg_score': round(score_sum / scored, 1) if scored and score_sum else 0,
+        'total_issues': issue_sum or 0,
+        'total_words': word_sum or 0,
+        'last_scan_time': last[0] if last else None,
+        'score_distribution': sorted([{'range': k, 'count': v} for k, v in scores.items()],
+                                     key=lambda x: int(x['range'].split('-')[0])),
+        'grade_distribution': {b: n for b, _, n in _dimension(ROLLUP_GRADE)},
+        'severity_distribution': {b: n for b, _, n in _dimension(ROLLUP_SEVERITY)},
+        'issue_categories': [{'category': b, 'count': n}
+                             for b, _, n in _dimension(ROLLUP_CATEGORY, top_categories)],
+        'top_issues': [{'message': b, 'category': c, 'count': n}
+                       for b, c, n in _dimension(ROLLUP_MESSAGE, top_messages)],
+    }
+
+
+def _role_dictionary_changed():
+    """v6.3.3: Have compiled role matchers (phrase_matcher) rebuild from the new dictionary."""
+    try:
+        from phrase_matcher import notify_dictionary_changed, ROLE_DICTIONARY
+    except ImportError:
+        return
+    notify_dictionary_changed(ROLE_DICTIONARY)
+
+
 # ============================================================
 # SHAREABLE DICTIONARY FILE SUPPORT
 # ============================================================
@@ -554,11 +834,178 @@ class ScanHistoryDB:
                 if 'duplicate column' not in str(e).lower():
                     _log(f'Migration: could not add {col_name} to scan_statements: {e}', 'warning')
 
+        # v6.3.3: Normalized scan result storage (see write_scan_results)
+        self._create_table_safe('scan_issues', '''
+                CREATE TABLE IF NOT EXISTS scan_issues (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    scan_id INTEGER NOT NULL,
+                    seq INTEGER NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    category TEXT,
+                    severity TEXT,
+                    paragraph_index INTEGER,
+                    message TEXT,
+                    issue_json TEXT,
+                    FOREIGN KEY (scan_id) REFERENCES scans(id)
+                )
+            ''',
+            'CREATE INDEX IF NOT EXISTS idx_scan_issues_scan ON scan_issues(scan_id, seq)',
+            'CREATE INDEX IF NOT EXISTS idx_scan_issues_fingerprint ON scan_issues(fingerprint)',
+            'CREATE INDEX IF NOT EXISTS idx_scan_issues_category ON scan_issues(category)')
+
+        self._create_table_safe('scan_blobs', '''
+                CREATE TABLE IF NOT EXISTS scan_blobs (
+                    content_hash TEXT PRIMARY KEY,
+                    encoding TEXT NOT NULL DEFAULT 'zlib',
+                    raw_size INTEGER,
+                    data BLOB
+                )
+            ''')
+
+        self._create_table_safe('scan_payloads', '''
+                CREATE TABLE IF NOT EXISTS scan_payloads (
+                    scan_id INTEGER NOT NULL,
+                    field TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    PRIMARY KEY (scan_id, field),
+                    FOREIGN KEY (scan_id) REFERENCES scans(id)
+                )
+            ''',
+            'CREATE INDEX IF NOT EXISTS idx_scan_payloads_hash ON scan_payloads(content_hash)')
+
+        self._migrate_scan_storage()
+
+        # v6.3.3: Materialized dashboard metrics (see apply_scan_rollups)
+        self._create_table_safe('metrics_totals', '''
+                CREATE TABLE IF NOT EXISTS metrics_totals (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    scan_count INTEGER NOT NULL DEFAULT 0,
+                    scored_count INTEGER NOT NULL DEFAULT 0,
+                    score_sum REAL NOT NULL DEFAULT 0,
+                    issue_sum INTEGER NOT NULL DEFAULT 0,
+                    word_sum INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
+
+        self._create_table_safe('metrics_rollup', '''
+                CREATE TABLE IF NOT EXISTS metrics_rollup (
+                    dimension TEXT NOT NULL,
+                    bucket TEXT NOT NULL,
+                    category TEXT NOT NULL DEFAULT '',
+                    count INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (dimension, bucket, category)
+                )
+            ''',
+            'CREATE INDEX IF NOT EXISTS idx_metrics_rollup_count ON metrics_rollup(dimension, count)')
+
+        self._create_table_safe('metrics_latest_scan', '''
+                CREATE TABLE IF NOT EXISTS metrics_latest_scan (
+                    document_id INTEGER PRIMARY KEY,
+                    scan_id INTEGER NOT NULL
+                )
+            ''',
+            'CREATE INDEX IF NOT EXISTS idx_metrics_latest_scan_scan ON metrics_latest_scan(scan_id)')
+
+        # Backfill once: the totals row only exists after a rebuild or a scan
+        try:
+            with self.connection() as (conn, cursor):
+                cursor.execute('SELECT 1 FROM metrics_totals WHERE id = 1')
+                initialized = cursor.fetchone() is not None
+            if not initialized:
+                self.rebuild_metrics_rollups()
+        except Exception as e:
+            _log(f'Migration: could not build metrics rollups: {e}', 'warning')
+
         # Seed function categories if empty (in its own transaction)
         self._seed_function_categories()
 
         _log("Database initialized")
 
+    def _migrate_scan_storage(self, batch_size: int = 50):
+        """Backfill scan_issues/scan_blobs from pre-v6.3.3 whole-result blobs.
+
+        Each batch is its own transaction, so an interrupted migration resumes
+        where it stopped on the next start. Rows whose JSON cannot be parsed
+        are left untouched (load_scan_results still reads them as before).
+        """
+        migrated = 0
+        last_id = 0
+        try:
+            while True:
+                with self.connection() as (conn, cursor):
+                    cursor.execute('''
+                        SELECT id, results_json FROM scans
+                        WHERE id > ? AND results_json IS NOT NULL
+                          AND substr(results_json, 1, ?) != ?
+                        ORDER BY id LIMIT ?
+                    ''', (last_id, len(_NORMALIZED_PREFIX), _NORMALIZED_PREFIX, batch_size))
+                    rows = cursor.fetchall()
+                    if not rows:
+                        break
+                    for scan_id, results_json in rows:
+                        last_id = scan_id
+                        try:
+                            results = json.loads(results_json)
+                        except (json.JSONDecodeError, TypeError):
+                            continue
+                        if not isinstance(results, dict):
+                            continue
+                        cursor.execute('DELETE FROM scan_issues WHERE scan_id = ?', (scan_id,))
+                        slim_json = write_scan_results(cursor, scan_id, results)
+                        cursor.execute('UPDATE scans SET results_json = ? WHERE id = ?',
+                                       (slim_json, scan_id))
+                        migrated += 1
+        except Exception as e:
+            _log(f'Migration: scan result normalization stopped after {migrated} scans: {e}', 'warning')
+            return
+        if migrated:
+            _log(f'Migration: normalized stored results for {migrated} scans')
+
+    def rebuild_metrics_rollups(self) -> Dict[str, int]:
+        """Recompute metrics_totals / metrics_rollup / metrics_latest_scan from scans and scan_issues.
+
+        Scans stored before v6.3.3 that could not be normalized contribute to
+        the totals, scores and grades but not to the issue breakdowns.
+        """
+        with self.connection() as (conn, cursor):
+            for table in ('metrics_totals', 'metrics_rollup', 'metrics_latest_scan'):
+                cursor.execute(f'DELETE FROM {table}')
+            cursor.execute('''
+                INSERT INTO metrics_totals (id, scan_count, scored_count, score_sum, issue_sum, word_sum)
+                SELECT 1, COUNT(*), COUNT(score), COALESCE(SUM(score), 0),
+                       COALESCE(SUM(issue_count), 0), COALESCE(SUM(word_count), 0)
+                FROM scans
+            ''')
+            cursor.execute('''
+                INSERT INTO metrics_latest_scan (document_id, scan_id)
+                SELECT document_id, MAX(id) FROM scans
+                WHERE document_id IS NOT NULL GROUP BY document_id
+            ''')
+
+            counts: Dict[tuple, int] = {}
+            cursor.execute('SELECT score, COUNT(*) FROM scans WHERE score IS NOT NULL GROUP BY score')
+            for score, n in cursor.fetchall():
+                bucket = score_bucket(score)
+                if bucket:
+                    counts[(ROLLUP_SCORE, bucket, '')] = counts.get((ROLLUP_SCORE, bucket, ''), 0) + n
+            cursor.execute('SELECT grade, COUNT(*) FROM scans WHERE grade IS NOT NULL GROUP BY grade')
+            for grade, n in cursor.fetchall():
+                counts[(ROLLUP_GRADE, grade, '')] = n
+            cursor.execute('''
+                SELECT category, severity, substr(message, 1, ?), COUNT(*)
+                FROM scan_issues GROUP BY 1, 2, 3
+            ''', (ROLLUP_MESSAGE_LENGTH,))
+            for category, severity, message, n in cursor.fetchall():
+                for key in _issue_rollup_keys(category, severity, message):
+                    counts[key] = counts.get(key, 0) + n
+            _bump_rollups(cursor, counts)
+
+            cursor.execute('SELECT scan_count FROM metrics_totals WHERE id = 1')
+            scans = cursor.fetchone()[0]
+        if scans:
+            _log(f'Metrics rollups rebuilt from {scans} scans')
+        return {'scans': scans, 'rollup_rows': len(counts)}
+
     def _seed_function_categories(self):
         """Seed function categories table with NGC function codes."""
         try:
@@ -745,12 +1192,13 @@ class ScanHistoryDB:
                 if prev_scan:
                     prev_scan_id = prev_scan[0]
                     prev_issue_count = prev_scan[1]
-                    prev_results = json.loads(prev_scan[2]) if prev_scan[2] else {}
 
-                    # Calculate changes
-                    changes = self._calculate_changes(
-                        prev_results.get('issues', []),
-                        results.get('issues', [])
+                    # v6.3.3: Compare precomputed fingerprints instead of
+                    # re-parsing the previous scan's full results
+                    changes = self._changes_from_fingerprints(
+                        self._get_issue_fingerprints(cursor, prev_scan_id, prev_scan[2]),
+                        [(issue_fingerprint(i), i.get('category', 'Unknown'))
+                         for i in results.get('issues', [])]
                     )
                     changes['file_changed'] = (file_hash != old_hash)
             else:
@@ -767,11 +1215,11 @@ class ScanHistoryDB:
                     ''', (filename, filepath, file_hash, word_count, paragraph_count))
                 document_id = cursor.lastrowid
 
-            # Record the scan
+            # Record the scan (v6.3.3: issues/text go to their own tables)
             cursor.execute('''
                 INSERT INTO scans (document_id, options_json, issue_count, score, grade,
-                                  word_count, paragraph_count, results_json)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                                  word_count, paragraph_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (
                 document_id,
                 json.dumps(options),
@@ -779,10 +1227,20 @@ class ScanHistoryDB:
                 score,
                 grade,
                 word_count,
-                paragraph_count,
-                json.dumps(results)
+                paragraph_count
             ))
             scan_id = cursor.lastrowid
+            cursor.execute('UPDATE scans SET results_json = ? WHERE id = ?',
+                           (write_scan_results(cursor, scan_id, results), scan_id))
+
+            # v6.3.3: Keep the dashboard rollups current in the same transaction
+            apply_scan_rollups(cursor, {
+                'score': score, 'grade': grade,
+                'issue_count': issue_count, 'word_count': word_count
+            }, [(i.get('category'), i.get('severity'), i.get('message'))
+                for i in results.get('issues') or []])
+            cursor.execute('INSERT OR REPLACE INTO metrics_latest_scan (document_id, scan_id) VALUES (?, ?)',
+                           (document_id, scan_id))
 
             # Record changes if rescan
             if is_rescan and changes:
@@ -843,46 +1301,50 @@ class ScanHistoryDB:
 
     def _calculate_changes(self, old_issues: List[Dict], new_issues: List[Dict]) -> Dict:
         """Calculate differences between two issue lists."""
-        # Create fingerprints for comparison
-        def fingerprint(issue):
-            return (
-                issue.get('category', ''),
-                issue.get('message', '')[:50],
-                issue.get('paragraph_index', 0)
-            )
-        
-        old_fps = set(fingerprint(i) for i in old_issues)
-        new_fps = set(fingerprint(i) for i in new_issues)
-        
+        return self._changes_from_fingerprints(
+            [(issue_fingerprint(i), i.get('category', 'Unknown')) for i in old_issues],
+            [(issue_fingerprint(i), i.get('category', 'Unknown')) for i in new_issues]
+        )
+
+    def _get_issue_fingerprints(self, cursor, scan_id: int, results_json: Optional[str]) -> List[tuple]:
+        """(fingerprint, category) for every issue of a stored scan."""
+        if results_json and results_json.startswith(_NORMALIZED_PREFIX):
+            cursor.execute(
+                'SELECT fingerprint, category FROM scan_issues WHERE scan_id = ?', (scan_id,))
+            return [(r[0], r[1] or 'Unknown') for r in cursor.fetchall()]
+        try:
+            issues = load_scan_results(cursor, scan_id, results_json,
+                                       include_text=False).get('issues', [])
+        except (json.JSONDecodeError, TypeError):
+            issues = []
+        return [(issue_fingerprint(i), i.get('category', 'Unknown')) for i in issues]
+
+    def _changes_from_fingerprints(self, old_rows: List[tuple], new_rows: List[tuple]) -> Dict:
+        """Added/removed/unchanged counts from (fingerprint, category) rows."""
+        old_fps = set(fp for fp, _ in old_rows)
+        new_fps = set(fp for fp, _ in new_rows)
+
         added = new_fps - old_fps
         removed = old_fps - new_fps
         unchanged = old_fps & new_fps
-        
+
         return {
             'added': len(added),
             'removed': len(removed),
             'unchanged': len(unchanged),
-            'added_categories': self._categorize_changes(new_issues, added),
-            'removed_categories': self._categorize_changes(old_issues, removed)
+            'added_categories': self._categorize_changes(new_rows, added),
+            'removed_categories': self._categorize_changes(old_rows, removed)
         }
-    
-    def _categorize_changes(self, issues: List[Dict], fingerprints: set) -> Dict[str, int]:
+
+    def _categorize_changes(self, rows: List[tuple], fingerprints: set) -> Dict[str, int]:
         """Group changes by category."""
-        def fingerprint(issue):
-            return (
-                issue.get('category', ''),
-                issue.get('message', '')[:50],
-                issue.get('paragraph_index', 0)
-            )
-        
         categories = {}
-        for issue in issues:
-            if fingerprint(issue) in fingerprints:
-                cat = issue.get('category', 'Unknown')
+        for fp, cat in rows:
+            if fp in fingerprints:
                 categories[cat] = categories.get(cat, 0) + 1
-        
+
         return categories
-    
+
     def _process_roles(self, cursor, document_id: int, roles_data: Dict):
         """Process and store role data from scan results."""
         if not roles_data:
@@ -1929,7 +2391,10 @@ class ScanHistoryDB:
         try:
             with self.connection() as (conn, cursor):
                 # First, get the document_id for this scan
-                cursor.execute('SELECT document_id FROM scans WHERE id = ?', (scan_id,))
+                cursor.execute('''
+                    SELECT document_id, score, grade, issue_count, word_count
+                    FROM scans WHERE id = ?
+                ''', (scan_id,))
                 row = cursor.fetchone()
 
                 if not row:
@@ -1937,12 +2402,27 @@ class ScanHistoryDB:
 
                 document_id = row[0]
 
+                # v6.3.3: Take this scan back out of the dashboard rollups
+                cursor.execute('SELECT category, severity, message FROM scan_issues WHERE scan_id = ?',
+                               (scan_id,))
+                apply_scan_rollups(cursor, {
+                    'score': row[1], 'grade': row[2], 'issue_count': row[3], 'word_count': row[4]
+                }, [tuple(r) for r in cursor.fetchall()], sign=-1)
+
                 # Delete issue_changes for this scan
                 cursor.execute('DELETE FROM issue_changes WHERE scan_id = ?', (scan_id,))
 
                 # Delete scan_statements for this scan (v6.3.1: prevent orphaned rows)
                 cursor.execute('DELETE FROM scan_statements WHERE scan_id = ?', (scan_id,))
 
+                # v6.3.3: Normalized issues and payload links; blobs no other scan uses
+                cursor.execute('DELETE FROM scan_issues WHERE scan_id = ?', (scan_id,))
+                cursor.execute('DELETE FROM scan_payloads WHERE scan_id = ?', (scan_id,))
+                cursor.execute('''
+                    DELETE FROM scan_blobs WHERE content_hash NOT IN
+                        (SELECT content_hash FROM scan_payloads)
+                ''')
+
                 # Delete the scan itself
                 cursor.execute('DELETE FROM scans WHERE id = ?', (scan_id,))
                 scan_deleted = cursor.rowcount > 0
@@ -1952,8 +2432,15 @@ class ScanHistoryDB:
                 remaining_scans = cursor.fetchone()[0]
 
                 document_deleted = False
-                if remaining_scans == 0:
+                if remaining_scans:
+                    cursor.execute('''
+                        UPDATE metrics_latest_scan
+                        SET scan_id = (SELECT MAX(id) FROM scans WHERE document_id = ?)
+                        WHERE document_id = ? AND scan_id = ?
+                    ''', (document_id, document_id, scan_id))
+                else:
                     # No more scans for this document - clean up
+                    cursor.execute('DELETE FROM metrics_latest_scan WHERE document_id = ?', (document_id,))
                     cursor.execute('DELETE FROM document_roles WHERE document_id = ?', (document_id,))
                     cursor.execute('DELETE FROM documents WHERE id = ?', (document_id,))
                     document_deleted = True
@@ -2573,7 +3060,7 @@ class ScanHistoryDB:
                     relationships_created += 1
 
             conn.commit()
-            return {
+            result = {
                 'success': True,
                 'roles_added': roles_added,
                 'roles_updated': roles_updated,
@@ -2583,6 +3070,8 @@ class ScanHistoryDB:
                 'tags_assigned': tags_assigned,
                 'tags_removed': 0
             }
+        _role_dictionary_changed()
+        return result
 
     def clear_sipoc_import(self) -> Dict:
         """
@@ -2608,12 +3097,14 @@ class ScanHistoryDB:
             roles_removed = cursor.rowcount
 
             conn.commit()
-            return {
+            result = {
                 'success': True,
                 'roles_removed': roles_removed,
                 'relationships_removed': rels_removed,
                 'tags_removed': tags_removed
             }
+        _role_dictionary_changed()
+        return result
 
     def get_role_graph_data(self, max_nodes: int = 100, min_weight: int = 1) -> Dict:
         """
@@ -2902,6 +3393,7 @@ class ScanHistoryDB:
                 ))
                 role_id = cursor.lastrowid
 
+            _role_dictionary_changed()
             return {
                 'success': True,
                 'id': role_id,
@@ -2958,6 +3450,8 @@ class ScanHistoryDB:
 
                 success = cursor.rowcount > 0
 
+            if success:
+                _role_dictionary_changed()
             return {
                 'success': success,
                 'updated': success
@@ -2983,6 +3477,8 @@ class ScanHistoryDB:
 
                 success = cursor.rowcount > 0
 
+            if success:
+                _role_dictionary_changed()
             return {'success': success, 'deleted': success}
         except Exception as e:
             return {'success': False, 'error': str(e)}
@@ -3132,6 +3628,7 @@ class ScanHistoryDB:
 
         # v5.9.50: Learn from adjudication decisions
         if processed > 0:
+            _role_dictionary_changed()
             try:
                 from roles_learner import learn_from_adjudication
                 learn_from_adjudication(decisions)
@@ -4692,6 +5189,7 @@ class ScanHistoryDB:
             results['skipped'] = import_result.get('skipped', 0)
             results['errors'] = import_result.get('errors', [])
         
+        _role_dictionary_changed()
         results['success'] = True
         return results
     
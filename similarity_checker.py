@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 """
-Requirement Similarity & Duplicate Detection Checker v1.0.0
+Requirement Similarity & Duplicate Detection Checker v1.1.0
 ============================================================
 Uses sentence-transformers to detect duplicate/near-duplicate requirements
 and semantically similar statements across a document.
@@ -19,6 +19,10 @@ This checker:
 5. Detects contradicting requirements (high similarity but opposite polarity)
 
 Falls back to TF-IDF + cosine similarity when sentence-transformers unavailable.
+
+v1.1.0: Blocked matrix-multiply similarity over normalized vectors (no dense
+n×n matrix, no Python pair loop), optional MinHash/LSH candidate blocking for
+5k+ requirements, and find_cross_document_duplicates() for corpus-wide checks.
 """
 
 import re
@@ -31,7 +35,7 @@ try:
 except ImportError:
     from .base_checker import BaseChecker, ReviewIssue
 
-__version__ = "1.0.0"
+__version__ = "1.1.0"
 
 # Requirement sentence patterns
 REQUIREMENT_PATTERNS = [
@@ -46,11 +50,12 @@ class RequirementSimilarityChecker(BaseChecker):
     """
 
     CHECKER_NAME = "Requirement Similarity"
-    CHECKER_VERSION = "1.0.0"
+    CHECKER_VERSION = "1.1.0"
 
     DUPLICATE_THRESHOLD = 0.92    # Very high similarity = likely duplicate
     SIMILAR_THRESHOLD = 0.80      # High similarity = related, worth reviewing
-    MAX_REQUIREMENTS = 500        # Limit for performance (pairwise = O(n²))
+    MAX_REQUIREMENTS = 50000      # v1.1.0: raised from 500 — blocked matmul is O(block × n) memory
+    LSH_MIN_REQUIREMENTS = 5000   # v1.1.0: above this, score only MinHash/LSH candidate pairs
     MIN_SENTENCE_LENGTH = 15      # Skip very short sentences
 
     def __init__(self, enabled=True):
@@ -118,41 +123,45 @@ class RequirementSimilarityChecker(BaseChecker):
         return requirements
 
     def _check_with_transformers(self, requirements):
-        """Use sentence-transformers for semantic similarity detection."""
+        """Use sentence-transformers for semantic similarity detection.
+
+        v1.1.0: Embeddings are L2-normalized once and compared with blocked
+        matrix multiplies (see similar_pairs_for()) instead of a Python double loop.
+        """
         issues = []
 
         try:
             texts = [r['text'] for r in requirements]
 
             # Encode all requirements
-            embeddings = self.model.encode(texts, show_progress_bar=False, batch_size=32)
+            embeddings = self.model.encode(texts, show_progress_bar=False, batch_size=32,
+                                           normalize_embeddings=True)
+
+            candidates = None
+            if len(texts) >= self.LSH_MIN_REQUIREMENTS:
+                candidates = minhash_candidate_pairs(texts)
 
-            # Compute pairwise cosine similarity
             duplicates_found = set()
             similar_pairs = []
 
-            for i in range(len(embeddings)):
-                for j in range(i + 1, len(embeddings)):
-                    # Cosine similarity
-                    sim = self._cosine_similarity(embeddings[i], embeddings[j])
-
-                    if sim >= self.DUPLICATE_THRESHOLD:
-                        pair_key = (min(i, j), max(i, j))
-                        if pair_key not in duplicates_found:
-                            duplicates_found.add(pair_key)
-                            issues.append(ReviewIssue(
-                                category="Requirement Similarity",
-                                severity="High",
-                                message=f"Potential DUPLICATE requirement detected (similarity: {sim:.0%}).",
-                                context=f"Req A (¶{requirements[i]['paragraph_index']}): \"{requirements[i]['text'][:120]}\" | Req B (¶{requirements[j]['paragraph_index']}): \"{requirements[j]['text'][:120]}\"",
-                                paragraph_index=requirements[i]['paragraph_index'],
-                                suggestion="Review both requirements. If they're truly duplicates, consolidate into one. If they differ, make the distinction explicit.",
-                                rule_id="SIM-DUP",
-                                flagged_text=requirements[i]['text'][:80]
-                            ))
-
-                    elif sim >= self.SIMILAR_THRESHOLD:
-                        similar_pairs.append((i, j, sim))
+            for i, j, sim in similar_pairs_for(embeddings, self.SIMILAR_THRESHOLD,
+                                               candidates=candidates):
+                if sim >= self.DUPLICATE_THRESHOLD:
+                    pair_key = (min(i, j), max(i, j))
+                    if pair_key not in duplicates_found:
+                        duplicates_found.add(pair_key)
+                        issues.append(ReviewIssue(
+                            category="Requirement Similarity",
+                            severity="High",
+                            message=f"Potential DUPLICATE requirement detected (similarity: {sim:.0%}).",
+                            context=f"Req A (¶{requirements[i]['paragraph_index']}): \"{requirements[i]['text'][:120]}\" | Req B (¶{requirements[j]['paragraph_index']}): \"{requirements[j]['text'][:120]}\"",
+                            paragraph_index=requirements[i]['paragraph_index'],
+                            suggestion="Review both requirements. If they're truly duplicates, consolidate into one. If they differ, make the distinction explicit.",
+                            rule_id="SIM-DUP",
+                            flagged_text=requirements[i]['text'][:80]
+                        ))
+                else:
+                    similar_pairs.append((i, j, sim))
 
             # Report top similar (non-duplicate) pairs
             similar_pairs.sort(key=lambda x: x[2], reverse=True)
@@ -188,59 +197,113 @@ class RequirementSimilarityChecker(BaseChecker):
         return issues
 
     def _check_with_tfidf(self, requirements):
-        """Fallback: TF-IDF based similarity detection."""
+        """Fallback: TF-IDF based similarity detection.
+
+        v1.1.0: TF-IDF rows are already L2-normalized, so similarity is computed
+        block-by-block as sparse products instead of a dense n×n matrix.
+        """
         issues = []
 
         try:
             from sklearn.feature_extraction.text import TfidfVectorizer
-            from sklearn.metrics.pairwise import cosine_similarity
 
             texts = [r['text'] for r in requirements]
             vectorizer = TfidfVectorizer(max_features=5000, stop_words='english')
             tfidf_matrix = vectorizer.fit_transform(texts)
 
-            # Compute pairwise similarity
-            sim_matrix = cosine_similarity(tfidf_matrix)
+            candidates = None
+            if len(texts) >= self.LSH_MIN_REQUIREMENTS:
+                candidates = minhash_candidate_pairs(texts)
 
             duplicates_found = set()
-
-            for i in range(len(texts)):
-                for j in range(i + 1, len(texts)):
-                    sim = sim_matrix[i][j]
-
-                    if sim >= self.DUPLICATE_THRESHOLD:
-                        pair_key = (i, j)
-                        if pair_key not in duplicates_found:
-                            duplicates_found.add(pair_key)
-                            issues.append(ReviewIssue(
-                                category="Requirement Similarity",
-                                severity="High",
-                                message=f"Potential DUPLICATE requirement (TF-IDF similarity: {sim:.0%}).",
-                                context=f"Req A (¶{requirements[i]['paragraph_index']}): \"{texts[i][:120]}\" | Req B (¶{requirements[j]['paragraph_index']}): \"{texts[j][:120]}\"",
-                                paragraph_index=requirements[i]['paragraph_index'],
-                                suggestion="Consolidate duplicate requirements or make distinctions explicit.",
-                                rule_id="SIM-DUP",
-                                flagged_text=texts[i][:80]
-                            ))
-
-                    elif sim >= self.SIMILAR_THRESHOLD:
-                        if len([iss for iss in issues if iss.rule_id == 'SIM-HIGH']) < 10:
-                            issues.append(ReviewIssue(
-                                category="Requirement Similarity",
-                                severity="Medium",
-                                message=f"Similar requirements detected (TF-IDF: {sim:.0%}).",
-                                context=f"Req A (¶{requirements[i]['paragraph_index']}): \"{texts[i][:120]}\" | Req B (¶{requirements[j]['paragraph_index']}): \"{texts[j][:120]}\"",
-                                paragraph_index=requirements[i]['paragraph_index'],
-                                suggestion="Verify these are intentionally distinct requirements.",
-                                rule_id="SIM-HIGH",
-                                flagged_text=texts[i][:80]
-                            ))
+            similar_count = 0
+
+            for i, j, sim in similar_pairs_for(tfidf_matrix, self.SIMILAR_THRESHOLD,
+                                               candidates=candidates):
+                if sim >= self.DUPLICATE_THRESHOLD:
+                    pair_key = (i, j)
+                    if pair_key not in duplicates_found:
+                        duplicates_found.add(pair_key)
+                        issues.append(ReviewIssue(
+                            category="Requirement Similarity",
+                            severity="High",
+                            message=f"Potential DUPLICATE requirement (TF-IDF similarity: {sim:.0%}).",
+                            context=f"Req A (¶{requirements[i]['paragraph_index']}): \"{texts[i][:120]}\" | Req B (¶{requirements[j]['paragraph_index']}): \"{texts[j][:120]}\"",
+                            paragraph_index=requirements[i]['paragraph_index'],
+                            suggestion="Consolidate duplicate requirements or make distinctions explicit.",
+                            rule_id="SIM-DUP",
+                            flagged_text=texts[i][:80]
+                        ))
+
+                elif similar_count < 10:
+                    similar_count += 1
+                    issues.append(ReviewIssue(
+                        category="Requirement Similarity",
+                        severity="Medium",
+                        message=f"Similar requirements detected (TF-IDF: {sim:.0%}).",
+                        context=f"Req A (¶{requirements[i]['paragraph_index']}): \"{texts[i][:120]}\" | Req B (¶{requirements[j]['paragraph_index']}): \"{texts[j][:120]}\"",
+                        paragraph_index=requirements[i]['paragraph_index'],
+                        suggestion="Verify these are intentionally distinct requirements.",
+                        rule_id="SIM-HIGH",
+                        flagged_text=texts[i][:80]
+                    ))
 
         except ImportError:
             pass
 
         return issues
 
+    def find_cross_document_duplicates(self, documents: Dict[str, List[Tuple[int, str]]],
+                                       threshold: float = None) -> List[Dict]:
+        """
+        Find near-duplicate requirements across a corpus of documents.
+
+        Args:
+            documents: {document_name: [(paragraph_index, text), ...]}
+            threshold: Minimum similarity (defaults to SIMILAR_THRESHOLD)
+
+        Returns:
+            List of pair dicts (document/paragraph/text for both sides plus
+            similarity), ordered by descending similarity. Pairs within the
+            same document are excluded — check() already reports those.
+        """
+        threshold = self.SIMILAR_THRESHOLD if threshold is None else threshold
+        requirements = []
+        for doc_name, paragraphs in documents.items():
+            for req in self._extract_requirements(paragraphs):
+                req['document'] = doc_name
+                requirements.append(req)
+        if len(requirements) < 2:
+            return []
+
+        texts = [r['text'] for r in requirements]
+        if self.st_available and self.model is not None:
+            vectors = self.model.encode(texts, show_progress_bar=False, batch_size=32,
+                                        normalize_embeddings=True)
+        else:
+            try:
+                from sklearn.feature_extraction.text import TfidfVectorizer
+            except ImportError:
+                return []
+            vectors = TfidfVectorizer(max_features=5000, stop_words='english').fit_transform(texts)
+
+        candidates = None
+        if len(texts) >= self.LSH_MIN_REQUIREMENTS:
+            candidates = minhash_candidate_pairs(texts)
+
+        pairs = []
+        for i, j, sim in similar_pairs_for(vectors, threshold, candidates=candidates):
+            a, b = requirements[i], requirements[j]
+            if a['document'] == b['document']:
+                continue
+            pairs.append({
+                'similarity': round(sim, 4),
+                'document_a': a['document'], 'paragraph_a': a['paragraph_index'], 'text_a': a['text'],
+                'document_b': b['document'], 'paragraph_b': b['paragraph_index'], 'text_b': b['text'],
+            })
+        pairs.sort(key=lambda p: p['similarity'], reverse=True)
+        return pairs
+
     def _cosine_similarity(self, a, b):
         """Compute cosine similarity between two vectors."""
         dot = sum(x * y for x, y in zip(a, b))
@@ -251,6 +314,161 @@ class RequirementSimilarityChecker(BaseChecker):
         return dot / (norm_a * norm_b)
 
 
+# =============================================================================
+# v1.1.0: SCALABLE PAIR SEARCH
+# =============================================================================
+# similar_pairs_for() compares L2-normalized rows (dense embeddings or sparse
+# TF-IDF) in row blocks, so memory is O(block × n) instead of O(n²). For very
+# large inputs a MinHash/LSH blocking stage limits scoring to candidate pairs
+# that share enough vocabulary. Pairs are always yielded in (i, j) order with
+# i < j, matching the original nested loops.
+
+SIMILARITY_BLOCK_SIZE = 256
+
+MINHASH_PERMUTATIONS = 64
+MINHASH_BANDS = 16            # 16 bands × 4 rows ≈ 0.5 Jaccard detection point
+MINHASH_MAX_BUCKET = 100      # larger buckets are template collisions and are not expanded
+MINHASH_BOILERPLATE_DF = 0.05  # shingles in more than 5% of texts are template boilerplate
+MINHASH_BOILERPLATE_MIN = 20   # ... but only once they appear in more than this many texts
+_MINHASH_PRIME = (1 << 31) - 1   # a * h + b stays inside int64
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+_MINHASH_STOPWORDS = frozenset((
+    'a', 'an', 'and', 'any', 'are', 'as', 'at', 'be', 'been', 'by', 'each', 'for',
+    'from', 'has', 'have', 'if', 'in', 'into', 'is', 'it', 'its', 'must', 'no', 'not',
+    'of', 'on', 'or', 'shall', 'should', 'such', 'than', 'that', 'the', 'their', 'then',
+    'there', 'these', 'this', 'to', 'was', 'were', 'when', 'which', 'will', 'with',
+))
+
+
+def _normalize_rows(matrix):
+    """L2-normalize dense rows (sparse TF-IDF rows are normalized by the vectorizer)."""
+    import numpy as np
+    if hasattr(matrix, 'tocsr'):
+        return matrix.tocsr()
+    matrix = np.asarray(matrix, dtype=np.float32)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def similar_pairs_for(matrix, threshold: float, block_size: int = SIMILARITY_BLOCK_SIZE,
+                      candidates: Optional[List[Tuple[int, int]]] = None):
+    """
+    Yield (i, j, similarity) for i < j with cosine similarity >= threshold.
+
+    Args:
+        matrix: Dense (n × d) array-like or scipy sparse matrix, one row per text
+        threshold: Minimum cosine similarity to report
+        block_size: Rows compared per matrix multiply
+        candidates: Optional pre-blocked (i, j) pairs; only these are scored
+    """
+    import numpy as np
+    matrix = _normalize_rows(matrix)
+    sparse = hasattr(matrix, 'tocsr')
+
+    if candidates is not None:
+        if not candidates:
+            return
+        pairs = np.array(sorted(set(candidates)), dtype=np.int64)
+        for start in range(0, len(pairs), block_size * 64):
+            chunk = pairs[start:start + block_size * 64]
+            left, right = matrix[chunk[:, 0]], matrix[chunk[:, 1]]
+            if sparse:
+                sims = np.asarray(left.multiply(right).sum(axis=1)).ravel()
+            else:
+                sims = np.einsum('ij,ij->i', left, right)
+            for (i, j), sim in zip(chunk, sims):
+                if sim >= threshold:
+                    yield int(i), int(j), float(sim)
+        return
+
+    n = matrix.shape[0]
+    for start in range(0, n, block_size):
+        end = min(start + block_size, n)
+        block = matrix[start:end] @ matrix.T
+        if sparse:
+            block = block.tocsr()
+            for r in range(end - start):
+                i = start + r
+                lo, hi = block.indptr[r], block.indptr[r + 1]
+                cols, vals = block.indices[lo:hi], block.data[lo:hi]
+                mask = (cols > i) & (vals >= threshold)
+                order = np.argsort(cols[mask], kind='stable')
+                for j, sim in zip(cols[mask][order], vals[mask][order]):
+                    yield i, int(j), float(sim)
+        else:
+            rows, cols = np.nonzero(np.asarray(block) >= threshold)
+            for r, j in zip(rows, cols):
+                i = start + int(r)
+                if j > i:
+                    yield i, int(j), float(block[r, j])
+
+
+def _minhash_signature(tokens, coeffs) -> Tuple[int, ...]:
+    """MinHash signature of a token set; vectorized with numpy when available."""
+    import zlib
+    hashes = [zlib.crc32(t.encode('utf-8')) % _MINHASH_PRIME for t in tokens] or [0]
+    try:
+        import numpy as np
+        a = np.array([c[0] for c in coeffs], dtype=np.int64)[:, None]
+        b = np.array([c[1] for c in coeffs], dtype=np.int64)[:, None]
+        h = np.array(hashes, dtype=np.int64)[None, :]
+        return tuple(((a * h + b) % _MINHASH_PRIME).min(axis=1).tolist())
+    except ImportError:
+        return tuple(min((a * h + b) % _MINHASH_PRIME for h in hashes) for a, b in coeffs)
+
+
+def _minhash_shingles(text: str) -> set:
+    """Unigram + bigram shingles of the non-stopword tokens of text."""
+    words = [w for w in _TOKEN_RE.findall(text.lower()) if w not in _MINHASH_STOPWORDS]
+    return set(words) | {f'{a} {b}' for a, b in zip(words, words[1:])}
+
+
+def minhash_candidate_pairs(texts: List[str], num_perm: int = MINHASH_PERMUTATIONS,
+                            bands: int = MINHASH_BANDS, seed: int = 1,
+                            max_bucket: int = MINHASH_MAX_BUCKET) -> List[Tuple[int, int]]:
+    """
+    LSH blocking: return (i, j) pairs (i < j) whose token-set MinHash signatures
+    collide in at least one band. Texts sharing roughly half their unigrams and
+    bigrams become candidates; the rest are never scored.
+
+    Stopwords and boilerplate shingles (found in more than
+    MINHASH_BOILERPLATE_DF of the texts, e.g. "system shall" in templated
+    requirements) are left out of the signatures, and buckets with more than
+    max_bucket members are skipped so templated text cannot degrade into
+    all-pairs scoring.
+    """
+    import random
+    rng = random.Random(seed)
+    coeffs = [(rng.randrange(1, _MINHASH_PRIME), rng.randrange(0, _MINHASH_PRIME))
+              for _ in range(num_perm)]
+    rows = max(1, num_perm // bands)
+
+    shingle_sets = [_minhash_shingles(text) for text in texts]
+    doc_freq = defaultdict(int)
+    for shingles in shingle_sets:
+        for shingle in shingles:
+            doc_freq[shingle] += 1
+    max_df = max(MINHASH_BOILERPLATE_MIN, MINHASH_BOILERPLATE_DF * len(texts))
+    boilerplate = {s for s, count in doc_freq.items() if count > max_df}
+
+    buckets = defaultdict(list)
+    for idx, shingles in enumerate(shingle_sets):
+        # Pure-boilerplate texts keep their full set so they still match each other
+        sig = _minhash_signature((shingles - boilerplate) or shingles, coeffs)
+        for band in range(bands):
+            buckets[(band, sig[band * rows:(band + 1) * rows])].append(idx)
+
+    pairs = set()
+    for members in buckets.values():
+        if len(members) < 2 or len(members) > max_bucket:
+            continue
+        for a in range(len(members)):
+            for b in range(a + 1, len(members)):
+                pairs.add((members[a], members[b]))
+    return sorted(pairs)
+
+
 def get_similarity_checkers() -> Dict[str, BaseChecker]:
     """Factory function returning requirement similarity checkers."""
     return {
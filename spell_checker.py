@@ -9,7 +9,7 @@ Features:
 - Custom dictionary support
 - Technical/domain term whitelist
 - Aerospace/defense terminology built-in
-- Context-aware suggestions
+- Context-aware suggestions (indexed lookup via suggestion_index, v6.3.3)
 - Compound word handling
 
 Author: AEGIS
@@ -21,6 +21,11 @@ from typing import List, Dict, Tuple, Set, Optional
 from collections import Counter
 from pathlib import Path
 
+try:
+    from suggestion_index import get_suggestion_index
+except ImportError:
+    get_suggestion_index = None
+
 try:
     from base_checker import BaseChecker
 except ImportError:
@@ -520,6 +525,9 @@ class EnhancedSpellChecker(BaseChecker):
         
         # Cache for document-learned words
         self._document_words: Set[str] = set()
+
+        # v6.3.3: Symmetric-delete suggestion index, built on first lookup
+        self._suggestion_index = None
     
     def _build_dictionary(self) -> Set[str]:
         """Build the complete dictionary from all sources."""
@@ -543,6 +551,8 @@ class EnhancedSpellChecker(BaseChecker):
         """Add words to the custom dictionary."""
         self.custom_dictionary.update(words)
         self._dictionary.update(w.lower() for w in words)
+        # The index may be shared with other instances; fetch a new one on next lookup
+        self._suggestion_index = None
     
     def load_dictionary_file(self, filepath: str):
         """Load additional words from a file (one word per line)."""
@@ -618,6 +628,11 @@ class EnhancedSpellChecker(BaseChecker):
         
         return issues
     
+    def reset_review_state(self):
+        """v6.3.3: Learned document words are per review, not shared with the template."""
+        super().reset_review_state()
+        self._document_words = set()
+
     def _learn_document_words(self, paragraphs: List[Tuple[int, str]]):
         """Learn words from the document (proper nouns, repeated terms)."""
         word_counts: Counter = Counter()
@@ -694,6 +709,12 @@ class EnhancedSpellChecker(BaseChecker):
         if word_lower in self.COMMON_MISSPELLINGS:
             return self.COMMON_MISSPELLINGS[word_lower]
         
+        # v6.3.3: Closest match from the shared suggestion index
+        if get_suggestion_index is not None:
+            if self._suggestion_index is None:
+                self._suggestion_index = get_suggestion_index('spell_checker', self._dictionary)
+            return self._suggestion_index.best(word_lower, 2)
+
         # Find closest match using edit distance
         candidates = []
         
@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+AEGIS SQLite Connection Pool
+============================
+Per-thread reusable SQLite connections with tuned PRAGMAs, shared by the
+scan history, hyperlink storage, database and adaptive learner stores.
+
+v6.3.3: Each store used to open a brand new sqlite3 connection (and re-issue
+PRAGMA journal_mode=WAL) on every call, including inside per-file batch loops.
+Now:
+- get_pool(db_path) returns one ConnectionPool per database file.
+- pool.connection() returns this thread's connection, opened once with
+  WAL, synchronous=NORMAL, temp_store=MEMORY, a larger page cache and mmap
+  I/O — PRAGMAs are issued once per thread instead of once per query.
+- sqlite3's statement cache is enlarged so repeated queries reuse their
+  prepared statements for the life of the connection.
+- pool.transaction() is the drop-in replacement for the old
+  db_connection() context managers: commit on success, rollback on error.
+  Nested blocks on the same thread become SAVEPOINTs, so an inner failure
+  that the caller catches only undoes the inner work.
+- WriteQueue batches high-frequency, fire-and-forget writes (hit counters,
+  telemetry) into one executemany transaction.
+
+Connections are never shared between threads or across a fork.
+
+Usage:
+    from sqlite_pool import get_pool
+
+    with get_pool(db_path).transaction() as (conn, cursor):
+        cursor.execute('SELECT ...')
+"""
+
+import atexit
+import os
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+__version__ = "1.0.0"
+
+DEFAULT_PRAGMAS = (
+    ('synchronous', 'NORMAL'),
+    ('temp_store', 'MEMORY'),
+    ('cache_size', -16000),        # ~16 MB page cache per connection
+    ('mmap_size', 134217728),      # 128 MB memory-mapped reads
+)
+DEFAULT_TIMEOUT = 30.0
+STATEMENT_CACHE_SIZE = 256
+
+try:
+    from config_logging import get_logger
+    _logger = get_logger('sqlite_pool')
+except ImportError:
+    _logger = None
+
+
+def _log(message: str, level: str = 'debug', **kwargs):
+    """Internal logging helper."""
+    if _logger:
+        getattr(_logger, level)(message, **kwargs)
+    elif level in ('warning', 'error', 'critical'):
+        print(f"[{level.upper()}] {message}")
+
+
+class ConnectionPool:
+    """Thread-local sqlite3 connections to one database file."""
+
+    def __init__(self, db_path: str, pragmas: Sequence[Tuple[str, Any]] = DEFAULT_PRAGMAS,
+                 timeout: float = DEFAULT_TIMEOUT, foreign_keys: bool = False,
+                 row_factory: Optional[Callable] = sqlite3.Row):
+        self.db_path = str(db_path)
+        self.pragmas = tuple(pragmas)
+        self.timeout = timeout
+        self.foreign_keys = foreign_keys
+        self.row_factory = row_factory
+        self._local = threading.local()
+        self.stats = {'opened': 0, 'reused': 0}
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        if self.row_factory is not None:
+            conn.row_factory = self.row_factory
+        conn.execute('PRAGMA journal_mode=WAL')
+        for name, value in self.pragmas:
+            try:
+                conn.execute(f'PRAGMA {name}={value}')
+            except sqlite3.Error as e:
+                _log(f" PRAGMA {name} not applied to {self.db_path}: {e}")
+        if self.foreign_keys:
+            conn.execute('PRAGMA foreign_keys = ON')
+        self.stats['opened'] += 1
+        return conn
+
+    def _file_id(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.db_path)
+            return (st.st_dev, st.st_ino)
+        except OSError:
+            return None
+
+    def connection(self) -> sqlite3.Connection:
+        """
+        This thread's connection. Opened on first use, and reopened after a
+        fork or when the database file was deleted or replaced (restores,
+        resets) so a stale handle never points at an unlinked file.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            if self._local.pid == os.getpid() and self._local.file_id == self._file_id():
+                self.stats['reused'] += 1
+                return conn
+            if self._local.pid == os.getpid() and not self._local.depth:
+                conn.close()
+            elif self._local.depth:
+                return conn  # Mid-transaction: finish on the handle we have
+        conn = self._open()
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        self._local.file_id = self._file_id()
+        self._local.depth = 0
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """
+        Yield (connection, cursor); commit on success, roll back on exception.
+
+        Nested use on the same thread is wrapped in a SAVEPOINT and only the
+        outermost block commits. Callers must not call conn.commit() inside a
+        nested block: that ends the enclosing transaction (and its savepoint),
+        so the block is left as committed and can no longer be rolled back.
+        """
+        conn = self.connection()
+        depth = self._local.depth
+        savepoint = f'pool_sp_{depth}' if depth else None
+        if savepoint:
+            conn.execute(f'SAVEPOINT {savepoint}')
+        self._local.depth = depth + 1
+        cursor = conn.cursor()
+        try:
+            yield (conn, cursor)
+            if savepoint:
+                # A commit inside the block already released the savepoint
+                if conn.in_transaction:
+                    conn.execute(f'RELEASE {savepoint}')
+            else:
+                conn.commit()
+        except BaseException:
+            if savepoint:
+                if conn.in_transaction:
+                    conn.execute(f'ROLLBACK TO {savepoint}')
+                    conn.execute(f'RELEASE {savepoint}')
+            else:
+                conn.rollback()
+            raise
+        finally:
+            self._local.depth = depth
+            cursor.close()
+
+    def close_thread_connection(self):
+        """Close this thread's connection (e.g. before deleting the file)."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            self._local.conn = None
+            if self._local.pid == os.getpid():
+                conn.close()
+
+
+_pools: Dict[str, ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(db_path, **kwargs) -> ConnectionPool:
+    """
+    Return the process-wide pool for `db_path`.
+
+    Keyword arguments (pragmas, timeout, foreign_keys, row_factory) only take
+    effect when the pool is first created.
+    """
+    key = os.path.abspath(str(db_path))
+    pool = _pools.get(key)
+    if pool is None:
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None:
+                pool = ConnectionPool(db_path, **kwargs)
+                _pools[key] = pool
+    return pool
+
+
+@contextmanager
+def pooled_connection(db_path):
+    """Drop-in for the old per-call db_connection(): yields (conn, cursor)."""
+    with get_pool(db_path).transaction() as handles:
+        yield handles
+
+
+# =============================================================================
+# BATCHED WRITES
+# =============================================================================
+
+class WriteQueue:
+    """
+    Background writer that groups queued statements into batched transactions.
+
+    For writes nobody waits on (hit counters, usage stats). Statements are
+    applied in submission order; flush() blocks until everything queued so far
+    is committed.
+    """
+
+    def __init__(self, db_path: str, batch_size: int = 200, interval: float = 0.5):
+        self.db_path = str(db_path)
+        self.batch_size = batch_size
+        self.interval = interval
+        self._queue: 'queue.Queue' = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self.stats = {'queued': 0, 'written': 0, 'batches': 0, 'errors': 0}
+
+    def _ensure_thread(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='sqlite-write-queue',
+                                                daemon=True)
+                self._thread.start()
+
+    def submit(self, sql: str, params: Sequence = ()):
+        """Queue one statement."""
+        self.stats['queued'] += 1
+        self._queue.put((sql, tuple(params)))
+        self._ensure_thread()
+
+    def flush(self, timeout: Optional[float] = None):
+        """Block until everything queued before this call is written."""
+        if self._thread is None:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        self._ensure_thread()
+        done.wait(timeout)
+
+    def _run(self):
+        pool = get_pool(self.db_path)
+        while True:
+            item = self._queue.get()
+            batch: List[Tuple[str, tuple]] = []
+            waiters = []
+            while True:
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get(timeout=self.interval if not waiters else 0)
+                except queue.Empty:
+                    break
+            if batch:
+                self._write(pool, batch)
+            for event in waiters:
+                event.set()
+
+    def _write(self, pool: ConnectionPool, batch: List[Tuple[str, tuple]]):
+        # Consecutive identical statements go through one executemany call
+        groups: List[Tuple[str, List[tuple]]] = []
+        for sql, params in batch:
+            if groups and groups[-1][0] == sql:
+                groups[-1][1].append(params)
+            else:
+                groups.append((sql, [params]))
+        try:
+            with pool.transaction() as (conn, cursor):
+                for sql, rows in groups:
+                    cursor.executemany(sql, rows)
+            self.stats['written'] += len(batch)
+            self.stats['batches'] += 1
+        except sqlite3.Error as e:
+            self.stats['errors'] += 1
+            _log(f" Batched write to {self.db_path} failed ({len(batch)} statements): {e}",
+                 'warning')
+
+
+_queues: Dict[str, WriteQueue] = {}
+
+
+def get_write_queue(db_path, **kwargs) -> WriteQueue:
+    """Return the process-wide write queue for `db_path`."""
+    key = os.path.abspath(str(db_path))
+    with _pools_lock:
+        if key not in _queues:
+            _queues[key] = WriteQueue(db_path, **kwargs)
+        return _queues[key]
+
+
+@atexit.register
+def flush_all_queues(timeout: float = 5.0):
+    """Flush every write queue (registered to run at interpreter exit)."""
+    for write_queue in list(_queues.values()):
+        write_queue.flush(timeout)
@@ -38,6 +38,8 @@ except ImportError:
         except:
             return None
 
+from nlp_doc_store import parse as parse_doc
+
 __version__ = "1.0.0"
 
 
@@ -154,7 +156,7 @@ class SemanticRoleAnalysisChecker(BaseChecker):
         issues = []
 
         try:
-            doc = self.nlp(text)
+            doc = parse_doc(self.nlp, text)
 
             # Analyze each sentence
             for sent in doc.sents:
@@ -18,13 +18,12 @@ import re
 import logging
 from datetime import datetime
 
+from learned_rules import KeywordRules, LearnedRules
+
 logger = logging.getLogger(__name__)
 
 PATTERNS_FILE = os.path.join(os.path.dirname(__file__), 'statement_patterns.json')
 
-# Module-level cache
-_learned_patterns = None
-
 
 def _is_learning_enabled():
     """Check if learning is enabled via config.json (v5.9.52)."""
@@ -70,18 +69,75 @@ def save_patterns(patterns: dict):
             pass
 
 
+class StatementRules:
+    """Learned statement patterns compiled for per-statement lookups (v6.3.3).
+
+    Context words are keyword-indexed (KeywordRules), so a lookup costs one
+    pass over the description rather than a _context_matches call per entry.
+    """
+
+    def __init__(self, patterns: dict):
+        directive_rules = {}
+        self._universal_directives = {}
+        for position, entry in enumerate(patterns.get('directive_corrections', [])):
+            count = entry.get('count', 0)
+            if count < 2:
+                continue
+            from_dir = entry.get('from_directive', '')
+            to_dir = entry.get('to_directive', '')
+            context = entry.get('context_words', '')
+            if context:
+                directive_rules.setdefault(from_dir, []).append((context, (position, to_dir)))
+            elif count >= 3:
+                self._universal_directives.setdefault(from_dir, (position, to_dir))
+        self._directives = {from_dir: KeywordRules(rules)
+                            for from_dir, rules in directive_rules.items()}
+
+        self._roles = KeywordRules(
+            (entry.get('context_key', ''), entry.get('role', ''))
+            for entry in patterns.get('role_assignments', [])
+            if entry.get('count', 0) >= 2)
+
+        self._deletions = KeywordRules(
+            (entry.get('keyword', ''), True)
+            for entry in patterns.get('deletion_patterns', [])
+            if entry.get('count', 0) >= 3)
+
+    def directive_override(self, original_directive: str, description: str) -> str:
+        # The earlier entry wins between a context match and a universal correction
+        from_dir = original_directive.lower()
+        best = None
+        rules = self._directives.get(from_dir)
+        if rules:
+            best = rules.first_match(description)
+        universal = self._universal_directives.get(from_dir)
+        if universal and (best is None or universal[0] < best[0]):
+            best = universal
+        return best[1] if best else ''
+
+    def role_suggestion(self, description: str) -> str:
+        return self._roles.first_match(description, '')
+
+    def should_skip(self, description: str) -> bool:
+        return self._deletions.first_match(description, False)
+
+
+_rules = LearnedRules(lambda: PATTERNS_FILE, load_patterns, StatementRules)
+
+
 def reload_learned_patterns():
-    """Clear module-level cache so next access loads fresh from disk."""
-    global _learned_patterns
-    _learned_patterns = None
+    """Drop the compiled rules so next access loads fresh from disk."""
+    _rules.invalidate()
 
 
 def get_learned_patterns() -> dict:
-    """Get cached learned patterns (loads from disk on first call)."""
-    global _learned_patterns
-    if _learned_patterns is None:
-        _learned_patterns = load_patterns()
-    return _learned_patterns
+    """Get cached learned patterns (reloaded when the file changes on disk)."""
+    return _rules.patterns()
+
+
+def get_statement_rules() -> StatementRules:
+    """Get the compiled statement rules (recompiled when the file changes on disk)."""
+    return _rules.get()
 
 
 # ──────────────────────────────────────────────
@@ -200,25 +256,7 @@ def get_directive_override(original_directive: str, description: str) -> str:
 
     Returns override directive if pattern count >= 2, else empty string.
     """
-    patterns = get_learned_patterns()
-
-    for entry in patterns.get('directive_corrections', []):
-        if entry.get('count', 0) < 2:
-            continue
-
-        from_dir = entry.get('from_directive', '')
-        to_dir = entry.get('to_directive', '')
-        context = entry.get('context_words', '')
-
-        if from_dir == original_directive.lower():
-            # If context words match, this is a strong signal
-            if context and _context_matches(description, context):
-                return to_dir
-            # Universal correction (no context dependency) needs higher count
-            if not context and entry.get('count', 0) >= 3:
-                return to_dir
-
-    return ''
+    return get_statement_rules().directive_override(original_directive, description)
 
 
 def get_role_suggestion(description: str, directive: str = '') -> str:
@@ -226,17 +264,7 @@ def get_role_suggestion(description: str, directive: str = '') -> str:
 
     Returns role name if pattern count >= 2, else empty string.
     """
-    patterns = get_learned_patterns()
-
-    for entry in patterns.get('role_assignments', []):
-        if entry.get('count', 0) < 2:
-            continue
-
-        context = entry.get('context_key', '')
-        if context and _context_matches(description, context):
-            return entry.get('role', '')
-
-    return ''
+    return get_statement_rules().role_suggestion(description)
 
 
 def should_skip_extraction(description: str) -> bool:
@@ -245,17 +273,7 @@ def should_skip_extraction(description: str) -> bool:
     Returns True if users consistently delete statements with this pattern
     (count >= 3, higher threshold since deletion is more destructive).
     """
-    patterns = get_learned_patterns()
-
-    for entry in patterns.get('deletion_patterns', []):
-        if entry.get('count', 0) < 3:
-            continue
-
-        keyword = entry.get('keyword', '')
-        if keyword and _context_matches(description, keyword):
-            return True
-
-    return False
+    return get_statement_rules().should_skip(description)
 
 
 def get_pattern_stats() -> dict:
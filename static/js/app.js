@@ -14554,6 +14554,140 @@ STEPS TO REPRODUCE
             const MAX_POLL_FAILURES = 10;
             const processedDocs = new Set(); // Track docs we've already updated in UI
 
+            // v6.3.3: Render one progress payload (from the stream or a poll);
+            // returns it once the scan reached a terminal phase
+            const applyProgress = (d) => {
+                const totalDone = d.processed + d.errors;
+                const pct = d.total_files > 0
+                    ? Math.round(15 + (totalDone / d.total_files) * 85) // 15-100%
+                    : 15;
+
+                // Update main progress
+                updateProgress(pct, `Processed ${totalDone} of ${d.total_files}...`);
+                docsComplete.textContent = totalDone;
+                if (d.current_chunk && d.total_chunks) {
+                    queueStatus.textContent = `Chunk ${d.current_chunk}/${d.total_chunks} • ${d.processed} complete, ${d.errors} errors`;
+                    if (chunkInfoEl) chunkInfoEl.textContent = `${d.current_chunk}/${d.total_chunks}`;
+                }
+
+                // Update estimated remaining time from server EMA
+                if (d.estimated_remaining && d.estimated_remaining > 0) {
+                    remainingTimeEl.textContent = _formatTimeMs(d.estimated_remaining * 1000);
+                    // Show ECD line with estimated completion time
+                    if (ecdLine && ecdText) {
+                        const ecdDate = new Date(Date.now() + d.estimated_remaining * 1000);
+                        const ecdTimeStr = ecdDate.toLocaleTimeString([], {hour: '2-digit', minute: '2-digit'});
+                        ecdText.textContent = `~${_formatTimeMs(d.estimated_remaining * 1000)} remaining • Est. completion: ${ecdTimeStr}`;
+                        ecdLine.style.display = '';
+                    }
+                }
+
+                // Calculate speed
+                if (d.elapsed_seconds > 0 && d.processed > 0 && speedEl) {
+                    const docsPerMin = (d.processed / (d.elapsed_seconds / 60)).toFixed(1);
+                    speedEl.textContent = docsPerMin + ' docs/min';
+                }
+
+                // v6.2.0: Update severity stat chips
+                if (d.summary && d.summary.issues_by_severity && sevStats) {
+                    sevStats.style.display = '';
+                    const sev = d.summary.issues_by_severity;
+                    const sevCritical = document.getElementById('batch-sev-critical');
+                    const sevHigh = document.getElementById('batch-sev-high');
+                    const sevMedium = document.getElementById('batch-sev-medium');
+                    const sevLow = document.getElementById('batch-sev-low');
+                    const sevInfo = document.getElementById('batch-sev-info');
+                    if (sevCritical) sevCritical.textContent = 'C: ' + (sev.Critical || 0);
+                    if (sevHigh) sevHigh.textContent = 'H: ' + (sev.High || 0);
+                    if (sevMedium) sevMedium.textContent = 'M: ' + (sev.Medium || 0);
+                    if (sevLow) sevLow.textContent = 'L: ' + (sev.Low || 0);
+                    if (sevInfo) sevInfo.textContent = 'I: ' + (sev.Info || 0);
+                }
+
+                // v6.2.0: Update activity log
+                if (d.activity_log && d.activity_log.length > 0 && activityList) {
+                    if (d.activity_log.length !== lastActivityCount) {
+                        lastActivityCount = d.activity_log.length;
+                        if (activityCount) activityCount.textContent = d.activity_log.length + ' events';
+                        // Render last 50 entries (newest at bottom)
+                        const entries = d.activity_log.slice(-50);
+                        activityList.innerHTML = entries.map(entry => {
+                            const ts = entry.timestamp ? entry.timestamp.split(' ').pop().split('.')[0] : '';
+                            return `<div class="bpd-activity-entry" data-event="${entry.event || ''}">
+                                <span class="bpd-activity-time">${ts}</span>
+                                <span class="bpd-activity-event">${entry.event || ''}</span>
+                                <span class="bpd-activity-msg">${entry.message || ''}</span>
+                            </div>`;
+                        }).join('');
+                        // Auto-scroll to bottom
+                        activityList.scrollTop = activityList.scrollHeight;
+                    }
+                }
+
+                // Update per-file phase indicators from current_files
+                if (d.current_files) {
+                    Object.entries(d.current_files).forEach(([fname, info]) => {
+                        const idx = filenameToIndex[fname];
+                        if (idx !== undefined && !processedDocs.has(fname)) {
+                            const phase = info.phase || 'processing';
+                            const phaseProgress = info.progress || 0;
+                            // Map phase progress to 30-90% range for the per-doc bar
+                            const docPct = 30 + Math.round(phaseProgress * 0.6);
+                            const metaEl = document.getElementById(`batch-doc-meta-${idx}`);
+                            if (metaEl) {
+                                metaEl.innerHTML = `<span class="bpd-phase-badge phase-${phase}">${phase}</span> ${escapeHtml(info.message || '')}`;
+                            }
+                            // Update row status and progress bar (don't overwrite meta again)
+                            const row = document.getElementById(`batch-doc-${idx}`);
+                            const fillEl = document.getElementById(`batch-doc-fill-${idx}`);
+                            if (row && !row.classList.contains('processing')) {
+                                row.className = 'bpd-doc-row processing';
+                                if (!docStartTimes[idx]) docStartTimes[idx] = Date.now();
+                                const iconDiv = row.querySelector('.bpd-doc-icon');
+                                if (iconDiv) iconDiv.innerHTML = '<div class="bpd-spinner"></div>';
+                                row.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
+                            }
+                            if (fillEl) fillEl.style.width = docPct + '%';
+                        }
+                    });
+                }
+
+                // Process newly completed documents
+                if (d.documents && d.documents.length > 0) {
+                    d.documents.forEach(doc => {
+                        if (processedDocs.has(doc.filename)) return;
+                        processedDocs.add(doc.filename);
+
+                        const idx = filenameToIndex[doc.filename];
+                        if (idx === undefined) return;
+
+                        if (doc.status === 'error') {
+                            updateDocRow(idx, 'error', `Error: ${doc.error || 'Unknown'}`, null, 100);
+                        } else {
+                            const words = (doc.word_count || 0).toLocaleString();
+                            const issues = doc.issue_count || 0;
+                            const roles = doc.role_count || 0;
+                            const score = doc.score || 0;
+                            const metaLine = `${words} words • ${issues} issues • ${roles} roles • Score: ${score}%`;
+                            updateDocRow(idx, 'complete', metaLine, issues, 100);
+
+                            runningIssues += issues;
+                            runningRoles += roles;
+                            if (issuesCountEl) issuesCountEl.textContent = runningIssues.toLocaleString();
+                            if (rolesCountEl) rolesCountEl.textContent = runningRoles.toLocaleString();
+                        }
+                    });
+                    since = d.total_documents_ready; // Incremental: only fetch new docs next time
+                }
+
+                // Check terminal states
+                if (d.phase === 'complete' || d.phase === 'error' || d.phase === 'cancelled') {
+                    // Build final allResults from full data
+                    return d;
+                }
+                return null;
+            };
+
             const pollLoop = async () => {
                 while (true) {
                     try {
@@ -14569,134 +14703,9 @@ STEPS TO REPRODUCE
                         pollFailures = 0;
                         pollDelay = 1500; // Reset backoff on success
 
-                        const d = data.data;
-                        const totalDone = d.processed + d.errors;
-                        const pct = d.total_files > 0
-                            ? Math.round(15 + (totalDone / d.total_files) * 85) // 15-100%
-                            : 15;
-
-                        // Update main progress
-                        updateProgress(pct, `Processed ${totalDone} of ${d.total_files}...`);
-                        docsComplete.textContent = totalDone;
-                        if (d.current_chunk && d.total_chunks) {
-                            queueStatus.textContent = `Chunk ${d.current_chunk}/${d.total_chunks} • ${d.processed} complete, ${d.errors} errors`;
-                            if (chunkInfoEl) chunkInfoEl.textContent = `${d.current_chunk}/${d.total_chunks}`;
-                        }
-
-                        // Update estimated remaining time from server EMA
-                        if (d.estimated_remaining && d.estimated_remaining > 0) {
-                            remainingTimeEl.textContent = _formatTimeMs(d.estimated_remaining * 1000);
-                            // Show ECD line with estimated completion time
-                            if (ecdLine && ecdText) {
-                                const ecdDate = new Date(Date.now() + d.estimated_remaining * 1000);
-                                const ecdTimeStr = ecdDate.toLocaleTimeString([], {hour: '2-digit', minute: '2-digit'});
-                                ecdText.textContent = `~${_formatTimeMs(d.estimated_remaining * 1000)} remaining • Est. completion: ${ecdTimeStr}`;
-                                ecdLine.style.display = '';
-                            }
-                        }
-
-                        // Calculate speed
-                        if (d.elapsed_seconds > 0 && d.processed > 0 && speedEl) {
-                            const docsPerMin = (d.processed / (d.elapsed_seconds / 60)).toFixed(1);
-                            speedEl.textContent = docsPerMin + ' docs/min';
-                        }
-
-                        // v6.2.0: Update severity stat chips
-                        if (d.summary && d.summary.issues_by_severity && sevStats) {
-                            sevStats.style.display = '';
-                            const sev = d.summary.issues_by_severity;
-                            const sevCritical = document.getElementById('batch-sev-critical');
-                            const sevHigh = document.getElementById('batch-sev-high');
-                            const sevMedium = document.getElementById('batch-sev-medium');
-                            const sevLow = document.getElementById('batch-sev-low');
-                            const sevInfo = document.getElementById('batch-sev-info');
-                            if (sevCritical) sevCritical.textContent = 'C: ' + (sev.Critical || 0);
-                            if (sevHigh) sevHigh.textContent = 'H: ' + (sev.High || 0);
-                            if (sevMedium) sevMedium.textContent = 'M: ' + (sev.Medium || 0);
-                            if (sevLow) sevLow.textContent = 'L: ' + (sev.Low || 0);
-                            if (sevInfo) sevInfo.textContent = 'I: ' + (sev.Info || 0);
-                        }
-
-                        // v6.2.0: Update activity log
-                        if (d.activity_log && d.activity_log.length > 0 && activityList) {
-                            if (d.activity_log.length !== lastActivityCount) {
-                                lastActivityCount = d.activity_log.length;
-                                if (activityCount) activityCount.textContent = d.activity_log.length + ' events';
-                                // Render last 50 entries (newest at bottom)
-                                const entries = d.activity_log.slice(-50);
-                                activityList.innerHTML = entries.map(entry => {
-                                    const ts = entry.timestamp ? entry.timestamp.split(' ').pop().split('.')[0] : '';
-                                    return `<div class="bpd-activity-entry" data-event="${entry.event || ''}">
-                                        <span class="bpd-activity-time">${ts}</span>
-                                        <span class="bpd-activity-event">${entry.event || ''}</span>
-                                        <span class="bpd-activity-msg">${entry.message || ''}</span>
-                                    </div>`;
-                                }).join('');
-                                // Auto-scroll to bottom
-                                activityList.scrollTop = activityList.scrollHeight;
-                            }
-                        }
-
-                        // Update per-file phase indicators from current_files
-                        if (d.current_files) {
-                            Object.entries(d.current_files).forEach(([fname, info]) => {
-                                const idx = filenameToIndex[fname];
-                                if (idx !== undefined && !processedDocs.has(fname)) {
-                                    const phase = info.phase || 'processing';
-                                    const phaseProgress = info.progress || 0;
-                                    // Map phase progress to 30-90% range for the per-doc bar
-                                    const docPct = 30 + Math.round(phaseProgress * 0.6);
-                                    const metaEl = document.getElementById(`batch-doc-meta-${idx}`);
-                                    if (metaEl) {
-                                        metaEl.innerHTML = `<span class="bpd-phase-badge phase-${phase}">${phase}</span> ${escapeHtml(info.message || '')}`;
-                                    }
-                                    // Update row status and progress bar (don't overwrite meta again)
-                                    const row = document.getElementById(`batch-doc-${idx}`);
-                                    const fillEl = document.getElementById(`batch-doc-fill-${idx}`);
-                                    if (row && !row.classList.contains('processing')) {
-                                        row.className = 'bpd-doc-row processing';
-                                        if (!docStartTimes[idx]) docStartTimes[idx] = Date.now();
-                                        const iconDiv = row.querySelector('.bpd-doc-icon');
-                                        if (iconDiv) iconDiv.innerHTML = '<div class="bpd-spinner"></div>';
-                                        row.scrollIntoView({ behavior: 'smooth', block: 'nearest' });
-                                    }
-                                    if (fillEl) fillEl.style.width = docPct + '%';
-                                }
-                            });
-                        }
-
-                        // Process newly completed documents
-                        if (d.documents && d.documents.length > 0) {
-                            d.documents.forEach(doc => {
-                                if (processedDocs.has(doc.filename)) return;
-                                processedDocs.add(doc.filename);
-
-                                const idx = filenameToIndex[doc.filename];
-                                if (idx === undefined) return;
-
-                                if (doc.status === 'error') {
-                                    updateDocRow(idx, 'error', `Error: ${doc.error || 'Unknown'}`, null, 100);
-                                } else {
-                                    const words = (doc.word_count || 0).toLocaleString();
-                                    const issues = doc.issue_count || 0;
-                                    const roles = doc.role_count || 0;
-                                    const score = doc.score || 0;
-                                    const metaLine = `${words} words • ${issues} issues • ${roles} roles • Score: ${score}%`;
-                                    updateDocRow(idx, 'complete', metaLine, issues, 100);
-
-                                    runningIssues += issues;
-                                    runningRoles += roles;
-                                    if (issuesCountEl) issuesCountEl.textContent = runningIssues.toLocaleString();
-                                    if (rolesCountEl) rolesCountEl.textContent = runningRoles.toLocaleString();
-                                }
-                            });
-                            since = d.total_documents_ready; // Incremental: only fetch new docs next time
-                        }
-
-                        // Check terminal states
-                        if (d.phase === 'complete' || d.phase === 'error' || d.phase === 'cancelled') {
-                            // Build final allResults from full data
-                            return d;
+                        const finished = applyProgress(data.data);
+                        if (finished) {
+                            return finished;
                         }
 
                     } catch (pollError) {
@@ -14714,7 +14723,58 @@ STEPS TO REPRODUCE
                 }
             };
 
-            const finalState = await pollLoop();
+            // v6.3.3: Server-Sent Events stream instead of polling; the server
+            // pushes only when the scan state changes. Falls back to pollLoop().
+            const streamLoop = () => new Promise((resolve, reject) => {
+                if (typeof EventSource === 'undefined') {
+                    reject(new Error('EventSource not supported'));
+                    return;
+                }
+                const source = new EventSource(`/api/review/batch-progress/${scanId}/stream?since=${since}`);
+                let received = false;
+                let streamErrors = 0;
+                source.onmessage = (event) => {
+                    received = true;
+                    streamErrors = 0;
+                    let d;
+                    try {
+                        d = JSON.parse(event.data);
+                    } catch (e) {
+                        return;
+                    }
+                    const finished = applyProgress(d);
+                    if (finished) {
+                        source.close();
+                        resolve(finished);
+                    }
+                };
+                source.addEventListener('gone', () => {
+                    source.close();
+                    reject(new Error('Batch scan state no longer available'));
+                });
+                source.addEventListener('busy', () => {
+                    // Server is at its open-stream limit
+                    source.close();
+                    reject(new Error('Progress stream limit reached'));
+                });
+                source.onerror = () => {
+                    // EventSource reconnects by itself (resuming from Last-Event-ID);
+                    // give up if it never connected or keeps failing
+                    streamErrors++;
+                    if (!received || streamErrors >= MAX_POLL_FAILURES) {
+                        source.close();
+                        reject(new Error('Progress stream unavailable'));
+                    }
+                };
+            });
+
+            let finalState;
+            try {
+                finalState = await streamLoop();
+            } catch (streamError) {
+                console.warn('[TWR] Batch progress stream unavailable, polling instead:', streamError);
+                finalState = await pollLoop();
+            }
 
             // ── STEP 4: Scan complete — build final results ──
             if (elapsedInterval) clearInterval(elapsedInterval);
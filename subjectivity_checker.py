@@ -17,9 +17,14 @@ This checker flags:
 Falls back to TextBlob directly when spacytextblob pipeline unavailable.
 """
 
-import re
 from typing import Dict, List, Tuple, Optional
 
+from regex_registry import compile_pattern, word_pattern
+
+# v6.3.3: compiled once through the shared regex registry
+_QUANTIFIER = compile_pattern(r'(?:than|of|at\s+least|or\s+more|or\s+less|\d)',
+                              name='subjectivity.quantifier')
+
 try:
     from base_checker import BaseChecker, ReviewIssue
 except ImportError:
@@ -35,6 +40,8 @@ except ImportError:
         except Exception:
             return None
 
+from nlp_doc_store import parse as parse_doc
+
 __version__ = "1.0.0"
 
 # Marketing-speak / hype words that don't belong in technical docs
@@ -158,11 +165,10 @@ class SubjectivityChecker(BaseChecker):
 
         for adj in SUBJECTIVE_ADJECTIVES:
             # Look for the adjective as a whole word
-            pattern = re.compile(rf'\b{re.escape(adj)}\b', re.IGNORECASE)
-            for match in pattern.finditer(text):
+            for match in word_pattern(adj).finditer(text):
                 # Check if it's followed by a quantifier (which would make it OK)
                 after = text[match.end():match.end()+30].strip()
-                has_quantifier = bool(re.match(r'(?:than|of|at\s+least|or\s+more|or\s+less|\d)', after))
+                has_quantifier = bool(_QUANTIFIER.match(after))
 
                 if not has_quantifier:
                     issues.append(ReviewIssue(
@@ -183,7 +189,7 @@ class SubjectivityChecker(BaseChecker):
         """Use spacytextblob for sentence-level subjectivity scoring."""
         issues = []
         try:
-            doc = self.nlp(text[:5000])
+            doc = parse_doc(self.nlp, text[:5000], pipes=('spacytextblob',))
 
             # Document-level subjectivity
             if hasattr(doc._, 'blob'):
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+AEGIS Spelling Suggestion Index
+===============================
+Symmetric-delete (SymSpell-style) index for "closest dictionary word" lookups.
+
+v6.3.3: EnhancedSpellChecker._get_suggestion and TechnicalDictionary.suggest_similar
+both computed Levenshtein distance against every dictionary word for every
+unknown word. This index is built once per word list (and persisted to
+dictionaries/.index/), then answers a lookup by generating the deletes of the
+query and verifying only the words that share one.
+
+Results are exact: every word within `max_distance` Levenshtein edits is
+returned, ordered by (distance, word) exactly like the original linear scans.
+Only the first `prefix_length` characters are indexed (as SymSpell does); this
+keeps the index small without losing candidates because each candidate is
+verified with the full-word distance.
+
+Usage:
+    from suggestion_index import get_suggestion_index
+
+    index = get_suggestion_index('spell_checker', words)
+    index.lookup('recieve')         # [('receive', 2), ...]
+    index.best('recieve')           # 'receive'
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from itertools import combinations
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+__version__ = "1.0.0"
+
+DEFAULT_MAX_DISTANCE = 2
+DEFAULT_PREFIX_LENGTH = 7
+INDEX_DIR = Path(__file__).parent / 'dictionaries' / '.index'
+_FORMAT_VERSION = 1
+
+try:
+    from config_logging import get_logger
+    _logger = get_logger('suggestion_index')
+except ImportError:
+    _logger = None
+
+
+def _log(message: str, level: str = 'debug', **kwargs):
+    """Internal logging helper."""
+    if _logger:
+        getattr(_logger, level)(message, **kwargs)
+    elif level in ('warning', 'error', 'critical'):
+        print(f"[{level.upper()}] {message}")
+
+
+def levenshtein(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """
+    Levenshtein edit distance. With `max_distance`, returns max_distance + 1
+    as soon as the distance is known to exceed it.
+    """
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    if max_distance is not None and len(s1) - len(s2) > max_distance:
+        return max_distance + 1
+    if not s2:
+        return len(s1)
+
+    previous_row = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1):
+        current_row = [i + 1]
+        for j, c2 in enumerate(s2):
+            current_row.append(min(previous_row[j + 1] + 1,
+                                   current_row[j] + 1,
+                                   previous_row[j] + (c1 != c2)))
+        if max_distance is not None and min(current_row) > max_distance:
+            return max_distance + 1
+        previous_row = current_row
+    return previous_row[-1]
+
+
+def _deletes(key: str, max_distance: int) -> Set[str]:
+    """`key` plus every string obtained by deleting up to max_distance characters."""
+    result = {key}
+    for n in range(1, min(max_distance, len(key)) + 1):
+        for positions in combinations(range(len(key)), n):
+            result.add(''.join(c for i, c in enumerate(key) if i not in positions))
+    return result
+
+
+def fingerprint(words: Iterable[str], max_distance: int = DEFAULT_MAX_DISTANCE,
+                prefix_length: int = DEFAULT_PREFIX_LENGTH) -> str:
+    """Stable hash of a word list and index parameters (used as the cache key)."""
+    digest = hashlib.sha1(f'{_FORMAT_VERSION}:{max_distance}:{prefix_length}\n'.encode('utf-8'))
+    for word in sorted(set(words)):
+        digest.update(word.encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+class SuggestionIndex:
+    """Symmetric-delete index over a word set with exact Levenshtein verification."""
+
+    def __init__(self, words: Iterable[str] = (), max_distance: int = DEFAULT_MAX_DISTANCE,
+                 prefix_length: int = DEFAULT_PREFIX_LENGTH):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._words: Set[str] = set()
+        self._deletes: Dict[str, List[str]] = {}
+        self._lock = threading.RLock()
+        self.update(words)
+
+    def __len__(self):
+        return len(self._words)
+
+    def __contains__(self, word: str):
+        return word in self._words
+
+    def add(self, word: str):
+        """Add one word (no-op for empty or already indexed words)."""
+        if not word or word in self._words:
+            return
+        with self._lock:
+            self._words.add(word)
+            for key in _deletes(word[:self.prefix_length], self.max_distance):
+                self._deletes.setdefault(key, []).append(word)
+
+    def update(self, words: Iterable[str]):
+        """Add many words."""
+        for word in words:
+            self.add(word)
+
+    def remove(self, word: str):
+        """Remove a word from the index."""
+        if word not in self._words:
+            return
+        with self._lock:
+            self._words.discard(word)
+            for key in _deletes(word[:self.prefix_length], self.max_distance):
+                bucket = self._deletes.get(key)
+                if bucket and word in bucket:
+                    bucket.remove(word)
+                    if not bucket:
+                        del self._deletes[key]
+
+    def lookup(self, word: str, max_distance: Optional[int] = None,
+               limit: Optional[int] = None) -> List[Tuple[str, int]]:
+        """
+        Return (word, distance) for every indexed word within max_distance,
+        sorted by distance then alphabetically.
+
+        Raises:
+            ValueError: if max_distance exceeds the distance the index was built for
+        """
+        if max_distance is None:
+            max_distance = self.max_distance
+        if max_distance > self.max_distance:
+            raise ValueError(f"Index built for max_distance={self.max_distance}, "
+                             f"lookup asked for {max_distance}")
+        if not word:
+            return []
+
+        candidates: Set[str] = set()
+        for key in _deletes(word[:self.prefix_length], max_distance):
+            bucket = self._deletes.get(key)
+            if bucket:
+                candidates.update(bucket)
+
+        results = []
+        for candidate in candidates:
+            distance = levenshtein(word, candidate, max_distance)
+            if distance <= max_distance:
+                results.append((candidate, distance))
+        results.sort(key=lambda x: (x[1], x[0]))
+        return results[:limit] if limit is not None else results
+
+    def best(self, word: str, max_distance: Optional[int] = None) -> Optional[str]:
+        """Closest indexed word (ties broken alphabetically), or None."""
+        results = self.lookup(word, max_distance)
+        return results[0][0] if results else None
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def save(self, path: Path, key: str):
+        """Write the index to `path` atomically, tagged with fingerprint `key`."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            'format': _FORMAT_VERSION,
+            'fingerprint': key,
+            'max_distance': self.max_distance,
+            'prefix_length': self.prefix_length,
+            'words': self._words,
+            'deletes': self._deletes,
+        }
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: Path, key: str) -> Optional['SuggestionIndex']:
+        """Load an index saved by save(); None if missing, stale or unreadable."""
+        try:
+            with open(path, 'rb') as f:
+                payload = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            return None
+        if (not isinstance(payload, dict) or payload.get('format') != _FORMAT_VERSION
+                or payload.get('fingerprint') != key):
+            return None
+        index = cls(max_distance=payload['max_distance'], prefix_length=payload['prefix_length'])
+        index._words = payload['words']
+        index._deletes = payload['deletes']
+        return index
+
+
+# =============================================================================
+# PROCESS-WIDE SHARED INDEXES
+# =============================================================================
+# Checker instances (and their per-review forks) that are built from the same
+# word list share one index. An instance that later adds its own words must
+# ask for a new index rather than mutate the shared one.
+
+_shared: Dict[Tuple[str, str], SuggestionIndex] = {}
+_shared_lock = threading.Lock()
+_MAX_SHARED = 8
+
+
+def get_suggestion_index(name: str, words: Iterable[str],
+                         max_distance: int = DEFAULT_MAX_DISTANCE,
+                         prefix_length: int = DEFAULT_PREFIX_LENGTH,
+                         persist: bool = True) -> SuggestionIndex:
+    """
+    Return the shared index for `words`, loading it from dictionaries/.index/
+    or building (and saving) it on first use.
+
+    Args:
+        name: Short identifier for the word source (used in the file name)
+        words: The dictionary words (already lowercased by the caller)
+        persist: Read/write the on-disk copy
+    """
+    words = set(words)
+    key = fingerprint(words, max_distance, prefix_length)
+    with _shared_lock:
+        index = _shared.get((name, key))
+        if index is not None:
+            return index
+
+        path = INDEX_DIR / f'{name}.pkl'
+        if persist:
+            index = SuggestionIndex.load(path, key)
+        if index is None:
+            index = SuggestionIndex(words, max_distance, prefix_length)
+            _log(f" Built suggestion index '{name}' ({len(words)} words)")
+            if persist:
+                try:
+                    index.save(path, key)
+                except Exception as e:
+                    _log(f" Could not persist suggestion index '{name}': {e}")
+        else:
+            _log(f" Loaded suggestion index '{name}' from {path}")
+
+        if len(_shared) >= _MAX_SHARED:
+            _shared.pop(next(iter(_shared)))
+        _shared[(name, key)] = index
+        return index
+
+
+def clear_shared_indexes():
+    """Drop in-memory shared indexes (tests, dictionary reloads)."""
+    with _shared_lock:
+        _shared.clear()
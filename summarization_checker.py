@@ -19,6 +19,8 @@ and identifies paragraphs with significantly lower information density.
 import re
 from typing import Dict, List, Tuple, Optional, Set
 
+from regex_registry import compile_pattern
+
 try:
     from base_checker import BaseChecker
 except ImportError:
@@ -171,8 +173,7 @@ class VerbosityDetectionChecker(BaseChecker):
                 # Find and report the specific phrase
                 for phrase in self.FILLER_PHRASES:
                     if phrase in text_lower:
-                        pattern = re.compile(re.escape(phrase), re.IGNORECASE)
-                        match = pattern.search(text)
+                        match = compile_pattern(re.escape(phrase), re.IGNORECASE).search(text)
                         if match:
                             issues.append(self.create_issue(
                                 severity='Low',
@@ -23,6 +23,8 @@ import re
 from typing import Dict, List, Optional, Any
 from pathlib import Path
 
+from docx_package import docx_document
+
 # Try imports
 try:
     import pdfplumber
@@ -32,8 +34,7 @@ except ImportError:
     print("[TableProcessor] pdfplumber not installed - PDF support disabled")
 
 try:
-    from docx import Document as DocxDocument
-    from docx.table import Table as DocxTable
+    import docx  # noqa: F401  (availability check; parsing goes through docx_package)
     DOCX_SUPPORT = True
 except ImportError:
     DOCX_SUPPORT = False
@@ -147,7 +148,8 @@ class TableProcessor:
     
     def _process_docx(self, filepath: str) -> Dict[str, Any]:
         """Extract tables and text from Word document."""
-        doc = DocxDocument(filepath)
+        # v6.3.3: Reuse the review's parsed document when one is attached to this thread
+        doc = docx_document(filepath)
         tables = []
         all_text = []
         roles_from_tables = set()
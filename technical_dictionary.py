@@ -51,6 +51,11 @@ try:
 except ImportError:
     pass
 
+try:
+    from suggestion_index import get_suggestion_index
+except ImportError:
+    get_suggestion_index = None
+
 
 @dataclass
 class DictionaryStats:
@@ -96,6 +101,7 @@ class TechnicalDictionary:
         self._proper_nouns: Set[str] = set()
         self._custom_terms: Set[str] = set()
         self._stats = DictionaryStats()
+        self._suggestion_index = None  # v6.3.3: built on first suggest_similar()
 
         # Load embedded dictionaries
         self._load_embedded_dictionaries()
@@ -281,6 +287,7 @@ class TechnicalDictionary:
         term_lower = term.lower().strip()
         self._custom_terms.add(term_lower)
         self._valid_terms.add(term_lower)
+        self._suggestion_index = None
         self._stats.custom_terms = len(self._custom_terms)
         self._stats.total_terms = len(self._valid_terms)
         return True
@@ -294,6 +301,7 @@ class TechnicalDictionary:
         if term_lower in self._custom_terms:
             self._custom_terms.discard(term_lower)
             self._valid_terms.discard(term_lower)
+            self._suggestion_index = None
             self._update_stats()
             return True
         return False
@@ -346,6 +354,13 @@ class TechnicalDictionary:
             return []
 
         word_lower = word.lower()
+
+        # v6.3.3: Indexed lookup (same results as the scan below, sub-linear)
+        if get_suggestion_index is not None and max_distance <= 2:
+            if self._suggestion_index is None:
+                self._suggestion_index = get_suggestion_index('technical_dictionary', self._valid_terms)
+            return self._suggestion_index.lookup(word_lower, max_distance, limit=10)
+
         suggestions = []
 
         # Simple edit distance calculation
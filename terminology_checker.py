@@ -24,6 +24,8 @@ from dataclasses import dataclass, field
 from collections import defaultdict
 import logging
 
+from phrase_matcher import PhraseMatcher, shared_matcher
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -231,6 +233,40 @@ ABBREVIATION_PAIRS = {
     'integers': 'ints',
 }
 
+# Common terms with variable hyphenation
+HYPHENATION_VARIANTS = {
+    'end user': ['end-user', 'enduser'],
+    'third party': ['third-party', 'thirdparty'],
+    'cross reference': ['cross-reference', 'crossreference'],
+    'co-ordinate': ['coordinate', 'co ordinate'],
+    're-use': ['reuse', 're use'],
+    're-design': ['redesign', 're design'],
+    'pre-condition': ['precondition', 'pre condition'],
+    'post-condition': ['postcondition', 'post condition'],
+    'non-compliance': ['noncompliance', 'non compliance'],
+    'anti-virus': ['antivirus', 'anti virus'],
+}
+
+
+def _build_term_matcher() -> PhraseMatcher:
+    forms = []
+    for canonical, variants in SPELLING_VARIANTS.items():
+        forms.append(canonical)
+        forms.extend(variants)
+    for american, british in BRITISH_AMERICAN.items():
+        forms.extend((american, british))
+    for full_form, abbrev in ABBREVIATION_PAIRS.items():
+        forms.extend((full_form, abbrev))
+    for base, variants in HYPHENATION_VARIANTS.items():
+        forms.append(base)
+        forms.extend(variants)
+    return PhraseMatcher(forms)
+
+
+def get_term_matcher() -> PhraseMatcher:
+    """v6.3.3: One compiled matcher over every dictionary form above, shared process-wide."""
+    return shared_matcher('terminology', _build_term_matcher)
+
 
 class TerminologyChecker:
     """
@@ -287,16 +323,20 @@ class TerminologyChecker:
         """
         issues = []
 
+        # v6.3.3: Locate every dictionary form in one pass; the checks below
+        # only look up the forms they care about
+        positions = self._find_terms(text)
+
         # Check spelling variants
-        spelling_issues = self._check_spelling_variants(text)
+        spelling_issues = self._check_spelling_variants(text, positions)
         issues.extend(spelling_issues)
 
         # Check British/American consistency
-        uk_us_issues = self._check_british_american(text)
+        uk_us_issues = self._check_british_american(text, positions)
         issues.extend(uk_us_issues)
 
         # Check abbreviation consistency
-        abbrev_issues = self._check_abbreviations(text)
+        abbrev_issues = self._check_abbreviations(text, positions)
         issues.extend(abbrev_issues)
 
         # Check capitalization consistency
@@ -304,15 +344,21 @@ class TerminologyChecker:
         issues.extend(cap_issues)
 
         # Check hyphenation consistency
-        hyphen_issues = self._check_hyphenation(text)
+        hyphen_issues = self._check_hyphenation(text, positions)
         issues.extend(hyphen_issues)
 
         return issues
 
-    def _check_spelling_variants(self, text: str) -> List[TerminologyIssue]:
+    def _find_terms(self, text: str) -> Dict[str, List[int]]:
+        """Whole-word start offsets (in text.lower()) of every dictionary form present."""
+        return get_term_matcher().positions(text)
+
+    def _check_spelling_variants(self, text: str,
+                                 positions: Optional[Dict[str, List[int]]] = None) -> List[TerminologyIssue]:
         """Check for spelling variant inconsistencies."""
         issues = []
-        text_lower = text.lower()
+        if positions is None:
+            positions = self._find_terms(text)
 
         # Track found variants for each canonical form
         found_variants: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
@@ -321,12 +367,11 @@ class TerminologyChecker:
             all_forms = [canonical] + variants
 
             for form in all_forms:
-                # Find all occurrences (word boundaries)
-                pattern = r'\b' + re.escape(form) + r'\b'
-                for match in re.finditer(pattern, text_lower):
+                # All occurrences (word boundaries)
+                for start in positions.get(form, ()):
                     # Get the actual text (preserving case)
-                    actual_text = text[match.start():match.end()]
-                    found_variants[canonical][actual_text.lower()].append(match.start())
+                    actual_text = text[start:start + len(form)]
+                    found_variants[canonical][actual_text.lower()].append(start)
 
         # Report inconsistencies
         for canonical, variants_dict in found_variants.items():
@@ -352,10 +397,12 @@ class TerminologyChecker:
 
         return issues
 
-    def _check_british_american(self, text: str) -> List[TerminologyIssue]:
+    def _check_british_american(self, text: str,
+                                positions: Optional[Dict[str, List[int]]] = None) -> List[TerminologyIssue]:
         """Check for British/American English mixing."""
         issues = []
-        text_lower = text.lower()
+        if positions is None:
+            positions = self._find_terms(text)
 
         # Count American vs British spellings
         american_count = 0
@@ -365,15 +412,13 @@ class TerminologyChecker:
 
         for american, british in BRITISH_AMERICAN.items():
             # Find American spellings
-            am_pattern = r'\b' + re.escape(american) + r'\b'
-            am_matches = list(re.finditer(am_pattern, text_lower))
+            am_matches = positions.get(american)
             if am_matches:
                 american_count += len(am_matches)
                 american_words.append(american)
 
             # Find British spellings
-            br_pattern = r'\b' + re.escape(british) + r'\b'
-            br_matches = list(re.finditer(br_pattern, text_lower))
+            br_matches = positions.get(british)
             if br_matches:
                 british_count += len(br_matches)
                 british_words.append(british)
@@ -404,24 +449,24 @@ class TerminologyChecker:
 
         return issues
 
-    def _check_abbreviations(self, text: str) -> List[TerminologyIssue]:
+    def _check_abbreviations(self, text: str,
+                             positions: Optional[Dict[str, List[int]]] = None) -> List[TerminologyIssue]:
         """Check for abbreviation consistency."""
         issues = []
-        text_lower = text.lower()
+        if positions is None:
+            positions = self._find_terms(text)
 
         # Track found forms
         found_pairs: Dict[str, Dict[str, List[int]]] = defaultdict(lambda: defaultdict(list))
 
         for full_form, abbrev in ABBREVIATION_PAIRS.items():
             # Find full form
-            full_pattern = r'\b' + re.escape(full_form) + r'\b'
-            for match in re.finditer(full_pattern, text_lower):
-                found_pairs[full_form]['full'].append(match.start())
+            for start in positions.get(full_form, ()):
+                found_pairs[full_form]['full'].append(start)
 
             # Find abbreviation
-            abbrev_pattern = r'\b' + re.escape(abbrev) + r'\b'
-            for match in re.finditer(abbrev_pattern, text_lower):
-                found_pairs[full_form]['abbrev'].append(match.start())
+            for start in positions.get(abbrev, ()):
+                found_pairs[full_form]['abbrev'].append(start)
 
         # Report mixed usage
         for full_form, forms_dict in found_pairs.items():
@@ -489,44 +534,26 @@ class TerminologyChecker:
 
         return issues
 
-    def _check_hyphenation(self, text: str) -> List[TerminologyIssue]:
+    def _check_hyphenation(self, text: str,
+                           positions: Optional[Dict[str, List[int]]] = None) -> List[TerminologyIssue]:
         """Check for hyphenation consistency."""
         issues = []
+        if positions is None:
+            positions = self._find_terms(text)
 
-        # Common terms with variable hyphenation
-        hyphen_variants = {
-            'end user': ['end-user', 'enduser'],
-            'third party': ['third-party', 'thirdparty'],
-            'cross reference': ['cross-reference', 'crossreference'],
-            'co-ordinate': ['coordinate', 'co ordinate'],
-            're-use': ['reuse', 're use'],
-            're-design': ['redesign', 're design'],
-            'pre-condition': ['precondition', 'pre condition'],
-            'post-condition': ['postcondition', 'post condition'],
-            'non-compliance': ['noncompliance', 'non compliance'],
-            'anti-virus': ['antivirus', 'anti virus'],
-        }
-
-        text_lower = text.lower()
-
-        for base, variants in hyphen_variants.items():
+        for base, variants in HYPHENATION_VARIANTS.items():
             all_forms = [base] + variants
             found_forms: Dict[str, int] = defaultdict(int)
 
             for form in all_forms:
-                pattern = r'\b' + re.escape(form) + r'\b'
-                for match in re.finditer(pattern, text_lower):
-                    found_forms[form] += 1
+                if positions.get(form):
+                    found_forms[form] += len(positions[form])
 
             if len(found_forms) > 1:
                 # Multiple forms found
                 most_common = max(found_forms.keys(), key=lambda k: found_forms[k])
-                first_match = None
-                for form in found_forms.keys():
-                    match = re.search(r'\b' + re.escape(form) + r'\b', text_lower)
-                    if match:
-                        first_match = match
-                        break
+                first_form = next(iter(found_forms))
+                first_start = positions[first_form][0]
 
                 issues.append(TerminologyIssue(
                     term=base,
@@ -534,8 +561,8 @@ class TerminologyChecker:
                     preferred_form=most_common,
                     issue_type='hyphenation',
                     occurrences=dict(found_forms),
-                    start_char=first_match.start() if first_match else 0,
-                    end_char=first_match.end() if first_match else 0,
+                    start_char=first_start,
+                    end_char=first_start + len(first_form),
                     confidence=0.80,
                     suggestion=f"Use consistent hyphenation: '{most_common}'"
                 ))
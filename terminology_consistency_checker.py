@@ -38,6 +38,8 @@ except ImportError:
         except Exception:
             return None
 
+from nlp_doc_store import parse as parse_doc
+
 __version__ = "1.0.0"
 
 # Curated synonym groups common in aerospace/defense technical writing
@@ -208,7 +210,7 @@ class TerminologyConsistencyChecker(BaseChecker):
                 if self.is_boilerplate(text) or len(text.strip()) < 20:
                     continue
 
-                doc = self.nlp(text[:3000])
+                doc = parse_doc(self.nlp, text[:3000])  # POS/lemma only
 
                 for token in doc:
                     if token.pos_ == 'NOUN' and len(token.text) > 3 and not token.is_stop:
@@ -224,7 +226,7 @@ class TerminologyConsistencyChecker(BaseChecker):
                     continue
 
                 try:
-                    doc1 = self.nlp(noun1)
+                    doc1 = parse_doc(self.nlp, noun1, pipes=('spacy_wordnet',))
                     if not doc1 or not doc1[0]._.wordnet:
                         continue
                     synsets1 = set()
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Tests and throughput benchmark for the async hyperlink validation engine
+=======================================================================
+Runs both engines against a local stand-in HTTP server.
+
+Run the benchmark with: pytest tests/test_async_engine.py -v -s
+or standalone:          python tests/test_async_engine.py [url_count]
+"""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('requests')  # hyperlink_validator/__init__ imports the validator
+pytest.importorskip('aiohttp')
+
+from hyperlink_validator.async_engine import AsyncValidationEngine
+from hyperlink_validator.domain_scheduler import DomainScheduler
+from hyperlink_validator.exclusion_matcher import CompiledExclusions
+from hyperlink_validator.storage import HyperlinkValidatorStorage
+from hyperlink_validator.validator import StandaloneHyperlinkValidator
+
+SLOW_DELAY = 0.2
+
+SOFT_404_PAGE = (b'<html><head><title>404 - Page Not Found</title></head>'
+                 b'<body><h1>Page not found</h1></body></html>')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, code, body=b'<html><body>ok</body></html>', headers=None, send_body=True):
+        self.send_response(code)
+        headers = dict(headers or {})
+        headers.setdefault('Content-Type', 'text/html; charset=utf-8')
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _route(self, send_body):
+        path = self.path
+        if path.startswith('/ok'):
+            self._send(200, send_body=send_body)
+        elif path.startswith('/slow'):
+            time.sleep(SLOW_DELAY)
+            self._send(200, send_body=send_body)
+        elif path == '/missing':
+            self._send(404, send_body=send_body)
+        elif path == '/nohead':
+            self._send(405 if self.command == 'HEAD' else 200, send_body=send_body)
+        elif path == '/redirect':
+            self._send(302, b'', {'Location': '/ok/target'}, send_body)
+        elif path == '/login-redirect':
+            self._send(302, b'', {'Location': '/adfs/ls/?wa=wsignin1.0'}, send_body)
+        elif path.startswith('/adfs/ls/'):
+            self._send(200, send_body=send_body)
+        elif path == '/report.pdf':
+            self._send(200, b'%PDF-1.4', {'Content-Type': 'application/pdf',
+                                          'Content-Disposition': 'attachment; filename="report.pdf"'},
+                       send_body)
+        elif path == '/soft404':
+            self._send(200, SOFT_404_PAGE, send_body=send_body)
+        elif path == '/error':
+            self._send(500, send_body=send_body)
+        else:
+            self._send(404, send_body=send_body)
+
+    def do_HEAD(self):
+        self._route(send_body=False)
+
+    def do_GET(self):
+        self._route(send_body=True)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 1024
+
+
+@pytest.fixture(scope='module')
+def server():
+    httpd = _Server(('127.0.0.1', 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f'http://127.0.0.1:{httpd.server_address[1]}'
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    storage = HyperlinkValidatorStorage(str(tmp_path / 'hv.db'))
+    monkeypatch.setattr('hyperlink_validator.storage.HyperlinkValidatorStorage',
+                        lambda *a, **k: storage)
+    return storage
+
+
+def _validate(urls, engine, **options):
+    validator = StandaloneHyperlinkValidator(timeout=5, retries=1, max_concurrent=20)
+    validator._probe_windows_auth = lambda *a, **k: {'message': 'skipped'}
+    opts = {'exclusions': [], 'use_cache': False, 'engine': engine,
+            'max_per_host': 500, 'rate_per_host': 100000}
+    opts.update(options)
+    return validator._validate_with_requests(urls, opts)
+
+
+class TestAsyncEngine:
+
+    def test_matches_thread_engine(self, server, storage):
+        urls = [f'{server}{path}' for path in (
+            '/ok/1', '/missing', '/nohead', '/redirect', '/login-redirect',
+            '/report.pdf', '/error',
+        )]
+        threaded = _validate(urls, 'threads')
+        async_ = _validate(urls, 'async')
+
+        for t, a in zip(threaded, async_):
+            assert (a.url, a.status, a.status_code) == (t.url, t.status, t.status_code)
+            assert a.message == t.message
+            assert a.redirect_count == t.redirect_count
+
+        by_path = {r.url[len(server):]: r for r in async_}
+        assert by_path['/ok/1'].status == 'WORKING'
+        assert by_path['/missing'].status == 'BROKEN'
+        assert by_path['/nohead'].status == 'WORKING'
+        assert by_path['/redirect'].redirect_count == 1
+        assert 'File download link' in by_path['/report.pdf'].message
+        assert by_path['/error'].message == 'Server error: HTTP 500'
+
+    def test_duplicates_get_their_own_result(self, server, storage):
+        urls = [f'{server}/ok/2', f'{server}/ok/2']
+        results = _validate(urls, 'async')
+        assert [r.url for r in results] == urls
+        assert results[0].status == results[1].status == 'WORKING'
+        assert results[0] is not results[1]
+
+    def test_soft_404_and_login_redirect(self, server):
+        # Engine-level results, before the retest phase can upgrade them
+        urls = [f'{server}/soft404', f'{server}/ok/4', f'{server}/login-redirect']
+        engine = AsyncValidationEngine(
+            StandaloneHyperlinkValidator(), DomainScheduler(urls),
+            headers={}, auth_used='none', timeout=5, retries=1, follow_redirects=True,
+            exclusions=CompiledExclusions([]), check_dns=False, check_ssl=False,
+            detect_soft_404_flag=True, check_suspicious=False,
+        )
+        results = {}
+        engine.run(lambda url, result: results.__setitem__(url, result))
+        assert results[urls[0]].is_soft_404 and results[urls[0]].status == 'BROKEN'
+        assert results[urls[1]].status == 'WORKING' and not results[urls[1]].is_soft_404
+        assert results[urls[2]].status == 'AUTH_REQUIRED'
+
+    def test_connection_refused(self, storage):
+        results = _validate(['http://127.0.0.1:9/nothing'], 'async')
+        assert results[0].status == 'BLOCKED'
+
+    def test_falls_back_without_aiohttp(self, server, storage, monkeypatch):
+        monkeypatch.setattr('hyperlink_validator.validator.ASYNC_ENGINE_AVAILABLE', False)
+        results = _validate([f'{server}/ok/3'], 'async')
+        assert results[0].status == 'WORKING'
+
+
+def run_benchmark(base_url, url_count=400):
+    """Validate url_count slow URLs with each engine; returns {engine: urls/second}."""
+    urls = [f'{base_url}/slow/{i}' for i in range(url_count)]
+    throughput = {}
+    for engine in ('threads', 'async'):
+        start = time.perf_counter()
+        results = _validate(urls, engine)
+        elapsed = time.perf_counter() - start
+        assert all(r.status == 'WORKING' for r in results), engine
+        throughput[engine] = url_count / elapsed
+        print(f"  {engine:8s} {url_count} URLs in {elapsed:6.2f}s  ({throughput[engine]:7.1f} URLs/s)")
+    return throughput
+
+
+class TestEngineThroughput:
+
+    def test_benchmark(self, server, storage):
+        print(f"\nStand-in server, {SLOW_DELAY * 1000:.0f}ms per response, 20 worker threads:")
+        throughput = run_benchmark(server)
+        # The thread engine is capped at max_concurrent in-flight requests
+        assert throughput['async'] > throughput['threads']
+
+
+if __name__ == '__main__':
+    import tempfile
+    import hyperlink_validator.storage as hv_storage
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as tmp:
+        shared = HyperlinkValidatorStorage(str(Path(tmp) / 'hv.db'))
+        hv_storage.HyperlinkValidatorStorage = lambda *a, **k: shared
+        httpd = _Server(('127.0.0.1', 0), _Handler)
+        threading.Thread(target=httpd.serve_forever, daemon=True).start()
+        try:
+            run_benchmark(f'http://127.0.0.1:{httpd.server_address[1]}', count)
+        finally:
+            httpd.shutdown()
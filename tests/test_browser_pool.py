@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent headless browser pool (hyperlink_validator.headless_validator.BrowserPool)
+=================================================================================================
+Uses an in-process fake browser, so Playwright is not required.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('requests')  # hyperlink_validator/__init__ imports the validator
+
+from hyperlink_validator import headless_validator as hv
+from hyperlink_validator.headless_validator import BrowserPool, _affinity_key
+
+
+class _Request:
+    resource_type = 'document'
+
+
+class _Response:
+    request = _Request()
+
+    def __init__(self, url, status):
+        self.url = url
+        self.status = status
+
+
+class _Page:
+    def __init__(self, context):
+        self.context = context
+
+    def on(self, event, handler):
+        pass
+
+    async def goto(self, url, timeout, wait_until):
+        self.context.visits.append(url)
+        if '/crash' in url:
+            raise hv.PlaywrightError('Target page, context or browser has been closed')
+        if '/slow' in url:
+            raise hv.PlaywrightError('Timeout 30000ms exceeded')
+        return _Response(url, 404 if '/missing' in url else 200)
+
+    async def title(self):
+        return 'Welcome'
+
+    async def content(self):
+        return '<html><body>Welcome</body></html>'
+
+    async def close(self):
+        pass
+
+
+class _Context:
+    def __init__(self, browser):
+        self.browser = browser
+        self.visits = []
+        self.closed = False
+        self.routes = []
+
+    async def new_page(self):
+        return _Page(self)
+
+    async def route(self, pattern, handler):
+        self.routes.append(pattern)
+
+    async def add_init_script(self, script):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class _Browser:
+    def __init__(self):
+        self.contexts = []
+        self.connected = True
+
+    def is_connected(self):
+        return self.connected
+
+    async def new_context(self, **options):
+        context = _Context(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self):
+        self.connected = False
+
+
+class _Playwright:
+    async def stop(self):
+        pass
+
+
+class _Launcher:
+    def __init__(self):
+        self.browsers = []
+
+    async def __call__(self, headless):
+        browser = _Browser()
+        self.browsers.append(browser)
+        return _Playwright(), browser
+
+
+@pytest.fixture
+def launcher():
+    return _Launcher()
+
+
+@pytest.fixture
+def make_pool(launcher):
+    pools = []
+
+    def factory(**kwargs):
+        kwargs.setdefault('idle_shutdown', 0)
+        pool = BrowserPool(launcher=launcher, **kwargs)
+        pools.append(pool)
+        return pool
+
+    yield factory
+    for pool in pools:
+        pool.close()
+
+
+class TestBrowserPool:
+
+    def test_browser_launched_once_across_calls(self, make_pool, launcher):
+        pool = make_pool()
+        for _ in range(3):
+            results = pool.validate_many(['https://a.example.com/1', 'https://a.example.com/missing'])
+            assert [r.status for r in results] == ['WORKING', 'BROKEN']
+        assert len(launcher.browsers) == 1
+        assert pool.stats()['launches'] == 1
+
+    def test_contexts_reused_with_domain_affinity(self, make_pool, launcher):
+        pool = make_pool(max_contexts=2)
+        pool.validate('https://www.army.mil/a')
+        pool.validate('https://www.dcma.mil/a')
+        pool.validate('https://docs.army.mil/b')
+        army, dcma = launcher.browsers[0].contexts
+        assert army.visits == ['https://www.army.mil/a', 'https://docs.army.mil/b']
+        assert dcma.visits == ['https://www.dcma.mil/a']
+        assert pool.stats()['affinity_hits'] == 1
+
+    def test_full_pool_rebinds_least_recently_used(self, make_pool, launcher):
+        pool = make_pool(max_contexts=1)
+        for url in ('https://a.army.mil/', 'https://a.navy.mil/', 'https://b.army.mil/'):
+            assert pool.validate(url).status == 'WORKING'
+        assert len(launcher.browsers[0].contexts) == 1
+
+    def test_affinity_prefers_matching_context(self, make_pool, launcher):
+        pool = make_pool(max_contexts=2)
+        pool.validate_many(['https://a.army.mil/', 'https://a.navy.mil/'])
+        pool.validate('https://b.navy.mil/')
+        navy = [c for c in launcher.browsers[0].contexts if any('navy' in v for v in c.visits)]
+        assert len(navy) == 1 and navy[0].visits.count('https://b.navy.mil/') == 1
+        assert not any('army' in v for v in navy[0].visits)
+
+    def test_context_recycled_after_request_limit(self, make_pool, launcher):
+        pool = make_pool(max_requests_per_context=2)
+        for i in range(5):
+            pool.validate(f'https://a.example.com/{i}')
+        contexts = launcher.browsers[0].contexts
+        assert len(contexts) == 3
+        assert all(c.closed for c in contexts[:2])
+        assert pool.stats()['contexts_recycled'] == 2
+
+    def test_context_recycled_after_max_age(self, launcher, make_pool):
+        now = [0.0]
+        pool = make_pool(max_context_age=60, clock=lambda: now[0])
+        pool.validate('https://a.example.com/1')
+        now[0] = 120.0
+        pool.validate('https://a.example.com/2')
+        pool.validate('https://a.example.com/3')
+        assert len(launcher.browsers[0].contexts) == 2
+
+    def test_closed_target_discards_context(self, make_pool, launcher):
+        pool = make_pool()
+        result = pool.validate('https://a.example.com/crash')
+        assert result.status == 'ERROR'
+        pool.validate('https://a.example.com/ok')
+        first, second = launcher.browsers[0].contexts
+        assert first.closed and not second.closed
+
+    def test_navigation_timeout_keeps_context(self, make_pool, launcher):
+        pool = make_pool()
+        assert pool.validate('https://a.example.com/slow', timeout_ms=5000).status == 'TIMEOUT'
+        pool.validate('https://a.example.com/ok')
+        assert len(launcher.browsers[0].contexts) == 1
+
+    def test_relaunches_disconnected_browser(self, make_pool, launcher):
+        pool = make_pool()
+        pool.validate('https://a.example.com/1')
+        launcher.browsers[0].connected = False
+        assert pool.validate('https://a.example.com/2').status == 'WORKING'
+        assert len(launcher.browsers) == 2
+
+    def test_idle_shutdown(self, make_pool, launcher):
+        pool = make_pool(idle_shutdown=0.05)
+        pool.validate('https://a.example.com/1')
+        time.sleep(0.3)
+        assert not pool.stats()['browser_running']
+        assert pool.validate('https://a.example.com/2').status == 'WORKING'
+        assert len(launcher.browsers) == 2
+
+    def test_results_in_input_order_with_progress(self, make_pool):
+        pool = make_pool(max_contexts=3)
+        urls = [f'https://h{i % 4}.example.org/{i}' for i in range(12)]
+        progress = []
+        results = pool.validate_many(urls, progress_callback=lambda done, total, url: progress.append(done))
+        assert [r.url for r in results] == urls
+        assert progress == list(range(1, 13))
+        assert pool.stats()['idle_contexts'] <= 3
+
+    def test_max_concurrent_limits_in_flight(self, make_pool, monkeypatch):
+        pool = make_pool(max_contexts=5)
+        in_flight, peak = [0], [0]
+
+        async def validate(url, timeout_ms):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await hv.asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return hv.HeadlessResult(url=url, status='WORKING')
+
+        monkeypatch.setattr(pool, '_validate', validate)
+        urls = [f'https://a.example.com/{i}' for i in range(8)]
+        results = pool.validate_many(urls, max_concurrent=2)
+        assert [r.url for r in results] == urls
+        assert peak[0] == 2
+        pool.validate_many(urls)
+        assert peak[0] > 2
+
+
+def test_affinity_key():
+    assert _affinity_key('https://www.dcma.mil/path') == 'dcma.mil'
+    assert _affinity_key('https://DCMA.mil') == 'dcma.mil'
+    assert _affinity_key('http://localhost:8080/x') == 'localhost'
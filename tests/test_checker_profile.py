@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Tests for per-checker telemetry (checker_profile.py)
+====================================================
+"""
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from base_checker import BaseChecker
+from checker_profile import (CheckerProfileStore, ReviewProfile, get_profile_settings,
+                             start_review_profile, stop_current_profile)
+from checker_scheduler import CheckerScheduler
+
+
+class _AllocatingChecker(BaseChecker):
+    CHECKER_NAME = "Allocating"
+
+    def check(self, paragraphs, **kwargs):
+        self._buffer = [bytearray(1024) for _ in range(200)]
+        del self._buffer
+        return [self.create_issue('Info', text[:20], paragraph_index=idx) for idx, text in paragraphs]
+
+
+class _FailingChecker(BaseChecker):
+    CHECKER_NAME = "Failing"
+
+    def check(self, paragraphs, **kwargs):
+        raise RuntimeError('boom')
+
+
+def _kwargs(count=5):
+    paragraphs = [(i, f'Paragraph number {i} of the test document.') for i in range(count)]
+    return {'paragraphs': paragraphs, 'tables': [], 'full_text': '', 'filepath': ''}
+
+
+def _profile(*rows, trace_memory=False):
+    profile = ReviewProfile(trace_memory=trace_memory)
+    for name, wall_ms, issues in rows:
+        profile.record(name, wall_ms, wall_ms / 2, issues=issues)
+    return profile
+
+
+class TestReviewProfile:
+
+    def test_scheduler_records_issues_errors_and_memory(self):
+        profile = ReviewProfile(trace_memory=True)
+        profile.start()
+        try:
+            scheduler = CheckerScheduler({'alloc': _AllocatingChecker(), 'fail': _FailingChecker()},
+                                         parallel=False, profiler=profile)
+            results = scheduler.run(['alloc', 'fail'], _kwargs())
+        finally:
+            profile.stop()
+        assert not tracemalloc.is_tracing()
+        assert [len(issues) for _, issues in results] == [5, 0]
+        stats = profile.stats
+        assert stats['alloc']['issues'] == 5 and stats['alloc']['errors'] == 0
+        assert stats['alloc']['peak_kb'] >= 200
+        assert stats['fail']['issues'] == 0 and stats['fail']['errors'] == 1
+        assert all(s['wall_ms'] >= 0 and s['runs'] == 1 for s in stats.values())
+
+    def test_repeated_runs_accumulate(self):
+        profile = ReviewProfile()
+        scheduler = CheckerScheduler({'alloc': _AllocatingChecker()}, parallel=False, profiler=profile)
+        scheduler.run(['alloc'], _kwargs(3))
+        scheduler.run(['alloc'], _kwargs(2))
+        entry = profile.stats['alloc']
+        assert entry['runs'] == 2 and entry['issues'] == 5
+        assert entry['peak_kb'] is None
+
+    def test_measure_counts_escaping_exception(self):
+        profile = ReviewProfile()
+        with pytest.raises(ValueError):
+            with profile.measure('nlp_x', kind='nlp'):
+                raise ValueError('bad model')
+        assert profile.stats['nlp_x']['errors'] == 1
+        assert profile.stats['nlp_x']['kind'] == 'nlp'
+
+    def test_options_override_settings(self):
+        assert get_profile_settings({'checker_profile': False})['enabled'] is False
+        assert get_profile_settings({'checker_profile_memory': True})['memory_rate'] == 1.0
+
+    def test_concurrent_reviews_share_one_trace(self):
+        traced = ReviewProfile(trace_memory=True)
+        traced.start()
+        other = ReviewProfile(trace_memory=True)
+        other.start()
+        try:
+            assert tracemalloc.is_tracing()
+            assert other.trace_memory is False
+            traced.record('alloc', 1.0, 1.0, peak_kb=50.0)
+        finally:
+            other.stop()
+            traced.stop()
+        assert not tracemalloc.is_tracing()
+        assert not traced.memory_traced
+        assert traced.summary()[0]['peak_kb'] is None
+
+    def test_stop_current_profile_ends_tracing(self):
+        profile = start_review_profile({'checker_profile_memory': True})
+        assert tracemalloc.is_tracing()
+        stop_current_profile()
+        assert not tracemalloc.is_tracing()
+        profile.stop()
+        stop_current_profile()
+
+
+class TestCheckerProfileStore:
+
+    def test_aggregate_and_prune(self, tmp_path):
+        store = CheckerProfileStore(tmp_path / 'profile.db', history=3)
+        for wall in (100, 200, 300, 5000):
+            store.record(_profile(('slow', wall, 2), ('fast', 1, 4)), paragraphs=10)
+        data = store.aggregate(slow_ms=2000)
+        assert data['reviews'] == 3
+        slow, fast = data['checkers']
+        assert slow['checker'] == 'slow' and slow['reviews'] == 3
+        assert slow['wall_ms_total'] == 5500 and slow['wall_ms_max'] == 5000
+        assert slow['slow'] is True and fast['slow'] is False
+        assert fast['issues_per_review'] == 4 and fast['issues_per_second'] == 4000
+        assert abs(slow['time_share'] + fast['time_share'] - 1) < 1e-3
+
+    def test_kind_filter_and_clear(self, tmp_path):
+        store = CheckerProfileStore(tmp_path / 'profile.db')
+        profile = _profile(('grammar', 5, 1))
+        profile.record('nlp_spelling', 7, 3, kind='nlp')
+        store.record(profile)
+        assert [c['checker'] for c in store.aggregate(kind='nlp')['checkers']] == ['nlp_spelling']
+        store.clear()
+        assert store.aggregate()['checkers'] == []
+
+
+class TestDiagnosticExport:
+
+    def test_report_lists_slow_checkers(self, tmp_path):
+        from diagnostic_export import format_diagnostic_report
+        store = CheckerProfileStore(tmp_path / 'profile.db')
+        store.record(_profile(('slow_checker', 4000, 1), ('quick', 2, 0)))
+        report = format_diagnostic_report({'checker_profile': store.aggregate(slow_ms=2000)})
+        assert 'CHECKER PROFILE' in report
+        assert 'Slow Checkers:     slow_checker' in report
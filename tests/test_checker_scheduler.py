@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for checker_scheduler (v6.3.3)
+====================================
+Verifies that parallel scheduling of PARALLEL_SAFE checkers produces the same
+issues, in the same order, as the sequential loop.
+"""
+
+import multiprocessing
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from base_checker import BaseChecker
+from checker_profile import ReviewProfile
+from checker_scheduler import (CheckerScheduler, get_scheduler_settings, start_review_worker,
+                               terminate_review_workers)
+from grammar_checker import PassiveVoiceChecker, ContractionsChecker, RepeatedWordsChecker
+from writing_quality_checker import WeakLanguageChecker, WordyPhrasesChecker, JargonChecker
+
+
+class _StatefulChecker(BaseChecker):
+    """Records its runs so tests can verify it stayed in-process."""
+    CHECKER_NAME = "Stateful"
+
+    def __init__(self):
+        super().__init__()
+        self.runs = 0
+
+    def check(self, paragraphs, **kwargs):
+        self.runs += 1
+        return [self.create_issue('Info', f'{len(paragraphs)} paragraphs')]
+
+
+def _paragraphs(count=60):
+    base = [
+        "The system shall be tested by the contractor and it can't be delayed.",
+        "The the operator should possibly verify the results in order to ensure quality.",
+        "It is important to note that the data was processed by the software.",
+        "Users will leverage synergy to optimize the bandwidth going forward.",
+    ]
+    return [(i, base[i % len(base)]) for i in range(count)]
+
+
+def _checkers():
+    return {
+        'passive_voice': PassiveVoiceChecker(),
+        'contractions': ContractionsChecker(),
+        'stateful': _StatefulChecker(),
+        'repeated_words': RepeatedWordsChecker(),
+        'weak_language': WeakLanguageChecker(),
+        'wordy_phrases': WordyPhrasesChecker(),
+        'jargon': JargonChecker(),
+    }
+
+
+def _kwargs():
+    paragraphs = _paragraphs()
+    return {
+        'paragraphs': paragraphs,
+        'tables': [],
+        'full_text': '\n'.join(t for _, t in paragraphs),
+        'filepath': '',
+    }
+
+
+def _as_comparable(results):
+    out = []
+    for name, issues in results:
+        for issue in issues:
+            d = issue if isinstance(issue, dict) else issue.to_dict()
+            out.append((name, d.get('paragraph_index'), d.get('message'), d.get('flagged_text')))
+    return out
+
+
+def _review_worker(queue):
+    """Stands in for routes.review_routes._review_worker_process."""
+    checkers = _checkers()
+    profile = ReviewProfile()
+    scheduler = CheckerScheduler(checkers, max_workers=2, parallel=True, min_paragraphs=0,
+                                 profiler=profile)
+    scheduler.run(list(checkers), _kwargs())
+    queue.put({name: entry['mode'] for name, entry in profile.stats.items()})
+
+
+def _idle_worker():
+    time.sleep(60)
+
+
+class TestCheckerScheduler:
+
+    def test_partition_respects_capability_flag(self):
+        scheduler = CheckerScheduler(_checkers())
+        parallel, serial = scheduler.partition(list(_checkers()))
+        assert 'stateful' in serial
+        assert 'passive_voice' in parallel
+        assert parallel == [n for n in _checkers() if n != 'stateful']
+
+    def test_base_checker_defaults_to_serial(self):
+        assert BaseChecker.PARALLEL_SAFE is False
+        assert PassiveVoiceChecker.PARALLEL_SAFE is True
+
+    def test_small_document_runs_sequentially(self):
+        checkers = _checkers()
+        scheduler = CheckerScheduler(checkers, max_workers=2, parallel=True, min_paragraphs=10_000)
+        results = scheduler.run(list(checkers), _kwargs())
+        assert scheduler.last_mode == 'sequential'
+        assert [name for name, _ in results] == list(checkers)
+
+    def test_parallel_matches_sequential_order(self):
+        enabled = list(_checkers())
+        sequential = CheckerScheduler(_checkers(), parallel=False).run(enabled, _kwargs())
+
+        checkers = _checkers()
+        scheduler = CheckerScheduler(checkers, max_workers=2, parallel=True, min_paragraphs=0)
+        progress = []
+        parallel = scheduler.run(enabled, _kwargs(),
+                                 on_complete=lambda n, done, total: progress.append((n, done, total)))
+
+        assert scheduler.last_mode == 'parallel'
+        assert _as_comparable(parallel) == _as_comparable(sequential)
+        assert len(progress) == len(enabled)
+        assert progress[-1][1:] == (len(enabled), len(enabled))
+        # Stateful checker ran in the parent process
+        assert checkers['stateful'].runs == 1
+
+    def test_cancellation_returns_none(self):
+        scheduler = CheckerScheduler(_checkers(), parallel=False)
+        assert scheduler.run(list(_checkers()), _kwargs(), is_cancelled=lambda: True) is None
+
+    def test_options_override_settings(self):
+        settings = get_scheduler_settings({'parallel_checkers': True, 'checker_workers': 3})
+        assert settings['parallel_checkers'] is True
+        assert settings['checker_workers'] == 3
+        assert get_scheduler_settings({'parallel_checkers': False})['parallel_checkers'] is False
+
+
+class TestReviewWorker:
+
+    def test_review_worker_dispatches_to_pool(self):
+        queue = multiprocessing.Queue()
+        worker = start_review_worker(_review_worker, args=(queue,), name='review-worker-test')
+        assert worker.daemon is False
+        modes = queue.get(timeout=120)
+        worker.join(30)
+        assert worker.exitcode == 0
+        assert modes['stateful'] == 'local'
+        assert {modes[n] for n in modes if n != 'stateful'} == {'pool'}
+
+    def test_leftover_workers_terminated(self):
+        worker = start_review_worker(_idle_worker, name='review-worker-idle')
+        terminate_review_workers(timeout=5)
+        assert not worker.is_alive()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Tests for per-review checker forks (v6.3.3)
+===========================================
+Cached checker instances are templates; each engine works on a fork that
+shares compiled data but keeps its own results, metrics and errors.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from acronym_checker import AcronymChecker
+from grammar_checker import PassiveVoiceChecker
+from spell_checker import EnhancedSpellChecker
+
+
+class TestCheckerFork:
+
+    def test_fork_shares_compiled_data(self):
+        template = PassiveVoiceChecker()
+        fork = template.fork()
+        assert fork is not template
+        assert type(fork) is type(template)
+        # Instance attributes (compiled patterns, word lists) are shared by reference
+        for name, value in vars(template).items():
+            if name != '_errors':
+                assert getattr(fork, name) is value
+
+    def test_fork_gets_fresh_errors(self):
+        template = PassiveVoiceChecker()
+        template._errors.append('template error')
+        fork = template.fork()
+        assert fork.get_errors() == []
+        fork._errors.append('fork error')
+        assert template.get_errors() == ['template error']
+
+    def test_acronym_metrics_are_per_fork(self):
+        template = AcronymChecker(ignore_common_acronyms=False)
+        doc_a = [(0, 'The Flight Management System (FMS) controls the XYZ unit.')]
+        doc_b = [(0, 'The ABC and DEF and GHI modules report status.')]
+
+        fork_a, fork_b = template.fork(), template.fork()
+        fork_a.check(doc_a, full_text=doc_a[0][1])
+        fork_b.check(doc_b, full_text=doc_b[0][1])
+
+        assert fork_a.get_metrics() != fork_b.get_metrics()
+        assert template.get_metrics()['total_acronyms_found'] == 0
+        assert 'FMS' in fork_a._defined and 'FMS' not in fork_b._defined
+
+    def test_spell_checker_document_words_are_per_fork(self):
+        template = EnhancedSpellChecker()
+        doc = [(i, 'Ferris reviewed the plan.') for i in range(3)]
+        fork_a, fork_b = template.fork(), template.fork()
+        fork_a.check(doc)
+        assert 'ferris' in fork_a._document_words
+        assert fork_b._document_words == set() and template._document_words == set()
+
+    def test_concurrent_forks_do_not_cross_talk(self):
+        template = AcronymChecker(ignore_common_acronyms=False)
+        docs = {
+            i: [(0, f'The system uses ACR{i}X and QQ{i}Z interfaces.')]
+            for i in range(8)
+        }
+        metrics = {}
+
+        def _run(i):
+            fork = template.fork()
+            fork.check(docs[i], full_text=docs[i][0][1])
+            metrics[i] = fork.get_metrics()['total_acronyms_found']
+
+        threads = [threading.Thread(target=_run, args=(i,)) for i in docs]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(set(metrics.values())) == 1
+        assert template._defined == set()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Tests and benchmark for large-document comparison (document_compare.differ v2.1.0)
+=================================================================================
+Run with -s to see the diff time vs. document size table.
+"""
+
+import difflib
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('flask')  # document_compare/__init__ registers its blueprint
+
+from document_compare.differ import (
+    EXHAUSTIVE_MOVE_PAIRS, DocumentDiffer, best_line_match, detect_moves, line_opcodes,
+)
+
+
+WORDS = ('system shall provide operator interface data telemetry record report verify '
+         'maintain configuration safety requirement ground flight mission software test').split()
+
+
+def _document(n_lines, rng):
+    lines = []
+    for k in range(n_lines):
+        if k % 40 == 0:
+            lines.append(f"{k // 40 + 1}.0 SECTION {k // 40 + 1}")
+        elif k % 7 == 0:
+            lines.append('')
+        else:
+            lines.append(f"{k}. The " + ' '.join(rng.choice(WORDS) for _ in range(12)) + '.')
+    return lines
+
+
+def _revise(lines, rng, churn=0.05, moved=40):
+    revised = list(lines)
+    for _ in range(int(len(revised) * churn)):
+        k = rng.randrange(len(revised))
+        revised[k] = 'Rewritten ' + ' '.join(rng.choice(WORDS) for _ in range(11))
+    start = len(revised) // 4
+    block = revised[start:start + moved]
+    del revised[start:start + moved]
+    target = 3 * len(revised) // 4
+    revised[target:target] = [line + ' (rev B)' if line else line for line in block]
+    return revised
+
+
+class TestLineOpcodes:
+
+    def test_opcodes_cover_both_sequences(self):
+        rng = random.Random(1)
+        for _ in range(300):
+            a = [rng.choice('abcdefg') for _ in range(rng.randint(0, 30))]
+            b = [rng.choice('abcdefg') for _ in range(rng.randint(0, 30))]
+            i = j = 0
+            for tag, i1, i2, j1, j2 in line_opcodes(a, b):
+                assert (i1, j1) == (i, j)
+                if tag == 'equal':
+                    assert a[i1:i2] == b[j1:j2]
+                i, j = i2, j2
+            assert (i, j) == (len(a), len(b))
+
+    def test_unique_lines_anchor_alignment(self):
+        a = ['intro', '', 'alpha', '', 'beta', '', 'gamma']
+        b = ['intro', '', 'alpha', 'inserted', '', 'beta', '', 'gamma']
+        assert line_opcodes(a, b) == [('equal', 0, 3, 0, 3), ('insert', 3, 3, 3, 4),
+                                      ('equal', 3, 7, 4, 8)]
+
+    def test_identical_documents_are_one_equal_block(self):
+        lines = _document(500, random.Random(2))
+        assert line_opcodes(lines, lines) == [('equal', 0, 500, 0, 500)]
+
+
+class TestLineMatching:
+
+    def test_best_line_match_equals_exhaustive_scan(self):
+        rng = random.Random(3)
+        lines = _document(120, rng)
+        targets = [line.replace('shall', 'must') if rng.random() < 0.5 else line for line in lines[60:]]
+        for line in lines[:60]:
+            best_ratio, best_idx = 0.0, -1
+            for idx, target in enumerate(targets):
+                ratio = difflib.SequenceMatcher(None, line, target).ratio()
+                if ratio > best_ratio:
+                    best_ratio, best_idx = ratio, idx
+            matchers = [(idx, difflib.SequenceMatcher(None, '', t)) for idx, t in enumerate(targets)]
+            found = best_line_match(line, matchers, floor=0.6)
+            if best_ratio >= 0.6:
+                assert found == (best_ratio, best_idx)
+            else:
+                assert found[1] == -1
+
+
+class TestMoveDetection:
+
+    def test_fuzzy_moves_found_beyond_pair_cap(self):
+        rng = random.Random(4)
+        old_lines = _document(1200, rng)
+        new_lines = _revise(old_lines, rng, churn=0.3, moved=40)
+        matcher = difflib.SequenceMatcher(None, old_lines, new_lines, autojunk=False)
+        deleted, added = set(), set()
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag in ('delete', 'replace'):
+                deleted.update(range(i1, i2))
+            if tag in ('insert', 'replace'):
+                added.update(range(j1, j2))
+        assert len(deleted) * len(added) > EXHAUSTIVE_MOVE_PAIRS
+
+        moves = detect_moves(old_lines, new_lines, deleted, added)
+        fuzzy = [m for m in moves if m['similarity'] < 1.0
+                 and m['new_line'] == m['old_line'] + ' (rev B)']
+        assert len(fuzzy) >= 20
+
+    def test_diff_marks_moved_rows(self):
+        rng = random.Random(5)
+        old_lines = _document(3000, rng)
+        new_lines = _revise(old_lines, rng, churn=0.2, moved=40)
+        result = DocumentDiffer().align_and_diff('\n'.join(old_lines), '\n'.join(new_lines))
+        assert result.stats['moved'] >= 20
+        assert any(r.status == 'moved_to' and r.move_source for r in result.rows)
+
+
+class TestDiffBenchmark:
+
+    SIZES = (500, 2000, 8000, 20000)
+
+    def test_diff_time_vs_document_size(self):
+        print("\n[PERF] DocumentDiffer.align_and_diff")
+        print(f"  {'lines':>6} {'rows':>7} {'moved':>6} {'seconds':>8}")
+        rng = random.Random(6)
+        timings = {}
+        for size in self.SIZES:
+            old_lines = _document(size, rng)
+            new_lines = _revise(old_lines, rng, churn=0.1)
+            old_text, new_text = '\n'.join(old_lines), '\n'.join(new_lines)
+            start = time.perf_counter()
+            result = DocumentDiffer().align_and_diff(old_text, new_text)
+            timings[size] = time.perf_counter() - start
+            print(f"  {size:>6} {result.stats['total_rows']:>7} {result.stats['moved']:>6} "
+                  f"{timings[size]:>8.2f}")
+            assert result.stats['moved'] > 0
+
+        # 40x the lines must not cost anywhere near 1600x the time
+        assert timings[self.SIZES[-1]] < max(timings[self.SIZES[0]], 0.05) * 400
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '-s'])
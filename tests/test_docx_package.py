@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared DOCX package model (docx_package.py)
+=========================================================
+"""
+
+import pickle
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import docx_package
+from docx_package import DocxPackage, current_package, open_package, set_current_package
+
+W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+
+DOCUMENT_XML = f'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W}" xmlns:r="{R}"><w:body>
+<w:p><w:r><w:t>The Program Management Office (PMO) owns the plan.</w:t></w:r></w:p>
+<w:p><w:hyperlink r:id="rId5"><w:r><w:t>MIL-STD-882E</w:t></w:r></w:hyperlink></w:p>
+<w:p><w:ins w:id="1" w:author="Reviewer"><w:r><w:t>Added text.</w:t></w:r></w:ins></w:p>
+<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Acronym</w:t></w:r></w:p></w:tc><w:tc><w:p><w:r><w:t>Definition</w:t></w:r></w:p></w:tc></w:tr>
+<w:tr><w:tc><w:p><w:r><w:t>QA</w:t></w:r></w:p></w:tc><w:tc><w:p><w:r><w:t>Quality Assurance</w:t></w:r></w:p></w:tc></w:tr></w:tbl>
+</w:body></w:document>'''
+
+RELS_XML = '''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">
+<Relationship Id="rId5" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink" Target="https://example.mil/882e" TargetMode="External"/>
+<Relationship Id="rId6" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image" Target="media/image1.png"/>
+</Relationships>'''
+
+COMMENTS_XML = f'''<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:comments xmlns:w="{W}"><w:comment w:id="0" w:author="Lead"><w:p><w:r><w:t>Check this.</w:t></w:r></w:p></w:comment></w:comments>'''
+
+
+@pytest.fixture
+def docx_path(tmp_path):
+    path = tmp_path / 'sample.docx'
+    with zipfile.ZipFile(path, 'w') as zf:
+        zf.writestr('word/document.xml', DOCUMENT_XML)
+        zf.writestr('word/_rels/document.xml.rels', RELS_XML)
+        zf.writestr('word/comments.xml', COMMENTS_XML)
+        zf.writestr('word/media/image1.png', b'\x89PNG' + b'\x00' * 96)
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def _detach():
+    yield
+    set_current_package(None)
+
+
+class TestDocxPackage:
+
+    def test_parts_are_read_once(self, docx_path):
+        with DocxPackage(docx_path) as pkg:
+            assert 'Program Management Office' in pkg.document_xml
+            assert pkg.document_tree is pkg.document_tree
+            assert pkg.document_xml is pkg.document_xml
+            assert pkg.reads == 1
+            assert pkg.read_text('word/missing.xml') is None
+            assert pkg.xml('word/missing.xml') is None
+
+    def test_relationships(self, docx_path):
+        with DocxPackage(docx_path) as pkg:
+            assert pkg.hyperlink_targets() == {'rId5': 'https://example.mil/882e'}
+            assert pkg.relationships()['rId5']['mode'] == 'External'
+            assert pkg.relationship_targets('image') == {'rId6': 'media/image1.png'}
+            assert pkg.image_parts() == {'word/media/image1.png': 100}
+
+    def test_tables_and_comments(self, docx_path):
+        with DocxPackage(docx_path) as pkg:
+            assert pkg.tables() == [[['Acronym', 'Definition'], ['QA', 'Quality Assurance']]]
+            assert 'Check this.' in pkg.comments_xml
+
+    def test_pickle_carries_only_path(self, docx_path):
+        pkg = DocxPackage(docx_path)
+        assert pkg.document_tree is not None
+        clone = pickle.loads(pickle.dumps(pkg))
+        assert clone.filepath == docx_path and clone.reads == 0
+        assert clone.hyperlink_targets() == pkg.hyperlink_targets()
+        pkg.close()
+        clone.close()
+
+    def test_open_package_shares_matching_package(self, docx_path, tmp_path):
+        shared = DocxPackage(docx_path)
+        with open_package(docx_path, shared) as pkg:
+            assert pkg is shared and pkg.document_xml
+        assert shared._zip is not None  # not closed by the borrower
+
+        set_current_package(shared)
+        with open_package(docx_path) as pkg:
+            assert pkg is shared
+
+        other = tmp_path / 'other.docx'
+        other.write_bytes(Path(docx_path).read_bytes())
+        with open_package(str(other)) as pkg:
+            assert pkg is not shared and pkg.document_xml
+        assert pkg._zip is None  # private package closed on exit
+
+        with open_package(str(tmp_path / 'report.pdf')) as pkg:
+            assert pkg is None
+
+    def test_set_current_package_closes_previous(self, docx_path):
+        first = DocxPackage(docx_path)
+        set_current_package(first)
+        assert first.document_xml
+        set_current_package(None)
+        assert current_package() is None and first._zip is None
+
+    def test_is_docx_file(self, docx_path, tmp_path):
+        assert docx_package.is_docx_file(docx_path)
+        text = tmp_path / 'notes.txt'
+        text.write_text('plain')
+        assert not docx_package.is_docx_file(str(text))
+        assert not docx_package.is_docx_file(str(tmp_path / 'missing.docx'))
+
+
+class TestConsumers:
+
+    def test_checkers_share_one_parse(self, docx_path):
+        from acronym_checker import AcronymChecker
+        from document_checker import TrackChangesChecker
+        from hyperlink_checker import HyperlinkChecker
+
+        paragraphs = [(0, 'The Program Management Office (PMO) owns the plan.'), (1, 'MIL-STD-882E')]
+        pkg = DocxPackage(docx_path)
+        kwargs = {'filepath': docx_path, 'docx_package': pkg}
+
+        links = HyperlinkChecker()._extract_docx_hyperlinks(docx_path, pkg)
+        assert [link['target'] for link in links] == ['https://example.mil/882e']
+        changes, comments = TrackChangesChecker()._extract_from_file(docx_path, pkg)
+        assert changes == [{'type': 'insertion', 'author': 'Reviewer'}]
+        assert comments[0]['author'] == 'Lead'
+        AcronymChecker().check(paragraphs, full_text='', **kwargs)
+
+        # document.xml, rels and comments each decompressed exactly once
+        assert pkg.reads == 3
+        # Same answers without a shared package
+        assert HyperlinkChecker()._extract_docx_hyperlinks(docx_path) == links
+        pkg.close()
+
+    def test_image_checker_uses_package(self, docx_path):
+        from image_figure_checker import ImageFigureChecker
+        with DocxPackage(docx_path) as pkg:
+            assert ImageFigureChecker()._extract_images(docx_path, pkg) == []
+            assert pkg.reads == 2
+
+    def test_review_detaches_package(self, tmp_path):
+        docx = pytest.importorskip('docx')
+        core = pytest.importorskip('core')
+        doc = docx.Document()
+        doc.add_paragraph('The contractor shall deliver the Test Plan (TP) within 30 days.')
+        table = doc.add_table(rows=2, cols=2)
+        table.cell(0, 0).text = 'Role'
+        table.cell(1, 0).text = 'Program Manager'
+        path = tmp_path / 'plan.docx'
+        doc.save(path)
+
+        result = core.AEGISEngine().review_document(
+            str(path), {'batch_mode': True, 'extraction_cache': False})
+        assert result['success']
+        assert current_package() is None
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Tests for the domain-aware validation scheduler (hyperlink_validator.domain_scheduler)
+====================================================================================
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('requests')  # hyperlink_validator/__init__ imports the validator
+
+from hyperlink_validator.domain_scheduler import (
+    DomainScheduler, TokenBucket, host_key, parse_retry_after,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _urls(host, count):
+    return [f'https://{host}/page/{i}' for i in range(count)]
+
+
+class TestHelpers:
+
+    def test_host_key_ignores_port_case_and_credentials(self):
+        assert host_key('https://User:pw@Example.COM:8443/x') == 'example.com'
+        assert host_key('http://[::1]:8080/') == '[::1]'
+
+    def test_parse_retry_after(self):
+        assert parse_retry_after('7') == 7.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after('soon') is None
+        assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+
+    def test_token_bucket_refills_at_rate(self):
+        bucket = TokenBucket(rate=2.0, burst=1, now=0.0)
+        assert bucket.wait_time(0.0) == 0.0
+        bucket.take(0.0)
+        assert bucket.wait_time(0.0) == pytest.approx(0.5)
+        assert bucket.wait_time(0.5) == 0.0
+
+
+class TestScheduling:
+
+    def test_round_robin_across_hosts(self):
+        urls = _urls('big.example', 6) + _urls('a.example', 2) + _urls('b.example', 2)
+        scheduler = DomainScheduler(urls, max_per_host=1, clock=_Clock())
+        order = []
+        for _ in range(3):
+            url = scheduler.next_url(timeout=0)
+            order.append(host_key(url))
+            scheduler.complete(url, 200)
+        assert order == ['big.example', 'a.example', 'b.example']
+
+    def test_in_flight_cap_per_host(self):
+        clock = _Clock()
+        scheduler = DomainScheduler(_urls('one.example', 5), max_per_host=2,
+                                    rate_per_host=1000, clock=clock)
+        first, second = scheduler.next_url(timeout=0), scheduler.next_url(timeout=0)
+        assert first and second
+        clock.now += 1
+        assert scheduler.next_url(timeout=0) is None
+        scheduler.complete(first, 200)
+        assert scheduler.next_url(timeout=0) is not None
+
+    def test_token_bucket_paces_a_host(self):
+        clock = _Clock()
+        scheduler = DomainScheduler(_urls('one.example', 4), max_per_host=10,
+                                    rate_per_host=2.0, burst=1, clock=clock)
+        url = scheduler.next_url(timeout=0)
+        scheduler.complete(url, 200)
+        assert scheduler.next_url(timeout=0) is None
+        clock.now += 0.5
+        assert scheduler.next_url(timeout=0) is not None
+
+    def test_backoff_requeues_and_honours_retry_after(self):
+        clock = _Clock()
+        urls = _urls('slow.example', 1) + _urls('fast.example', 2)
+        scheduler = DomainScheduler(urls, max_per_host=1, rate_per_host=1000, clock=clock)
+        throttled = scheduler.next_url(timeout=0)
+        assert scheduler.complete(throttled, 429, retry_after=30) is True
+        assert scheduler.outstanding == 3
+
+        handed_out = []
+        while (url := scheduler.next_url(timeout=0)) is not None:
+            handed_out.append(url)
+            scheduler.complete(url, 200)
+        assert all(host_key(u) == 'fast.example' for u in handed_out)
+        assert scheduler.snapshot()['slow.example']['backoff_remaining'] == 30
+
+        clock.now += 30
+        assert scheduler.next_url(timeout=0) == throttled
+        assert scheduler.snapshot()['slow.example']['rate_limit'] < 1000
+
+    def test_requeue_limit_reports_final_result(self):
+        clock = _Clock()
+        scheduler = DomainScheduler(_urls('down.example', 1), max_requeues=1,
+                                    base_backoff=0, clock=clock)
+        url = scheduler.next_url(timeout=0)
+        assert scheduler.complete(url, 503) is True
+        clock.now += 10
+        assert scheduler.next_url(timeout=0) == url
+        assert scheduler.complete(url, 503) is False
+        assert scheduler.outstanding == 0
+        assert scheduler.next_url() is None
+
+
+class TestConcurrency:
+
+    def test_workers_stay_busy_on_other_hosts(self):
+        """One slow, rate-limited host must not hold up the rest of the batch."""
+        urls = _urls('slow.example', 8) + [f'https://host{i}.example/' for i in range(24)]
+        scheduler = DomainScheduler(urls, max_per_host=2, rate_per_host=1000)
+        active = Counter()
+        peak = Counter()
+        finished = []
+        lock = threading.Lock()
+
+        def worker():
+            while (url := scheduler.next_url()) is not None:
+                host = host_key(url)
+                with lock:
+                    active[host] += 1
+                    peak[host] = max(peak[host], active[host])
+                time.sleep(0.05 if host == 'slow.example' else 0.005)
+                with lock:
+                    active[host] -= 1
+                if not scheduler.complete(url, 200):
+                    with lock:
+                        finished.append(url)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=10)
+
+        assert sorted(finished) == sorted(urls)
+        assert peak['slow.example'] <= 2
+        snapshot = scheduler.snapshot()
+        assert snapshot['slow.example']['completed'] == 8
+        assert snapshot['slow.example']['urls_per_second'] > 0
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled hyperlink exclusion matcher (hyperlink_validator.exclusion_matcher)
+========================================================================================
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('requests')  # hyperlink_validator/__init__ imports the validator
+
+from hyperlink_validator.exclusion_matcher import AhoCorasick, CompiledExclusions
+from hyperlink_validator.models import ExclusionRule
+from hyperlink_validator.storage import HyperlinkValidatorStorage
+
+
+HOSTS = ['example.com', 'intranet.corp', 'docs.python.org', 'EXAMPLE.com', 'a.mil']
+PATHS = ['', '/', '/docs', '/docs/', '/login?next=/x', '/files/report.pdf', '/Docs/Index.HTML']
+MATCH_TYPES = ['exact', 'prefix', 'suffix', 'contains', 'regex', 'bogus']
+
+
+def _urls(rng, count):
+    return [f"{rng.choice(['http', 'https', 'HTTPS'])}://{rng.choice(HOSTS)}{rng.choice(PATHS)}"
+            for _ in range(count)]
+
+
+def _rules(rng, count):
+    rules = []
+    for _ in range(count):
+        match_type = rng.choice(MATCH_TYPES)
+        url = _urls(rng, 1)[0]
+        if match_type == 'exact':
+            pattern = url
+        elif match_type == 'prefix':
+            pattern = url[:rng.randint(0, len(url))]
+        elif match_type == 'suffix':
+            pattern = url[rng.randint(0, len(url)):]
+        elif match_type == 'regex':
+            pattern = rng.choice([r'\.pdf$', r'log(in|out)', r'^https://[a-z]+\.mil', '[unclosed',
+                                  r'(docs)/\1', 'python'])
+        else:
+            pattern = url[rng.randint(0, 10):rng.randint(10, len(url))]
+        rules.append(ExclusionRule(pattern=pattern, match_type=match_type))
+    return rules
+
+
+class TestAhoCorasick:
+
+    def test_finds_overlapping_patterns(self):
+        automaton = AhoCorasick([('he', 0), ('she', 1), ('his', 2), ('hers', 3)])
+        assert automaton.find('ushers') == {0, 1, 3}
+        assert automaton.find('nothing') == set()
+
+
+class TestCompiledExclusions:
+
+    def test_matches_linear_scan_of_exclusion_rules(self):
+        rng = random.Random(7)
+        for _ in range(40):
+            rules = _rules(rng, rng.randint(1, 25))
+            index = CompiledExclusions(rules)
+            for url in _urls(rng, 40):
+                expected = next((r for r in rules if r.matches(url)), None)
+                assert index.match(url) is expected, (url, expected)
+
+    def test_storage_semantics_match_matches_pattern(self, tmp_path):
+        storage = HyperlinkValidatorStorage(str(tmp_path / 'hv.db'))
+        rng = random.Random(8)
+        rules = _rules(rng, 30)
+        index = CompiledExclusions(rules, storage_semantics=True)
+        for url in _urls(rng, 200):
+            expected = next((r for r in rules
+                             if storage._matches_pattern(url, r.pattern, r.match_type)), None)
+            assert index.match(url) is expected, (url, expected)
+
+    def test_http_https_and_trailing_slash_variants(self):
+        rule = ExclusionRule(pattern='https://example.com/docs/', match_type='exact')
+        index = CompiledExclusions([rule])
+        assert index.match('http://EXAMPLE.com/docs') is rule
+        assert index.match('https://example.com/docs/more') is None
+
+    def test_lookup_cost_does_not_grow_with_rule_count(self):
+        rules = [ExclusionRule(pattern=f'/archive/{i}/', match_type='contains') for i in range(5000)]
+        rules += [ExclusionRule(pattern=f'https://host{i}.example', match_type='prefix')
+                  for i in range(5000)]
+        index = CompiledExclusions(rules)
+        urls = [f'https://site{i}.example/page/{i}' for i in range(2000)]
+        start = time.perf_counter()
+        assert all(index.match(u) is None for u in urls)
+        indexed = time.perf_counter() - start
+        start = time.perf_counter()
+        assert all(not any(r.matches(u) for r in rules) for u in urls[:20])
+        linear = (time.perf_counter() - start) * 100
+        assert indexed < linear / 10
+
+
+class TestStorageIndex:
+
+    def test_find_matching_exclusion_sees_changes(self, tmp_path):
+        storage = HyperlinkValidatorStorage(str(tmp_path / 'hv.db'))
+        assert storage.find_matching_exclusion('https://a.example/login') is None
+        exclusion_id = storage.add_exclusion('/login', 'contains')
+        assert storage.find_matching_exclusion('https://a.example/login').id == exclusion_id
+        storage.update_exclusion(exclusion_id, is_active=False)
+        assert storage.find_matching_exclusion('https://a.example/login') is None
+        storage.update_exclusion(exclusion_id, is_active=True, pattern='/logout')
+        assert storage.find_matching_exclusion('https://a.example/logout').id == exclusion_id
+        storage.delete_exclusion(exclusion_id)
+        assert storage.find_matching_exclusion('https://a.example/logout') is None
+
+    def test_change_during_rebuild_is_not_cached_stale(self, tmp_path, monkeypatch):
+        storage = HyperlinkValidatorStorage(str(tmp_path / 'hv.db'))
+        read_rules = storage.get_all_exclusions
+        added = []
+
+        def racing_read(**kwargs):
+            rules = read_rules(**kwargs)
+            if not added:
+                # Another request adds a rule after this rebuild read the table
+                added.append(storage.add_exclusion('/login', 'contains'))
+            return rules
+
+        monkeypatch.setattr(storage, 'get_all_exclusions', racing_read)
+        assert storage.find_matching_exclusion('https://a.example/login') is None
+        assert storage.find_matching_exclusion('https://a.example/login').id == added[0]
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared URL result index used by highlighted exports
+=================================================================
+"""
+
+import io
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('requests')  # hyperlink_validator/__init__ imports the validator
+
+from hyperlink_validator.export import ResultIndex
+from hyperlink_validator.models import ValidationResult
+
+
+def _results():
+    return [
+        ValidationResult(url='https://Example.com/docs/', status='BROKEN', status_code=404, message='Not found'),
+        ValidationResult(url='http://ok.example.com/page', status='WORKING', status_code=200, message='OK'),
+        ValidationResult(url='https://gone.example.com/x', status='DNSFAILED', message='No such host'),
+        ValidationResult(url='https://intranet.corp/a', status='BROKEN', message='Excluded',
+                         excluded=True, exclusion_reason='treat as valid'),
+    ]
+
+
+class TestResultIndex:
+
+    def test_lookup_ignores_slash_scheme_and_host_case(self):
+        index = ResultIndex(_results())
+        for variant in ('https://example.com/docs', 'http://EXAMPLE.com/docs/',
+                        'https://example.com:443/docs#top'):
+            assert index.get(variant).status_code == 404
+        assert index.get('http://ok.example.com/page/').status == 'WORKING'
+        assert index.get('http://unknown.example.com/') is None
+        assert index.get('') is None
+
+    def test_first_result_wins_for_duplicates(self):
+        results = _results() + [ValidationResult(url='https://example.com/docs', status='WORKING')]
+        assert ResultIndex(results).get('https://example.com/docs').status == 'BROKEN'
+
+    def test_is_broken(self):
+        index = ResultIndex(_results())
+        assert index.is_broken('http://example.com/docs')
+        assert index.is_broken('http://gone.example.com/x')
+        assert not index.is_broken('http://ok.example.com/page')
+        assert not index.is_broken('https://intranet.corp/a')  # excluded, treated as valid
+
+    def test_broken_url_in_text(self):
+        index = ResultIndex(_results())
+        assert index.broken_url_in_text('See https://gone.example.com/x for details') == \
+            'https://gone.example.com/x'
+        assert index.broken_url_in_text('See http://ok.example.com/page') is None
+        assert index.broken_url_in_text('') is None
+
+    def test_display_applies_exclusion_rules(self):
+        index = ResultIndex(_results())
+        display = index.get_display('https://intranet.corp/a')
+        assert display is index.get_display('https://intranet.corp/a')
+        assert index.get_display('https://nowhere.example.com') is None
+
+
+class TestHighlightedExcel:
+
+    def test_broken_rows_highlighted(self, tmp_path):
+        openpyxl = pytest.importorskip('openpyxl')
+        from hyperlink_validator.export import export_highlighted_excel, export_highlighted_excel_multicolor
+
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = 'Links'
+        ws.append(['Name', 'Link'])
+        ws.append(['docs', 'https://example.com/docs'])
+        ws.append(['ok', 'http://ok.example.com/page'])
+        ws.append(['text', 'mirror at https://gone.example.com/x'])
+        source = tmp_path / 'links.xlsx'
+        wb.save(source)
+
+        ok, message, data = export_highlighted_excel(str(source), _results())
+        assert ok, message
+        out = openpyxl.load_workbook(io.BytesIO(data))['Links']
+        assert out['B2'].comment is not None and '404' in out['B2'].comment.text
+        assert out['B3'].comment is None
+        assert out['B4'].font.color.rgb.endswith('CC0000') or out['B4'].font.bold
+
+        ok, message, data = export_highlighted_excel_multicolor(str(source), _results())
+        assert ok, message
+        out = openpyxl.load_workbook(io.BytesIO(data))['Links']
+        assert out.cell(row=2, column=3).value != out.cell(row=3, column=3).value
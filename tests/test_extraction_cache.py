@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Tests for the content-addressed extraction cache (extraction_cache.py)
+======================================================================
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import extraction_cache
+from extraction_cache import CachedExtraction, ExtractionCache, cache_key, file_digest
+
+
+class _FakeExtractor:
+    def __init__(self, n=3, html_preview='<p>Scope</p>'):
+        self.paragraphs = [(i, f'Paragraph {i} text.') for i in range(n)]
+        self.tables = [{'number': 1, 'rows': [['A', 'B'], ['1', '2']], 'start_para': 0}]
+        self.figures = []
+        self.comments = []
+        self.track_changes = []
+        self.headings = [{'index': 0, 'text': 'Scope', 'style': 'Heading 1', 'level': 1}]
+        self.full_text = '\n'.join(t for _, t in self.paragraphs)
+        self.word_count = len(self.full_text.split())
+        self.has_toc = False
+        self.sections = {'Scope': 0}
+        self.page_map = {i: 1 + i // 2 for i in range(n)}
+        self.page_count = 2
+        self.html_preview = html_preview
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExtractionCache(tmp_path / 'extraction_cache.db')
+
+
+class TestExtractionCache:
+
+    def test_round_trip_restores_types(self, cache):
+        cache.put('k', _FakeExtractor(), docling_used=True, clean_full_text='clean',
+                  pdf_quality_info={'quality': 'good'})
+        hit = cache.get('k')
+        assert isinstance(hit, CachedExtraction)
+        assert hit.paragraphs == _FakeExtractor().paragraphs
+        assert all(isinstance(p, tuple) for p in hit.paragraphs)
+        assert hit.page_map == {0: 1, 1: 1, 2: 2}
+        assert hit.tables[0]['rows'] == [['A', 'B'], ['1', '2']]
+        assert hit.headings[0]['level'] == 1
+        assert hit.html_preview == '<p>Scope</p>'
+        assert hit.extractor_name == '_FakeExtractor'
+        assert hit.docling_used and hit.clean_full_text == 'clean'
+        assert hit.pdf_quality_info == {'quality': 'good'}
+        assert hit.hyperlinks == [] and hit.comments == []
+
+    def test_miss_and_stats(self, cache):
+        assert cache.get('missing') is None
+        cache.put('k', _FakeExtractor())
+        cache.get('k')
+        stats = cache.stats()
+        assert (stats['entries'], stats['hits'], stats['misses']) == (1, 1, 1)
+
+    def test_batch_entry_needs_preview_for_interactive_review(self, cache):
+        cache.put('k', _FakeExtractor(html_preview=''), has_preview=False)
+        assert cache.get('k', need_preview=False) is not None
+        assert cache.get('k') is None
+        cache.put('k', _FakeExtractor(), has_preview=True)
+        assert cache.get('k').html_preview
+
+    def test_size_budget_evicts_least_recently_used(self, tmp_path):
+        probe = ExtractionCache(tmp_path / 'probe.db')
+        probe.put('x', _FakeExtractor(n=50))
+        entry_size = probe.stats()['bytes']
+
+        small = ExtractionCache(tmp_path / 'small.db', max_bytes=int(entry_size * 2.5))
+        for key in ('a', 'b'):
+            small.put(key, _FakeExtractor(n=50))
+        small.get('a')  # b is now least recently used
+        small.put('c', _FakeExtractor(n=50))
+        assert small.get('b', need_preview=False) is None
+        assert small.get('a') is not None and small.get('c') is not None
+        assert small.stats()['bytes'] <= small.max_bytes
+
+    def test_oversized_entry_not_stored(self, tmp_path):
+        tiny = ExtractionCache(tmp_path / 'tiny.db', max_bytes=10)
+        assert not tiny.put('k', _FakeExtractor())
+        assert tiny.stats()['entries'] == 0
+
+    def test_key_depends_on_content_and_signature(self, tmp_path):
+        one, two = tmp_path / 'one.docx', tmp_path / 'two.docx'
+        one.write_bytes(b'PK same bytes')
+        two.write_bytes(b'PK same bytes')
+        assert file_digest(str(one)) == file_digest(str(two))
+        digest = file_digest(str(one))
+        assert cache_key(digest, 'aegis=1') != cache_key(digest, 'aegis=2')
+        two.write_bytes(b'PK other bytes')
+        assert file_digest(str(two)) != digest
+
+    def test_option_overrides_config(self):
+        assert extraction_cache.is_extraction_cache_enabled({'extraction_cache': False}) is False
+        assert extraction_cache.is_extraction_cache_enabled({'extraction_cache': True}) is True
+
+
+class TestReviewUsesCache:
+
+    def test_unchanged_document_skips_extraction(self, tmp_path, monkeypatch):
+        docx = pytest.importorskip('docx')
+        core = pytest.importorskip('core')
+
+        doc = docx.Document()
+        doc.add_heading('1.0 Scope', level=1)
+        doc.add_paragraph('The contractor shall deliver the report within 30 days.')
+        doc.add_paragraph('The reviewer shall verify every requirement in the report.')
+        path = tmp_path / 'spec.docx'
+        doc.save(path)
+
+        cache = ExtractionCache(tmp_path / 'extraction_cache.db')
+        monkeypatch.setattr(extraction_cache, 'get_extraction_cache', lambda *a, **k: cache)
+        monkeypatch.setattr(core, '_docling_session_broken', True)
+
+        calls = []
+
+        def _no_mammoth(filepath, **kwargs):
+            calls.append(filepath)
+            raise RuntimeError('mammoth disabled for test')
+
+        monkeypatch.setattr(core, 'MammothDocumentExtractor', _no_mammoth)
+
+        engine = core.AEGISEngine()
+        options = {'batch_mode': True, 'extraction_cache': True}
+        first = engine.review_document(str(path), dict(options))
+        second = engine.review_document(str(path), dict(options))
+
+        assert len(calls) == 1
+        assert not first['extraction_cached'] and second['extraction_cached']
+        assert second['paragraph_count'] == first['paragraph_count']
+        assert second['issue_count'] == first['issue_count']
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-host DNS/TLS probe cache (hyperlink_validator.host_probe)
+==========================================================================
+"""
+
+import asyncio
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('requests')  # hyperlink_validator/__init__ imports the validator
+
+from hyperlink_validator.host_probe import HostProbeCache, split_host
+from hyperlink_validator.validator import check_dns_resolution
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Resolver:
+    def __init__(self, delay=0.0, fail=()):
+        self.calls = []
+        self.delay = delay
+        self.fail = set(fail)
+        self._lock = threading.Lock()
+
+    def __call__(self, host):
+        with self._lock:
+            self.calls.append(host)
+        time.sleep(self.delay)
+        if host in self.fail:
+            return {'resolved': False, 'ip_addresses': [], 'response_time_ms': 0, 'error': 'nx'}
+        return {'resolved': True, 'ip_addresses': ['10.0.0.1'], 'response_time_ms': 1.0}
+
+
+def _ssl_prober(calls):
+    def probe(host, port, timeout):
+        calls.append((host, port))
+        return {'valid': True, 'issuer': 'Test CA', 'expires': '2030-01-01',
+                'days_until_expiry': 1000, 'warning': None}
+    return probe
+
+
+class TestSplitHost:
+
+    def test_ports_credentials_and_ipv6(self):
+        assert split_host('User:pw@Example.COM:8443') == ('example.com', 8443)
+        assert split_host('example.com') == ('example.com', 443)
+        assert split_host('[::1]:8080') == ('::1', 8080)
+        assert split_host('example.com', default_port=80) == ('example.com', 80)
+
+
+class TestHostProbeCache:
+
+    def test_one_lookup_per_host(self):
+        resolver = _Resolver()
+        probe = HostProbeCache(resolver=resolver)
+        for netloc in ('a.example', 'A.example:443', 'a.example:8080', 'b.example'):
+            assert probe.resolve(netloc)['resolved']
+        assert sorted(resolver.calls) == ['a.example', 'b.example']
+
+    def test_concurrent_callers_share_the_lookup(self):
+        resolver = _Resolver(delay=0.1)
+        probe = HostProbeCache(resolver=resolver)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(probe.resolve('slow.example')))
+                   for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert resolver.calls == ['slow.example']
+        assert len(results) == 10 and all(r['resolved'] for r in results)
+        assert results[0]['ip_addresses'] is not results[1]['ip_addresses']
+
+    def test_ttl_and_failure_ttl(self):
+        clock = _Clock()
+        resolver = _Resolver(fail={'bad.example'})
+        probe = HostProbeCache(dns_ttl=300, dns_failure_ttl=60, resolver=resolver, clock=clock)
+        probe.resolve('good.example')
+        probe.resolve('bad.example')
+        clock.now += 100
+        probe.resolve('good.example')
+        probe.resolve('bad.example')
+        assert resolver.calls == ['good.example', 'bad.example', 'bad.example']
+        clock.now += 250
+        probe.resolve('good.example')
+        assert resolver.calls.count('good.example') == 2
+
+    def test_refresh_and_timeout(self):
+        resolver = _Resolver()
+        probe = HostProbeCache(resolver=resolver)
+        probe.resolve('a.example')
+        probe.resolve('a.example', refresh=True)
+        assert resolver.calls == ['a.example', 'a.example']
+
+        slow = HostProbeCache(resolver=_Resolver(delay=0.5))
+        result = slow.resolve('slow.example', timeout=0.05)
+        assert not result['resolved'] and 'timed out' in result['error']
+
+    def test_prefetch_resolves_distinct_hosts(self):
+        resolver = _Resolver()
+        ssl_calls = []
+        probe = HostProbeCache(resolver=resolver, ssl_prober=_ssl_prober(ssl_calls))
+        urls = [f'https://a.example/p{i}' for i in range(50)] + \
+               ['http://b.example/', 'https://b.example:8443/', 'mailto:x@y.z']
+        assert probe.prefetch(urls, dns=True, ssl_certs=True) == 2
+        assert probe.resolve('a.example')['resolved']
+        assert probe.ssl_certificate('b.example:8443')['valid']
+        assert probe.ssl_certificate('a.example')['valid']
+        assert sorted(resolver.calls) == ['a.example', 'b.example']
+        assert sorted(ssl_calls) == [('a.example', 443), ('b.example', 8443)]
+
+    def test_async_api_shares_the_cache(self):
+        resolver = _Resolver(delay=0.05)
+        ssl_calls = []
+        probe = HostProbeCache(resolver=resolver, ssl_prober=_ssl_prober(ssl_calls))
+
+        async def main():
+            return await asyncio.gather(*(probe.aresolve('a.example') for _ in range(20)),
+                                        probe.assl_certificate('a.example'),
+                                        probe.assl_certificate('a.example:443'))
+
+        results = asyncio.run(main())
+        assert resolver.calls == ['a.example'] and ssl_calls == [('a.example', 443)]
+        assert all(r['resolved'] for r in results[:20])
+        assert probe.resolve('a.example')['resolved'] and resolver.calls == ['a.example']
+
+
+def test_check_dns_resolution_leaves_socket_timeout_alone():
+    before = socket.getdefaulttimeout()
+    check_dns_resolution('localhost', timeout=3)
+    assert socket.getdefaulttimeout() == before
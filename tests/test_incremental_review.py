@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Tests for incremental re-review (incremental_review.py)
+=======================================================
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from checker_scheduler import CheckerScheduler
+from grammar_checker import ContractionsChecker, PassiveVoiceChecker
+from incremental_review import IncrementalReview, ParagraphIssueCache, paragraph_hash
+from requirements_checker import RequirementsLanguageChecker
+from writing_quality_checker import WeakLanguageChecker, WordyPhrasesChecker
+
+
+PARAGRAPHS = [
+    (0, "The report was written by the team in order to document the results."),
+    (1, "We can't guarantee that the approximately correct values are used."),
+    (2, "The system shall be tested at the end of the day by the operator."),
+    (3, "Due to the fact that the data was corrupted, the run was repeated."),
+    (4, "This paragraph is plain and has nothing to flag for any checker here."),
+]
+
+
+class _CountingChecker:
+    """Wraps a checker and records which paragraphs it was asked to check."""
+
+    def __init__(self, inner, paragraph_local=True):
+        self.inner = inner
+        self.PARAGRAPH_LOCAL = paragraph_local
+        self.CHECKER_VERSION = inner.CHECKER_VERSION
+        self.seen = []
+
+    def safe_check(self, **kwargs):
+        self.seen.append([idx for idx, _ in kwargs['paragraphs']])
+        return self.inner.safe_check(**kwargs)
+
+
+class _DocumentCountChecker:
+    """Document-global checker: one issue reporting the paragraph count."""
+
+    CHECKER_VERSION = '1.0.0'
+
+    def safe_check(self, paragraphs, **kwargs):
+        return [{'category': 'Count', 'message': f'{len(paragraphs)} paragraphs',
+                 'paragraph_index': 0}]
+
+
+def _checkers():
+    return {
+        'passive_voice': _CountingChecker(PassiveVoiceChecker()),
+        'contractions': _CountingChecker(ContractionsChecker()),
+        'weak_language': _CountingChecker(WeakLanguageChecker()),
+        'wordy_phrases': _CountingChecker(WordyPhrasesChecker()),
+        'doc_count': _DocumentCountChecker(),
+    }
+
+
+def _run(checkers, paragraphs, cache, special_sections=None):
+    scheduler = CheckerScheduler(checkers, parallel=False)
+    kwargs = {'paragraphs': paragraphs, 'full_text': '\n'.join(t for _, t in paragraphs),
+              'special_sections': special_sections or {}}
+    incremental = IncrementalReview(checkers, paragraphs, special_sections, cache=cache)
+    return incremental.run(scheduler, list(checkers), kwargs), incremental.stats
+
+
+def _full(paragraphs, special_sections=None):
+    checkers = _checkers()
+    kwargs = {'paragraphs': paragraphs, 'full_text': '\n'.join(t for _, t in paragraphs),
+              'special_sections': special_sections or {}}
+    return CheckerScheduler(checkers, parallel=False).run(list(checkers), kwargs)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParagraphIssueCache(tmp_path / 'review_cache.db')
+
+
+class TestIncrementalReview:
+
+    def test_first_run_matches_full_review(self, cache):
+        results, stats = _run(_checkers(), PARAGRAPHS, cache)
+        assert results == _full(PARAGRAPHS)
+        assert stats['reused_checkers'] == 0
+
+    def test_unchanged_document_reuses_everything(self, cache):
+        _run(_checkers(), PARAGRAPHS, cache)
+        checkers = _checkers()
+        results, stats = _run(checkers, PARAGRAPHS, cache)
+        assert results == _full(PARAGRAPHS)
+        assert stats['reused_checkers'] == 4
+        assert all(checkers[n].seen == [] for n in ('passive_voice', 'contractions'))
+
+    def test_only_edited_paragraphs_are_rechecked(self, cache):
+        _run(_checkers(), PARAGRAPHS, cache)
+        edited = list(PARAGRAPHS)
+        edited[1] = (1, "We shouldn't rely on values that were basically estimated.")
+        edited.insert(3, (5, "A new paragraph was added in order to explain it."))
+        checkers = _checkers()
+        results, stats = _run(checkers, edited, cache)
+
+        assert results == _full(edited)
+        assert checkers['passive_voice'].seen == [[1, 5]]
+        assert stats['rechecked_paragraphs'] == 2
+
+    def test_moved_paragraphs_get_their_new_index(self, cache):
+        _run(_checkers(), PARAGRAPHS, cache)
+        renumbered = [(idx + 10, text) for idx, text in reversed(PARAGRAPHS)]
+        checkers = _checkers()
+        results, _ = _run(checkers, renumbered, cache)
+        assert results == _full(renumbered)
+        assert checkers['passive_voice'].seen == []
+
+    def test_document_global_checkers_always_see_whole_document(self, cache):
+        _run(_checkers(), PARAGRAPHS, cache)
+        shorter = PARAGRAPHS[:3]
+        results, stats = _run(_checkers(), shorter, cache)
+        assert dict(results)['doc_count'][0]['message'] == '3 paragraphs'
+        assert stats['full_checkers'] == 1
+
+    def test_special_section_membership_is_part_of_the_key(self, cache):
+        _run(_checkers(), PARAGRAPHS, cache)
+        special = {'definitions': [1]}
+        checkers = _checkers()
+        results, _ = _run(checkers, PARAGRAPHS, cache, special_sections=special)
+        assert results == _full(PARAGRAPHS, special)
+        assert checkers['weak_language'].seen == [[1]]
+        assert paragraph_hash('x', True) != paragraph_hash('x', False)
+
+    def test_checker_options_are_part_of_the_key(self, cache):
+        paragraphs = [(0, "The operator should verify the hydraulic pressure before taxi."),
+                      (1, "The system shall record every fault code in the maintenance log.")]
+
+        def run(flag):
+            checkers = {'requirements_language': RequirementsLanguageChecker(flag_should_in_reqs=flag)}
+            return _run(checkers, paragraphs, cache)
+
+        _, stats = run(True)
+        assert stats['reused_checkers'] == 0
+        _, stats = run(False)
+        assert stats['reused_checkers'] == 0 and stats['rechecked_paragraphs'] == 2
+        _, stats = run(True)
+        assert stats['reused_checkers'] == 1
+
+    def test_cache_is_bounded(self, tmp_path):
+        small = ParagraphIssueCache(tmp_path / 'small.db', max_entries=3)
+        _run(_checkers(), PARAGRAPHS, small)
+        assert len(small.load(paragraph_hash(t) for _, t in PARAGRAPHS)) == 3
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests for JobManager progress notification and the restart journal
+==================================================================
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from job_manager import JobManager, JobPhase, JobStatus, JobJournal
+
+
+@pytest.fixture
+def journal_path(tmp_path):
+    return str(tmp_path / 'job_journal.db')
+
+
+class TestProgressNotification:
+
+    def test_wait_wakes_on_update(self):
+        manager = JobManager(progress_interval=0)
+        job_id = manager.create_job('review')
+        version, _ = manager.wait_for_update(job_id, timeout=0)
+
+        threading.Timer(0.05, manager.start_job, args=(job_id,)).start()
+        start = time.monotonic()
+        new_version, data = manager.wait_for_update(job_id, since_version=version, timeout=5)
+        assert time.monotonic() - start < 2
+        assert new_version > version
+        assert data['status'] == 'running'
+        assert data['version'] == new_version
+
+    def test_wait_times_out_unchanged(self):
+        manager = JobManager()
+        job_id = manager.create_job('review')
+        version, _ = manager.wait_for_update(job_id, timeout=0)
+        assert manager.wait_for_update(job_id, since_version=version, timeout=0.05)[0] == version
+        assert manager.wait_for_update('missing', timeout=0) is None
+
+    def test_terminal_job_never_blocks(self):
+        manager = JobManager()
+        job_id = manager.create_job('review')
+        manager.complete_job(job_id, result={'ok': True})
+        version, data = manager.wait_for_update(job_id, since_version=10 ** 6, timeout=5)
+        assert data['status'] == 'complete'
+
+    def test_touch_wakes_waiters_without_changing_the_job(self):
+        manager = JobManager(progress_interval=0)
+        job_id = manager.create_job('batch_scan')
+        version, before = manager.wait_for_update(job_id, timeout=0)
+        threading.Timer(0.05, manager.touch, args=(job_id,)).start()
+        new_version, after = manager.wait_for_update(job_id, since_version=version, timeout=5)
+        assert new_version == version + 1
+        assert after['progress'] == before['progress'] and after['status'] == before['status']
+        assert manager.touch('missing') is False
+
+    def test_progress_ticks_are_coalesced(self):
+        manager = JobManager(progress_interval=60)
+        job_id = manager.create_job('review')
+        manager.start_job(job_id)
+        manager.update_phase(job_id, JobPhase.CHECKING)
+        job = manager.get_job(job_id)
+        notified = job._last_notify
+        for i in range(50):
+            manager.update_checker_progress(job_id, 'grammar', i, 50)
+        # Version moves on every tick, waiters are only woken by forced updates
+        assert job._last_notify == notified
+        version, data = manager.wait_for_update(job_id, since_version=0, timeout=0)
+        assert data['progress']['checkers_completed'] == 49
+
+    def test_jobs_progress_independently(self):
+        manager = JobManager()
+        ids = [manager.create_job('review') for _ in range(4)]
+        for job_id in ids:
+            manager.start_job(job_id)
+
+        def work(job_id):
+            for i in range(200):
+                manager.update_phase_progress(job_id, i / 2)
+
+        threads = [threading.Thread(target=work, args=(job_id,)) for job_id in ids]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert all(manager.get_job(j).progress.phase_progress == 99.5 for j in ids)
+
+
+def _journaling_manager(journal_path, *job_types):
+    manager = JobManager(journal_path=journal_path)
+    for job_type in job_types:
+        manager.register_resume_handler(job_type, lambda job: None)
+    return manager
+
+
+class TestJournal:
+
+    def test_unfinished_jobs_restored_as_interrupted(self, journal_path, tmp_path):
+        completed = [str(tmp_path / 'a.docx')]
+        manager = _journaling_manager(journal_path, 'batch_scan', 'review')
+        running = manager.create_job('batch_scan', metadata={'scan_id': 'abc'})
+        manager.start_job(running)
+        manager.update_phase(running, JobPhase.CHECKING)
+        manager.checkpoint(running, {'completed_paths': completed})
+        done = manager.create_job('review')
+        manager.complete_job(done)
+
+        restored = JobManager(journal_path=journal_path)
+        job = restored.get_job(running)
+        assert job.status == JobStatus.INTERRUPTED
+        assert job.progress.phase == JobPhase.CHECKING
+        assert job.metadata == {'scan_id': 'abc'}
+        assert job.checkpoint == {'completed_paths': completed}
+        assert restored.get_job(done) is None
+
+    def test_terminal_rows_removed(self, journal_path):
+        manager = _journaling_manager(journal_path, 'review')
+        job_id = manager.create_job('review')
+        assert [r['job_id'] for r in JobJournal(journal_path).load()] == [job_id]
+        manager.fail_job(job_id, 'boom')
+        assert JobJournal(journal_path).load() == []
+
+    def test_resume_calls_handler(self, journal_path):
+        manager = _journaling_manager(journal_path, 'batch_scan')
+        job_id = manager.create_job('batch_scan')
+        manager.checkpoint(job_id, {'completed_paths': ['x']})
+
+        restored = JobManager(journal_path=journal_path)
+        seen = []
+        restored.register_resume_handler('batch_scan', lambda job: seen.append(dict(job.checkpoint)))
+        assert restored.is_resumable(job_id)
+        assert restored.resume_interrupted() == [job_id]
+        assert seen == [{'completed_paths': ['x']}]
+        job = restored.get_job(job_id)
+        assert job.status == JobStatus.PENDING
+        assert job.metadata['resume_count'] == 1
+        assert not restored.resume_job(job_id)
+
+    def test_failing_resume_handler_fails_job(self, journal_path):
+        manager = _journaling_manager(journal_path, 'batch_scan')
+        job_id = manager.create_job('batch_scan')
+
+        restored = JobManager(journal_path=journal_path)
+
+        def handler(job):
+            raise RuntimeError('files gone')
+
+        restored.register_resume_handler('batch_scan', handler)
+        assert not restored.resume_job(job_id)
+        assert restored.get_job(job_id).status == JobStatus.FAILED
+        assert JobJournal(journal_path).load() == []
+
+    def test_types_without_handler_not_journaled(self, journal_path):
+        manager = _journaling_manager(journal_path, 'batch_scan')
+        job_id = manager.create_job('review')
+        assert JobJournal(journal_path).load() == []
+        assert JobManager(journal_path=journal_path).get_job(job_id) is None
+
+    def test_legacy_row_without_handler_not_resumable(self, journal_path):
+        job_id = _journaling_manager(journal_path, 'review').create_job('review')
+        restored = JobManager(journal_path=journal_path)
+        assert not restored.is_resumable(job_id)
+        assert restored.cancel_job(job_id)
+        assert JobJournal(journal_path).load() == []
+
+    def test_interrupted_jobs_evicted(self, journal_path):
+        manager = _journaling_manager(journal_path, 'batch_scan')
+        stale = manager.create_job('batch_scan')
+
+        restored = JobManager(journal_path=journal_path, job_ttl=0)
+        assert restored.get_job(stale).status == JobStatus.INTERRUPTED
+        time.sleep(0.01)
+        restored.create_job('review')
+        assert restored.get_job(stale) is None
+        assert JobJournal(journal_path).load() == []
+
+        manager = _journaling_manager(journal_path, 'batch_scan')
+        ids = [manager.create_job('batch_scan') for _ in range(3)]
+        restored = JobManager(journal_path=journal_path, max_jobs=2)
+        restored.create_job('review')
+        assert restored.get_job(ids[0]) is None
+        assert len(JobJournal(journal_path).load()) < 3
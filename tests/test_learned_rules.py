@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled learner rules (learned_rules.py)
+=======================================================
+"""
+
+import json
+import os
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from learned_rules import KeywordRules, LearnedRules
+
+
+def _entry(count, **fields):
+    return dict(count=count, **fields)
+
+
+def _write(path, patterns):
+    patterns.setdefault('_meta', {'version': '1.0'})
+    tmp = str(path) + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(patterns, f)
+    os.replace(tmp, path)
+
+
+@pytest.fixture
+def review(tmp_path, monkeypatch):
+    import review_learner
+    monkeypatch.setattr(review_learner, 'PATTERNS_FILE', str(tmp_path / 'review_patterns.json'))
+    review_learner.reload_learned_patterns()
+    yield review_learner
+    review_learner.reload_learned_patterns()
+
+
+class TestLearnedRules:
+
+    def test_recompiles_only_when_file_changes(self, tmp_path):
+        path = tmp_path / 'patterns.json'
+        _write(path, {'items': [1]})
+        builds = []
+
+        def compile_fn(patterns):
+            builds.append(patterns)
+            return len(patterns['items'])
+
+        rules = LearnedRules(lambda: str(path), lambda: json.loads(path.read_text()), compile_fn)
+        assert rules.get() == 1 and rules.get() == 1
+        assert len(builds) == 1
+        _write(path, {'items': [1, 2]})
+        assert rules.get() == 2
+        rules.invalidate()
+        assert rules.get() == 2 and len(builds) == 3
+
+    def test_keyword_rules_match_context_semantics(self):
+        from statement_forge.statement_learner import _context_matches
+        vocabulary = ['valve', 'pressure', 'test', 'report', 'monthly', 'flight', 'data',
+                      'review', 'the', 'Upper', 'ure']
+        rng = random.Random(7)
+        contexts = [' '.join(rng.choice(vocabulary) for _ in range(rng.randint(0, 5)))
+                    for _ in range(40)]
+        rules = KeywordRules((context, i) for i, context in enumerate(contexts))
+        for _ in range(300):
+            text = ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(0, 8)))
+            expected = next((i for i, c in enumerate(contexts) if _context_matches(text, c)), None)
+            assert rules.first_match(text) == expected
+
+
+class TestReviewRules:
+
+    def test_lookups_keep_first_entry_order(self, review):
+        _write(review.PATTERNS_FILE, {
+            'dismissed_categories': [
+                _entry(2, category_key='requirements:passive voice', category='Passive Voice'),
+                _entry(3, category_key='acronyms', category='Acronyms'),
+                _entry(1, category_key='grammar', category='Grammar'),
+            ],
+            'severity_overrides': [
+                _entry(2, category_key='spelling', preferred_severity='Low'),
+                _entry(2, category_key='requirements:spelling', preferred_severity='Info'),
+                _entry(2, category_key='requirements:grammar', preferred_severity='High'),
+                _entry(2, category_key='grammar', preferred_severity='Medium'),
+            ],
+            'fix_patterns': [_entry(2, original='utilize', replacement='use')],
+        })
+        assert review.get_suppressed_categories('requirements') == {'passive voice', 'acronyms'}
+        assert review.get_suppressed_categories('') == {'acronyms'}
+        assert review.get_severity_override('Spelling', 'requirements') == 'Low'
+        assert review.get_severity_override('Grammar', 'requirements') == 'High'
+        assert review.get_severity_override('Grammar', 'general') == 'Medium'
+        assert review.get_severity_override('Style') == ''
+        assert review.get_learned_fixes() == {'utilize': 'use'}
+
+    def test_learning_refreshes_rules(self, review, monkeypatch):
+        monkeypatch.setattr(review, '_is_learning_enabled', lambda: True)
+        assert review.get_severity_override('Grammar') == ''
+        review.learn_severity_preference('Grammar', 'Medium', 'Low')
+        review.learn_severity_preference('Grammar', 'Medium', 'Low')
+        assert review.get_severity_override('Grammar') == 'Low'
+        os.unlink(review.PATTERNS_FILE)
+        assert review.get_severity_override('Grammar') == ''
+
+
+class TestStatementRules:
+
+    def test_directive_role_and_deletion_lookups(self, tmp_path, monkeypatch):
+        from statement_forge import statement_learner as sl
+        monkeypatch.setattr(sl, 'PATTERNS_FILE', str(tmp_path / 'statement_patterns.json'))
+        sl.reload_learned_patterns()
+        _write(sl.PATTERNS_FILE, {
+            'directive_corrections': [
+                _entry(2, from_directive='should', to_directive='shall',
+                       context_words='valve pressure test'),
+                _entry(3, from_directive='should', to_directive='will', context_words=''),
+            ],
+            'role_assignments': [_entry(2, context_key='monthly status report', role='Program Manager')],
+            'deletion_patterns': [_entry(3, keyword='table contents page'),
+                                  _entry(2, keyword='revision history')],
+        })
+        assert sl.get_directive_override('Should', 'The valve pressure test is logged.') == 'shall'
+        assert sl.get_directive_override('should', 'Unrelated text.') == 'will'
+        assert sl.get_directive_override('must', 'The valve pressure test.') == ''
+        assert sl.get_role_suggestion('Deliver the monthly status report.') == 'Program Manager'
+        assert sl.get_role_suggestion('Nothing relevant.') == ''
+        assert sl.should_skip_extraction('Table of contents page 3')
+        assert not sl.should_skip_extraction('Revision history')
+        sl.reload_learned_patterns()
+
+
+class TestHVRules:
+
+    def test_domain_lookups(self, tmp_path, monkeypatch):
+        from hyperlink_validator import hv_learner as hv
+        monkeypatch.setattr(hv, 'PATTERNS_FILE', str(tmp_path / 'hv_patterns.json'))
+        hv.reload_learned_patterns()
+        _write(hv.PATTERNS_FILE, {
+            'status_overrides': [_entry(2, domain='Intranet.example.com',
+                                        original_status='AUTH_REQUIRED', user_status='WORKING')],
+            'trusted_domains': [_entry(2, domain='intranet.example.com')],
+            'exclusion_domains': [_entry(3, domain='tracker.example.com'),
+                                  _entry(2, domain='wiki.example.com')],
+            'headless_required_domains': [_entry(2, domain='portal.example.com')],
+        })
+        assert hv.get_status_override('https://intranet.example.com/a', 'auth_required') == 'WORKING'
+        assert hv.get_status_override('https://intranet.example.com/a', 'BLOCKED') == ''
+        assert hv.get_trusted_domains() == {'intranet.example.com'}
+        assert hv.should_prioritize_headless('Portal.example.com')
+        urls = ['https://tracker.example.com/1', 'https://wiki.example.com/2']
+        assert hv.get_auto_exclude_suggestions(urls) == urls[:1]
+        hv.reload_learned_patterns()
+
+
+class TestProposalRules:
+
+    def test_parser_uses_compiled_rules(self, tmp_path, monkeypatch):
+        from proposal_compare import pattern_learner, parser
+        monkeypatch.setattr(pattern_learner, 'PATTERNS_FILE', str(tmp_path / 'parser_patterns.json'))
+        parser.reload_learned_patterns()
+        _write(pattern_learner.PATTERNS_FILE, {
+            'category_overrides': [_entry(2, keyword='cloud hosting', category='ODC'),
+                                   _entry(2, keyword='hosting', category='Software'),
+                                   _entry(1, keyword='widgets', category='Material')],
+            'company_patterns': [_entry(2, pattern='Acme Corp', filename_hint='acme_proposal')],
+            'financial_table_headers': [_entry(1, header_signature='phase|hours', is_financial=False)],
+        })
+        assert parser.classify_line_item('Managed Cloud Hosting services') == 'ODC'
+        assert parser.classify_line_item('On-prem hosting') == 'Software'
+        assert parser.extract_company_from_text('', filename='ACME_Proposal_v2.pdf') == 'Acme Corp'
+        assert parser.is_financial_table(['Phase', 'Hours'], []) is False
+        parser.reload_learned_patterns()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for the materialized dashboard metrics (scan_history v6.3.3)
+==================================================================
+record_scan / delete_scan keep metrics_totals, metrics_rollup and
+metrics_latest_scan current; read_metrics_rollups() serves the dashboard.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scan_history import ScanHistoryDB, read_metrics_rollups, score_bucket
+
+ISSUES = [
+    {'category': 'Grammar', 'message': 'Passive voice detected', 'severity': 'Low'},
+    {'category': 'Grammar', 'message': 'Passive voice detected', 'severity': 'Low'},
+    {'category': 'Spelling', 'message': 'Possible misspelling: recieve', 'severity': 'Medium'},
+    {'message': 'x' * 120, 'severity': 'High'},
+]
+
+
+def _results(issues, score=85, grade='B'):
+    return {'issues': issues, 'issue_count': len(issues), 'score': score,
+            'grade': grade, 'word_count': 500}
+
+
+@pytest.fixture
+def db(tmp_path):
+    return ScanHistoryDB(str(tmp_path / 'scan_history.db'))
+
+
+@pytest.fixture
+def doc(tmp_path):
+    path = tmp_path / 'spec.docx'
+    path.write_bytes(b'fake docx')
+    return str(path)
+
+
+def _rollups(db):
+    with db.connection() as (conn, cursor):
+        return read_metrics_rollups(cursor)
+
+
+def _latest(db):
+    with db.connection() as (conn, cursor):
+        cursor.execute('SELECT document_id, scan_id FROM metrics_latest_scan ORDER BY document_id')
+        return [tuple(r) for r in cursor.fetchall()]
+
+
+class TestMetricsRollups:
+
+    def test_score_bucket(self):
+        assert score_bucket(0) == '0-10'
+        assert score_bucket(85.5) == '80-90'
+        assert score_bucket(100) == '90-100'
+        assert score_bucket(None) is None
+
+    def test_empty_history(self, db):
+        m = _rollups(db)
+        assert (m['total_scans'], m['avg_score'], m['last_scan_time']) == (0, 0, None)
+        assert len(m['score_distribution']) == 10
+        assert m['issue_categories'] == [] and m['top_issues'] == []
+
+    def test_record_scan_updates_rollups(self, db, doc):
+        db.record_scan('spec.docx', doc, _results(ISSUES), {})
+        db.record_scan('other.docx', doc, _results(ISSUES[:1], score=95, grade='A'), {})
+        m = _rollups(db)
+        assert (m['total_scans'], m['avg_score'], m['total_issues'], m['total_words']) == (2, 90.0, 5, 1000)
+        assert m['last_scan_time'] is not None
+        assert {d['range']: d['count'] for d in m['score_distribution']}['80-90'] == 1
+        assert m['grade_distribution'] == {'A': 1, 'B': 1}
+        assert m['severity_distribution'] == {'Low': 3, 'Medium': 1, 'High': 1}
+        assert m['issue_categories'][0] == {'category': 'Grammar', 'count': 3}
+        assert {'category': 'Unknown', 'count': 1} in m['issue_categories']
+        assert m['top_issues'][0] == {'message': 'Passive voice detected', 'category': 'Grammar', 'count': 3}
+        assert any(len(t['message']) == 80 for t in m['top_issues'])
+
+    def test_latest_scan_per_document(self, db, doc):
+        first = db.record_scan('spec.docx', doc, _results(ISSUES), {})
+        second = db.record_scan('spec.docx', doc, _results([]), {})
+        assert _latest(db) == [(first['document_id'], second['scan_id'])]
+
+        db.delete_scan(second['scan_id'])
+        assert _latest(db) == [(first['document_id'], first['scan_id'])]
+        db.delete_scan(first['scan_id'])
+        assert _latest(db) == []
+
+    def test_delete_scan_reverses_rollups(self, db, doc):
+        kept = db.record_scan('spec.docx', doc, _results(ISSUES[:1], score=95, grade='A'), {})
+        before = _rollups(db)
+        dropped = db.record_scan('other.docx', doc, _results(ISSUES), {})
+        db.delete_scan(dropped['scan_id'])
+        assert _rollups(db) == before
+        assert kept['scan_id'] != dropped['scan_id']
+
+    def test_rebuild_matches_incremental(self, db, doc):
+        db.record_scan('spec.docx', doc, _results(ISSUES), {})
+        db.record_scan('spec.docx', doc, _results(ISSUES[2:], score=72, grade='C'), {})
+        db.record_scan('other.docx', doc, _results([], score=None, grade=None), {})
+        incremental, latest = _rollups(db), _latest(db)
+        assert db.rebuild_metrics_rollups()['scans'] == 3
+        assert _rollups(db) == incremental and _latest(db) == latest
+
+    def test_existing_history_backfilled_on_open(self, db, doc, tmp_path):
+        db.record_scan('spec.docx', doc, _results(ISSUES), {})
+        expected = _rollups(db)
+        with db.connection() as (conn, cursor):
+            for table in ('metrics_totals', 'metrics_rollup', 'metrics_latest_scan'):
+                cursor.execute(f'DROP TABLE {table}')
+        reopened = ScanHistoryDB(str(tmp_path / 'scan_history.db'))
+        assert _rollups(reopened) == expected
+
+
+class TestDashboardRoute:
+
+    def test_quality_section_reads_rollups(self, db, doc, monkeypatch):
+        pytest.importorskip('flask')
+        import routes._shared as _shared
+        from routes import data_routes
+
+        db.record_scan('spec.docx', doc, _results(ISSUES), {})
+        monkeypatch.setattr(_shared, 'SCAN_HISTORY_AVAILABLE', True)
+        monkeypatch.setattr(data_routes, 'get_scan_history_db', lambda: db)
+
+        from flask import Flask
+        app = Flask(__name__)
+        with app.test_request_context('/api/metrics/dashboard'):
+            resp = data_routes.get_metrics_dashboard.__wrapped__()
+        data = resp.get_json()['data']
+        assert data['overview']['total_scans'] == 1
+        assert data['documents'][0]['latest_grade'] == 'B'
+        assert data['quality']['issue_categories'][0]['category'] == 'Grammar'
+        assert data['quality']['severity_distribution']['Low'] == 2
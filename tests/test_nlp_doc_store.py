@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Tests for nlp_doc_store (v6.3.3)
+================================
+Uses a minimal stand-in for a spaCy Language so the store logic is tested
+without requiring a spaCy model download.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from nlp_doc_store import ParsedDocStore, activate, current_store, parse
+
+
+class _FakeDoc:
+    def __init__(self, text, pipes):
+        self.text = text
+        self.pipes = list(pipes)
+
+
+class _FakeNLP:
+    """Records how often the core pipeline and each add-on run."""
+
+    def __init__(self):
+        self.pipe_names = ['tok2vec', 'parser', 'ner', 'negex', 'spacytextblob']
+        self.core_runs = 0
+        self.batch_calls = 0
+        self.addon_runs = {'negex': 0, 'spacytextblob': 0}
+
+    def _make(self, text, disable):
+        self.core_runs += 1
+        return _FakeDoc(text, [p for p in self.pipe_names if p not in disable])
+
+    # No select_pipes(): the store must not toggle pipes on the shared model
+    def __call__(self, text, disable=()):
+        return self._make(text, disable)
+
+    def pipe(self, texts, batch_size=64, disable=()):
+        self.batch_calls += 1
+        for text in texts:
+            yield self._make(text, disable)
+
+    def get_pipe(self, name):
+        def _component(doc):
+            self.addon_runs[name] += 1
+            doc.pipes.append(name)
+            return doc
+        return _component
+
+
+PARAGRAPHS = [(0, 'The system shall not fail.'), (1, 'The operator shall verify.'),
+              (2, 'The system shall not fail.')]
+
+
+class TestParsedDocStore:
+
+    def test_batch_parse_once_with_addons_disabled(self):
+        nlp = _FakeNLP()
+        store = ParsedDocStore(nlp, PARAGRAPHS)
+        doc = store.get('The operator shall verify.')
+        assert nlp.batch_calls == 1
+        assert nlp.core_runs == 2  # duplicate paragraph parsed once
+        assert doc.pipes == ['tok2vec', 'parser', 'ner']
+        store.get('The system shall not fail.')
+        assert nlp.core_runs == 2
+        assert store.stats['hits'] == 2
+
+    def test_addons_applied_only_on_request_and_once(self):
+        nlp = _FakeNLP()
+        store = ParsedDocStore(nlp, PARAGRAPHS)
+        store.get('The system shall not fail.', pipes=('negex',))
+        doc = store.get('The system shall not fail.', pipes=('negex',))
+        assert nlp.addon_runs == {'negex': 1, 'spacytextblob': 0}
+        assert 'negex' in doc.pipes and 'spacytextblob' not in doc.pipes
+
+    def test_unknown_text_is_parsed_and_cached(self):
+        nlp = _FakeNLP()
+        store = ParsedDocStore(nlp, PARAGRAPHS)
+        store.get('A paragraph outside the review.')
+        store.get('A paragraph outside the review.')
+        assert store.stats['misses'] == 1
+        assert nlp.core_runs == 3
+
+    def test_miss_parse_leaves_shared_model_pipes_alone(self):
+        nlp = _FakeNLP()
+        store = ParsedDocStore(nlp, PARAGRAPHS)
+        doc = store.get('A paragraph outside the review.')
+        assert doc.pipes == ['tok2vec', 'parser', 'ner']
+        # Another thread parsing with the same model still gets every pipe
+        assert nlp('Concurrent text.').pipes == nlp.pipe_names
+
+    def test_parse_uses_active_store_for_same_model_only(self):
+        nlp, other = _FakeNLP(), _FakeNLP()
+        store = ParsedDocStore(nlp, PARAGRAPHS)
+        with activate(store):
+            assert current_store() is store
+            parse(nlp, 'The operator shall verify.')
+            parse(other, 'The operator shall verify.')
+        assert current_store() is None
+        assert nlp.batch_calls == 1
+        # Different model falls back to a plain call with every pipe
+        assert other.batch_calls == 0 and other.core_runs == 1
+
+    def test_parse_without_store_calls_model(self):
+        nlp = _FakeNLP()
+        doc = parse(nlp, 'Standalone text.')
+        assert doc.pipes == nlp.pipe_names
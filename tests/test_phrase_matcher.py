@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the compiled multi-phrase matcher (phrase_matcher.py)
+===============================================================
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from phrase_matcher import (PhraseMatcher, ROLE_DICTIONARY, dictionary_generation,
+                            notify_dictionary_changed, shared_matcher)
+
+
+class TestPhraseMatcher:
+
+    def test_overlapping_phrases_whole_words(self):
+        m = PhraseMatcher(['program manager', 'deputy program manager', 'pm'])
+        text = 'The Deputy Program Manager briefs the PM; subprogram managers do not count.'
+        found = [(text[x.start:x.end], x.phrase) for x in m.findall(text)]
+        assert found == [('Deputy Program Manager', 'deputy program manager'),
+                         ('Program Manager', 'program manager'),
+                         ('PM', 'pm')]
+
+    def test_punctuation_edges_and_word_char(self):
+        m = PhraseMatcher(['e-mail', 'mail'])
+        assert m.positions('send e-mail or mail_box') == {'e-mail': [5], 'mail': [7]}
+        alnum = PhraseMatcher(['mail'], word_char=str.isalnum)
+        assert alnum.positions('mail_box') == {'mail': [0]}
+
+    def test_overlapping_flag_matches_re_finditer(self):
+        m = PhraseMatcher(['a a'])
+        assert len(list(m.finditer('a a a'))) == 2
+        assert m.positions('a a a') == {'a a': [0]}
+
+    def test_case_and_values(self):
+        m = PhraseMatcher([('SE', 'systems'), ('SE', 'software'), ('QA', None)],
+                          case_sensitive=True, whole_words=False)
+        assert 'SE' in m and 'se' not in m and len(m) == 2
+        (match,) = [x for x in m.finditer('SEMP') if x.phrase == 'SE']
+        assert match.values == ('systems', 'software')
+        assert m.present('xqa') == set()
+
+    def test_empty(self):
+        m = PhraseMatcher([''])
+        assert not m and m.findall('anything') == []
+
+    def test_shared_matcher_rebuilds_after_change(self):
+        builds = []
+
+        def build():
+            builds.append(1)
+            return PhraseMatcher(['alpha'])
+
+        first = shared_matcher('test_dictionary', build)
+        assert shared_matcher('test_dictionary', build) is first
+        notify_dictionary_changed('test_dictionary')
+        assert shared_matcher('test_dictionary', build) is not first
+        assert len(builds) == 2
+
+
+class TestRoleExtractorMatcher:
+
+    def test_rebuilds_when_dictionary_changes(self, monkeypatch):
+        from role_extractor_v3 import RoleExtractor
+
+        dictionary = {'active': ['flight readiness reviewer'], 'rejected': []}
+        monkeypatch.setattr(RoleExtractor, '_load_dictionary_roles', lambda self: list(dictionary['active']))
+        monkeypatch.setattr(RoleExtractor, '_load_rejected_roles', lambda self: list(dictionary['rejected']))
+        extractor = RoleExtractor(use_nlp=False)
+        text = 'The Flight Readiness Reviewer and the Mission Assurance Liaison sign the form.'
+
+        roles = extractor._scan_for_known_roles(text, {}, set(), 'p1')
+        assert 'Flight Readiness Reviewer' in roles
+        assert 'Mission Assurance Liaison' not in roles
+        matcher = extractor._get_known_role_matcher()
+        assert extractor._get_known_role_matcher() is matcher
+
+        dictionary['active'].append('mission assurance liaison')
+        dictionary['rejected'].append('flight readiness reviewer')
+        notify_dictionary_changed(ROLE_DICTIONARY)
+
+        roles = extractor._scan_for_known_roles(text, {}, set(), 'p1')
+        assert 'Mission Assurance Liaison' in roles
+        assert 'Flight Readiness Reviewer' not in roles
+        assert extractor._get_known_role_matcher() is not matcher
+
+    def test_direct_edits_rebuild(self):
+        from role_extractor_v3 import RoleExtractor
+        extractor = RoleExtractor(use_dictionary=False, use_nlp=False)
+        text = 'The Quartermaster Liaison approves the launch.'
+        assert 'Quartermaster Liaison' not in extractor._scan_for_known_roles(text, {}, set(), 'p')
+        extractor.known_roles.add('quartermaster liaison')
+        assert 'Quartermaster Liaison' in extractor._scan_for_known_roles(text, {}, set(), 'p')
+
+    def test_same_size_edit_rebuilds(self):
+        from role_extractor_v3 import RoleExtractor
+        extractor = RoleExtractor(use_dictionary=False, use_nlp=False)
+        text = 'The Harbor Pilot Officer signs the manifest.'
+        extractor.known_roles.add('quartermaster liaison')
+        assert 'Harbor Pilot Officer' not in extractor._scan_for_known_roles(text, {}, set(), 'p')
+        extractor.known_roles.discard('quartermaster liaison')
+        extractor.known_roles.add('harbor pilot officer')
+        assert 'Harbor Pilot Officer' in extractor._scan_for_known_roles(text, {}, set(), 'p')
+        extractor.false_positives = set(extractor.false_positives) | {'harbor pilot officer'}
+        assert 'Harbor Pilot Officer' not in extractor._scan_for_known_roles(text, {}, set(), 'p')
+
+    def test_scan_history_writes_bump_generation(self, tmp_path):
+        from scan_history import ScanHistoryDB
+        db = ScanHistoryDB(str(tmp_path / 'scan_history.db'))
+        before = dictionary_generation(ROLE_DICTIONARY)
+        result = db.add_role_to_dictionary('Launch Director', source='manual')
+        assert result['success']
+        assert dictionary_generation(ROLE_DICTIONARY) == before + 1
+        db.batch_adjudicate([{'role_name': 'Launch Director', 'action': 'rejected'}])
+        assert dictionary_generation(ROLE_DICTIONARY) == before + 2
+
+
+class TestTerminologyMatcher:
+
+    def test_single_pass_results(self):
+        from terminology_checker import TerminologyChecker
+        text = ('Send an e-mail and an email. The colour and the color differ. '
+                'We reuse parts; re-use is also used. End user and end-user guides.')
+        issues = {i.issue_type + ':' + i.term: i for i in TerminologyChecker().check_text(text)}
+        spelling = issues['spelling_variant:email']
+        assert spelling.occurrences == {'e-mail': 1, 'email': 1}
+        assert spelling.start_char == text.lower().index('e-mail')
+        assert issues['uk_us:spelling_style'].occurrences == {'American': 1, 'British': 1}
+        hyphen = issues['hyphenation:re-use']
+        assert hyphen.variants_found == ['re-use', 'reuse']
+        assert (hyphen.start_char, hyphen.end_char) == (text.index('re-use'), text.index('re-use') + 6)
+        assert 'hyphenation:end user' in issues
+
+    def test_acronym_inside_longer_definition(self):
+        from acronym_checker import AcronymChecker
+        checker = AcronymChecker(ignore_common_acronyms=False)
+        checker._defined = {'SEMP', 'ICD'}
+        checker._index_embedded_acronyms(['SE', 'ICD', 'EMP', 'XYZ'])
+        assert checker._embedded_in_defined == {'SE', 'EMP'}
+        assert checker._is_inside_defined('SE') and not checker._is_inside_defined('ICD')
+        assert checker._is_inside_defined('MP')  # not indexed: falls back to the scan
+
+    def test_fresh_checker_falls_back_to_scan(self):
+        from acronym_checker import AcronymChecker
+        checker = AcronymChecker(ignore_common_acronyms=False)
+        assert checker._indexed_acronyms == set()
+        checker._defined = {'SEMP'}
+        assert checker._is_inside_defined('SE')
+        checker.reset_review_state()
+        assert checker._indexed_acronyms == set() and checker._embedded_in_defined is None
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared compiled-pattern registry (regex_registry.py)
+==================================================================
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from regex_registry import REGISTRY, RegexRegistry, compile_pattern, word_pattern
+
+
+class TestRegexRegistry:
+
+    def test_same_source_shares_one_compiled_pattern(self):
+        registry = RegexRegistry()
+        first = registry.compile(r'\bshall\b', re.IGNORECASE, name='test.shall')
+        assert registry.compile(r'\bshall\b', re.IGNORECASE) is first
+        assert registry.compile(r'\bshall\b') is not first
+        assert registry.get('test.shall') is first and 'test.shall' in registry
+
+    def test_word_pattern_escapes_and_bounds(self):
+        registry = RegexRegistry()
+        assert registry.word('e.g.', trailing_boundary=False).search('see E.G. below')
+        assert not registry.word('use').search('reuse')
+        assert registry.word('C++', flags=0).pattern == r'\bC\+\+\b'
+
+    def test_any_of_matches_like_the_separate_patterns(self):
+        registry = RegexRegistry()
+        sources = [r'^[A-Z]{1,2}\d-', r'^MIL-STD-\d', r'^[A-Z]\d{1,2}$']
+        merged = registry.any_of(sources)
+        for text in ['N0-0202', 'MIL-STD-498', 'A12', 'A123', 'XMIL-STD-1', 'FMEA']:
+            assert bool(merged.match(text)) == any(re.match(s, text) for s in sources)
+        with pytest.raises(ValueError):
+            registry.any_of([r'(a)\1'])
+
+    def test_capacity_limit_still_compiles(self):
+        registry = RegexRegistry(max_patterns=1)
+        registry.compile('a')
+        assert registry.compile('b').match('b') and len(registry) == 1
+
+    def test_profile_reports_each_pattern(self):
+        registry = RegexRegistry()
+        registry.compile(r'\d+', name='test.digits')
+        registry.compile(r'[A-Z]{2,}', name='test.caps')
+        report = registry.profile(['ABC 123 and DEF 45'], names=['test.digits', 'test.caps'])
+        assert {row['name']: row['matches'] for row in report} == {'test.digits': 2, 'test.caps': 2}
+        assert all(row['seconds'] >= 0 for row in report)
+
+    def test_find_backtracking_flags_exponential_pattern(self):
+        registry = RegexRegistry()
+        registry.compile(r'^(a+)+$', name='test.evil')
+        registry.compile(r'^[a-z]+$', name='test.linear')
+        flagged = registry.find_backtracking(names=['test.evil', 'test.linear'], budget=0.01)
+        assert [row['name'] for row in flagged] == ['test.evil']
+        assert flagged[0]['probe'] == 'a'
+
+
+class TestCheckerPatterns:
+
+    def test_checker_patterns_registered_at_import(self):
+        import acronym_checker  # noqa: F401
+        import core  # noqa: F401
+        for name in ('acronym.candidate', 'acronym.doc_number', 'docx.paragraph', 'heading.section_number'):
+            assert name in REGISTRY
+
+    def test_registered_checker_patterns_backtracking_report(self):
+        import acronym_checker  # noqa: F401
+        import core  # noqa: F401
+        names = [n for n in REGISTRY.named() if n.startswith(('acronym.', 'docx.', 'heading.'))]
+        flagged = {row['name'] for row in REGISTRY.find_backtracking(names=names, budget=0.5)}
+        # Known: quadratic on multi-thousand-character runs of letters
+        assert flagged <= {'acronym.inline_definition'}
+
+    def test_module_helpers_use_shared_registry(self):
+        assert compile_pattern(r'\bTBD\b') is REGISTRY.compile(r'\bTBD\b')
+        assert word_pattern('tbd') is compile_pattern(r'\btbd\b', re.IGNORECASE)
+
+    def test_nominalization_matches_per_pair_scan(self):
+        import random
+        from writing_quality_checker import NominalizationChecker
+        checker = NominalizationChecker()
+        rng = random.Random(3)
+        leads = ['make a', 'made the', 'conduct an', 'carry out the', 'gave a', 'retake a',
+                 'come to a', 'arrive at the', 'provide an', 'Reach  the', 'performed a']
+        nouns = list(checker.NOMINALIZATIONS) + ['decisions', 'statements.', 'plan']
+        paragraphs = [(i, ' '.join(rng.choice(leads) + ' ' + rng.choice(nouns) for _ in range(6)))
+                      for i in range(40)]
+        expected = []
+        for idx, text in paragraphs:
+            for noun in checker.NOMINALIZATIONS:
+                for verbose in checker.VERBOSE_PATTERNS:
+                    for match in re.finditer(verbose + re.escape(noun) + r'\b', text.lower()):
+                        expected.append((idx, match.start(), match.group()))
+        found = [(i['paragraph_index'], i['source']['start_offset'], i['flagged_text'].lower())
+                 for i in (issue if isinstance(issue, dict) else issue.to_dict()
+                           for issue in checker.check(paragraphs))]
+        assert found == expected and expected
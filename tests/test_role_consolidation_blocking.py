@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for blocked / incremental role consolidation (role_consolidation_engine v1.1)
+==================================================================================
+"""
+
+import random
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from role_consolidation_engine import (
+    RoleConsolidationEngine, RoleFeatures, SimilarityEngine,
+    all_pairs, blocked_pairs, score_features, score_pairs,
+)
+
+
+@dataclass
+class _Role:
+    id: str
+    canonical_name: str
+    usage_count: int = 1
+    source_document_ids: List[str] = field(default_factory=list)
+    aliases: List[str] = field(default_factory=list)
+
+
+PREFIXES = ['', 'Senior ', 'Lead ', 'Chief ', 'Deputy ', 'Assistant ', 'Sr. ', 'Jr. ']
+SPECIALTIES = ['Systems', 'Software', 'Test', 'Quality', 'Safety', 'Configuration',
+               'Program', 'Project', 'Mission', 'Flight', 'Ground', 'Logistics']
+CORES = ['Engineer', 'Manager', 'Mgr', 'Lead', 'Director', 'Analyst', 'Specialist',
+         'Coordinator', 'Technician', 'Officer', 'Inspector', 'Administrator', 'Eng']
+
+
+def _role_names(count, seed=11):
+    rng = random.Random(seed)
+    names = set()
+    while len(names) < count:
+        names.add(f"{rng.choice(PREFIXES)}{rng.choice(SPECIALTIES)} {rng.choice(CORES)}".strip())
+    names.update(['Customer', 'Contracting Officer', 'CO', 'QA', 'Quality Assurance'])
+    return sorted(names)
+
+
+def _roles(names):
+    return [_Role(id=f'r{i}', canonical_name=n, usage_count=len(n) % 5,
+                  source_document_ids=[f'd{i % 3}']) for i, n in enumerate(names)]
+
+
+def _exhaustive(roles, threshold):
+    found = []
+    for i in range(len(roles)):
+        for j in range(i + 1, len(roles)):
+            overall, _ = SimilarityEngine.compute_overall_similarity(
+                roles[i].canonical_name, roles[j].canonical_name)
+            if overall >= threshold:
+                found.append((roles[i].id, roles[j].id, overall))
+    return found
+
+
+def _summary(candidates):
+    return [(c.primary_role_id, tuple(c.secondary_role_ids), round(c.overall_similarity, 12))
+            for c in candidates]
+
+
+class TestScoreFeatures:
+
+    def test_matches_compute_overall_similarity(self):
+        names = _role_names(60)
+        features = [RoleFeatures(n) for n in names]
+        for i in range(len(names)):
+            for j in range(len(names)):
+                expected = SimilarityEngine.compute_overall_similarity(names[i], names[j])
+                assert score_features(features[i], features[j]) == expected
+
+    def test_pruning_never_drops_qualifying_pairs(self):
+        names = _role_names(80)
+        features = [RoleFeatures(n) for n in names]
+        for i in range(len(names)):
+            for j in range(i + 1, len(names)):
+                overall, _ = SimilarityEngine.compute_overall_similarity(names[i], names[j])
+                pruned = score_features(features[i], features[j], 0.65)
+                if overall >= 0.65:
+                    assert pruned is not None and pruned[0] == overall
+
+
+class TestBlocking:
+
+    def test_blocked_pairs_cover_exhaustive_results(self):
+        names = _role_names(120)
+        features = [RoleFeatures(n) for n in names]
+        blocked = blocked_pairs(features)
+        assert len(blocked) < len(all_pairs(len(names)))
+        expected = [(i, j) for i, j, _, _ in score_pairs(features, all_pairs(len(names)), 0.51)]
+        found = [(i, j) for i, j, _, _ in score_pairs(features, blocked, 0.51)]
+        assert found == expected
+
+    def test_only_restricts_to_touching_pairs(self):
+        features = [RoleFeatures(n) for n in _role_names(30)]
+        k = blocked_pairs(features)[0][1]
+        pairs = blocked_pairs(features, only={k})
+        assert pairs and all(k in pair for pair in pairs)
+        assert set(pairs) == {p for p in blocked_pairs(features) if k in p}
+
+    def test_parallel_scoring_matches_sequential(self):
+        features = [RoleFeatures(n) for n in _role_names(60)]
+        pairs = all_pairs(len(features))
+        sequential = score_pairs(features, pairs, 0.65, workers=1)
+        import role_consolidation_engine as rce
+        original = rce.PARALLEL_MIN_PAIRS
+        rce.PARALLEL_MIN_PAIRS = 1
+        try:
+            parallel = score_pairs(features, pairs, 0.65, workers=2, chunk_size=400)
+        finally:
+            rce.PARALLEL_MIN_PAIRS = original
+        assert parallel == sequential
+
+
+class TestEngine:
+
+    def test_candidates_match_exhaustive_scan(self):
+        roles = _roles(_role_names(100))
+        engine = RoleConsolidationEngine(roles=roles)
+        candidates = engine.find_consolidation_candidates(workers=1)
+        pairs = {(c.primary_role_id, c.secondary_role_ids[0]) for c in candidates
+                 if len(c.secondary_role_ids) == 1}
+        expected = _exhaustive(roles, engine.REVIEW_THRESHOLD)
+        assert expected
+        # Every qualifying pair is either its own candidate or merged into a group
+        grouped = set()
+        for c in candidates:
+            grouped.update([c.primary_role_id] + c.secondary_role_ids)
+        for id1, id2, _ in expected:
+            assert (id1, id2) in pairs or (id2, id1) in pairs or {id1, id2} <= grouped
+
+    def test_low_threshold_uses_all_pairs(self):
+        roles = _roles(['Customer', 'Program Manager', 'Flight Director'])
+        engine = RoleConsolidationEngine(roles=roles)
+        candidates = engine.find_consolidation_candidates(min_similarity=0.0, workers=1)
+        assert len(candidates) >= 1
+
+    def test_incremental_matches_full_run(self):
+        names = _role_names(90)
+        roles = _roles(names)
+        first, rest = roles[:70], roles[70:]
+
+        incremental = RoleConsolidationEngine(roles=first)
+        incremental.find_consolidation_candidates(workers=1)
+        incremental.add_roles(rest)
+        result = incremental.find_consolidation_candidates(incremental=True, workers=1)
+
+        full = RoleConsolidationEngine(roles=roles).find_consolidation_candidates(workers=1)
+        assert _summary(result) == _summary(full)
+
+    def test_incremental_picks_up_renamed_role(self):
+        roles = _roles(['Program Manager', 'Quality Lead', 'Test Engineer'])
+        engine = RoleConsolidationEngine(roles=roles)
+        assert engine.find_consolidation_candidates(workers=1) == []
+        roles[1].canonical_name = 'Program Mgr'
+        result = engine.find_consolidation_candidates(incremental=True, workers=1)
+        assert [sorted([c.primary_role_id] + c.secondary_role_ids) for c in result] == [['r0', 'r1']]
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Tests for normalized scan result storage (scan_history v6.3.3)
+==============================================================
+Issues go to scan_issues, large text to compressed scan_blobs, and
+load_scan_results() gives readers the original results dict back.
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scan_history import ScanHistoryDB, load_scan_results
+
+
+def _results(issues, text='The system shall log events. ' * 200):
+    return {
+        'issues': issues,
+        'issue_count': len(issues),
+        'score': 90,
+        'grade': 'A',
+        'word_count': 1000,
+        'by_category': {'Grammar': len(issues)},
+        'full_text': text,
+        'paragraphs': [[0, 'The system shall log events.']],
+        'html_preview': '<p>' + text + '</p>',
+    }
+
+
+ISSUES = [
+    {'category': 'Grammar', 'message': 'Passive voice detected', 'paragraph_index': 1, 'severity': 'Low'},
+    {'category': 'Spelling', 'message': 'Possible misspelling: recieve', 'paragraph_index': 2, 'severity': 'Medium'},
+]
+
+
+@pytest.fixture
+def db(tmp_path):
+    return ScanHistoryDB(str(tmp_path / 'scan_history.db'))
+
+
+@pytest.fixture
+def doc(tmp_path):
+    path = tmp_path / 'spec.docx'
+    path.write_bytes(b'fake docx')
+    return str(path)
+
+
+def _stored(db, scan_id):
+    with db.connection() as (conn, cursor):
+        cursor.execute('SELECT results_json FROM scans WHERE id = ?', (scan_id,))
+        results_json = cursor.fetchone()[0]
+        return results_json, load_scan_results(cursor, scan_id, results_json)
+
+
+class TestNormalizedStorage:
+
+    def test_round_trip(self, db, doc):
+        results = _results(ISSUES)
+        scan_id = db.record_scan('spec.docx', doc, results, {})['scan_id']
+        slim, loaded = _stored(db, scan_id)
+        assert 'full_text' not in json.loads(slim) and 'issues' not in json.loads(slim)
+        assert loaded == json.loads(json.dumps(results))
+
+    def test_text_stored_once_per_content(self, db, doc):
+        db.record_scan('spec.docx', doc, _results(ISSUES), {})
+        db.record_scan('spec.docx', doc, _results(ISSUES[:1]), {})
+        with db.connection() as (conn, cursor):
+            cursor.execute('SELECT COUNT(*), SUM(length(data)), SUM(raw_size) FROM scan_blobs')
+            count, stored, raw = cursor.fetchone()
+        assert count == 3  # full_text, paragraphs, html_preview shared by both scans
+        assert stored < raw
+
+    def test_rescan_changes(self, db, doc):
+        db.record_scan('spec.docx', doc, _results(ISSUES), {})
+        new_issue = {'category': 'Clarity', 'message': 'Vague term', 'paragraph_index': 3}
+        info = db.record_scan('spec.docx', doc, _results(ISSUES[:1] + [new_issue]), {})
+        changes = info['changes']
+        assert (changes['added'], changes['removed'], changes['unchanged']) == (1, 1, 1)
+        assert changes['added_categories'] == {'Clarity': 1}
+        assert changes['removed_categories'] == {'Spelling': 1}
+
+    def test_delete_scan_removes_unshared_blobs(self, db, doc):
+        first = db.record_scan('spec.docx', doc, _results(ISSUES), {})['scan_id']
+        db.record_scan('spec.docx', doc, _results(ISSUES, text='Different text.'), {})
+        db.delete_scan(first)
+        with db.connection() as (conn, cursor):
+            cursor.execute('SELECT COUNT(*) FROM scan_issues WHERE scan_id = ?', (first,))
+            assert cursor.fetchone()[0] == 0
+            cursor.execute('SELECT COUNT(*) FROM scan_blobs')
+            assert cursor.fetchone()[0] == 3
+
+
+class TestMigration:
+
+    def test_legacy_rows_are_backfilled(self, tmp_path, doc):
+        path = str(tmp_path / 'scan_history.db')
+        ScanHistoryDB(path)
+        results = _results(ISSUES)
+        conn = sqlite3.connect(path)
+        conn.execute("INSERT INTO documents (filename, filepath, file_hash) VALUES ('old.docx', ?, 'x')", (doc,))
+        conn.execute('INSERT INTO scans (document_id, issue_count, results_json) VALUES (1, 2, ?)',
+                     (json.dumps(results),))
+        conn.execute("INSERT INTO documents (filename, filepath, file_hash) VALUES ('bad.docx', ?, 'y')", (doc,))
+        conn.execute("INSERT INTO scans (document_id, issue_count, results_json) VALUES (2, 0, 'not json')")
+        conn.commit()
+        conn.close()
+
+        db = ScanHistoryDB(path)
+        slim, loaded = _stored(db, 1)
+        assert slim.startswith('{"_storage":')
+        assert loaded == json.loads(json.dumps(results))
+        with db.connection() as (conn, cursor):
+            cursor.execute('SELECT results_json FROM scans WHERE id = 2')
+            assert cursor.fetchone()[0] == 'not json'
+
+        info = db.record_scan('old.docx', doc, _results(ISSUES), {})
+        assert info['changes']['unchanged'] == 2
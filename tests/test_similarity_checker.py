@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for scalable requirement similarity (similarity_checker v1.1.0)
+=====================================================================
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from similarity_checker import minhash_candidate_pairs, similar_pairs_for
+
+
+REQS = [
+    "The system shall log all maintenance events to non-volatile storage.",
+    "The system shall log all maintenance events to the non-volatile storage.",
+    "The operator shall wear protective gloves during fueling operations.",
+    "The contractor shall deliver the test report within 30 days.",
+    "The contractor shall deliver the final test report within 30 days.",
+]
+
+
+class TestMinHashBlocking:
+
+    def test_near_duplicates_become_candidates(self):
+        pairs = minhash_candidate_pairs(REQS)
+        assert (0, 1) in pairs
+        assert (3, 4) in pairs
+        assert all(i < j for i, j in pairs)
+
+    def test_unrelated_texts_are_not_candidates(self):
+        pairs = minhash_candidate_pairs(REQS)
+        assert (0, 2) not in pairs
+        assert (2, 3) not in pairs
+
+    def test_deterministic(self):
+        assert minhash_candidate_pairs(REQS) == minhash_candidate_pairs(REQS)
+
+    def test_templated_text_stays_sparse(self):
+        rng = random.Random(7)
+        verbs = ['record', 'display', 'transmit', 'store', 'validate', 'encrypt', 'archive', 'report']
+        objects = ['fault code', 'operator command', 'sensor reading', 'maintenance event', 'fuel level',
+                   'cabin pressure', 'flight plan', 'status message', 'audit record', 'alarm state']
+        texts = [f"The system shall {rng.choice(verbs)} the {rng.choice(objects)} within "
+                 f"{rng.randint(1, 500)} seconds in accordance with ICD section {rng.randint(1, 40)}."
+                 for _ in range(300)]
+        texts[10] = "The system shall encrypt the flight plan within 12 seconds of crew sign-off."
+        texts[200] = "The system shall encrypt the flight plan within 12 seconds after crew sign-off."
+        pairs = minhash_candidate_pairs(texts)
+        n = len(texts)
+        assert len(pairs) < n * (n - 1) // 2 // 20
+        assert (10, 200) in pairs
+
+
+class TestBlockedSimilarity:
+
+    def _brute_force(self, vectors, threshold):
+        import numpy as np
+        normed = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        sims = normed @ normed.T
+        return [(i, j) for i in range(len(vectors)) for j in range(i + 1, len(vectors))
+                if sims[i, j] >= threshold]
+
+    def test_blocked_matches_brute_force(self):
+        np = pytest.importorskip('numpy')
+        rng = np.random.default_rng(7)
+        base = rng.normal(size=(40, 16))
+        vectors = np.vstack([base, base[:10] + rng.normal(scale=0.05, size=(10, 16))])
+        result = [(i, j) for i, j, _ in similar_pairs_for(vectors, 0.9, block_size=7)]
+        assert result == self._brute_force(vectors, 0.9)
+        assert len(result) >= 10
+
+    def test_candidate_scoring_only_scores_candidates(self):
+        np = pytest.importorskip('numpy')
+        vectors = np.array([[1.0, 0.0], [0.99, 0.01], [1.0, 0.0]])
+        result = list(similar_pairs_for(vectors, 0.9, candidates=[(0, 1)]))
+        assert [(i, j) for i, j, _ in result] == [(0, 1)]
+
+    def test_sparse_tfidf_matches_dense(self):
+        pytest.importorskip('sklearn')
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        texts = REQS * 3
+        random.Random(3).shuffle(texts)
+        matrix = TfidfVectorizer().fit_transform(texts)
+        sparse_pairs = [(i, j) for i, j, _ in similar_pairs_for(matrix, 0.8, block_size=4)]
+        dense_pairs = [(i, j) for i, j, _ in similar_pairs_for(matrix.toarray(), 0.8, block_size=4)]
+        assert sparse_pairs == dense_pairs
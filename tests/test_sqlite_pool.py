@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for sqlite_pool (v6.3.3)
+==============================
+"""
+
+import os
+import sqlite3
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlite_pool import ConnectionPool, WriteQueue
+
+
+@pytest.fixture
+def pool(tmp_path):
+    pool = ConnectionPool(str(tmp_path / 'test.db'))
+    with pool.transaction() as (conn, cursor):
+        cursor.execute('CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, hits INTEGER DEFAULT 0)')
+    return pool
+
+
+def _names(pool):
+    with pool.transaction() as (conn, cursor):
+        return [r['name'] for r in cursor.execute('SELECT name FROM items ORDER BY id')]
+
+
+class TestConnectionPool:
+
+    def test_connection_reused_per_thread(self, pool):
+        assert pool.connection() is pool.connection()
+        other = []
+        t = threading.Thread(target=lambda: other.append(pool.connection()))
+        t.start()
+        t.join()
+        assert other[0] is not pool.connection()
+
+    def test_pragmas_applied(self, pool):
+        conn = pool.connection()
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        assert conn.execute('PRAGMA synchronous').fetchone()[0] == 1  # NORMAL
+
+    def test_rollback_on_error(self, pool):
+        with pytest.raises(ValueError):
+            with pool.transaction() as (conn, cursor):
+                cursor.execute("INSERT INTO items (name) VALUES ('lost')")
+                raise ValueError
+        assert _names(pool) == []
+
+    def test_nested_failure_only_undoes_inner_block(self, pool):
+        with pool.transaction() as (conn, cursor):
+            cursor.execute("INSERT INTO items (name) VALUES ('outer')")
+            try:
+                with pool.transaction() as (_, inner):
+                    inner.execute("INSERT INTO items (name) VALUES ('inner')")
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            cursor.execute("INSERT INTO items (name) VALUES ('after')")
+        assert _names(pool) == ['outer', 'after']
+
+    def test_commit_inside_nested_block_does_not_break_release(self, pool):
+        with pool.transaction() as (conn, cursor):
+            cursor.execute("INSERT INTO items (name) VALUES ('outer')")
+            with pool.transaction() as (inner_conn, inner):
+                inner.execute("INSERT INTO items (name) VALUES ('inner')")
+                inner_conn.commit()
+            with pytest.raises(RuntimeError):
+                with pool.transaction() as (inner_conn, inner):
+                    inner.execute("INSERT INTO items (name) VALUES ('kept')")
+                    inner_conn.commit()
+                    raise RuntimeError
+        assert _names(pool) == ['outer', 'inner', 'kept']
+
+    def test_reopens_when_file_replaced(self, pool):
+        _names(pool)
+        first = pool.connection()
+        os.unlink(pool.db_path)
+        fresh = sqlite3.connect(pool.db_path)
+        fresh.execute('CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT, hits INTEGER)')
+        fresh.execute("INSERT INTO items (name) VALUES ('restored')")
+        fresh.commit()
+        fresh.close()
+        assert _names(pool) == ['restored']
+        assert pool.connection() is not first
+
+
+class TestWriteQueue:
+
+    def test_batched_updates_flush(self, pool):
+        with pool.transaction() as (conn, cursor):
+            cursor.execute("INSERT INTO items (name) VALUES ('a')")
+        queue = WriteQueue(pool.db_path, batch_size=10, interval=0.01)
+        for _ in range(25):
+            queue.submit('UPDATE items SET hits = hits + 1 WHERE id = ?', (1,))
+        queue.flush(timeout=5)
+        with pool.transaction() as (conn, cursor):
+            assert cursor.execute('SELECT hits FROM items').fetchone()[0] == 25
+        assert queue.stats['written'] == 25
+        assert queue.stats['batches'] < 25
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for suggestion_index (v6.3.3)
+===================================
+The symmetric-delete index must return exactly what the original linear
+Levenshtein scans returned.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import suggestion_index
+from suggestion_index import SuggestionIndex, get_suggestion_index, levenshtein
+
+
+def _brute_force(words, word, max_distance):
+    hits = [(w, levenshtein(word, w)) for w in words]
+    return sorted([h for h in hits if h[1] <= max_distance], key=lambda x: (x[1], x[0]))
+
+
+def _mutate(rng, word):
+    chars = list(word)
+    for _ in range(rng.randint(0, 3)):
+        op = rng.choice('ids')
+        pos = rng.randrange(len(chars) + (op == 'i')) if chars else 0
+        if op == 'i' or not chars:
+            chars.insert(pos, rng.choice('abcde'))
+        elif op == 'd':
+            del chars[pos]
+        else:
+            chars[pos] = rng.choice('abcde')
+    return ''.join(chars)
+
+
+class TestSuggestionIndex:
+
+    def test_matches_brute_force(self):
+        rng = random.Random(11)
+        words = {''.join(rng.choice('abcde') for _ in range(rng.randint(1, 12)))
+                 for _ in range(600)}
+        index = SuggestionIndex(words)
+        for word in rng.sample(sorted(words), 80):
+            query = _mutate(rng, word) or word
+            for distance in (1, 2):
+                assert index.lookup(query, distance) == _brute_force(words, query, distance)
+
+    def test_add_and_remove(self):
+        index = SuggestionIndex(['receive', 'antenna'])
+        assert index.best('recieve') == 'receive'
+        index.remove('receive')
+        assert index.best('recieve') is None
+        index.add('receive')
+        assert 'receive' in index
+
+    def test_lookup_beyond_built_distance_raises(self):
+        index = SuggestionIndex(['word'], max_distance=1)
+        try:
+            index.lookup('wrd', 2)
+        except ValueError:
+            return
+        raise AssertionError('expected ValueError')
+
+    def test_persisted_index_round_trips(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(suggestion_index, 'INDEX_DIR', tmp_path)
+        suggestion_index.clear_shared_indexes()
+        words = {'avionics', 'airframe', 'aileron'}
+        first = get_suggestion_index('test', words)
+        assert (tmp_path / 'test.pkl').exists()
+        assert get_suggestion_index('test', set(words)) is first
+
+        suggestion_index.clear_shared_indexes()
+        loaded = get_suggestion_index('test', words)
+        assert loaded is not first
+        assert loaded.lookup('avoinics') == first.lookup('avoinics')
+
+        # A changed word list is never served a stale index
+        changed = get_suggestion_index('test', words | {'avionic'})
+        assert 'avionic' in changed
+        suggestion_index.clear_shared_indexes()
+
+
+class TestConsumers:
+
+    def test_spell_checker_suggestion_unchanged(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(suggestion_index, 'INDEX_DIR', tmp_path)
+        from spell_checker import EnhancedSpellChecker
+        checker = EnhancedSpellChecker()
+        for word in ('sytem', 'requirment', 'avionicz', 'qqqqqqqq', 'verifcation'):
+            expected = sorted(
+                ((w, checker._edit_distance(word, w)) for w in checker._dictionary),
+                key=lambda x: (x[1], x[0]))
+            expected = [w for w, d in expected if d <= 2][:1]
+            result = checker._get_suggestion(word)
+            assert ([result] if result else []) == expected
+
+    def test_technical_dictionary_picks_up_new_terms(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(suggestion_index, 'INDEX_DIR', tmp_path)
+        from technical_dictionary import TechnicalDictionary
+        tech = TechnicalDictionary(load_external=False)
+        assert ('zorblaxian', 1) not in tech.suggest_similar('zorblaxia')
+        tech.add_custom_term('zorblaxian')
+        assert ('zorblaxian', 1) in tech.suggest_similar('zorblaxia')
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent URL validation cache (hyperlink_validator v6.3.3)
+=========================================================================
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+pytest.importorskip('requests')  # hyperlink_validator/__init__ imports the validator
+
+import hyperlink_validator.storage as hv_storage
+from hyperlink_validator.models import ValidationResult, normalize_url
+from hyperlink_validator.storage import HyperlinkValidatorStorage, URL_CACHE_TTLS, url_cache_context
+from hyperlink_validator.validator import StandaloneHyperlinkValidator
+
+
+def _result(url, status='WORKING', code=200, **kwargs):
+    result = ValidationResult(url=url, status=status, status_code=code, **kwargs)
+    result.message = f'HTTP {code}'
+    return result
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return HyperlinkValidatorStorage(str(tmp_path / 'hv.db'))
+
+
+class TestNormalizeUrl:
+
+    def test_equivalent_forms_share_a_key(self):
+        forms = ['HTTPS://Example.com:443/Docs/', 'https://example.com/Docs',
+                 'https://example.com/Docs#section-2']
+        assert {normalize_url(u) for u in forms} == {'https://example.com/Docs'}
+
+    def test_query_and_path_case_are_kept(self):
+        assert normalize_url('http://a.com/X?b=1') == 'http://a.com/X?b=1'
+        assert normalize_url('http://a.com/x') != normalize_url('http://a.com/X')
+
+
+class TestUrlCacheStorage:
+
+    def test_round_trip_by_normalized_url(self, storage):
+        storage.cache_url_results([_result('https://example.com/a/', etag='"v1"')])
+        found = storage.get_cached_url_results(['https://EXAMPLE.com:443/a/#top', 'https://example.com/a',
+                                                'https://example.com/b'])
+        assert list(found) == ['https://EXAMPLE.com:443/a/#top']
+        entry = found['https://EXAMPLE.com:443/a/#top']
+        assert entry['fresh'] and entry['etag'] == '"v1"'
+        assert entry['result']['url'] == 'https://EXAMPLE.com:443/a/#top'
+
+    def test_request_context_is_part_of_the_key(self, storage):
+        anonymous = url_cache_context()
+        sso = url_cache_context(auth='windows_sso')
+        no_verify = url_cache_context(verify=False)
+        proxied = url_cache_context(proxy='http://proxy:8080')
+        assert len({anonymous, sso, no_verify, proxied}) == 4
+        storage.cache_url_results([_result('https://intranet.example')], context=no_verify)
+        assert storage.get_cached_url_results(['https://intranet.example'], context=anonymous) == {}
+        assert storage.get_cached_url_results(['https://intranet.example'], context=sso) == {}
+        assert 'https://intranet.example' in storage.get_cached_url_results(
+            ['https://intranet.example'], context=no_verify)
+
+    def test_ttl_depends_on_status(self, storage):
+        storage.cache_url_results([_result('https://ok.com'), _result('https://bad.com', 'BROKEN', 404),
+                                   _result('https://slow.com', 'RATE_LIMITED', 429)])
+        found = storage.get_cached_url_results(['https://ok.com', 'https://bad.com', 'https://slow.com'])
+        assert set(found) == {'https://ok.com', 'https://bad.com'}
+
+        def ttl(url):
+            return found[url]['expires_at'] - found[url]['checked_at']
+
+        assert ttl('https://ok.com') == pytest.approx(URL_CACHE_TTLS['WORKING'])
+        assert ttl('https://bad.com') == pytest.approx(URL_CACHE_TTLS['BROKEN'])
+
+    def test_scan_depth_and_exclusions_are_respected(self, storage):
+        storage.cache_url_results([_result('https://ok.com'), _result('https://skip.com', excluded=True)],
+                                  scan_depth='standard')
+        assert storage.get_cached_url_results(['https://ok.com'], 'thorough') == {}
+        assert 'https://skip.com' not in storage.get_cached_url_results(['https://skip.com'])
+
+    def test_expiry_and_clear(self, storage, monkeypatch):
+        storage.cache_url_results([_result('https://ok.com')], ttls={'WORKING': 10})
+        later = time.time() + 60
+        monkeypatch.setattr(hv_storage.time, 'time', lambda: later)
+        assert storage.get_cached_url_results(['https://ok.com'])['https://ok.com']['fresh'] is False
+        assert storage.clear_url_cache(expired_only=True) == 1
+        assert storage.get_url_cache_stats()['total'] == 0
+
+
+class _Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def close(self):
+        pass
+
+
+class _Session:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.sent_headers = []
+
+    def head(self, url, headers=None, **kwargs):
+        self.sent_headers.append(headers)
+        return _Response(self.status_code)
+
+
+class TestValidatorCache:
+
+    def test_fresh_entries_skip_the_network(self, storage, monkeypatch):
+        validator = StandaloneHyperlinkValidator()
+        monkeypatch.setattr('hyperlink_validator.validator.WINDOWS_AUTH_AVAILABLE', False)
+        context = url_cache_context(auth='none', verify=bool(validator.verify_ssl))
+        storage.cache_url_results([_result('https://cached.example')], context=context)
+        storage.cache_url_results([_result('https://new.example')], context=url_cache_context(verify=False))
+        monkeypatch.setattr('hyperlink_validator.storage.HyperlinkValidatorStorage',
+                            lambda *a, **k: storage)
+        validator._probe_windows_auth = lambda *a, **k: {'message': 'skipped'}
+        fetched = []
+
+        def fake_validate(url, **kwargs):
+            fetched.append(url)
+            return _result(url)
+
+        validator._validate_single_url = fake_validate
+        results = validator._validate_with_requests(
+            ['https://cached.example', 'https://new.example'], {'exclusions': []})
+
+        assert fetched == ['https://new.example']
+        assert [r.cached for r in results] == [True, False]
+        assert 'https://new.example' in storage.get_cached_url_results(['https://new.example'], context=context)
+
+    def test_conditional_revalidation(self):
+        validator = StandaloneHyperlinkValidator()
+        entry = {'result': _result('https://a.example').to_dict(), 'etag': '"abc"',
+                 'last_modified': 'Wed, 21 Oct 2015 07:28:00 GMT'}
+
+        session = _Session(304)
+        result = validator._revalidate_cached_url('https://a.example', entry, session, {}, 5)
+        assert result.cached and result.status == 'WORKING' and result.etag == '"abc"'
+        assert session.sent_headers[0]['If-None-Match'] == '"abc"'
+        assert session.sent_headers[0]['If-Modified-Since'] == entry['last_modified']
+
+        assert validator._revalidate_cached_url('https://a.example', entry, _Session(200), {}, 5) is None
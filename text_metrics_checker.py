@@ -35,6 +35,8 @@ except ImportError:
         except Exception:
             return None
 
+from nlp_doc_store import parse as parse_doc
+
 __version__ = "1.0.0"
 
 
@@ -130,7 +132,8 @@ class TextMetricsChecker(BaseChecker):
         try:
             # Process in chunks if text is very long
             chunk = text[:50000]  # textdescriptives can be slow on huge texts
-            doc = self.nlp(chunk)
+            td_pipes = [p for p in self.nlp.pipe_names if p.startswith('textdescriptives')]
+            doc = parse_doc(self.nlp, chunk, pipes=td_pipes)
 
             # Extract readability metrics
             metrics = {}
@@ -414,7 +417,7 @@ class SentenceComplexityChecker(BaseChecker):
                 continue
 
             try:
-                doc = self.nlp(text[:5000])
+                doc = parse_doc(self.nlp, text[:5000])
 
                 for sent in doc.sents:
                     if len(list(sent)) < 5:
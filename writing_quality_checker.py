@@ -13,6 +13,8 @@ Checks for writing quality issues:
 import re
 from typing import List, Dict, Tuple, Optional
 
+from regex_registry import compile_pattern
+
 try:
     from base_checker import BaseChecker
 except ImportError:
@@ -26,6 +28,8 @@ class WeakLanguageChecker(BaseChecker):
     
     CHECKER_NAME = "Weak Language"
     CHECKER_VERSION = "2.1.0"  # v2.1.0: Added provenance tracking
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
     
     # Phrases that should NOT be flagged even though they contain weak words
     # These are common business/technical terms where the weak word is part of a proper noun or title
@@ -213,6 +217,8 @@ class WordyPhrasesChecker(BaseChecker):
     
     CHECKER_NAME = "Wordy Phrases"
     CHECKER_VERSION = "2.1.0"  # v2.1.0: Added provenance tracking
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
     
     WORDY_PHRASES = {
         'in order to': ('to', 'Low'),
@@ -344,11 +350,25 @@ class WordyPhrasesChecker(BaseChecker):
         return issues
 
 
+def _nominalization_patterns(verbose_patterns: List[str], nouns) -> List:
+    """
+    One compiled pattern per verbose lead-in, matching any of `nouns` in a
+    'noun' group (v6.3.3). Replaces one pattern per (lead-in, noun) pair —
+    690 sources, more than re's 512-entry cache, so they were recompiled
+    on every paragraph.
+    """
+    noun_group = '(?P<noun>' + '|'.join(re.escape(noun) for noun in nouns) + r')\b'
+    return [compile_pattern(verbose + noun_group, name=f'nominalization.verbose_{i}')
+            for i, verbose in enumerate(verbose_patterns)]
+
+
 class NominalizationChecker(BaseChecker):
     """Detects nominalizations (noun forms of verbs that weaken writing)."""
     
     CHECKER_NAME = "Nominalization"
     CHECKER_VERSION = "2.1.0"  # v2.1.0: Added provenance tracking
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
     
     NOMINALIZATIONS = {
         'decision': 'decide',
@@ -417,6 +437,9 @@ class NominalizationChecker(BaseChecker):
         r'come\s+to\s+(?:a|an|the)\s+',
         r'arrive\s+at\s+(?:a|an|the)\s+',
     ]
+
+    _VERBOSE_NOUN_PATTERNS = _nominalization_patterns(VERBOSE_PATTERNS, NOMINALIZATIONS)
+    _NOUN_ORDER = {noun: rank for rank, noun in enumerate(NOMINALIZATIONS)}
     
     def __init__(self, enabled: bool = True):
         super().__init__(enabled)
@@ -432,29 +455,34 @@ class NominalizationChecker(BaseChecker):
                 continue
             
             text_lower = text.lower()
-            
-            for noun, verb in self.NOMINALIZATIONS.items():
-                for verbose_pattern in self.VERBOSE_PATTERNS:
-                    full_pattern = verbose_pattern + re.escape(noun) + r'\b'
-                    for match in re.finditer(full_pattern, text_lower):
-                        actual_text = text[match.start():match.end()]
-                        
-                        # Use provenance tracking
-                        issue = self.create_validated_issue(
-                            severity='Medium',
-                            message=f'Verbose nominalization: "{actual_text}"',
-                            paragraph_index=idx,
-                            original_paragraph=text,
-                            normalized_paragraph=text_lower,
-                            match_text=match.group(),
-                            match_start=match.start(),
-                            match_end=match.end(),
-                            context=text[max(0, match.start()-10):match.end()+10],
-                            suggestion=f'Consider using the verb form: "{verb}"',
-                            rule_id='NOM001'
-                        )
-                        if issue:
-                            issues.append(issue)
+
+            # Report in (noun, lead-in, position) order, as the per-pair scan did
+            found = []
+            for pattern_rank, pattern in enumerate(self._VERBOSE_NOUN_PATTERNS):
+                for match in pattern.finditer(text_lower):
+                    found.append((self._NOUN_ORDER[match.group('noun')], pattern_rank, match.start(), match))
+            found.sort(key=lambda item: item[:3])
+
+            for _, _, _, match in found:
+                verb = self.NOMINALIZATIONS[match.group('noun')]
+                actual_text = text[match.start():match.end()]
+
+                # Use provenance tracking
+                issue = self.create_validated_issue(
+                    severity='Medium',
+                    message=f'Verbose nominalization: "{actual_text}"',
+                    paragraph_index=idx,
+                    original_paragraph=text,
+                    normalized_paragraph=text_lower,
+                    match_text=match.group(),
+                    match_start=match.start(),
+                    match_end=match.end(),
+                    context=text[max(0, match.start()-10):match.end()+10],
+                    suggestion=f'Consider using the verb form: "{verb}"',
+                    rule_id='NOM001'
+                )
+                if issue:
+                    issues.append(issue)
         
         return issues
 
@@ -464,6 +492,8 @@ class JargonChecker(BaseChecker):
     
     CHECKER_NAME = "Jargon"
     CHECKER_VERSION = "2.1.0"  # v2.1.0: Added provenance tracking
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
     
     JARGON_WORDS = {
         # NOTE: Removed common business/technical terms that are standard in corporate documents
@@ -597,6 +627,8 @@ class GenderLanguageChecker(BaseChecker):
     
     CHECKER_NAME = "Gender-Neutral"
     CHECKER_VERSION = "2.1.0"  # v2.1.0: Added provenance tracking
+    PARALLEL_SAFE = True
+    PARAGRAPH_LOCAL = True
     
     GENDERED_TERMS = {
         'he/she': ('they', 'Low'),